@@ -1,8 +1,13 @@
-from StructNoSQL.fields import BaseField, MapModel, TableDataModel
-from StructNoSQL.tables_clients.backend import PrimaryIndex, GlobalSecondaryIndex
+from StructNoSQL.fields import BaseField, VersionField, MapModel, TableDataModel
+from StructNoSQL.tables_clients.backend import PrimaryIndex, GlobalSecondaryIndex, ConnectionPoolConfig, RetryPolicy
+from StructNoSQL.base_tables.cached_records_store import CacheEvictionPolicy
+from StructNoSQL.base_tables.shared_cache_backends import BaseSharedCacheBackend, MmapSharedCacheBackend
+from StructNoSQL.base_tables.pending_operations_auto_flush import AutoFlushPolicy
 from StructNoSQL.tables_clients.dynamodb_table_connectors import DynamoDBTableConnectors
 from StructNoSQL.tables_clients.dynamodb_basic_table import DynamoDBBasicTable
 from StructNoSQL.tables_clients.dynamodb_caching_table import DynamoDBCachingTable
+from StructNoSQL.tables_clients.async_dynamodb_basic_table import AsyncDynamoDBBasicTable
+from StructNoSQL.tables_clients.async_dynamodb_caching_table import AsyncDynamoDBCachingTable
 from StructNoSQL.utils.objects import NoneType, Undefined, ActiveSelf
-from StructNoSQL.models import FieldGetter, FieldSetter, UnsafeFieldSetter, FieldRemover, QueryMetadata
+from StructNoSQL.models import FieldGetter, FieldSetter, UnsafeFieldSetter, FieldRemover, QueryMetadata, CommitOperationsReport
 from StructNoSQL.exceptions import *
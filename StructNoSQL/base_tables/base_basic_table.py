@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any, Tuple, Callable, Union, Type
+from typing import Optional, List, Dict, Any, Tuple, Callable, Union, Type, Generator
 
 from StructNoSQL import PrimaryIndex, BaseField, TableDataModel
 from StructNoSQL.models import DatabasePathElement, FieldGetter, FieldSetter, UnsafeFieldSetter, FieldRemover, \
@@ -7,6 +7,7 @@ from StructNoSQL.base_tables.base_table import BaseTable
 from StructNoSQL.base_tables.shared_table_behaviors import _prepare_getters, _model_contain_all_index_keys, \
     unpack_validate_retrieved_field_if_need_to, unpack_validate_multiple_retrieved_fields_if_need_to
 from StructNoSQL.utils.data_processing import navigate_into_data_with_field_path_elements
+from StructNoSQL.utils.decimals import SHORTEST_FLOAT_CONVERSION
 from StructNoSQL.utils.process_render_fields_paths import process_and_make_single_rendered_database_path,\
     process_transforme_validate_data_from_write_and_make_single_rendered_database_path
 
@@ -14,33 +15,63 @@ from StructNoSQL.utils.process_render_fields_paths import process_and_make_singl
 class BaseBasicTable(BaseTable):
     def __init__(
             self, data_model: Type[TableDataModel], primary_index: PrimaryIndex,
-            auto_leading_key: Optional[str] = None
+            auto_leading_key: Optional[str] = None, float_conversion: str = SHORTEST_FLOAT_CONVERSION,
+            schema_cache_directory_path: Optional[str] = None
     ):
-        super().__init__(data_model=data_model, primary_index=primary_index, auto_leading_key=auto_leading_key)
+        super().__init__(
+            data_model=data_model, primary_index=primary_index,
+            auto_leading_key=auto_leading_key, float_conversion=float_conversion,
+            schema_cache_directory_path=schema_cache_directory_path
+        )
 
-    def _put_record(self, middleware: Callable[[dict], bool], record_dict_data: dict, data_validation: bool) -> bool:
+    def _put_record(self, middleware: Callable[[dict], bool], record_dict_data: dict, data_validation: bool) -> Generator[Any, Any, bool]:
         validated_data, is_valid = self.model_virtual_map_field.transform_validate_from_write(
             value=record_dict_data, data_validation=data_validation
         )
         if is_valid is not True:
             return False
-        return middleware(validated_data)
+        return (yield middleware(validated_data))
 
-    def _delete_record(self, middleware: Callable[[dict], bool], indexes_keys_selectors: dict) -> bool:
+    def _delete_record(self, middleware: Callable[[dict], bool], indexes_keys_selectors: dict) -> Generator[Any, Any, bool]:
         found_all_indexes: bool = _model_contain_all_index_keys(model=self.model, indexes_keys=indexes_keys_selectors.keys())
         if found_all_indexes is not True:
             return False
-        return middleware(indexes_keys_selectors)
+        return (yield middleware(indexes_keys_selectors))
+
+    def _put_records(self, middleware: Callable[[List[dict]], List[dict]], records_dicts_data: List[dict], data_validation: bool) -> Generator[Any, Any, bool]:
+        validated_records_data: List[dict] = []
+        all_records_are_valid: bool = True
+        for record_dict_data in records_dicts_data:
+            validated_data, is_valid = self.model_virtual_map_field.transform_validate_from_write(
+                value=record_dict_data, data_validation=data_validation
+            )
+            if is_valid is True:
+                validated_records_data.append(validated_data)
+            else:
+                all_records_are_valid = False
+
+        failed_records_data: List[dict] = (yield middleware(validated_records_data)) if len(validated_records_data) > 0 else []
+        return all_records_are_valid is True and not len(failed_records_data) > 0
+
+    def _delete_records(self, middleware: Callable[[List[dict]], List[dict]], indexes_keys_selectors_list: List[dict]) -> Generator[Any, Any, bool]:
+        valid_indexes_keys_selectors_list: List[dict] = [
+            indexes_keys_selectors for indexes_keys_selectors in indexes_keys_selectors_list
+            if _model_contain_all_index_keys(model=self.model, indexes_keys=indexes_keys_selectors.keys()) is True
+        ]
+        failed_indexes_keys_selectors: List[dict] = (
+            (yield middleware(valid_indexes_keys_selectors_list)) if len(valid_indexes_keys_selectors_list) > 0 else []
+        )
+        return len(valid_indexes_keys_selectors_list) == len(indexes_keys_selectors_list) and not len(failed_indexes_keys_selectors) > 0
 
     def _remove_record(
             self, middleware: Callable[[dict], Optional[dict]],
             indexes_keys_selectors: dict, data_validation: bool
-    ) -> Optional[dict]:
+    ) -> Generator[Any, Any, Optional[dict]]:
         found_all_indexes: bool = _model_contain_all_index_keys(model=self.model, indexes_keys=indexes_keys_selectors.keys())
         if found_all_indexes is not True:
             return None
 
-        removed_record_data: Optional[dict] = middleware(indexes_keys_selectors)
+        removed_record_data: Optional[dict] = yield middleware(indexes_keys_selectors)
         if removed_record_data is None:
             return None
 
@@ -52,7 +83,7 @@ class BaseBasicTable(BaseTable):
     def _get_field(
             self, middleware: Callable[[Union[List[DatabasePathElement], Dict[str, List[DatabasePathElement]]], bool], Optional[Any]],
             field_path: str, query_kwargs: Optional[dict], data_validation: bool
-    ) -> Optional[Any]:
+    ) -> Generator[Any, Any, Optional[Any]]:
         target_field_container, is_multi_selector = process_and_make_single_rendered_database_path(
             field_path=field_path, fields_switch=self.fields_switch, query_kwargs=query_kwargs
         )
@@ -60,14 +91,14 @@ class BaseBasicTable(BaseTable):
             target_field_container: Tuple[BaseField, List[DatabasePathElement]]
             field_object, field_path_elements = target_field_container
 
-            retrieved_item_data: Optional[Any] = middleware(field_path_elements, False)
+            retrieved_item_data: Optional[Any] = yield middleware(field_path_elements, False)
             transformed_validated_data, is_valid = field_object.transform_validate_from_read(value=retrieved_item_data, data_validation=data_validation)
             return transformed_validated_data
         else:
             target_field_container: Dict[str, Tuple[BaseField, List[DatabasePathElement]]]
 
             fields_paths_elements: Dict[str, List[DatabasePathElement]] = {key: item[1] for key, item in target_field_container.items()}
-            retrieved_items_data: Dict[str, Optional[Any]] = middleware(fields_paths_elements, True)
+            retrieved_items_data: Dict[str, Optional[Any]] = yield middleware(fields_paths_elements, True)
 
             output_data: Dict[str, Optional[Any]] = {}
             for item_key, item_container in target_field_container.items():
@@ -84,14 +115,14 @@ class BaseBasicTable(BaseTable):
     def inner_query_fields_secondary_index(
             self, middleware: Callable[[List[List[DatabasePathElement]]], Tuple[Optional[List[Any]], QueryMetadata]],
             fields_database_paths: List[List[DatabasePathElement]],
-    ) -> Tuple[Optional[dict], QueryMetadata]:
+    ) -> Generator[Any, Any, Tuple[Optional[dict], QueryMetadata]]:
         from StructNoSQL.base_tables.shared_table_behaviors import _inner_query_fields_secondary_index
-        return _inner_query_fields_secondary_index(
+        return (yield from _inner_query_fields_secondary_index(
             primary_index_name=self.primary_index_name,
             get_primary_key_database_path=self._get_primary_key_database_path,
             middleware=middleware,
             fields_paths_elements=fields_database_paths,
-        )
+        ))
 
     def unpack_validate_getters_record_attributes_if_need_to(
             self, data_validation: bool, record_attributes: dict,
@@ -111,7 +142,7 @@ class BaseBasicTable(BaseTable):
     def _query_field(
             self, middleware: Callable[[List[List[DatabasePathElement]]], Tuple[Optional[List[Any]], QueryMetadata]],
             key_value: str, field_path: str, query_kwargs: Optional[dict], index_name: Optional[str], data_validation: bool
-    ) -> Tuple[Optional[dict], QueryMetadata]:
+    ) -> Generator[Any, Any, Tuple[Optional[dict], QueryMetadata]]:
 
         target_field_container, is_multi_selector = process_and_make_single_rendered_database_path(
             field_path=field_path, fields_switch=self.fields_switch, query_kwargs=query_kwargs
@@ -122,7 +153,7 @@ class BaseBasicTable(BaseTable):
                 target_field_container: Tuple[BaseField, List[DatabasePathElement]]
                 fields_database_paths: List[List[DatabasePathElement]] = [target_field_container[1]]
 
-                records_attributes, query_metadata = self.inner_query_fields_secondary_index(
+                records_attributes, query_metadata = yield from self.inner_query_fields_secondary_index(
                     middleware=middleware, fields_database_paths=fields_database_paths,
                 )
                 for record_key, record_item_attributes in records_attributes.items():
@@ -135,7 +166,7 @@ class BaseBasicTable(BaseTable):
                 target_field_container: Dict[str, Tuple[BaseField, List[DatabasePathElement]]]
                 fields_database_paths: List[List[DatabasePathElement]] = [item[1] for item in target_field_container.values()]
 
-                records_attributes, query_metadata = self.inner_query_fields_secondary_index(
+                records_attributes, query_metadata = yield from self.inner_query_fields_secondary_index(
                     middleware=middleware, fields_database_paths=fields_database_paths,
                 )
                 for record_key, record_item_attributes in records_attributes.items():
@@ -151,7 +182,7 @@ class BaseBasicTable(BaseTable):
                 target_field_container: Tuple[BaseField, List[DatabasePathElement]]
                 field_object, field_path_elements = target_field_container
 
-                retrieved_records_items_data, query_metadata = middleware([field_path_elements])
+                retrieved_records_items_data, query_metadata = yield middleware([field_path_elements])
                 if retrieved_records_items_data is not None and len(retrieved_records_items_data) > 0:
                     # Since we query the primary_index, we know for a fact that we will never be returned more than
                     # one record item. Hence why we do not have a loop that iterate over the records_items_data,
@@ -166,7 +197,7 @@ class BaseBasicTable(BaseTable):
                 target_field_container: Dict[str, Tuple[BaseField, List[DatabasePathElement]]]
 
                 fields_paths_elements: List[List[DatabasePathElement]] = [item[1] for item in target_field_container.values()]
-                retrieved_records_items_data, query_metadata = middleware(fields_paths_elements)
+                retrieved_records_items_data, query_metadata = yield middleware(fields_paths_elements)
                 if retrieved_records_items_data is not None and len(retrieved_records_items_data) > 0:
                     # Since we query the primary_index, we know for a fact that we will never be returned more than
                     # one record item. Hence why we do not have a loop that iterate over the records_items_data,
@@ -181,13 +212,13 @@ class BaseBasicTable(BaseTable):
     def _query_multiple_fields(
             self, middleware: Callable[[List[List[DatabasePathElement]]], Tuple[Optional[List[Any]], QueryMetadata]],
             key_value: str, getters: Dict[str, FieldGetter], index_name: Optional[str], data_validation: bool
-    ) -> Tuple[Optional[dict], QueryMetadata]:
+    ) -> Generator[Any, Any, Tuple[Optional[dict], QueryMetadata]]:
         getters_database_paths, single_getters_target_fields_containers, grouped_getters_target_fields_containers = (
             _prepare_getters(fields_switch=self.fields_switch, getters=getters)
         )
 
         if index_name is None or index_name == self.primary_index_name:
-            retrieved_records_items_data, query_metadata = middleware(getters_database_paths)
+            retrieved_records_items_data, query_metadata = yield middleware(getters_database_paths)
             if retrieved_records_items_data is not None and len(retrieved_records_items_data) > 0:
                 # Since we query the primary_index, we know for a fact that we will never be returned more than
                 # one record item. Hence why we do not have a loop that iterate over the records_items_data,
@@ -200,7 +231,7 @@ class BaseBasicTable(BaseTable):
                 return {key_value: record_item_value}, query_metadata
             return None, query_metadata
         else:
-            records_attributes, query_metadata = self.inner_query_fields_secondary_index(
+            records_attributes, query_metadata = yield from self.inner_query_fields_secondary_index(
                 middleware=middleware, fields_database_paths=getters_database_paths,
             )
             output_records_values: dict = {
@@ -215,12 +246,12 @@ class BaseBasicTable(BaseTable):
     def _get_multiple_fields(
             self, middleware: Callable[[List[List[DatabasePathElement]]], Any],
             getters: Dict[str, FieldGetter], data_validation: bool
-    ) -> Dict[str, Optional[Any]]:
+    ) -> Generator[Any, Any, Dict[str, Optional[Any]]]:
 
         getters_database_paths, single_getters_target_fields_containers, grouped_getters_target_fields_containers = (
             _prepare_getters(fields_switch=self.fields_switch, getters=getters)
         )
-        record_attributes: Optional[dict] = middleware(getters_database_paths)
+        record_attributes: Optional[dict] = yield middleware(getters_database_paths)
         if record_attributes is None:
             return {getter_key: None for getter_key in getters.keys()}
 
@@ -230,26 +261,49 @@ class BaseBasicTable(BaseTable):
             grouped_getters_target_fields_containers=grouped_getters_target_fields_containers,
         )
 
+    def _get_multiple_records_fields(
+            self, middleware: Callable[[List[List[DatabasePathElement]], List[str]], Dict[str, Optional[dict]]],
+            keys_values: List[str], getters: Dict[str, FieldGetter], data_validation: bool
+    ) -> Generator[Any, Any, Dict[str, Dict[str, Optional[Any]]]]:
+
+        getters_database_paths, single_getters_target_fields_containers, grouped_getters_target_fields_containers = (
+            _prepare_getters(fields_switch=self.fields_switch, getters=getters)
+        )
+        records_attributes: Dict[str, Optional[dict]] = yield middleware(getters_database_paths, keys_values)
+
+        output_records_values: Dict[str, Dict[str, Optional[Any]]] = {}
+        for key_value in keys_values:
+            record_attributes: Optional[dict] = records_attributes.get(key_value, None)
+            if record_attributes is None:
+                output_records_values[key_value] = {getter_key: None for getter_key in getters.keys()}
+            else:
+                output_records_values[key_value] = self.unpack_validate_getters_record_attributes_if_need_to(
+                    data_validation=data_validation, record_attributes=record_attributes,
+                    single_getters_target_fields_containers=single_getters_target_fields_containers,
+                    grouped_getters_target_fields_containers=grouped_getters_target_fields_containers,
+                )
+        return output_records_values
+
     def _update_field(
             self, middleware: Callable[[List[DatabasePathElement], Any], bool],
             field_path: str, value_to_set: Any, query_kwargs: Optional[dict] = None
-    ) -> bool:
+    ) -> Generator[Any, Any, bool]:
         field_object, field_path_elements, validated_data, is_valid = process_transforme_validate_data_from_write_and_make_single_rendered_database_path(
             field_path=field_path, fields_switch=self.fields_switch, query_kwargs=query_kwargs, data_to_validate=value_to_set
         )
-        return middleware(field_path_elements, validated_data) if is_valid is True else False
+        return (yield middleware(field_path_elements, validated_data)) if is_valid is True else False
 
     def _update_field_return_old(
             self, middleware: Callable[[List[DatabasePathElement], Any], Tuple[bool, Any]],
             field_path: str, value_to_set: Any, query_kwargs: Optional[dict], data_validation: bool
-    ) -> Tuple[bool, Optional[Any]]:
+    ) -> Generator[Any, Any, Tuple[bool, Optional[Any]]]:
         field_object, field_path_elements, validated_update_data, update_data_is_valid = process_transforme_validate_data_from_write_and_make_single_rendered_database_path(
             field_path=field_path, fields_switch=self.fields_switch, query_kwargs=query_kwargs, data_to_validate=value_to_set
         )
         if update_data_is_valid is not True:
             return False, None
 
-        update_success, response_attributes = middleware(field_path_elements, validated_update_data)
+        update_success, response_attributes = yield middleware(field_path_elements, validated_update_data)
 
         from StructNoSQL.utils.data_processing import navigate_into_data_with_field_path_elements
         old_item_data: Optional[Any] = navigate_into_data_with_field_path_elements(
@@ -265,7 +319,7 @@ class BaseBasicTable(BaseTable):
     def _update_multiple_fields(
             self, middleware: Callable[[List[FieldPathSetter]], bool],
             setters: List[FieldSetter or UnsafeFieldSetter]
-    ) -> bool:
+    ) -> Generator[Any, Any, bool]:
         dynamodb_setters: List[FieldPathSetter] = []
         for current_setter in setters:
             if isinstance(current_setter, FieldSetter):
@@ -275,7 +329,8 @@ class BaseBasicTable(BaseTable):
                 )
                 if is_valid is True:
                     dynamodb_setters.append(FieldPathSetter(
-                        field_path_elements=field_path_elements, value_to_set=validated_data
+                        field_path_elements=field_path_elements, value_to_set=validated_data,
+                        value_serializer=field_object.dynamodb_serializers.encode
                     ))
             elif isinstance(current_setter, UnsafeFieldSetter):
                 raise Exception(f"UnsafeFieldSetter not supported in basic_table")
@@ -301,13 +356,13 @@ class BaseBasicTable(BaseTable):
                     field_path_elements=rendered_field_path_elements,
                     value_to_set=processed_value_to_set
                 ))"""
-        update_success: bool = middleware(dynamodb_setters)
+        update_success: bool = yield middleware(dynamodb_setters)
         return update_success
 
     def _update_multiple_fields_return_old(
             self, middleware: Callable[[Dict[str, FieldPathSetter]], Tuple[bool, Dict[str, Optional[Any]]]],
             setters: Dict[str, FieldSetter], data_validation: bool
-    ) -> Tuple[bool, Dict[str, Optional[Any]]]:
+    ) -> Generator[Any, Any, Tuple[bool, Dict[str, Optional[Any]]]]:
 
         setters_containers: Dict[str, Tuple[BaseField, List[DatabasePathElement]]] = {}
         dynamodb_setters: Dict[str, FieldPathSetter] = {}
@@ -319,9 +374,10 @@ class BaseBasicTable(BaseTable):
             if is_valid is True:
                 setters_containers[setter_key] = (field_object, field_path_elements)
                 dynamodb_setters[setter_key] = FieldPathSetter(
-                    field_path_elements=field_path_elements, value_to_set=validated_data
+                    field_path_elements=field_path_elements, value_to_set=validated_data,
+                    value_serializer=field_object.dynamodb_serializers.encode
                 )
-        update_success, setters_response_attributes = middleware(dynamodb_setters)
+        update_success, setters_response_attributes = yield middleware(dynamodb_setters)
 
         output_data: Dict[str, Optional[Any]] = {}
         for item_key, item_container in setters_containers.items():
@@ -341,7 +397,7 @@ class BaseBasicTable(BaseTable):
     def _remove_field(
             self, middleware: Callable[[List[List[DatabasePathElement]]], Optional[dict]],
             field_path: str, query_kwargs: Optional[dict], data_validation: bool
-    ) -> Optional[Any]:
+    ) -> Generator[Any, Any, Optional[Any]]:
         target_field_container, is_multi_selector = process_and_make_single_rendered_database_path(
             field_path=field_path, fields_switch=self.fields_switch, query_kwargs=query_kwargs
         )
@@ -350,7 +406,7 @@ class BaseBasicTable(BaseTable):
             target_field_container: Tuple[BaseField, List[DatabasePathElement]]
             field_path_object, field_path_elements = target_field_container
 
-            removed_item_attributes: Optional[dict] = middleware([field_path_elements])
+            removed_item_attributes: Optional[dict] = yield middleware([field_path_elements])
             if removed_item_attributes is None:
                 return None
 
@@ -366,7 +422,7 @@ class BaseBasicTable(BaseTable):
             target_field_container: Dict[str, Tuple[BaseField, List[DatabasePathElement]]]
 
             fields_paths_elements: List[List[DatabasePathElement]] = [item[1] for item in target_field_container.values()]
-            removed_items_attributes: Optional[dict] = middleware(fields_paths_elements)
+            removed_items_attributes: Optional[dict] = yield middleware(fields_paths_elements)
             # The attributes of all the removed items are packed inside the same dictionary,
             # because all the remove's are expected to be done by a single database operation.
             if removed_items_attributes is None:
@@ -390,22 +446,22 @@ class BaseBasicTable(BaseTable):
     def _delete_field(
             self, middleware: Callable[[List[List[DatabasePathElement]]], bool],
             field_path: str, query_kwargs: Optional[dict] = None
-    ) -> bool:
+    ) -> Generator[Any, Any, bool]:
         target_field_container, is_multi_selector = process_and_make_single_rendered_database_path(
             field_path=field_path, fields_switch=self.fields_switch, query_kwargs=query_kwargs
         )
         if is_multi_selector is not None:
             target_field_container: Tuple[BaseField, List[DatabasePathElement]]
-            return middleware([target_field_container[1]])
+            return (yield middleware([target_field_container[1]]))
         else:
             target_field_container: Dict[str, Tuple[BaseField, List[DatabasePathElement]]]
             targets_paths_elements: List[List[DatabasePathElement]] = [item[1] for item in target_field_container.values()]
-            return middleware(targets_paths_elements)
+            return (yield middleware(targets_paths_elements))
 
     def _grouped_remove_multiple_fields(
             self, middleware: Callable[[List[List[DatabasePathElement]]], Any],
             removers: Dict[str, FieldRemover], data_validation: bool
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Generator[Any, Any, Optional[Dict[str, Any]]]:
         if not len(removers) > 0:
             # If no remover has been specified, we do not run the database
             # operation, and since no value has been removed, we return None.
@@ -433,7 +489,7 @@ class BaseBasicTable(BaseTable):
                 grouped_removers_field_paths_elements[remover_key] = target_field_container
                 removers_database_paths.extend(fields_paths_elements)
 
-        record_attributes: Optional[dict] = middleware(removers_database_paths)
+        record_attributes: Optional[dict] = yield middleware(removers_database_paths)
         if record_attributes is None:
             return None
 
@@ -445,7 +501,7 @@ class BaseBasicTable(BaseTable):
 
     def _grouped_delete_multiple_fields(
             self, middleware: Callable[[List[List[DatabasePathElement]]], Any], removers: List[FieldRemover],
-    ) -> bool:
+    ) -> Generator[Any, Any, bool]:
         if not len(removers) > 0:
             # If no remover has been specified, we do not run the database operation, yet we still
             # return True, since technically, what needed to be performed (nothing) was performed.
@@ -465,5 +521,5 @@ class BaseBasicTable(BaseTable):
                 fields_paths_elements: List[List[DatabasePathElement]] = [item[1] for item in target_field_container.values()]
                 removers_database_paths.extend(fields_paths_elements)
 
-        response: Optional[Any] = middleware(removers_database_paths)
+        response: Optional[Any] = yield middleware(removers_database_paths)
         return response is not None
@@ -1,24 +1,59 @@
 import abc
-from typing import Optional, List, Dict, Any, Tuple, Callable, Union, Type
+import copy
+import threading
+from typing import Optional, List, Dict, Any, Tuple, Callable, Union, Type, Generator
 
-from StructNoSQL import BaseField, TableDataModel
+from StructNoSQL import BaseField, VersionField, TableDataModel
 from StructNoSQL.tables_clients.backend import PrimaryIndex
 from StructNoSQL.models import DatabasePathElement, FieldGetter, FieldRemover, FieldSetter, UnsafeFieldSetter, \
     FieldPathSetter, QueryMetadata
 from StructNoSQL.base_tables.base_table import BaseTable
+from StructNoSQL.base_tables.cached_records_store import CachedRecordsStore, CacheEvictionPolicy, CachedRecordData
+from StructNoSQL.base_tables.cache_snapshots import CacheSnapshot, write_cache_snapshot_file
+from StructNoSQL.base_tables.path_indexed_record_data import PathIndexedRecordData
+from StructNoSQL.base_tables.shared_cache_backends import BaseSharedCacheBackend
+from StructNoSQL.base_tables.pending_operations_auto_flush import AutoFlushPolicy, PendingOperationsTracker
 from StructNoSQL.base_tables.shared_table_behaviors import _model_contain_all_index_keys, \
     unpack_validate_retrieved_field_if_need_to, unpack_validate_multiple_retrieved_fields_if_need_to
 from StructNoSQL.utils.data_processing import navigate_into_data_with_field_path_elements
+from StructNoSQL.practical_logger import message_with_vars
+from StructNoSQL.utils.decimals import SHORTEST_FLOAT_CONVERSION
 from StructNoSQL.utils.process_render_fields_paths import process_and_make_single_rendered_database_path, \
     process_transforme_validate_data_from_write_and_make_single_rendered_database_path, join_field_path_elements
 
 
 class BaseCachingTable(BaseTable):
-    def __init__(self, data_model: Type[TableDataModel], primary_index: PrimaryIndex, auto_leading_key: Optional[str] = None):
-        super().__init__(data_model=data_model, primary_index=primary_index, auto_leading_key=auto_leading_key)
-        self._cached_data_per_primary_key: Dict[str, Any] = {}
+    def __init__(
+            self, data_model: Type[TableDataModel], primary_index: PrimaryIndex,
+            auto_leading_key: Optional[str] = None, float_conversion: str = SHORTEST_FLOAT_CONVERSION,
+            cache_eviction_policy: Optional[CacheEvictionPolicy] = None,
+            shared_cache_backend: Optional[BaseSharedCacheBackend] = None,
+            auto_flush_policy: Optional[AutoFlushPolicy] = None,
+            schema_cache_directory_path: Optional[str] = None
+    ):
+        super().__init__(
+            data_model=data_model, primary_index=primary_index,
+            auto_leading_key=auto_leading_key, float_conversion=float_conversion,
+            schema_cache_directory_path=schema_cache_directory_path
+        )
+        self._cached_data_per_primary_key = CachedRecordsStore(
+            eviction_policy=cache_eviction_policy, is_record_evictable=self._is_record_cache_evictable,
+            shared_backend=shared_cache_backend
+        )
         self._pending_update_operations_per_primary_key: Dict[str, Dict[str, FieldPathSetter]] = {}
         self._pending_remove_operations_per_primary_key: Dict[str, Dict[str, List[DatabasePathElement]]] = {}
+        # Only required to track the pending operations when they can be auto flushed
+        self._pending_operations_tracker: Optional[PendingOperationsTracker] = (
+            PendingOperationsTracker(auto_flush_policy=auto_flush_policy) if auto_flush_policy is not None else None
+        )
+        # Guards the pending operations against the auto flush thread, which commits them from another thread
+        self._pending_operations_lock = threading.RLock()
+        # Only one commit is running at a time, and the pending operations lock is never held while acquiring it
+        self._commit_lock = threading.RLock()
+        self._version_field: Optional[VersionField] = next((
+            field_object for field_path, field_object in self.fields_switch.items()
+            if isinstance(field_object, VersionField) and len(field_object.database_path) == 1
+        ), None)
         self._debug = False
         self._wrap_item_value = BaseCachingTable._without_debug_wrap_item_value
 
@@ -53,17 +88,178 @@ class BaseCachingTable(BaseTable):
             BaseCachingTable._without_debug_wrap_item_value
         )
 
+    @property
+    def cache_eviction_policy(self) -> CacheEvictionPolicy:
+        return self._cached_data_per_primary_key.eviction_policy
+
+    @property
+    def cache_hits_count(self) -> int:
+        return self._cached_data_per_primary_key.hits_count
+
+    @property
+    def cache_misses_count(self) -> int:
+        return self._cached_data_per_primary_key.misses_count
+
+    @property
+    def cache_negative_hits_count(self) -> int:
+        # Number of reads answered by the cache with a field or a record known to be missing from the database
+        return self._cached_data_per_primary_key.negative_hits_count
+
+    @property
+    def cache_evictions_count(self) -> int:
+        # Number of records evicted from the cache because of the bounds or of the records ttl of the cache_eviction_policy
+        return self._cached_data_per_primary_key.evictions_count
+
+    @property
+    def cached_records_count(self) -> int:
+        return len(self._cached_data_per_primary_key)
+
+    def reset_cache_counters(self) -> None:
+        self._cached_data_per_primary_key.reset_counters()
+
+    def _is_record_cache_evictable(self, primary_key_value: str) -> bool:
+        # The records with pending operations are never evicted, since their pending operations have not been sent yet
+        return (
+            not len(self._pending_update_operations_per_primary_key.get(primary_key_value, {})) > 0 and
+            not len(self._pending_remove_operations_per_primary_key.get(primary_key_value, {})) > 0
+        )
+
+    @property
+    def shared_cache_backend(self) -> Optional[BaseSharedCacheBackend]:
+        return self._cached_data_per_primary_key.shared_backend
+
+    def publish_cached_records(self) -> None:
+        # Publishes to the shared_cache_backend the records modified since the last publication. Called automatically
+        # after each operation of the table, and only required after modifying the cache without running an operation.
+        self._cached_data_per_primary_key.publish_modified_records()
+
+    def _with_cached_records_publication(self, operation: Generator) -> Generator[Any, Any, Any]:
+        operation_result: Any = yield from operation
+        self._cached_data_per_primary_key.publish_modified_records()
+        return operation_result
+
+    @property
+    def version_field(self) -> Optional[VersionField]:
+        return self._version_field
+
+    def _get_captured_record_version(self, primary_key_value: str) -> Optional[int]:
+        # None when the version of the record has not been captured, like when the record has only been written
+        if self._version_field is None:
+            return None
+        record_data: Optional[dict] = self._cached_data_per_primary_key.get_record_data(primary_key_value=primary_key_value)
+        return record_data.get(self._version_field.field_name, None) if record_data is not None else None
+
+    def _get_version_path_to_capture(self, primary_key_value: str) -> Optional[List[DatabasePathElement]]:
+        # The version of a record is retrieved along with the first fields of the record retrieved from the database
+        if self._version_field is None or self._get_captured_record_version(primary_key_value=primary_key_value) is not None:
+            return None
+        return self._version_field.database_path
+
+    def _cache_record_version(self, primary_key_value: str, record_version: Optional[Any]) -> None:
+        # A record missing from the database (or that has never been written with a version) has the version 0
+        self._cache_put_data(
+            primary_key_value=primary_key_value, field_path_elements=self._version_field.database_path,
+            data=int(record_version) if record_version is not None else 0
+        )
+
+    def _capture_record_version_if_need_to(self, primary_key_value: str, record_attributes: Optional[dict]) -> None:
+        if self._get_version_path_to_capture(primary_key_value=primary_key_value) is not None:
+            self._cache_record_version(
+                primary_key_value=primary_key_value,
+                record_version=record_attributes.get(self._version_field.field_name, None) if record_attributes is not None else None
+            )
+
+    def _make_session(self) -> 'BaseCachingTable':
+        # A session is a shallow copy of the table (sharing its fields_switch and its dynamodb_client, so that the data model
+        # is only processed once), with its own pending operations, and a cache that reads through the cache of the table.
+        # The records are copied from the cache of the table when first used by the session, so the writes of a session
+        # are isolated from the other sessions until being committed and merged into the cache of the table, which can be
+        # shared by the sessions of multiple threads (as long as the table itself is only used through its sessions).
+        session = copy.copy(self)
+        session.table = session
+        session._cached_data_per_primary_key = CachedRecordsStore(
+            eviction_policy=self.cache_eviction_policy, is_record_evictable=session._is_record_cache_evictable,
+            parent_store=self._cached_data_per_primary_key
+        )
+        session._pending_update_operations_per_primary_key = {}
+        session._pending_remove_operations_per_primary_key = {}
+        # The operations of a session are committed when the session ends, instead of being auto flushed
+        session._pending_operations_tracker = None
+        session._pending_operations_lock = threading.RLock()
+        session._commit_lock = threading.RLock()
+        return session
+
+    def _close_session(self, is_committed: bool) -> None:
+        # The pending operations left in a session that has not been committed are discarded
+        self._cached_data_per_primary_key.merge_into_parent_store(with_written_records=is_committed)
+        self.clear_pending_operations()
+
     def clear_cached_data(self):
-        self._cached_data_per_primary_key = {}
+        # With a shared_cache_backend, the cached data shared with the other processes is also cleared
+        self._cached_data_per_primary_key.clear()
+
+    def export_cache_snapshot(self, file_path: Optional[str] = None) -> bytes:
+        # Returns a snapshot of the cached records (except the records with pending operations, which cached data has not
+        # been committed yet) along with their age, to warm up the cache of another process with load_cache_snapshot. When
+        # a file_path is specified (like a file in /tmp, or in a volume shared by the processes), the file is also written.
+        snapshot_bytes: bytes = self._cached_data_per_primary_key.export_snapshot()
+        if file_path is not None:
+            write_cache_snapshot_file(file_path=file_path, snapshot_bytes=snapshot_bytes)
+        return snapshot_bytes
+
+    def load_cache_snapshot(self, file_path: Optional[str] = None, snapshot_bytes: Optional[bytes] = None) -> bool:
+        # Only the index of the snapshot is loaded, and each record is loaded the first time that it is used. The records
+        # older than the record_ttl_seconds of the cache_eviction_policy are not loaded. Returns False when the snapshot
+        # could not be loaded (like when its file does not exist yet), in which case the records are not cached.
+        if (file_path is None) == (snapshot_bytes is None):
+            raise Exception(message_with_vars(
+                message="Either a file_path or a snapshot_bytes is required to load a cache snapshot",
+                vars_dict={'filePath': file_path, 'hasSnapshotBytes': snapshot_bytes is not None}
+            ))
+        try:
+            snapshot: CacheSnapshot = (
+                CacheSnapshot.from_file(file_path=file_path) if file_path is not None
+                else CacheSnapshot(snapshot_buffer=snapshot_bytes)
+            )
+        except Exception as e:
+            print(message_with_vars(
+                message="Failed to load the cache snapshot",
+                vars_dict={'filePath': file_path, 'exceptionType': type(e).__name__, 'exception': str(e)}
+            ))
+            return False
+        self._cached_data_per_primary_key.load_snapshot(snapshot=snapshot)
+        return True
 
     def clear_cached_data_for_record(self, record_primary_key: str):
-        self._cached_data_per_primary_key.pop(record_primary_key, None)
+        self._cached_data_per_primary_key.remove_record(primary_key_value=record_primary_key)
+
+    @property
+    def auto_flush_policy(self) -> Optional[AutoFlushPolicy]:
+        return self._pending_operations_tracker.auto_flush_policy if self._pending_operations_tracker is not None else None
+
+    def _track_pending_operations(self, primary_key_value: str) -> None:
+        if self._pending_operations_tracker is not None:
+            self._pending_operations_tracker.track_record(
+                primary_key_value=primary_key_value,
+                pending_update_operations=self._pending_update_operations_per_primary_key.get(primary_key_value, {}),
+                pending_remove_operations=self._pending_remove_operations_per_primary_key.get(primary_key_value, {})
+            )
+
+    def _track_all_pending_operations(self) -> None:
+        if self._pending_operations_tracker is not None:
+            self._pending_operations_tracker.clear()
+            for primary_key_value in {**self._pending_update_operations_per_primary_key, **self._pending_remove_operations_per_primary_key}.keys():
+                self._track_pending_operations(primary_key_value=primary_key_value)
 
     def clear_pending_update_operations(self):
-        self._pending_update_operations_per_primary_key = {}
+        with self._pending_operations_lock:
+            self._pending_update_operations_per_primary_key = {}
+            self._track_all_pending_operations()
 
     def clear_pending_remove_operations(self):
-        self._pending_remove_operations_per_primary_key = {}
+        with self._pending_operations_lock:
+            self._pending_remove_operations_per_primary_key = {}
+            self._track_all_pending_operations()
 
     def clear_pending_operations(self):
         self.clear_pending_update_operations()
@@ -73,13 +269,11 @@ class BaseCachingTable(BaseTable):
         self.clear_cached_data()
         self.clear_pending_operations()
 
-    def _index_cached_data(self, primary_key_value: str) -> dict:
-        if primary_key_value not in self._cached_data_per_primary_key:
-            self._cached_data_per_primary_key[primary_key_value] = {}
-        return self._cached_data_per_primary_key[primary_key_value]
+    def _index_cached_data(self, primary_key_value: str) -> CachedRecordData:
+        return self._cached_data_per_primary_key.index_record(primary_key_value=primary_key_value)
 
     def _remove_index_from_cached_data(self, primary_key_value: str) -> Optional[dict]:
-        return self._cached_data_per_primary_key.pop(primary_key_value, None)
+        return self._cached_data_per_primary_key.remove_record(primary_key_value=primary_key_value)
 
     def _index_pending_update_operations(self, primary_key_value: str) -> dict:
         if primary_key_value not in self._pending_update_operations_per_primary_key:
@@ -91,17 +285,34 @@ class BaseCachingTable(BaseTable):
             self._pending_remove_operations_per_primary_key[primary_key_value] = {}
         return self._pending_remove_operations_per_primary_key[primary_key_value]
 
+    @staticmethod
+    def _discard_committed_pending_operations(
+            pending_operations_per_primary_key: Dict[str, dict], primary_key_value: str, committed_operations: dict
+    ) -> None:
+        # The operations added for the same fields while the commit was running are more recent than the committed
+        # ones (which can happen with the async tables), and are kept pending.
+        pending_operations: Optional[dict] = pending_operations_per_primary_key.get(primary_key_value, None)
+        if pending_operations is None:
+            return
+        for joined_field_path, committed_operation in committed_operations.items():
+            if pending_operations.get(joined_field_path, None) is committed_operation:
+                pending_operations.pop(joined_field_path)
+        if not len(pending_operations) > 0:
+            pending_operations_per_primary_key.pop(primary_key_value)
+
     def has_pending_update_operations(self) -> bool:
-        for index_operations in self._pending_update_operations_per_primary_key.values():
-            if len(index_operations) > 0:
-                return True
-        return False
+        with self._pending_operations_lock:
+            for index_operations in self._pending_update_operations_per_primary_key.values():
+                if len(index_operations) > 0:
+                    return True
+            return False
 
     def has_pending_remove_operations(self) -> bool:
-        for index_operations in self._pending_remove_operations_per_primary_key.values():
-            if len(index_operations) > 0:
-                return True
-        return False
+        with self._pending_operations_lock:
+            for index_operations in self._pending_remove_operations_per_primary_key.values():
+                if len(index_operations) > 0:
+                    return True
+            return False
 
     def has_pending_operations(self) -> bool:
         return self.has_pending_update_operations() or self.has_pending_remove_operations()
@@ -114,28 +325,52 @@ class BaseCachingTable(BaseTable):
     def commit_remove_operations(self) -> bool:
         raise Exception("commit_remove_operations not implemented")
 
+    @abc.abstractmethod
+    def _get_failed_retrievals_count(self) -> int:
+        # Used to only cache the fields and the records found missing by the retrieval operations that did not fail
+        raise Exception("_get_failed_retrievals_count not implemented")
+
     def commit_operations(self) -> bool:
         update_operations_commit_success: bool = self.commit_update_operations()
         remove_operations_commit_success: bool = self.commit_remove_operations()
         return all([update_operations_commit_success, remove_operations_commit_success])
 
-    def _cache_put_data(self, primary_key_value: str, field_path_elements: List[DatabasePathElement], data: Any):
-        index_cached_data = self._index_cached_data(primary_key_value=primary_key_value)
-
-        if len(field_path_elements) > 0:
-            navigated_cached_data = index_cached_data
-            for path_element in field_path_elements[:-1]:
-                stringed_element_key = f'{path_element.element_key}'
-                # We wrap the element_key inside a string, to handle a scenario where we would put an item from a list,
-                # where the element_key will be an int, that could be above zero, and cannot be handled by a classical list.
-
-                if stringed_element_key not in navigated_cached_data:
-                    navigated_cached_data[stringed_element_key] = {}
-                navigated_cached_data = navigated_cached_data[stringed_element_key]
+    @staticmethod
+    def _make_cache_path_keys(field_path_elements: List[DatabasePathElement]) -> Tuple[str, ...]:
+        return tuple([f'{path_element.element_key}' for path_element in field_path_elements])
 
-            last_field_path_element = field_path_elements[-1]
-            navigated_cached_data[f'{last_field_path_element.element_key}'] = data
-            # todo: handle list's and set's
+    def _cache_put_data(self, primary_key_value: str, field_path_elements: List[DatabasePathElement], data: Any):
+        # The data of the record is changed while holding the lock of the store, since the commits of the
+        # pending operations (which can run in the auto flush thread) also change the data of the records.
+        with self._cached_data_per_primary_key.lock:
+            index_cached_data = self._index_cached_data(primary_key_value=primary_key_value)
+
+            if len(field_path_elements) > 0:
+                path_keys: Tuple[str, ...] = self._make_cache_path_keys(field_path_elements)
+                self._cached_data_per_primary_key.discard_negative_paths(primary_key_value=primary_key_value, path_keys=path_keys)
+                if type(index_cached_data) is PathIndexedRecordData:
+                    index_cached_data.put(path_keys=path_keys, data=data)
+                    return
+
+                navigated_cached_data = index_cached_data
+                for path_element in field_path_elements[:-1]:
+                    stringed_element_key = f'{path_element.element_key}'
+                    # We wrap the element_key inside a string, to handle a scenario where we would put an item from a list,
+                    # where the element_key will be an int, that could be above zero, and cannot be handled by a classical list.
+
+                    if stringed_element_key not in navigated_cached_data:
+                        navigated_cached_data[stringed_element_key] = {}
+                    navigated_cached_data = navigated_cached_data[stringed_element_key]
+
+                last_field_path_element = field_path_elements[-1]
+                navigated_cached_data[f'{last_field_path_element.element_key}'] = data
+                # todo: handle list's and set's
+
+    def _cache_put_missing_data(self, primary_key_value: str, field_path_elements: List[DatabasePathElement]):
+        # Remembers that the field (or the entire record with an empty field_path_elements) is missing from the database
+        self._cached_data_per_primary_key.add_negative_path(
+            primary_key_value=primary_key_value, path_keys=self._make_cache_path_keys(field_path_elements)
+        )
 
     def _cache_get_data(self, primary_key_value: str, field_path_elements: List[DatabasePathElement]) -> Tuple[bool, Any]:
         if len(field_path_elements) > 0:
@@ -145,26 +380,49 @@ class BaseCachingTable(BaseTable):
             # retrieved data (the primary_key_value is not stored as the key, not inside the data object).
             if len(field_path_elements) == 1:
                 if field_path_elements[0].element_key == self.primary_index_name:
+                    if self._cached_data_per_primary_key.is_path_negative(primary_key_value=primary_key_value, path_keys=()):
+                        self._cached_data_per_primary_key.count_negative_hit()
+                        return True, None
                     if primary_key_value in self._cached_data_per_primary_key:
+                        self._cached_data_per_primary_key.count_hit()
                         return True, primary_key_value
 
-            index_cached_data: dict = self._index_cached_data(primary_key_value=primary_key_value)
-            navigated_cached_data: dict = index_cached_data
-
-            for path_element in field_path_elements[:-1]:
-                stringed_element_key = f'{path_element.element_key}'
-                # We wrap the element_key inside a string, to handle a scenario where we would put an item from a list,
-                # where the element_key will be an int, that could be above zero, and cannot be handled by a classical list.
-                navigated_cached_data = (
-                    navigated_cached_data[stringed_element_key]
-                    if stringed_element_key in navigated_cached_data
-                    else path_element.get_default_value()
-                )
+            index_cached_data: CachedRecordData = self._cached_data_per_primary_key.index_record(
+                primary_key_value=primary_key_value, is_for_write=False
+            )
+            if type(index_cached_data) is PathIndexedRecordData:
+                path_keys: Tuple[str, ...] = self._make_cache_path_keys(field_path_elements)
+                found_item_value, retrieved_item_value = index_cached_data.get(path_keys=path_keys)
+                if found_item_value is True:
+                    self._cached_data_per_primary_key.count_hit()
+                    return True, retrieved_item_value
+            else:
+                navigated_cached_data: dict = index_cached_data
+                for path_element in field_path_elements[:-1]:
+                    stringed_element_key = f'{path_element.element_key}'
+                    # We wrap the element_key inside a string, to handle a scenario where we would put an item from a list,
+                    # where the element_key will be an int, that could be above zero, and cannot be handled by a classical list.
+                    navigated_cached_data = (
+                        navigated_cached_data[stringed_element_key]
+                        if stringed_element_key in navigated_cached_data
+                        else path_element.get_default_value()
+                    )
 
-            last_field_path_element: DatabasePathElement = field_path_elements[-1]
-            if last_field_path_element.element_key in navigated_cached_data:
-                retrieved_item_value: Any = navigated_cached_data[last_field_path_element.element_key]
-                return True, retrieved_item_value
+                last_field_path_element: DatabasePathElement = field_path_elements[-1]
+                if last_field_path_element.element_key in navigated_cached_data:
+                    retrieved_item_value: Any = navigated_cached_data[last_field_path_element.element_key]
+                    self._cached_data_per_primary_key.count_hit()
+                    return True, retrieved_item_value
+                path_keys: Tuple[str, ...] = self._make_cache_path_keys(field_path_elements)
+            if (
+                self._cached_data_per_primary_key.is_path_complete(primary_key_value=primary_key_value, path_keys=path_keys) or
+                self._cached_data_per_primary_key.is_path_negative(primary_key_value=primary_key_value, path_keys=path_keys)
+            ):
+                # The field is missing from a path that has been entirely loaded (by the prefetch_records function),
+                # or has already been found missing from the database, which means that it does not exist there.
+                self._cached_data_per_primary_key.count_negative_hit()
+                return True, None
+            self._cached_data_per_primary_key.count_miss()
         return False, None
 
     def _cache_delete_field(self, primary_key_value: str, field_path_elements: List[DatabasePathElement]) -> str:
@@ -278,34 +536,75 @@ class BaseCachingTable(BaseTable):
         validated_data, is_valid = field_object.transform_validate_from_read(value=value, data_validation=data_validation)
         return self.wrap_item_value(item_value=validated_data, from_cache=from_cache)
 
-    def _put_record(self, middleware: Callable[[dict], bool], record_dict_data: dict, data_validation: bool) -> bool:
+    def _put_record(self, middleware: Callable[[dict], bool], record_dict_data: dict, data_validation: bool) -> Generator[Any, Any, bool]:
         validated_data, is_valid = self.model_virtual_map_field.transform_validate_from_write(
             value=record_dict_data, data_validation=data_validation
         )
-        put_record_success: bool = middleware(validated_data)
+        put_record_success: bool = yield middleware(validated_data)
         if put_record_success is True:
-            self._cached_data_per_primary_key[validated_data[self.primary_index_name]] = validated_data
+            self._cached_data_per_primary_key.put_record(
+                primary_key_value=validated_data[self.primary_index_name], record_data=validated_data
+            )
+            self._capture_record_version_if_need_to(primary_key_value=validated_data[self.primary_index_name], record_attributes=validated_data)
         return put_record_success
 
-    def _delete_record(self, middleware: Callable[[dict], bool], indexes_keys_selectors: dict) -> bool:
+    def _delete_record(self, middleware: Callable[[dict], bool], indexes_keys_selectors: dict) -> Generator[Any, Any, bool]:
         found_all_indexes: bool = _model_contain_all_index_keys(model=self.model, indexes_keys=indexes_keys_selectors.keys())
         if found_all_indexes is not True:
             return False
 
-        deletion_success: bool = middleware(indexes_keys_selectors)
+        deletion_success: bool = yield middleware(indexes_keys_selectors)
         if deletion_success is True:
             self._remove_index_from_cached_data(primary_key_value=indexes_keys_selectors[self.primary_index_name])
         return deletion_success
 
+    def _put_records(self, middleware: Callable[[List[dict]], List[dict]], records_dicts_data: List[dict], data_validation: bool) -> Generator[Any, Any, bool]:
+        validated_records_data: List[dict] = []
+        all_records_are_valid: bool = True
+        for record_dict_data in records_dicts_data:
+            validated_data, is_valid = self.model_virtual_map_field.transform_validate_from_write(
+                value=record_dict_data, data_validation=data_validation
+            )
+            if is_valid is True:
+                validated_records_data.append(validated_data)
+            else:
+                all_records_are_valid = False
+
+        failed_records_data: List[dict] = (yield middleware(validated_records_data)) if len(validated_records_data) > 0 else []
+        failed_primary_keys_values: set = {record_data[self.primary_index_name] for record_data in failed_records_data}
+        for validated_data in validated_records_data:
+            record_primary_key_value: str = validated_data[self.primary_index_name]
+            if record_primary_key_value not in failed_primary_keys_values:
+                self._cached_data_per_primary_key.put_record(primary_key_value=record_primary_key_value, record_data=validated_data)
+                self._capture_record_version_if_need_to(primary_key_value=record_primary_key_value, record_attributes=validated_data)
+        return all_records_are_valid is True and not len(failed_records_data) > 0
+
+    def _delete_records(self, middleware: Callable[[List[dict]], List[dict]], indexes_keys_selectors_list: List[dict]) -> Generator[Any, Any, bool]:
+        valid_indexes_keys_selectors_list: List[dict] = [
+            indexes_keys_selectors for indexes_keys_selectors in indexes_keys_selectors_list
+            if _model_contain_all_index_keys(model=self.model, indexes_keys=indexes_keys_selectors.keys()) is True
+        ]
+        failed_indexes_keys_selectors: List[dict] = (
+            (yield middleware(valid_indexes_keys_selectors_list)) if len(valid_indexes_keys_selectors_list) > 0 else []
+        )
+        failed_primary_keys_values: set = {
+            indexes_keys_selectors[self.primary_index_name] for indexes_keys_selectors in failed_indexes_keys_selectors
+        }
+        for indexes_keys_selectors in valid_indexes_keys_selectors_list:
+            record_primary_key_value: str = indexes_keys_selectors[self.primary_index_name]
+            if record_primary_key_value not in failed_primary_keys_values:
+                self._remove_index_from_cached_data(primary_key_value=record_primary_key_value)
+        return len(valid_indexes_keys_selectors_list) == len(indexes_keys_selectors_list) and not len(failed_indexes_keys_selectors) > 0
+
     def _remove_record(
             self, middleware: Callable[[dict], Optional[dict]],
             indexes_keys_selectors: dict, data_validation: bool
-    ) -> Optional[dict]:
+    ) -> Generator[Any, Any, Optional[dict]]:
         found_all_indexes: bool = _model_contain_all_index_keys(model=self.model, indexes_keys=indexes_keys_selectors.keys())
         if found_all_indexes is not True:
             return None
 
-        removed_record_data: Optional[dict] = middleware(indexes_keys_selectors)
+        removed_record_data: Optional[dict] = yield middleware(indexes_keys_selectors)
         if removed_record_data is None:
             return None
 
@@ -318,7 +617,7 @@ class BaseCachingTable(BaseTable):
     def _get_field(
             self, middleware: Callable[[Union[List[DatabasePathElement], Dict[str, List[DatabasePathElement]]], bool], Any],
             key_value: str, field_path: str, query_kwargs: Optional[dict], data_validation: bool
-    ) -> Optional[Any]:
+    ) -> Generator[Any, Any, Optional[Any]]:
 
         primary_key_field = self.table._get_primary_key_field()
         transformed_key_value: str = primary_key_field.transform_from_write(value=key_value)
@@ -339,13 +638,26 @@ class BaseCachingTable(BaseTable):
                     field_object=field_object, from_cache=True
                 )
 
-            retrieved_data: Optional[Any] = middleware(field_path_elements, False)
+            failed_retrievals_count: int = self._get_failed_retrievals_count()
+            version_path_to_capture: Optional[List[DatabasePathElement]] = self._get_version_path_to_capture(primary_key_value=transformed_key_value)
+            if version_path_to_capture is None:
+                retrieved_data: Optional[Any] = yield middleware(field_path_elements, False)
+            else:
+                # The field and the version of the record are retrieved by the same request
+                retrieved_items_data: Dict[str, Optional[Any]] = yield middleware({
+                    'field': field_path_elements, 'recordVersion': version_path_to_capture
+                }, True)
+                retrieved_data: Optional[Any] = retrieved_items_data.get('field', None)
+                if self._get_failed_retrievals_count() == failed_retrievals_count:
+                    self._cache_record_version(primary_key_value=transformed_key_value, record_version=retrieved_items_data.get('recordVersion', None))
             if retrieved_data is not None:
                 return self.validate_transform_from_read_cache_format_field_value_if_need_to(
                     value=retrieved_data, data_validation=data_validation,
                     field_object=field_object, field_path_elements=field_path_elements,
                     primary_key_value=transformed_key_value, from_cache=False
                 )
+            if self._get_failed_retrievals_count() == failed_retrievals_count:
+                self._cache_put_missing_data(primary_key_value=transformed_key_value, field_path_elements=field_path_elements)
         else:
             target_field_container: Dict[str, Tuple[BaseField, List[DatabasePathElement]]]
 
@@ -370,12 +682,20 @@ class BaseCachingTable(BaseTable):
 
             if len(target_field_container) > 0:
                 fields_paths_elements: Dict[str, List[DatabasePathElement]] = {key: item[1] for key, item in target_field_container.items()}
-                retrieved_items_data: Dict[str, Optional[Any]] = middleware(fields_paths_elements, True)
+                version_path_to_capture: Optional[List[DatabasePathElement]] = self._get_version_path_to_capture(primary_key_value=transformed_key_value)
+                if version_path_to_capture is not None:
+                    # The items keys of a multi selector are field names, which cannot contain parentheses
+                    fields_paths_elements['(recordVersion)'] = version_path_to_capture
+                failed_retrievals_count: int = self._get_failed_retrievals_count()
+                retrieved_items_data: Dict[str, Optional[Any]] = yield middleware(fields_paths_elements, True)
+                retrieval_succeeded: bool = self._get_failed_retrievals_count() == failed_retrievals_count
+                if version_path_to_capture is not None and retrieval_succeeded is True:
+                    self._cache_record_version(primary_key_value=transformed_key_value, record_version=retrieved_items_data.get('(recordVersion)', None))
                 for item_key, item_container in target_field_container.items():
                     item_field_object, item_field_path_elements = item_container
                     matching_item_data: Optional[Any] = retrieved_items_data.get(item_key, None)
                     if matching_item_data is not None:
-                        index_cached_data: dict = self._index_cached_data(primary_key_value=transformed_key_value)
+                        index_cached_data: CachedRecordData = self._index_cached_data(primary_key_value=transformed_key_value)
                         # We call index_cached_data only after the cache manipulation and if the retrieved_data is not None,
                         # to avoid instancing a cache object too soon, which could declare the record key even before we know
                         # if the record exist. Waiting for the retrieved_data to not be None ensure that the record exists.
@@ -385,20 +705,22 @@ class BaseCachingTable(BaseTable):
                             primary_key_value=transformed_key_value, from_cache=False
                         )
                     else:
+                        if retrieval_succeeded is True:
+                            self._cache_put_missing_data(primary_key_value=transformed_key_value, field_path_elements=item_field_path_elements)
                         output_items[item_key] = None
             return output_items
 
     def inner_query_fields_secondary_index(
             self, middleware: Callable[[List[List[DatabasePathElement]]], Tuple[Optional[List[Any]], QueryMetadata]],
             fields_database_paths: List[List[DatabasePathElement]],
-    ) -> Tuple[Optional[dict], QueryMetadata]:
+    ) -> Generator[Any, Any, Tuple[Optional[dict], QueryMetadata]]:
         from StructNoSQL.base_tables.shared_table_behaviors import _inner_query_fields_secondary_index
-        return _inner_query_fields_secondary_index(
+        return (yield from _inner_query_fields_secondary_index(
             primary_index_name=self.primary_index_name,
             get_primary_key_database_path=self._get_primary_key_database_path,
             middleware=middleware,
             fields_paths_elements=fields_database_paths
-        )
+        ))
 
     def format_item_value_if_need_to(self, item_value: Any):
         pass
@@ -409,11 +731,15 @@ class BaseCachingTable(BaseTable):
             data_validation: bool, record_attributes: dict, primary_key_value: str, base_output_values: Optional[Dict[str, Any]] = None
     ):
         def item_mutator(item_value: Any, item_field_path_elements: List[DatabasePathElement]) -> Any:
-            self._cache_put_data(
-                primary_key_value=primary_key_value,
-                field_path_elements=item_field_path_elements,
-                data=item_value
-            )
+            if item_value is not None:
+                self._cache_put_data(
+                    primary_key_value=primary_key_value,
+                    field_path_elements=item_field_path_elements,
+                    data=item_value
+                )
+            else:
+                # The field is missing from the retrieved record attributes
+                self._cache_put_missing_data(primary_key_value=primary_key_value, field_path_elements=item_field_path_elements)
             return self.wrap_item_value(item_value=item_value, from_cache=False)
 
         from StructNoSQL.base_tables.shared_table_behaviors import _unpack_validate_getters_record_attributes_if_need_to
@@ -427,7 +753,7 @@ class BaseCachingTable(BaseTable):
     def _shared_rar(
             self, middleware: Callable[[List[List[DatabasePathElement]]], Tuple[List[Any], QueryMetadata]],
             key_value: str, target_fields_containers: Dict[str, Tuple[BaseField, List[DatabasePathElement]]], data_validation: bool
-    ) -> Tuple[Optional[dict], QueryMetadata]:
+    ) -> Generator[Any, Any, Tuple[Optional[dict], QueryMetadata]]:
         existing_record_data: dict = {}
 
         keys_fields_already_cached_to_pop: List[str] = []
@@ -450,7 +776,7 @@ class BaseCachingTable(BaseTable):
             return {key_value: existing_record_data}, QueryMetadata(count=1, has_reached_end=True, last_evaluated_key=None)
 
         fields_paths_elements: List[List[DatabasePathElement]] = [item[1] for item in target_fields_containers.values()]
-        retrieved_records_items_data, query_metadata = middleware(fields_paths_elements)
+        retrieved_records_items_data, query_metadata = yield middleware(fields_paths_elements)
         if retrieved_records_items_data is not None and len(retrieved_records_items_data) > 0:
             # Since we query the primary_index, we know for a fact that we will never be returned more than
             # one record item. Hence why we do not have a loop that iterate over the records_items_data,
@@ -477,7 +803,7 @@ class BaseCachingTable(BaseTable):
             self, middleware: Callable[[List[List[DatabasePathElement]]], Tuple[Optional[List[Any]], QueryMetadata]],
             key_value: str, field_path: str, query_kwargs: Optional[dict], index_name: Optional[str],
             data_validation: bool
-    ) -> Tuple[Optional[dict], QueryMetadata]:
+    ) -> Generator[Any, Any, Tuple[Optional[dict], QueryMetadata]]:
 
         target_field_container, is_multi_selector = process_and_make_single_rendered_database_path(
             field_path=field_path, fields_switch=self.fields_switch, query_kwargs=query_kwargs
@@ -489,7 +815,7 @@ class BaseCachingTable(BaseTable):
                 target_field_container: Tuple[BaseField, List[DatabasePathElement]]
                 fields_database_paths: List[List[DatabasePathElement]] = [target_field_container[1]]
 
-                records_attributes, query_metadata = self.inner_query_fields_secondary_index(
+                records_attributes, query_metadata = yield from self.inner_query_fields_secondary_index(
                     middleware=middleware, fields_database_paths=fields_database_paths
                 )
                 for record_key, record_attributes in records_attributes.items():
@@ -511,7 +837,7 @@ class BaseCachingTable(BaseTable):
                 target_field_container: Dict[str, Tuple[BaseField, List[DatabasePathElement]]]
                 fields_database_paths: List[List[DatabasePathElement]] = [item[1] for item in target_field_container.values()]
 
-                records_attributes, query_metadata = self.inner_query_fields_secondary_index(
+                records_attributes, query_metadata = yield from self.inner_query_fields_secondary_index(
                     middleware=middleware, fields_database_paths=fields_database_paths
                 )
                 for record_key, record_item_attributes in records_attributes.items():
@@ -550,7 +876,7 @@ class BaseCachingTable(BaseTable):
                     output_item_value = self.wrap_item_value(item_value=field_value_from_cache, from_cache=True)
                     return {key_value: output_item_value}, query_metadata
 
-                records_attributes, query_metadata = middleware([field_path_elements])
+                records_attributes, query_metadata = yield middleware([field_path_elements])
                 if records_attributes is not None and len(records_attributes) > 0:
                     # Since we query the primary_index, we know for a fact that we will never be returned more than
                     # one record item. Hence why we do not have a loop that iterate over the records_items_data,
@@ -570,11 +896,11 @@ class BaseCachingTable(BaseTable):
                 return None, query_metadata
             else:
                 target_field_container: Dict[str, Tuple[BaseField, List[DatabasePathElement]]]
-                return self._shared_rar(
+                return (yield from self._shared_rar(
                     middleware=middleware, key_value=key_value,
                     target_fields_containers=target_field_container,
                     data_validation=data_validation
-                )
+                ))
 
     def _prepare_getters_with_cache(self, data_validation: bool, key_value: str, getters: Dict[str, FieldGetter]) -> Tuple[
         dict,
@@ -628,7 +954,7 @@ class BaseCachingTable(BaseTable):
                             field_object=item_field_object, from_cache=True
                         )
                     else:
-                        container_fields[getter_key] = item_target_field_container
+                        container_fields[item_key] = item_target_field_container
                         getters_database_paths.append(item_field_path_elements)
 
                 grouped_getters_target_fields_containers[getter_key] = container_fields
@@ -647,7 +973,7 @@ class BaseCachingTable(BaseTable):
             self._prepare_getters_with_cache(data_validation=data_validation, key_value=transformed_key_value, getters=getters)
         )
         if index_name is None or index_name == self.primary_index_name:
-            records_attributes, query_metadata = middleware(getters_database_paths)
+            records_attributes, query_metadata = yield middleware(getters_database_paths)
             if records_attributes is not None and len(records_attributes) > 0:
                 # Since we query the primary_index, we know for a fact that we will never be returned more than
                 # one record item. Hence why we do not have a loop that iterate over the records_items_data,
@@ -661,7 +987,7 @@ class BaseCachingTable(BaseTable):
                 return {key_value: record_values}, query_metadata
             return None, query_metadata
         else:
-            records_attributes, query_metadata = self.inner_query_fields_secondary_index(
+            records_attributes, query_metadata = yield from self.inner_query_fields_secondary_index(
                 middleware=middleware, fields_database_paths=getters_database_paths
             )
             output_records_values: dict = {
@@ -677,19 +1003,31 @@ class BaseCachingTable(BaseTable):
     def _get_multiple_fields(
             self, middleware: Callable[[List[List[DatabasePathElement]]], Any],
             key_value: str, getters: Dict[str, FieldGetter], data_validation: bool
-    ) -> Optional[dict]:
+    ) -> Generator[Any, Any, Optional[dict]]:
 
         existing_values, getters_database_paths, single_getters_target_fields_containers, grouped_getters_target_fields_containers = (
             self._prepare_getters_with_cache(data_validation=data_validation, key_value=key_value, getters=getters)
         )
-
-        record_attributes: Optional[dict] = middleware(getters_database_paths)
+        if not len(getters_database_paths) > 0:
+            # All the getters have been found in the cache (including the fields known to be missing from the database)
+            return existing_values
+
+        version_path_to_capture: Optional[List[DatabasePathElement]] = self._get_version_path_to_capture(primary_key_value=key_value)
+        failed_retrievals_count: int = self._get_failed_retrievals_count()
+        record_attributes: Optional[dict] = yield middleware(
+            getters_database_paths if version_path_to_capture is None else [*getters_database_paths, version_path_to_capture]
+        )
+        if version_path_to_capture is not None and self._get_failed_retrievals_count() == failed_retrievals_count:
+            self._capture_record_version_if_need_to(primary_key_value=key_value, record_attributes=record_attributes)
         if record_attributes is None:
+            if self._get_failed_retrievals_count() == failed_retrievals_count:
+                for field_path_elements in getters_database_paths:
+                    self._cache_put_missing_data(primary_key_value=key_value, field_path_elements=field_path_elements)
             # We first create a None value for each of the getters items, then we override with
             # the existing_values. This ensures that all the getters keys are always specified.
             return {**{getter_key: None for getter_key in getters.keys()}, **existing_values}
 
-        index_cached_data: dict = self._index_cached_data(primary_key_value=key_value)
+        index_cached_data: CachedRecordData = self._index_cached_data(primary_key_value=key_value)
         unpacked_retrieved_items: dict = self.unpack_validate_cache_getters_record_attributes_if_need_to(
             data_validation=data_validation, record_attributes=record_attributes,
             primary_key_value=key_value,
@@ -698,6 +1036,147 @@ class BaseCachingTable(BaseTable):
         )
         return {**existing_values, **unpacked_retrieved_items}
 
+    def _get_multiple_records_fields(
+            self, middleware: Callable[[List[List[DatabasePathElement]], List[str]], Dict[str, Optional[dict]]],
+            keys_values: List[str], getters: Dict[str, FieldGetter], data_validation: bool
+    ) -> Generator[Any, Any, Dict[str, Dict[str, Optional[Any]]]]:
+
+        prepared_getters_per_record: Dict[str, tuple] = {}
+        keys_values_to_retrieve: List[str] = []
+        # The projection of a batch get request is shared by all of its keys. We use the union of
+        # the fields that are missing from the cache of each record, and only request the records
+        # that are missing at least one field. Any additional field retrieved for a record is ignored.
+        union_getters_database_paths: Dict[str, List[DatabasePathElement]] = {}
+        for key_value in keys_values:
+            if key_value in prepared_getters_per_record:
+                continue
+            record_prepared_getters = self._prepare_getters_with_cache(
+                data_validation=data_validation, key_value=key_value, getters=getters
+            )
+            prepared_getters_per_record[key_value] = record_prepared_getters
+            record_getters_database_paths: List[List[DatabasePathElement]] = record_prepared_getters[1]
+            if len(record_getters_database_paths) > 0:
+                keys_values_to_retrieve.append(key_value)
+                for field_path_elements in record_getters_database_paths:
+                    union_getters_database_paths[join_field_path_elements(field_path_elements)] = field_path_elements
+                version_path_to_capture: Optional[List[DatabasePathElement]] = self._get_version_path_to_capture(primary_key_value=key_value)
+                if version_path_to_capture is not None:
+                    union_getters_database_paths[join_field_path_elements(version_path_to_capture)] = version_path_to_capture
+
+        failed_retrievals_count: int = self._get_failed_retrievals_count()
+        records_attributes: Dict[str, Optional[dict]] = (
+            (yield middleware(list(union_getters_database_paths.values()), keys_values_to_retrieve))
+            if len(keys_values_to_retrieve) > 0 else {}
+        )
+        if self._get_failed_retrievals_count() == failed_retrievals_count:
+            for key_value in keys_values_to_retrieve:
+                self._capture_record_version_if_need_to(primary_key_value=key_value, record_attributes=records_attributes.get(key_value, None))
+                if key_value not in records_attributes:
+                    # The record does not exist, so any of its fields can be answered as missing from the cache
+                    self._cache_put_missing_data(primary_key_value=key_value, field_path_elements=[])
+
+        output_records_values: Dict[str, Dict[str, Optional[Any]]] = {}
+        for key_value, record_prepared_getters in prepared_getters_per_record.items():
+            existing_values, _, single_getters_target_fields_containers, grouped_getters_target_fields_containers = record_prepared_getters
+            record_attributes: Optional[dict] = records_attributes.get(key_value, None)
+            if record_attributes is None:
+                output_records_values[key_value] = {**{getter_key: None for getter_key in getters.keys()}, **existing_values}
+            else:
+                unpacked_retrieved_items: dict = self.unpack_validate_cache_getters_record_attributes_if_need_to(
+                    data_validation=data_validation, record_attributes=record_attributes,
+                    primary_key_value=key_value,
+                    single_getters_target_fields_containers=single_getters_target_fields_containers,
+                    grouped_getters_target_fields_containers=grouped_getters_target_fields_containers
+                )
+                output_records_values[key_value] = {**existing_values, **unpacked_retrieved_items}
+        return output_records_values
+
+    def _render_prefetch_getters_paths(self, getters: Dict[str, FieldGetter]) -> List[Tuple[BaseField, List[DatabasePathElement]]]:
+        targets_fields_containers: List[Tuple[BaseField, List[DatabasePathElement]]] = []
+        for getter_item in getters.values():
+            target_field_container, is_multi_selector = process_and_make_single_rendered_database_path(
+                field_path=getter_item.field_path, fields_switch=self.fields_switch, query_kwargs=getter_item.query_kwargs
+            )
+            if is_multi_selector is not True:
+                targets_fields_containers.append(target_field_container)
+            else:
+                targets_fields_containers.extend(target_field_container.values())
+        return targets_fields_containers
+
+    def _prefetch_record_projection(
+            self, primary_key_value: str, record_item: dict, data_validation: bool,
+            targets_fields_containers: List[Tuple[BaseField, List[DatabasePathElement]]]
+    ) -> None:
+        for field_object, field_path_elements in targets_fields_containers:
+            if any(path_element.default_type in (list, set) for path_element in field_path_elements[:-1]):
+                # The items of lists and sets are not navigated into, so their paths are left to the get operations
+                continue
+            navigated_item: Any = record_item
+            for path_element in field_path_elements:
+                navigated_item = (
+                    navigated_item.get(path_element.element_key, None)
+                    if isinstance(navigated_item, dict) else None
+                )
+            if navigated_item is not None:
+                validated_data, is_valid = field_object.transform_validate_from_read(value=navigated_item, data_validation=data_validation)
+                self._cache_put_data(primary_key_value=primary_key_value, field_path_elements=field_path_elements, data=validated_data)
+            else:
+                # Declares the record in the cache, so that the path can be marked as complete
+                self._index_cached_data(primary_key_value=primary_key_value)
+            self._cached_data_per_primary_key.mark_path_complete(
+                primary_key_value=primary_key_value, path_keys=self._make_cache_path_keys(field_path_elements)
+            )
+
+    def _prefetch_records(
+            self, middleware: Callable[[Optional[List[List[DatabasePathElement]]], List[str]], Dict[str, Optional[dict]]],
+            keys_values: List[str], getters: Optional[Dict[str, FieldGetter]], data_validation: bool
+    ) -> Generator[Any, Any, Dict[str, Optional[bool]]]:
+        # Loads the entire records (or only the fields of the getters) with batched requests, and marks their loaded paths as
+        # complete, so that the fields missing from the loaded paths are retrieved from the cache as None. The records with
+        # pending operations are not prefetched, since their cached data is more recent than the data of the database.
+        keys_values_to_prefetch: List[str] = [
+            key_value for key_value in dict.fromkeys(keys_values)
+            if self._is_record_cache_evictable(primary_key_value=key_value)
+        ]
+        targets_fields_containers: Optional[List[Tuple[BaseField, List[DatabasePathElement]]]] = (
+            self._render_prefetch_getters_paths(getters=getters) if getters is not None else None
+        )
+        failed_retrievals_count: int = self._get_failed_retrievals_count()
+        records_items: Dict[str, Optional[dict]] = (yield middleware(
+            [
+                *[field_path_elements for _, field_path_elements in targets_fields_containers],
+                *([self._version_field.database_path] if self._version_field is not None else [])
+            ] if targets_fields_containers is not None else None,
+            keys_values_to_prefetch
+        )) if len(keys_values_to_prefetch) > 0 else {}
+        retrieval_succeeded: bool = self._get_failed_retrievals_count() == failed_retrievals_count
+
+        for key_value in keys_values_to_prefetch:
+            record_item: Optional[dict] = records_items.get(key_value, None)
+            if record_item is None:
+                if retrieval_succeeded is True:
+                    self._capture_record_version_if_need_to(primary_key_value=key_value, record_attributes=None)
+                    self._cache_put_missing_data(primary_key_value=key_value, field_path_elements=[])
+                continue
+            if targets_fields_containers is None:
+                validated_record_data, is_valid = self.model_virtual_map_field.transform_validate_from_read(
+                    value=record_item, data_validation=data_validation
+                )
+                self._cached_data_per_primary_key.put_record(primary_key_value=key_value, record_data=validated_record_data)
+                self._cached_data_per_primary_key.mark_path_complete(primary_key_value=key_value, path_keys=())
+            else:
+                self._prefetch_record_projection(
+                    primary_key_value=key_value, record_item=record_item, data_validation=data_validation,
+                    targets_fields_containers=targets_fields_containers
+                )
+            self._capture_record_version_if_need_to(primary_key_value=key_value, record_attributes=record_item)
+        return {
+            key_value: (
+                True if key_value in records_items else
+                False if key_value in keys_values_to_prefetch and retrieval_succeeded is True else None
+            ) for key_value in keys_values
+        }
+
     def _update_field(self, key_value: str, field_path: str, value_to_set: Any, query_kwargs: Optional[dict] = None) -> bool:
         field_object, field_path_elements, validated_data, is_valid = process_transforme_validate_data_from_write_and_make_single_rendered_database_path(
             field_path=field_path, fields_switch=self.fields_switch, query_kwargs=query_kwargs, data_to_validate=value_to_set
@@ -711,7 +1190,8 @@ class BaseCachingTable(BaseTable):
             joined_field_path = join_field_path_elements(field_path_elements)
             pending_update_operations = self._index_pending_update_operations(primary_key_value=key_value)
             pending_update_operations[joined_field_path] = FieldPathSetter(
-                field_path_elements=field_path_elements, value_to_set=validated_data
+                field_path_elements=field_path_elements, value_to_set=validated_data,
+                value_serializer=field_object.dynamodb_serializers.encode
             )
             return True
         return False
@@ -719,7 +1199,7 @@ class BaseCachingTable(BaseTable):
     def _update_field_return_old(
             self, middleware: Callable[[List[DatabasePathElement], Any], Tuple[bool, Optional[Any]]],
             key_value: str, field_path: str, value_to_set: Any, query_kwargs: Optional[dict], data_validation: bool
-    ) -> Tuple[bool, Optional[Any]]:
+    ) -> Generator[Any, Any, Tuple[bool, Optional[Any]]]:
 
         field_object, field_path_elements, validated_update_data, update_data_is_valid = process_transforme_validate_data_from_write_and_make_single_rendered_database_path(
             field_path=field_path, fields_switch=self.fields_switch, query_kwargs=query_kwargs, data_to_validate=value_to_set
@@ -734,23 +1214,25 @@ class BaseCachingTable(BaseTable):
         if found_value_in_cache is True:
             # When the old value of our field is found in cache, we are not forced to perform a database operation right away in order
             # to know the old value of our field, but we still need to schedule an update operation, then update the in memory cache.
-            joined_field_path = join_field_path_elements(field_path_elements)
-            pending_update_operations = self._index_pending_update_operations(primary_key_value=key_value)
-            pending_update_operations[joined_field_path] = FieldPathSetter(
-                field_path_elements=field_path_elements, value_to_set=validated_update_data
-            )
+            with self._pending_operations_lock:
+                joined_field_path = join_field_path_elements(field_path_elements)
+                pending_update_operations = self._index_pending_update_operations(primary_key_value=key_value)
+                pending_update_operations[joined_field_path] = FieldPathSetter(
+                    field_path_elements=field_path_elements, value_to_set=validated_update_data,
+                    value_serializer=field_object.dynamodb_serializers.encode
+                )
 
-            self._cache_put_data(
-                primary_key_value=key_value,
-                field_path_elements=field_path_elements,
-                data=validated_update_data
-            )
+                self._cache_put_data(
+                    primary_key_value=key_value,
+                    field_path_elements=field_path_elements,
+                    data=validated_update_data
+                )
             return True, self._transform_validate_from_write_format_field_value_if_need_to(
                 value=field_value_from_cache, data_validation=data_validation,
                 field_object=field_object, from_cache=True
             )
         else:
-            update_success, response_attributes = middleware(field_path_elements, validated_update_data)
+            update_success, response_attributes = yield middleware(field_path_elements, validated_update_data)
             if update_success is not True:
                 return False, None
 
@@ -786,7 +1268,8 @@ class BaseCachingTable(BaseTable):
                     joined_field_path = join_field_path_elements(field_path_elements)
                     pending_update_operations = self._index_pending_update_operations(primary_key_value=key_value)
                     pending_update_operations[joined_field_path] = FieldPathSetter(
-                        field_path_elements=field_path_elements, value_to_set=validated_data
+                        field_path_elements=field_path_elements, value_to_set=validated_data,
+                        value_serializer=field_object.dynamodb_serializers.encode
                     )
             elif isinstance(current_setter, UnsafeFieldSetter):
                 raise Exception(f"UnsafeFieldSetter not supported in caching_table")
@@ -816,57 +1299,60 @@ class BaseCachingTable(BaseTable):
     def _update_multiple_fields_return_old(
             self, middleware: Callable[[Dict[str, FieldPathSetter]], Tuple[bool, Optional[dict]]],
             key_value: str, setters: Dict[str, FieldSetter], data_validation: bool
-    ) -> Tuple[bool, Dict[str, Optional[Any]]]:
+    ) -> Generator[Any, Any, Tuple[bool, Dict[str, Optional[Any]]]]:
 
         setters_containers: Dict[str, Tuple[BaseField, List[DatabasePathElement]]] = {}
         dynamodb_setters: Dict[str, FieldPathSetter] = {}
         output_data: Dict[str, Optional[Any]] = {}
 
-        for setter_key, setter_item in setters.items():
-            field_object, field_path_elements, validated_data, is_valid = process_transforme_validate_data_from_write_and_make_single_rendered_database_path(
-                field_path=setter_item.field_path, fields_switch=self.fields_switch,
-                query_kwargs=setter_item.query_kwargs, data_to_validate=setter_item.value_to_set
-            )
-            if is_valid is True:
-                found_value_in_cache, field_value_from_cache = self._cache_get_data(
-                    primary_key_value=key_value, field_path_elements=field_path_elements
+        with self._pending_operations_lock:
+            for setter_key, setter_item in setters.items():
+                field_object, field_path_elements, validated_data, is_valid = process_transforme_validate_data_from_write_and_make_single_rendered_database_path(
+                    field_path=setter_item.field_path, fields_switch=self.fields_switch,
+                    query_kwargs=setter_item.query_kwargs, data_to_validate=setter_item.value_to_set
                 )
-                if found_value_in_cache is True:
-                    # When the old value of our field is found in cache, we are not forced to perform a database operation right away in order
-                    # to know the old value of our field, but we still need to schedule an update operation, then update the in memory cache.
-                    joined_field_path = join_field_path_elements(field_path_elements)
-                    pending_update_operations = self._index_pending_update_operations(primary_key_value=key_value)
-                    pending_update_operations[joined_field_path] = FieldPathSetter(
-                        field_path_elements=field_path_elements, value_to_set=validated_data
+                if is_valid is True:
+                    found_value_in_cache, field_value_from_cache = self._cache_get_data(
+                        primary_key_value=key_value, field_path_elements=field_path_elements
                     )
+                    if found_value_in_cache is True:
+                        # When the old value of our field is found in cache, we are not forced to perform a database operation right away in order
+                        # to know the old value of our field, but we still need to schedule an update operation, then update the in memory cache.
+                        joined_field_path = join_field_path_elements(field_path_elements)
+                        pending_update_operations = self._index_pending_update_operations(primary_key_value=key_value)
+                        pending_update_operations[joined_field_path] = FieldPathSetter(
+                            field_path_elements=field_path_elements, value_to_set=validated_data,
+                            value_serializer=field_object.dynamodb_serializers.encode
+                        )
 
-                    self._cache_put_data(
-                        primary_key_value=key_value,
-                        field_path_elements=field_path_elements,
-                        data=validated_data
-                    )
+                        self._cache_put_data(
+                            primary_key_value=key_value,
+                            field_path_elements=field_path_elements,
+                            data=validated_data
+                        )
 
-                    output_data[setter_key] = self._transform_validate_from_write_format_field_value_if_need_to(
-                        value=field_value_from_cache, data_validation=data_validation,
-                        field_object=field_object, from_cache=True
-                    )
-                else:
-                    setters_containers[setter_key] = (field_object, field_path_elements)
-                    dynamodb_setters[setter_key] = FieldPathSetter(
-                        field_path_elements=field_path_elements, value_to_set=validated_data
-                    )
-                    self._cache_put_data(
-                        primary_key_value=key_value,
-                        field_path_elements=field_path_elements,
-                        data=validated_data
-                    )
+                        output_data[setter_key] = self._transform_validate_from_write_format_field_value_if_need_to(
+                            value=field_value_from_cache, data_validation=data_validation,
+                            field_object=field_object, from_cache=True
+                        )
+                    else:
+                        setters_containers[setter_key] = (field_object, field_path_elements)
+                        dynamodb_setters[setter_key] = FieldPathSetter(
+                            field_path_elements=field_path_elements, value_to_set=validated_data,
+                            value_serializer=field_object.dynamodb_serializers.encode
+                        )
+                        self._cache_put_data(
+                            primary_key_value=key_value,
+                            field_path_elements=field_path_elements,
+                            data=validated_data
+                        )
 
         if not len(dynamodb_setters) > 0:
             # If all the fields old values have been found in cache, and their update
             # have been scheduled, but we do not need to send a database request.
             return True, output_data
 
-        update_success, setters_response_attributes = middleware(dynamodb_setters)
+        update_success, setters_response_attributes = yield middleware(dynamodb_setters)
 
         for item_key, item_container in setters_containers.items():
             item_field_object, item_field_path_elements = item_container
@@ -885,7 +1371,7 @@ class BaseCachingTable(BaseTable):
     def _remove_field(
             self, middleware: Callable[[List[List[DatabasePathElement]]], Any],
             key_value: str, field_path: str, query_kwargs: Optional[dict], data_validation: bool
-    ) -> Optional[Any]:
+    ) -> Generator[Any, Any, Optional[Any]]:
 
         target_field_container, is_multi_selector = process_and_make_single_rendered_database_path(
             field_path=field_path, fields_switch=self.fields_switch, query_kwargs=query_kwargs
@@ -899,12 +1385,13 @@ class BaseCachingTable(BaseTable):
                 primary_key_value=key_value, field_path_elements=field_path_elements
             )
             if found_value_in_cache is True:
-                pending_remove_operations = self._index_pending_remove_operations(primary_key_value=key_value)
-                self._cache_add_delete_operation(
-                    primary_key_value=key_value,
-                    pending_remove_operations=pending_remove_operations,
-                    field_path_elements=field_path_elements
-                )
+                with self._pending_operations_lock:
+                    pending_remove_operations = self._index_pending_remove_operations(primary_key_value=key_value)
+                    self._cache_add_delete_operation(
+                        primary_key_value=key_value,
+                        pending_remove_operations=pending_remove_operations,
+                        field_path_elements=field_path_elements
+                    )
                 # Even when we retrieve a removed value from the cache, and that we do not need to perform a remove operation right away to retrieve
                 # the removed value, we still want to add a delete_operation that will be performed on operation commits, because if we remove a value
                 # from the cache, it does not remove a potential older value present in the database, that the remove operation should remove.
@@ -914,11 +1401,12 @@ class BaseCachingTable(BaseTable):
                 )
             else:
                 target_path_elements: List[List[DatabasePathElement]] = [field_path_elements]
-                self._cache_remove_field(
-                    primary_key_value=key_value,
-                    field_path_elements=field_path_elements
-                )
-                response_attributes: Optional[dict] = middleware(target_path_elements)
+                with self._pending_operations_lock:
+                    self._cache_remove_field(
+                        primary_key_value=key_value,
+                        field_path_elements=field_path_elements
+                    )
+                response_attributes: Optional[dict] = yield middleware(target_path_elements)
                 removed_item_data: Optional[Any] = navigate_into_data_with_field_path_elements(
                     data=response_attributes, field_path_elements=field_path_elements,
                     num_keys_to_navigation_into=len(field_path_elements)
@@ -933,32 +1421,33 @@ class BaseCachingTable(BaseTable):
             target_path_elements: List[List[DatabasePathElement]] = []
             container_output_data: Dict[str, Any] = {}
 
-            for item_key, item_container in target_field_container.items():
-                item_field_object, item_field_path_elements = item_container
+            with self._pending_operations_lock:
+                for item_key, item_container in target_field_container.items():
+                    item_field_object, item_field_path_elements = item_container
 
-                found_item_value_in_cache, field_item_value_from_cache = self._cache_get_data(
-                    primary_key_value=key_value, field_path_elements=item_field_path_elements
-                )
-                if found_item_value_in_cache is True:
-                    pending_remove_operations = self._index_pending_remove_operations(primary_key_value=key_value)
-                    self._cache_add_delete_operation(
-                        primary_key_value=key_value,
-                        pending_remove_operations=pending_remove_operations,
-                        field_path_elements=item_field_path_elements
-                    )
-                    container_output_data[item_key] = self._transform_validate_from_write_format_field_value_if_need_to(
-                        value=field_item_value_from_cache, data_validation=data_validation,
-                        field_object=item_field_object, from_cache=True
-                    )
-                else:
-                    target_path_elements.append(item_field_path_elements)
-                    self._cache_remove_field(
-                        primary_key_value=key_value,
-                        field_path_elements=item_field_path_elements
+                    found_item_value_in_cache, field_item_value_from_cache = self._cache_get_data(
+                        primary_key_value=key_value, field_path_elements=item_field_path_elements
                     )
+                    if found_item_value_in_cache is True:
+                        pending_remove_operations = self._index_pending_remove_operations(primary_key_value=key_value)
+                        self._cache_add_delete_operation(
+                            primary_key_value=key_value,
+                            pending_remove_operations=pending_remove_operations,
+                            field_path_elements=item_field_path_elements
+                        )
+                        container_output_data[item_key] = self._transform_validate_from_write_format_field_value_if_need_to(
+                            value=field_item_value_from_cache, data_validation=data_validation,
+                            field_object=item_field_object, from_cache=True
+                        )
+                    else:
+                        target_path_elements.append(item_field_path_elements)
+                        self._cache_remove_field(
+                            primary_key_value=key_value,
+                            field_path_elements=item_field_path_elements
+                        )
 
             if len(target_path_elements) > 0:
-                response_attributes: Optional[dict] = middleware(target_path_elements)
+                response_attributes: Optional[dict] = yield middleware(target_path_elements)
                 for item_key, item_container in target_field_container.items():
                     item_field_object, item_field_path_elements = item_container
 
@@ -985,7 +1474,7 @@ class BaseCachingTable(BaseTable):
     def _grouped_remove_multiple_fields(
             self, middleware: Callable[[List[List[DatabasePathElement]]], Any],
             key_value: str, removers: Dict[str, FieldRemover], data_validation: bool
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Generator[Any, Any, Optional[Dict[str, Any]]]:
         # todo: do not perform the operation but store it as pending if a matching value exists in the cache
         if not len(removers) > 0:
             # If no remover has been specified, we do not run the database
@@ -1001,37 +1490,38 @@ class BaseCachingTable(BaseTable):
             # todo: add the remove items present in cache to the output_data instead of only returning the items not removed from cache
 
             removers_database_paths: List[List[DatabasePathElement]] = []
-            for remover_key, remover_item in removers.items():
-                target_field_container, is_multi_selector = process_and_make_single_rendered_database_path(
-                    field_path=remover_item.field_path, fields_switch=self.fields_switch,
-                    query_kwargs=remover_item.query_kwargs
-                )
-                if is_multi_selector is not True:
-                    target_field_container: Tuple[BaseField, List[DatabasePathElement]]
-                    field_object, field_path_elements = target_field_container
-
-                    removers_field_paths_elements[remover_key] = target_field_container
-                    removers_database_paths.append(field_path_elements)
-                    self._cache_remove_field(
-                        index_cached_data=index_cached_data,
-                        primary_key_value=key_value,
-                        field_path_elements=field_path_elements
+            with self._pending_operations_lock:
+                for remover_key, remover_item in removers.items():
+                    target_field_container, is_multi_selector = process_and_make_single_rendered_database_path(
+                        field_path=remover_item.field_path, fields_switch=self.fields_switch,
+                        query_kwargs=remover_item.query_kwargs
                     )
-                else:
-                    target_field_container: Dict[str, Tuple[BaseField, List[DatabasePathElement]]]
-
-                    grouped_removers_field_paths_elements[remover_key] = target_field_container
-                    for item_container in target_field_container.values():
-                        item_field_object, item_field_path_elements = item_container
+                    if is_multi_selector is not True:
+                        target_field_container: Tuple[BaseField, List[DatabasePathElement]]
+                        field_object, field_path_elements = target_field_container
 
-                        removers_database_paths.append(item_field_path_elements)
+                        removers_field_paths_elements[remover_key] = target_field_container
+                        removers_database_paths.append(field_path_elements)
                         self._cache_remove_field(
                             index_cached_data=index_cached_data,
                             primary_key_value=key_value,
-                            field_path_elements=item_field_path_elements
+                            field_path_elements=field_path_elements
                         )
+                    else:
+                        target_field_container: Dict[str, Tuple[BaseField, List[DatabasePathElement]]]
+
+                        grouped_removers_field_paths_elements[remover_key] = target_field_container
+                        for item_container in target_field_container.values():
+                            item_field_object, item_field_path_elements = item_container
+
+                            removers_database_paths.append(item_field_path_elements)
+                            self._cache_remove_field(
+                                index_cached_data=index_cached_data,
+                                primary_key_value=key_value,
+                                field_path_elements=item_field_path_elements
+                            )
 
-            record_attributes = middleware(removers_database_paths)
+            record_attributes = yield middleware(removers_database_paths)
             if record_attributes is None:
                 return None
 
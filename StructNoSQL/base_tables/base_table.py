@@ -1,40 +1,240 @@
+import copy
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import threading
 from copy import deepcopy
-from typing import Optional, List, Any, Set, _GenericAlias, Callable, Dict, Type
+from dataclasses import dataclass
+from typing import Optional, List, Any, Set, _GenericAlias, Callable, Dict, Type, Generator, Tuple
 
 from StructNoSQL.models import DatabasePathElement, FieldRemover
 from StructNoSQL.fields import BaseField, MapItem, TableDataModel, DictModel, MapModel, BaseItem
 from StructNoSQL.practical_logger import message_with_vars
 from StructNoSQL.tables_clients.backend import PrimaryIndex
+from StructNoSQL.tables_clients.backend.dynamodb_utils import DynamoDBSerializers
+from StructNoSQL.tables_clients.backend.operations import ConcurrentOperations
 from StructNoSQL.utils.misc_fields_items import try_to_get_primitive_default_type_of_item, make_dict_key_var_name
+from StructNoSQL.utils.process_render_fields_paths import FieldPathsCompiler
 from StructNoSQL.utils.types import PRIMITIVE_TYPES
+from StructNoSQL.utils.decimals import SHORTEST_FLOAT_CONVERSION, get_float_to_decimal_function
+from StructNoSQL.base_tables.schema_serializers import compile_table_serializers, SchemaSerializersCompiler
+from StructNoSQL.base_tables.schema_cache import compute_model_source_hash, make_schema_cache_file_path, \
+    read_schema_file, write_schema_file, load_processed_schema, export_processed_schema
 
 
 # todo: add ability to add or remove items from list's
 
 
+DYNAMODB_MAX_NESTED_DEPTH = 32
+
+
 class FieldsSwitch(dict):
     def __init__(self, *args, **kwargs):
         super(dict).__init__(*args, **kwargs)
+        # The compiled fields paths are cleared when a field is set, since they contain the fields objects
+        self.paths_compiler = FieldPathsCompiler(fields_switch=self)
+        # The nested levels of the {i} recursive fields are only added to the fields switch when a field path targets them
+        self.recursive_fields: Dict[str, RecursiveField] = {}
+        self.serializers_compiler: Optional[SchemaSerializersCompiler] = None
+        self._recursive_fields_lock = threading.Lock()
 
     def set(self, key: str, item: BaseField) -> bool:
-        if len(item.database_path) > 32:
+        if len(item.database_path) > DYNAMODB_MAX_NESTED_DEPTH:
             print("\nDynamoDB support a maximum depth of nested of items of 32. This is not imposed by StructNoSQL but by DynamoDB.\n"
                   "See : https://docs.aws.amazon.com/amazondynamodb/latest/developerguide/Limits.html#limits-attributes")
             return False
         else:
             self.__setitem__(key, item)
+            self.paths_compiler.clear()
             return True
 
+    def add_recursive_field(self, field_path: str, field: BaseField) -> None:
+        # Like the fields, a recursive field processed again replaces the recursive field with the same field path
+        self.recursive_fields[field_path] = RecursiveField(field_path=field_path, field=field)
+
+    def get(self, key: str, default: Optional[BaseItem] = None) -> Optional[BaseItem]:
+        field_object: Optional[BaseItem] = dict.get(self, key, None)
+        if field_object is None and len(self.recursive_fields) > 0:
+            field_object = self._expand_recursive_fields(field_path=key)
+        return field_object if field_object is not None else default
+
+    def __missing__(self, key: str) -> BaseItem:
+        field_object: Optional[BaseItem] = self._expand_recursive_fields(field_path=key) if len(self.recursive_fields) > 0 else None
+        if field_object is None:
+            raise KeyError(key)
+        return field_object
+
+    def _expand_recursive_fields(self, field_path: str) -> Optional[BaseItem]:
+        with self._recursive_fields_lock:
+            field_object: Optional[BaseItem] = dict.get(self, field_path, None)
+            if field_object is not None:
+                # The field has been expanded by another thread
+                return field_object
+            # The recursive fields found in the expanded levels are added to the recursive_fields, and are expanded by the
+            # next pass, until the expansion of the field_path does not find new recursive fields.
+            num_checked_recursive_fields = 0
+            while num_checked_recursive_fields < len(self.recursive_fields):
+                num_checked_recursive_fields = len(self.recursive_fields)
+                for recursive_field in list(self.recursive_fields.values()):
+                    num_levels: int = recursive_field.get_num_levels_of_field_path(field_path=field_path)
+                    if num_levels > recursive_field.num_expanded_levels:
+                        expanded_fields, expanded_recursive_fields = recursive_field.expand(num_levels=num_levels)
+                        for expanded_field_path, expanded_field_object in expanded_fields.items():
+                            if self.serializers_compiler is not None:
+                                expanded_field_object.dynamodb_serializers = self.serializers_compiler.compile_field(field=expanded_field_object)
+                            # The fields paths already compiled are not cleared, since the expanded fields are only new fields
+                            self.__setitem__(expanded_field_path, expanded_field_object)
+                        for expanded_recursive_field_path, expanded_recursive_field in expanded_recursive_fields:
+                            self.add_recursive_field(field_path=expanded_recursive_field_path, field=expanded_recursive_field)
+            return dict.get(self, field_path, None)
+
+
+class RecursiveField:
+    # A field with a {i} key_name (like a Dict of ActiveSelf items), whose nested levels are only created when a field path
+    # targets them (like 'childProperties.{{childPropertyKey0}}.childProperties.{{childPropertyKey1}}.name' for the second
+    # level) instead of creating all the levels up to the max_nested_depth of the field when the table is created. A level
+    # is made of the MapItem of the items of the field, and of copies of the fields of the items model (each with its own
+    # database path), copied from templates of these fields that are processed only once, when the first level is created.
+    def __init__(self, field_path: str, field: BaseField):
+        self.field_path = field_path
+        self.field = field
+        self.num_expanded_levels = 0
+        self._items_fields_templates: Optional[FieldsSwitch] = None
+        # The field whose items are the next level to expand (the recursive field itself, then its copies at each level)
+        self._next_level_parent_field: BaseField = field
+        self._next_level_parent_field_path: str = field_path
+
+    def render_level_key_name(self, i_level: int) -> str:
+        return self.field.key_name.replace("{i}", f"{i_level}")
+
+    def get_num_levels_of_field_path(self, field_path: str) -> int:
+        # Returns the number of levels required by the field_path, or zero if the field_path does not target the levels
+        if not field_path.startswith(self.field_path):
+            return 0
+        level_separator = f".{self.field.field_name}"
+        position: int = len(self.field_path)
+        i_level = 0
+        while True:
+            level_key = ".{{" + self.render_level_key_name(i_level) + "}}"
+            if not field_path.startswith(level_key, position):
+                return i_level
+            position += len(level_key)
+            i_level += 1
+            if not field_path.startswith(level_separator + ".{{", position):
+                return i_level
+            position += len(level_separator)
+
+    def _make_items_fields_templates(self) -> FieldsSwitch:
+        # The fields of the items model, with database paths relative to an item of the field. The {i} fields directly in
+        # the items model (like the field itself with ActiveSelf items) are not registered as recursive fields, since the
+        # levels of the field already continue them, where as the {i} fields nested deeper get their own expanded levels.
+        items_fields_templates = FieldsSwitch()
+        if self.field.items_excepted_type not in PRIMITIVE_TYPES:
+            Processor(fields_switch=items_fields_templates, copy_fields=True).assign_internal_mapping_from_class(
+                class_type=self.field.items_excepted_type, is_nested=True
+            )
+        return items_fields_templates
+
+    def expand(self, num_levels: int) -> Tuple[Dict[str, BaseItem], List[Tuple[str, BaseField]]]:
+        if self._items_fields_templates is None:
+            self._items_fields_templates = self._make_items_fields_templates()
+        templates_recursive_fields_paths: Set[str] = set(self._items_fields_templates.recursive_fields.keys())
+
+        expanded_fields: Dict[str, BaseItem] = {}
+        expanded_recursive_fields: List[Tuple[str, BaseField]] = []
+        while self.num_expanded_levels < min(num_levels, self.field.max_nested):
+            level_key_name: str = self.render_level_key_name(self.num_expanded_levels)
+            level_parent_field: BaseField = copy.copy(self._next_level_parent_field)
+            level_parent_field._key_name = level_key_name
+            # The MapItem retrieve its key_name and its database path from its parent_field
+            map_item = MapItem(
+                parent_field=level_parent_field,
+                field_type=self.field.default_field_type,
+                model_type=self.field.items_excepted_type
+            )
+            if len(map_item.database_path) > DYNAMODB_MAX_NESTED_DEPTH:
+                break
+
+            level_field_path: str = f"{self._next_level_parent_field_path}.{{{{{level_key_name}}}}}"
+            expanded_fields[level_field_path] = map_item
+            items_database_path: List[DatabasePathElement] = [*level_parent_field.database_path, DatabasePathElement(
+                element_key=make_dict_key_var_name(level_key_name),
+                default_type=self.field.default_field_type,
+                custom_default_value=self.field.custom_default_value
+            )]
+            for template_field_path, template_field in self._items_fields_templates.items():
+                field_object: BaseItem = copy.copy(template_field)
+                field_object._database_path = [*items_database_path, *template_field.database_path]
+                if len(field_object.database_path) <= DYNAMODB_MAX_NESTED_DEPTH:
+                    expanded_field_path = f"{level_field_path}.{template_field_path}"
+                    expanded_fields[expanded_field_path] = field_object
+                    if template_field_path in templates_recursive_fields_paths:
+                        expanded_recursive_fields.append((expanded_field_path, field_object))
+
+            next_level_parent_field: BaseField = copy.copy(self.field)
+            next_level_parent_field._database_path = [*items_database_path, DatabasePathElement(
+                element_key=self.field.field_name,
+                default_type=self.field.default_field_type,
+                custom_default_value=self.field.custom_default_value
+            )]
+            self._next_level_parent_field = next_level_parent_field
+            self._next_level_parent_field_path = f"{level_field_path}.{self.field.field_name}"
+            self.num_expanded_levels += 1
+        return expanded_fields, expanded_recursive_fields
+
+
+@dataclass(frozen=True)
+class CompiledTableSchema:
+    # The processed model of a table, with its fields switch and its compiled serializers, that is shared by all the tables
+    # of a same model and processing options (see the BaseTable._COMPILED_SCHEMAS), and must never be modified by a table.
+    # The fields switch of a compiled schema still creates the levels of its recursive fields when they are first used.
+    model: Type[TableDataModel]
+    fields_switch: FieldsSwitch
+    model_virtual_map_field: BaseField
+    record_dynamodb_serializers: DynamoDBSerializers
+
 
 class BaseTable:
+    _COMPILED_SCHEMAS: Dict[tuple, CompiledTableSchema] = {}
+
     def __init__(
             self, data_model: Type[TableDataModel], primary_index: PrimaryIndex,
-            auto_leading_key: Optional[str] = None
+            auto_leading_key: Optional[str] = None, float_conversion: str = SHORTEST_FLOAT_CONVERSION,
+            schema_cache_directory_path: Optional[str] = None
     ):
-        self.fields_switch = FieldsSwitch()
         self._internal_mapping = {}
+        self._primary_index_name = primary_index.index_custom_name or primary_index.hash_key_name
+        self._float_conversion = float_conversion
+        self.processed_class_types: Set[type] = set()
+
+        # We store the compiled schemas in a static variable, so that the tables created with the same model, primary index,
+        # auto_leading_key and float_conversion (like a basic and a caching table of a same model, or a table per tenant or
+        # per region) do not copy and process the model again. The transformers of the auto_leading_key and the serializers
+        # of the float_conversion are set on the fields of the compiled schema, which is why they are part of its key.
+        compiled_schema_key: tuple = (
+            data_model if isinstance(data_model, type) else type(data_model),
+            self._primary_index_name, auto_leading_key, float_conversion
+        )
+        compiled_schema: Optional[CompiledTableSchema] = self._COMPILED_SCHEMAS.get(compiled_schema_key, None)
+        if compiled_schema is None:
+            compiled_schema = self._compile_schema(
+                data_model=data_model, auto_leading_key=auto_leading_key,
+                float_conversion=float_conversion, schema_cache_directory_path=schema_cache_directory_path
+            )
+            self._COMPILED_SCHEMAS[compiled_schema_key] = compiled_schema
+        self._model = compiled_schema.model
+        self.fields_switch = compiled_schema.fields_switch
+        self._model_virtual_map_field = compiled_schema.model_virtual_map_field
+        self._record_dynamodb_serializers = compiled_schema.record_dynamodb_serializers
+
+    @staticmethod
+    def clear_compiled_schemas() -> None:
+        # The tables created afterwards will compile their schema again (like after a modification of their model)
+        BaseTable._COMPILED_SCHEMAS.clear()
+
+    def _compile_schema(
+            self, data_model: Type[TableDataModel], auto_leading_key: Optional[str],
+            float_conversion: str, schema_cache_directory_path: Optional[str]
+    ) -> CompiledTableSchema:
+        self.fields_switch = FieldsSwitch()
 
         model_copy = data_model.copy()
 
@@ -43,10 +243,15 @@ class BaseTable:
             raise Exception("TableModel must inherit from TableDataModel class")
         self._model_virtual_map_field = None
 
-        self._primary_index_name = primary_index.index_custom_name or primary_index.hash_key_name
-
-        self.processed_class_types: Set[type] = set()
-        Processor(table=self).assign_internal_mapping_from_class(class_type=self._model)
+        self._process_model(data_model=data_model, schema_cache_directory_path=schema_cache_directory_path)
+        record_dynamodb_serializers: DynamoDBSerializers = compile_table_serializers(
+            model_virtual_map_field=self.model_virtual_map_field, fields_switch=self.fields_switch,
+            float_to_decimal_function=get_float_to_decimal_function(float_conversion=float_conversion)
+        )
+        # Compiles the serializers of the fields created by the expansion of the recursive fields
+        self.fields_switch.serializers_compiler = SchemaSerializersCompiler(
+            float_to_decimal_function=get_float_to_decimal_function(float_conversion=float_conversion)
+        )
 
         if auto_leading_key is not None:
             def remove_auto_leading_key(value: Any):
@@ -62,6 +267,48 @@ class BaseTable:
             primary_key_field_object.write_transformers.insert(0, lambda value: f"{auto_leading_key}{value}")
             primary_key_field_object.read_transformers.insert(0, remove_auto_leading_key)
 
+        return CompiledTableSchema(
+            model=self._model, fields_switch=self.fields_switch,
+            model_virtual_map_field=self.model_virtual_map_field,
+            record_dynamodb_serializers=record_dynamodb_serializers
+        )
+
+    def _process_model(self, data_model: Type[TableDataModel], schema_cache_directory_path: Optional[str]) -> None:
+        # With a schema_cache_directory_path, the processed schema of the model is loaded from its schema file if it exists
+        # (see the schema_cache module), otherwise the model is processed, and its processed schema is saved in a new file.
+        schema_cache_file_path: Optional[str] = None
+        if schema_cache_directory_path is not None:
+            source_hash: Optional[bytes] = compute_model_source_hash(data_model=data_model)
+            if source_hash is None:
+                print(message_with_vars(
+                    message="The schema of the model cannot be cached, since it uses a __setup__ function or since the source of its classes could not be found",
+                    vars_dict={'data_model': data_model.__qualname__}
+                ))
+            else:
+                schema_cache_file_path = make_schema_cache_file_path(
+                    directory_path=schema_cache_directory_path, data_model=data_model, source_hash=source_hash
+                )
+                try:
+                    schema_bytes: Optional[bytes] = read_schema_file(file_path=schema_cache_file_path)
+                    if schema_bytes is not None:
+                        load_processed_schema(
+                            model_class=self._model, fields_switch=self.fields_switch,
+                            schema_bytes=schema_bytes, source_hash=source_hash
+                        )
+                        return
+                except Exception as e:
+                    print(f"Failed to load the cached schema of the model, the model will be processed. Exception of type {type(e).__name__} occurred: {str(e)}")
+                    self.fields_switch = FieldsSwitch()
+
+        Processor(fields_switch=self.fields_switch).assign_internal_mapping_from_class(class_type=self._model)
+        if schema_cache_file_path is not None:
+            try:
+                write_schema_file(file_path=schema_cache_file_path, schema_bytes=export_processed_schema(
+                    model_class=self._model, fields_switch=self.fields_switch, source_hash=source_hash
+                ))
+            except Exception as e:
+                print(f"Failed to save the processed schema of the model. Exception of type {type(e).__name__} occurred: {str(e)}")
+
     @property
     def model(self) -> TableDataModel:
         return self._model
@@ -76,6 +323,14 @@ class BaseTable:
             # put_record operation, needs to validate its data, based on the table data model, not a BaseField.
         return self._model_virtual_map_field
 
+    @property
+    def float_conversion(self) -> str:
+        return self._float_conversion
+
+    @property
+    def record_dynamodb_serializers(self) -> DynamoDBSerializers:
+        return self._record_dynamodb_serializers
+
     @property
     def internal_mapping(self) -> dict:
         return self._internal_mapping
@@ -85,12 +340,16 @@ class BaseTable:
         return self._primary_index_name
 
     @staticmethod
-    def _async_field_removers_executor(task_executor: Callable[[FieldRemover], Any], removers: Dict[str, FieldRemover]) -> Dict[str, Any]:
-        # This function is used both to run delete_field and remove_field operations asynchronously
+    def _concurrent_field_removers_operation(
+            operation_factory: Callable[[FieldRemover], Generator], removers: Dict[str, FieldRemover]
+    ) -> Generator[Any, Any, Dict[str, Any]]:
+        # This function is used both to run delete_field and remove_field operations concurrently
         if not len(removers) > 0:
             return {}
-        with ThreadPoolExecutor(max_workers=len(removers)) as executor:
-            return {key: executor.submit(task_executor, item).result() for key, item in removers.items()}
+        results: List[Any] = yield ConcurrentOperations(operations=[
+            operation_factory(item) for item in removers.values()
+        ])
+        return dict(zip(removers.keys(), results))
 
     def _get_primary_key_field(self) -> BaseItem:
         primary_key_field_object: Optional[BaseItem] = self.fields_switch.get(self.primary_index_name, None)
@@ -105,8 +364,11 @@ class BaseTable:
 
 
 class Processor:
-    def __init__(self, table: BaseTable):
-        self.table = table
+    def __init__(self, fields_switch: FieldsSwitch, copy_fields: bool = False):
+        self.fields_switch = fields_switch
+        # With copy_fields, the processed fields are copies of the fields of the models (which are left untouched), like
+        # the templates of the fields of the levels of the recursive fields, that are copied again at each level.
+        self.copy_fields = copy_fields
 
     def process_item(
             self, item_key_name: Optional[str], class_type: Optional[type], variable_item: Any, current_field_path: str,
@@ -119,6 +381,8 @@ class Processor:
         field_is_valid: bool = False
         if isinstance(variable_item, DictModel):
             variable_item: DictModel
+            if self.copy_fields is True:
+                variable_item = copy.copy(variable_item)
 
             """new_database_path_element = DatabasePathElement(
                 element_key=variable_item.key_name,
@@ -130,7 +394,7 @@ class Processor:
                 required_fields.append(variable_item)"""
 
             current_field_path += ("" if len(current_field_path) == 0 else ".") + "{{" + variable_item.key_name + "}}"
-            field_is_valid = self.table.fields_switch.set(key=current_field_path, item=variable_item)
+            field_is_valid = self.fields_switch.set(key=current_field_path, item=variable_item)
 
         elif MapModel in getattr(variable_item, '__mro__', ()):
             if len(current_path_elements) > 0:
@@ -142,6 +406,8 @@ class Processor:
 
         elif isinstance(variable_item, BaseField):
             variable_item: BaseField
+            if self.copy_fields is True:
+                variable_item = copy.copy(variable_item)
             if item_key_name is not None and variable_item.field_name is None:
                 variable_item.field_name = item_key_name
 
@@ -156,7 +422,7 @@ class Processor:
                 required_fields.append(variable_item)
 
             current_field_path += f"{variable_item.field_name}" if len(current_field_path) == 0 else f".{variable_item.field_name}"
-            field_is_valid = self.table.fields_switch.set(key=current_field_path, item=variable_item)
+            field_is_valid = self.fields_switch.set(key=current_field_path, item=variable_item)
             if variable_item.key_name is not None:
                 if "{i}" not in variable_item.key_name:
                     # The current_field_path concat is being handled lower in the code for the nested fields
@@ -185,65 +451,16 @@ class Processor:
 
                 if "{i}" in variable_item.key_name:
                     if is_nested is not True:
-                        current_nested_field_path = "" if current_field_path is None else current_field_path
-                        current_nested_database_path = [*variable_item.database_path]
-                        for i in range(variable_item.max_nested):
-                            if len(current_nested_database_path) > 32:
-                                print(message_with_vars(
-                                    message="Imposed a max nested database depth on field missing or with a too high nested depth limit.",
-                                    vars_dict={
-                                        'current_field_path': current_field_path,
-                                        'field_name': variable_item.field_name,
-                                        'imposedMaxNestedDepth': i
-                                    }
-                                ))
-                                break
-                            else:
-                                nested_variable_item = variable_item
-                                item_rendered_key_name: str = nested_variable_item.key_name.replace("{i}", f"{i}")
-                                nested_variable_item._database_path = [*current_nested_database_path]
-                                nested_variable_item._key_name = item_rendered_key_name
-                                # We create a copy of the variable_item unpon which we render the key_name and add
-                                # the appropriate database_path_elements into to prepare the creation of the MapItem.
-
-                                map_item = MapItem(
-                                    parent_field=nested_variable_item,
-                                    field_type=nested_variable_item.default_field_type,
-                                    model_type=nested_variable_item.items_excepted_type
-                                )
-                                # The MapItem will retrieve the key_name of its parent_field when initialized.
-                                # Hence, it is important to do the modifications on the nested_variable_item
-                                # before the initialization of the MapItem.
-
-                                if i > 0:
-                                    current_nested_field_path += f".{variable_item.field_name}"
-                                current_nested_field_path += ".{{" + map_item.key_name + "}}"
-
-                                current_nested_database_path.append(DatabasePathElement(
-                                    element_key=make_dict_key_var_name(map_item.key_name),
-                                    default_type=nested_variable_item.default_field_type,
-                                    custom_default_value=nested_variable_item.custom_default_value
-                                ))
-                                field_is_valid = self.table.fields_switch.set(key=current_nested_field_path, item=map_item)
-                                if field_is_valid is True:
-                                    if variable_item.items_excepted_type not in PRIMITIVE_TYPES:
-                                        self.assign_internal_mapping_from_class(
-                                            class_type=variable_item.items_excepted_type,
-                                            nested_field_path=current_nested_field_path,
-                                            current_path_elements=[*current_nested_database_path],
-                                            is_nested=True
-                                        )
-                                current_nested_database_path.append(DatabasePathElement(
-                                    element_key=nested_variable_item.field_name,
-                                    default_type=nested_variable_item.default_field_type,
-                                    custom_default_value=nested_variable_item.custom_default_value
-                                ))
+                        # The nested levels of the field (up to its max_nested_depth) are only created when a field path
+                        # targets them, by the fields switch (see the RecursiveField class). The key_name of the field is
+                        # left with its {i}, which is rendered in the key_name of the copies of the field at each level.
+                        self.fields_switch.add_recursive_field(field_path=current_field_path, field=variable_item)
                 else:
                     map_item = MapItem(
                         parent_field=variable_item, field_type=item_default_type,
                         model_type=variable_item.items_excepted_type
                     )
-                    field_is_valid = self.table.fields_switch.set(current_field_path, map_item)
+                    field_is_valid = self.fields_switch.set(current_field_path, map_item)
 
                     if field_is_valid is True:
                         items_excepted_type = variable_item.items_excepted_type
@@ -280,11 +497,6 @@ class Processor:
 
         # todo: re-implement some king of processed class types to avoid initializing
         #  multiple times the same class when we have a nested class ?
-        if class_type in self.table.processed_class_types:
-            pass
-            # return None
-        else:
-            pass
 
         deep_class_variables: dict = {}
         component_classes: Optional[List[type]] = getattr(class_type, '__mro__', None)
@@ -322,6 +534,8 @@ class Processor:
                     is_nested=is_nested
                 ))
 
-        setattr(class_type, 'required_fields', required_fields)
-        # We need to set the attribute, because when we go the required_fields with the get_attr
-        # function, we did not get a reference to the attribute, but a copy of the attribute value.
+        if self.copy_fields is not True:
+            # The required_fields of the models are compared with the fields of the models, not with their copies
+            setattr(class_type, 'required_fields', required_fields)
+            # We need to set the attribute, because when we go the required_fields with the get_attr
+            # function, we did not get a reference to the attribute, but a copy of the attribute value.
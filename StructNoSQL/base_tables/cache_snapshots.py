@@ -0,0 +1,126 @@
+import mmap
+import os
+import pickle
+import struct
+from dataclasses import dataclass
+from typing import Optional, Dict, Tuple, Set, List, Iterator, Union
+
+from StructNoSQL.practical_logger import message_with_vars
+
+
+# A cache snapshot contains the cached records of a caching table, to warm up the cache of a new process (like after the
+# cold start of a serverless function) without retrieving the records from the database. The snapshot starts with the
+# index of its records, and the data of each record is serialized apart (with pickle, which keeps the Decimal, set and
+# bytes values), so that loading a snapshot only de-serializes its index, and each record is only de-serialized the
+# first time that it is used. The snapshots are serialized with pickle, so they must only be loaded from trusted sources.
+
+_SNAPSHOT_HEADER = struct.Struct('<8sQ')  # magic, index bytes size
+_SNAPSHOT_MAGIC = b'SNSQLS01'
+
+# The primary key value, the time at which the record has been cached, and the serialized data of the record
+SnapshotRawRecord = Tuple[str, float, bytes]
+
+
+@dataclass
+class SnapshotRecord:
+    record_data: dict
+    cached_time: float
+    complete_paths: Set[Tuple[str, ...]]
+    # The (time.time) expiration time of each negative path, or None for the negative paths without expiration
+    negative_paths: Dict[Tuple[str, ...], Optional[float]]
+
+
+def serialize_snapshot_record(
+        record_data: dict, complete_paths: Set[Tuple[str, ...]], negative_paths: Dict[Tuple[str, ...], Optional[float]]
+) -> bytes:
+    return pickle.dumps((record_data, complete_paths, negative_paths), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def deserialize_snapshot_record(cached_time: float, record_bytes: bytes) -> SnapshotRecord:
+    record_data, complete_paths, negative_paths = pickle.loads(record_bytes)
+    return SnapshotRecord(
+        record_data=record_data, cached_time=cached_time,
+        complete_paths=complete_paths, negative_paths=negative_paths
+    )
+
+
+def serialize_cache_snapshot(raw_records: List[SnapshotRawRecord]) -> bytes:
+    # The offsets of the index are relative to the end of the index, so that the index can be serialized before them
+    records_entries: Dict[str, Tuple[float, int, int]] = {}
+    data_offset: int = 0
+    for primary_key_value, cached_time, record_bytes in raw_records:
+        records_entries[primary_key_value] = (cached_time, data_offset, len(record_bytes))
+        data_offset += len(record_bytes)
+    index_bytes: bytes = pickle.dumps(records_entries, protocol=pickle.HIGHEST_PROTOCOL)
+    return b''.join([
+        _SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, len(index_bytes)), index_bytes,
+        *(record_bytes for _, _, record_bytes in raw_records)
+    ])
+
+
+def write_cache_snapshot_file(file_path: str, snapshot_bytes: bytes) -> None:
+    # The file is replaced atomically, so that a process loading the snapshot never reads a partially written snapshot
+    temporary_file_path: str = f"{file_path}.{os.getpid()}.tmp"
+    with open(temporary_file_path, 'wb') as snapshot_file:
+        snapshot_file.write(snapshot_bytes)
+    os.replace(temporary_file_path, file_path)
+
+
+class CacheSnapshot:
+    # A snapshot loaded from a file is memory mapped, so that the pages of the records that are never used are not read
+    def __init__(self, snapshot_buffer: Union[bytes, mmap.mmap]):
+        if not len(snapshot_buffer) >= _SNAPSHOT_HEADER.size:
+            raise Exception(message_with_vars(
+                message="The cache snapshot is too small to contain its header",
+                vars_dict={'snapshotBytesSize': len(snapshot_buffer)}
+            ))
+        magic, index_bytes_size = _SNAPSHOT_HEADER.unpack_from(snapshot_buffer, 0)
+        if magic != _SNAPSHOT_MAGIC:
+            raise Exception(message_with_vars(
+                message="The cache snapshot has not been exported by a caching table, or by an unsupported version",
+                vars_dict={'magic': magic, 'supportedMagic': _SNAPSHOT_MAGIC}
+            ))
+        self._snapshot_buffer = snapshot_buffer
+        self._data_offset: int = _SNAPSHOT_HEADER.size + index_bytes_size
+        self._records_entries: Dict[str, Tuple[float, int, int]] = pickle.loads(
+            snapshot_buffer[_SNAPSHOT_HEADER.size:self._data_offset]
+        )
+
+    @staticmethod
+    def from_file(file_path: str) -> 'CacheSnapshot':
+        with open(file_path, 'rb') as snapshot_file:
+            if not os.fstat(snapshot_file.fileno()).st_size > 0:
+                # An empty file cannot be memory mapped
+                return CacheSnapshot(snapshot_buffer=b'')
+            # The memory map stays valid once its file has been closed
+            return CacheSnapshot(snapshot_buffer=mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return len(self._records_entries)
+
+    def close(self) -> None:
+        self._records_entries.clear()
+        if type(self._snapshot_buffer) is mmap.mmap:
+            self._snapshot_buffer.close()
+
+    def discard_record(self, primary_key_value: str) -> None:
+        self._records_entries.pop(primary_key_value, None)
+
+    def _get_record_bytes(self, data_offset: int, data_bytes_size: int) -> bytes:
+        start_offset: int = self._data_offset + data_offset
+        return self._snapshot_buffer[start_offset:start_offset + data_bytes_size]
+
+    def pop_record(self, primary_key_value: str) -> Optional[SnapshotRecord]:
+        # Each record is only loaded once, since the cached data of the record is then owned by the CachedRecordsStore
+        record_entry: Optional[Tuple[float, int, int]] = self._records_entries.pop(primary_key_value, None)
+        if record_entry is None:
+            return None
+        cached_time, data_offset, data_bytes_size = record_entry
+        return deserialize_snapshot_record(
+            cached_time=cached_time, record_bytes=self._get_record_bytes(data_offset=data_offset, data_bytes_size=data_bytes_size)
+        )
+
+    def iterate_raw_records(self) -> Iterator[SnapshotRawRecord]:
+        # The records that have not been loaded are exported again without being de-serialized
+        for primary_key_value, (cached_time, data_offset, data_bytes_size) in self._records_entries.items():
+            yield primary_key_value, cached_time, self._get_record_bytes(data_offset=data_offset, data_bytes_size=data_bytes_size)
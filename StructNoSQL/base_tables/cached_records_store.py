@@ -0,0 +1,598 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable, Set, List, Iterator, Tuple, Union
+
+from StructNoSQL.base_tables.cache_snapshots import CacheSnapshot, SnapshotRecord, SnapshotRawRecord, \
+    serialize_snapshot_record, deserialize_snapshot_record, serialize_cache_snapshot
+from StructNoSQL.base_tables.path_indexed_record_data import PathIndexedRecordData
+from StructNoSQL.base_tables.shared_cache_backends import BaseSharedCacheBackend, SharedCachedRecord
+from StructNoSQL.practical_logger import message_with_vars
+
+
+LRU_EVICTION_ORDERING = "LRU"
+LFU_EVICTION_ORDERING = "LFU"
+NESTED_RECORDS_LAYOUT = "NESTED"
+PATH_INDEXED_RECORDS_LAYOUT = "PATH_INDEXED"
+
+
+@dataclass(frozen=True)
+class CacheEvictionPolicy:
+    # Bounds of the cached records of a caching table. When a bound is exceeded, the least recently used (LRU) or the least
+    # frequently used (LFU) records are evicted from the cache, except the records that still have pending operations,
+    # which are never evicted. The max_bytes is an approximation of the memory used by the cached records, computed from
+    # the sys.getsizeof of their values. The records expire record_ttl_seconds after having been added to the cache, even
+    # if they are still being used, so that the cached data is never older than the ttl. With negative_caching, the fields
+    # and the records found missing from the database are remembered as missing (until they are written by the caching
+    # table), so that reading them again does not require a request. The missing entries expire after the optional
+    # negative_entry_ttl_seconds (on top of the record_ttl_seconds), since the other clients of the table can create them.
+    # With the PATH_INDEXED_LAYOUT records_layout, the cached data of each record is indexed by the paths used to read and
+    # write it (see the PathIndexedRecordData), which makes the access to the deeply nested fields faster.
+    LRU_ORDERING = LRU_EVICTION_ORDERING
+    LFU_ORDERING = LFU_EVICTION_ORDERING
+    NESTED_LAYOUT = NESTED_RECORDS_LAYOUT
+    PATH_INDEXED_LAYOUT = PATH_INDEXED_RECORDS_LAYOUT
+
+    max_records: Optional[int] = None
+    max_bytes: Optional[int] = None
+    record_ttl_seconds: Optional[float] = None
+    ordering: str = LRU_EVICTION_ORDERING
+    negative_caching: bool = True
+    negative_entry_ttl_seconds: Optional[float] = None
+    records_layout: str = NESTED_RECORDS_LAYOUT
+
+    def __post_init__(self):
+        if self.ordering not in [LRU_EVICTION_ORDERING, LFU_EVICTION_ORDERING]:
+            raise Exception(message_with_vars(
+                message="Unsupported cache eviction ordering",
+                vars_dict={'ordering': self.ordering, 'supportedOrderings': [LRU_EVICTION_ORDERING, LFU_EVICTION_ORDERING]}
+            ))
+        if self.records_layout not in [NESTED_RECORDS_LAYOUT, PATH_INDEXED_RECORDS_LAYOUT]:
+            raise Exception(message_with_vars(
+                message="Unsupported cached records layout",
+                vars_dict={'recordsLayout': self.records_layout, 'supportedLayouts': [NESTED_RECORDS_LAYOUT, PATH_INDEXED_RECORDS_LAYOUT]}
+            ))
+
+
+def approximate_bytes_size(value: Any) -> int:
+    value_type = type(value)
+    if value_type is dict:
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(key) + approximate_bytes_size(item) for key, item in value.items()
+        )
+    if value_type in (list, tuple, set, frozenset):
+        return sys.getsizeof(value) + sum(approximate_bytes_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+CachedRecordData = Union[dict, PathIndexedRecordData]
+
+
+def unwrap_cached_record_data(record_data: CachedRecordData) -> dict:
+    return record_data.record_data if type(record_data) is PathIndexedRecordData else record_data
+
+
+class CachedRecordsStore:
+    # Stores the cached data of each record of a caching table, with the ordering and the bounds of its eviction policy.
+    # The cached data of a record is a dict that is modified in place by the caching table after being indexed, so the
+    # size of a record is re-computed (if the policy has a max_bytes) the next time that the store is being accessed.
+    # With a shared_backend, the modified records are published by the caching table after each of its operations
+    # (except the records with pending operations, that are published once their operations have been committed),
+    # and the records are reloaded from the shared_backend when their version has been changed by another process.
+    # The complete paths of a record are the paths (as tuples of stringed element keys, the empty tuple for the entire
+    # record) which data has been entirely loaded in the cache, so that any field missing under them does not exist.
+    # The negative paths of a record are the paths found missing from the database, with their expiration time. They are
+    # kept apart from the cached data of the record, so that a missing field never creates its parents in the cached data.
+    # The records of a loaded CacheSnapshot are only added to the store when first accessed, and the records that are
+    # already in the store (or that have been shared by the other processes) are more recent than their snapshot.
+    # The store of a session of a caching table has a parent_store (the store of the table, or of the parent session),
+    # from which each record is copied when first accessed, and into which the records are merged when the session ends.
+
+    def __init__(
+            self, eviction_policy: Optional[CacheEvictionPolicy], is_record_evictable: Callable[[str], bool],
+            shared_backend: Optional[BaseSharedCacheBackend] = None, parent_store: Optional['CachedRecordsStore'] = None
+    ):
+        self.eviction_policy = eviction_policy if eviction_policy is not None else CacheEvictionPolicy()
+        self._is_record_evictable = is_record_evictable
+        self.shared_backend = shared_backend
+        self._records_shared_versions: Dict[str, int] = {}
+        self._unpublished_records_keys: Set[str] = set()
+        self._use_lfu_ordering: bool = self.eviction_policy.ordering == LFU_EVICTION_ORDERING
+        self._use_path_indexed_layout: bool = self.eviction_policy.records_layout == PATH_INDEXED_RECORDS_LAYOUT
+        self._records: OrderedDict = OrderedDict()
+        self._records_expiration_times: Dict[str, float] = {}
+        # The (time.time) time at which each record has been cached, so that the exported records keep their age
+        self._records_cached_times: Dict[str, float] = {}
+        self._snapshot: Optional[CacheSnapshot] = None
+        self.parent_store = parent_store
+        # The records that are no longer copied from the parent store, the records that have been copied from the parent
+        # store, and the records written by the session of the store. Only used by the stores of the sessions.
+        self._detached_records_keys: Set[str] = set()
+        self._parent_records_keys: Set[str] = set()
+        self._written_records_keys: Set[str] = set()
+        # Guards all the records and counters of the store, which is used from the threads of the sessions and from the
+        # thread of the auto flush. Reentrant, since the functions of the store call each other.
+        self._lock = threading.RLock()
+        self._records_frequencies: Dict[str, int] = {}
+        # The records of each frequency, in their order of use, so that the least recently used record is evicted first
+        # between the records with the same frequency. Only used with the LFU ordering.
+        self._frequencies_records: Dict[int, Dict[str, None]] = {}
+        self._records_bytes_sizes: Dict[str, int] = {}
+        self._modified_records_keys: Set[str] = set()
+        self._total_bytes_size: int = 0
+        self._records_complete_paths: Dict[str, Set[Tuple[str, ...]]] = {}
+        self._records_negative_paths: Dict[str, Dict[Tuple[str, ...], Optional[float]]] = {}
+
+        self.hits_count: int = 0
+        self.misses_count: int = 0
+        self.negative_hits_count: int = 0
+        self.evictions_count: int = 0
+
+    @property
+    def lock(self) -> threading.RLock:
+        # Held by the caching tables while changing the data of a record returned by the index_record function
+        return self._lock
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+    def __contains__(self, primary_key_value: str) -> bool:
+        with self._lock:
+            return self._get_local_or_shared_record(primary_key_value=primary_key_value) is not None
+
+    @property
+    def total_bytes_size(self) -> int:
+        with self._lock:
+            self._update_modified_records_bytes_sizes()
+            return self._total_bytes_size
+
+    def count_hit(self) -> None:
+        with self._lock:
+            self.hits_count += 1
+
+    def count_negative_hit(self) -> None:
+        with self._lock:
+            self.negative_hits_count += 1
+
+    def count_miss(self) -> None:
+        with self._lock:
+            self.misses_count += 1
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.hits_count = 0
+            self.misses_count = 0
+            self.negative_hits_count = 0
+            self.evictions_count = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            if self.shared_backend is not None:
+                self.shared_backend.clear()
+            self._records_shared_versions.clear()
+            self._unpublished_records_keys.clear()
+            self._records.clear()
+            self._records_expiration_times.clear()
+            self._records_cached_times.clear()
+            if self._snapshot is not None:
+                self._snapshot.close()
+                self._snapshot = None
+            self._records_frequencies.clear()
+            self._frequencies_records.clear()
+            self._records_bytes_sizes.clear()
+            self._modified_records_keys.clear()
+            self._total_bytes_size = 0
+            self._records_complete_paths.clear()
+            self._records_negative_paths.clear()
+
+    def mark_path_complete(self, primary_key_value: str, path_keys: Tuple[str, ...]) -> None:
+        with self._lock:
+            if primary_key_value in self._records:
+                self._records_complete_paths.setdefault(primary_key_value, set()).add(path_keys)
+
+    def is_path_complete(self, primary_key_value: str, path_keys: Tuple[str, ...]) -> bool:
+        with self._lock:
+            record_complete_paths: Optional[Set[Tuple[str, ...]]] = self._records_complete_paths.get(primary_key_value, None)
+            if record_complete_paths is None:
+                return False
+            return any(path_keys[:i] in record_complete_paths for i in range(len(path_keys) + 1))
+
+    def add_negative_path(self, primary_key_value: str, path_keys: Tuple[str, ...]) -> None:
+        with self._lock:
+            if self.eviction_policy.negative_caching is not True:
+                return
+            # Declares the record in the cache, so that the negative path is evicted along with the record
+            self.index_record(primary_key_value=primary_key_value, is_for_write=False)
+            negative_entry_ttl_seconds: Optional[float] = self.eviction_policy.negative_entry_ttl_seconds
+            self._records_negative_paths.setdefault(primary_key_value, {})[path_keys] = (
+                time.monotonic() + negative_entry_ttl_seconds if negative_entry_ttl_seconds is not None else None
+            )
+
+    def is_path_negative(self, primary_key_value: str, path_keys: Tuple[str, ...]) -> bool:
+        with self._lock:
+            record_negative_paths: Optional[Dict[Tuple[str, ...], Optional[float]]] = self._records_negative_paths.get(primary_key_value, None)
+            if record_negative_paths is None:
+                return False
+            for i in range(len(path_keys) + 1):
+                if path_keys[:i] not in record_negative_paths:
+                    continue
+                expiration_time: Optional[float] = record_negative_paths[path_keys[:i]]
+                if expiration_time is None or time.monotonic() < expiration_time:
+                    return True
+                record_negative_paths.pop(path_keys[:i])
+            return False
+
+    def discard_negative_paths(self, primary_key_value: str, path_keys: Tuple[str, ...]) -> None:
+        # Once a path is written, the path itself, its parents and its children can no longer be considered missing
+        with self._lock:
+            record_negative_paths: Optional[Dict[Tuple[str, ...], Optional[float]]] = self._records_negative_paths.get(primary_key_value, None)
+            if record_negative_paths is None:
+                return
+            for negative_path_keys in list(record_negative_paths.keys()):
+                common_length: int = min(len(negative_path_keys), len(path_keys))
+                if negative_path_keys[:common_length] == path_keys[:common_length]:
+                    record_negative_paths.pop(negative_path_keys)
+            if not len(record_negative_paths) > 0:
+                self._records_negative_paths.pop(primary_key_value)
+
+    def _expire_record_if_need_to(self, primary_key_value: str) -> bool:
+        expiration_time: Optional[float] = self._records_expiration_times.get(primary_key_value, None)
+        if expiration_time is None or time.monotonic() < expiration_time or not self._is_record_evictable(primary_key_value):
+            return False
+        self.pop_record(primary_key_value=primary_key_value)
+        self.evictions_count += 1
+        return True
+
+    def _use_record(self, primary_key_value: str) -> None:
+        if self._use_lfu_ordering is not True:
+            self._records.move_to_end(primary_key_value)
+            return
+        frequency: int = self._records_frequencies.get(primary_key_value, 0)
+        if frequency > 0:
+            frequency_records: Dict[str, None] = self._frequencies_records[frequency]
+            frequency_records.pop(primary_key_value)
+            if not len(frequency_records) > 0:
+                self._frequencies_records.pop(frequency)
+        self._records_frequencies[primary_key_value] = frequency + 1
+        self._frequencies_records.setdefault(frequency + 1, {})[primary_key_value] = None
+
+    def _add_record(self, primary_key_value: str, record_data: dict, age_seconds: float = 0.0) -> CachedRecordData:
+        cached_record_data: CachedRecordData = (
+            PathIndexedRecordData(record_data=record_data) if self._use_path_indexed_layout is True else record_data
+        )
+        self._records[primary_key_value] = cached_record_data
+        if self.eviction_policy.record_ttl_seconds is not None:
+            self._records_expiration_times[primary_key_value] = (
+                time.monotonic() + self.eviction_policy.record_ttl_seconds - age_seconds
+            )
+        self._records_cached_times[primary_key_value] = time.time() - age_seconds
+        if self.parent_store is not None:
+            self._detached_records_keys.add(primary_key_value)
+        self._use_record(primary_key_value=primary_key_value)
+        return cached_record_data
+
+    def _get_local_or_shared_record(self, primary_key_value: str) -> Optional[CachedRecordData]:
+        record_data: Optional[CachedRecordData] = self._records.get(primary_key_value, None)
+        if record_data is not None and self._expire_record_if_need_to(primary_key_value=primary_key_value):
+            record_data = None
+        if self.shared_backend is None:
+            if record_data is None and (self._snapshot is not None or self.parent_store is not None):
+                return self._load_snapshot_or_parent_record(primary_key_value=primary_key_value)
+            return record_data
+
+        if record_data is not None:
+            if primary_key_value in self._unpublished_records_keys or not self._is_record_evictable(primary_key_value):
+                # The local modifications of the record are more recent than the shared record
+                return record_data
+            if self.shared_backend.get_record_version(primary_key_value) == self._records_shared_versions.get(primary_key_value, None):
+                return record_data
+            self.pop_record(primary_key_value=primary_key_value)
+
+        shared_record: Optional[SharedCachedRecord] = self.shared_backend.load_record(primary_key_value=primary_key_value)
+        if shared_record is None:
+            return self._load_snapshot_record(primary_key_value=primary_key_value) if self._snapshot is not None else None
+        if self._snapshot is not None:
+            self._snapshot.discard_record(primary_key_value=primary_key_value)
+        # The records ttl is counted from the publication of the shared record, and not from its loading by this process
+        age_seconds: float = max(0.0, time.time() - shared_record.published_time)
+        record_ttl_seconds: Optional[float] = self.eviction_policy.record_ttl_seconds
+        if record_ttl_seconds is not None and not age_seconds < record_ttl_seconds:
+            return None
+        cached_record_data: CachedRecordData = self._add_record(
+            primary_key_value=primary_key_value, record_data=shared_record.record_data, age_seconds=age_seconds
+        )
+        self._records_shared_versions[primary_key_value] = shared_record.version
+        self._enforce_bounds(excluded_primary_key_value=primary_key_value)
+        return cached_record_data
+
+    def _load_snapshot_record(self, primary_key_value: str) -> Optional[CachedRecordData]:
+        snapshot_record: Optional[SnapshotRecord] = self._snapshot.pop_record(primary_key_value=primary_key_value)
+        if not len(self._snapshot) > 0:
+            self._snapshot.close()
+            self._snapshot = None
+        if snapshot_record is None:
+            return None
+        return self._add_snapshot_record(primary_key_value=primary_key_value, snapshot_record=snapshot_record)
+
+    def _load_snapshot_or_parent_record(self, primary_key_value: str) -> Optional[CachedRecordData]:
+        if self._snapshot is not None:
+            cached_record_data: Optional[CachedRecordData] = self._load_snapshot_record(primary_key_value=primary_key_value)
+            if cached_record_data is not None:
+                return cached_record_data
+        if self.parent_store is None or primary_key_value in self._detached_records_keys:
+            return None
+        # A record is only copied once from the parent store, so that the session keeps reading its own version of the record
+        self._detached_records_keys.add(primary_key_value)
+        raw_record: Optional[SnapshotRawRecord] = self.parent_store.export_record(primary_key_value=primary_key_value)
+        if raw_record is None:
+            return None
+        _, cached_time, record_bytes = raw_record
+        self._parent_records_keys.add(primary_key_value)
+        return self._add_snapshot_record(
+            primary_key_value=primary_key_value,
+            snapshot_record=deserialize_snapshot_record(cached_time=cached_time, record_bytes=record_bytes)
+        )
+
+    def _add_snapshot_record(self, primary_key_value: str, snapshot_record: SnapshotRecord) -> Optional[CachedRecordData]:
+        # Like the shared records, the records ttl is counted from the caching of the record by the exporting process
+        now_time: float = time.time()
+        age_seconds: float = max(0.0, now_time - snapshot_record.cached_time)
+        record_ttl_seconds: Optional[float] = self.eviction_policy.record_ttl_seconds
+        if record_ttl_seconds is not None and not age_seconds < record_ttl_seconds:
+            return None
+        cached_record_data: CachedRecordData = self._add_record(
+            primary_key_value=primary_key_value, record_data=snapshot_record.record_data, age_seconds=age_seconds
+        )
+        if len(snapshot_record.complete_paths) > 0:
+            self._records_complete_paths[primary_key_value] = snapshot_record.complete_paths
+        if self.eviction_policy.negative_caching is True:
+            now_monotonic: float = time.monotonic()
+            record_negative_paths: Dict[Tuple[str, ...], Optional[float]] = {
+                path_keys: now_monotonic + expiration_time - now_time if expiration_time is not None else None
+                for path_keys, expiration_time in snapshot_record.negative_paths.items()
+                if expiration_time is None or now_time < expiration_time
+            }
+            if len(record_negative_paths) > 0:
+                self._records_negative_paths[primary_key_value] = record_negative_paths
+        if self.shared_backend is not None:
+            # The snapshot record is used until another process publishes a more recent version of the record
+            self._records_shared_versions[primary_key_value] = self.shared_backend.get_record_version(primary_key_value)
+        self._enforce_bounds(excluded_primary_key_value=primary_key_value)
+        return cached_record_data
+
+    def load_snapshot(self, snapshot: CacheSnapshot) -> None:
+        # Replaces the previously loaded snapshot, which records that have not been used yet are not loaded anymore
+        with self._lock:
+            if self._snapshot is not None:
+                self._snapshot.close()
+            for primary_key_value in self._records.keys():
+                snapshot.discard_record(primary_key_value=primary_key_value)
+            self._snapshot = snapshot if len(snapshot) > 0 else None
+
+    def _serialize_record(self, primary_key_value: str, now_time: float, now_monotonic: float) -> Optional[SnapshotRawRecord]:
+        # The records that cannot be evicted have pending operations, so their cached data has not been committed yet
+        record_data: Optional[CachedRecordData] = self._records.get(primary_key_value, None)
+        if record_data is None or not self._is_record_evictable(primary_key_value):
+            return None
+        expiration_time: Optional[float] = self._records_expiration_times.get(primary_key_value, None)
+        if expiration_time is not None and not now_monotonic < expiration_time:
+            return None
+        record_negative_paths: Dict[Tuple[str, ...], Optional[float]] = {
+            path_keys: now_time + negative_expiration_time - now_monotonic if negative_expiration_time is not None else None
+            for path_keys, negative_expiration_time in self._records_negative_paths.get(primary_key_value, {}).items()
+            if negative_expiration_time is None or now_monotonic < negative_expiration_time
+        }
+        return primary_key_value, self._records_cached_times.get(primary_key_value, now_time), serialize_snapshot_record(
+            record_data=unwrap_cached_record_data(record_data),
+            complete_paths=self._records_complete_paths.get(primary_key_value, set()),
+            negative_paths=record_negative_paths
+        )
+
+    def export_snapshot(self) -> bytes:
+        with self._lock:
+            now_time: float = time.time()
+            now_monotonic: float = time.monotonic()
+            raw_records: List[SnapshotRawRecord] = []
+            for primary_key_value in self._records.keys():
+                raw_record: Optional[SnapshotRawRecord] = self._serialize_record(
+                    primary_key_value=primary_key_value, now_time=now_time, now_monotonic=now_monotonic
+                )
+                if raw_record is not None:
+                    raw_records.append(raw_record)
+            if self._snapshot is not None:
+                raw_records.extend(self._snapshot.iterate_raw_records())
+            return serialize_cache_snapshot(raw_records=raw_records)
+
+    def export_record(self, primary_key_value: str) -> Optional[SnapshotRawRecord]:
+        # Called by the stores of the sessions, which receive a serialized copy of the record, so that the record can
+        # be modified by the session without being modified in this store (and from the other threads of the sessions).
+        with self._lock:
+            if self._get_local_or_shared_record(primary_key_value=primary_key_value) is None:
+                return None
+            return self._serialize_record(primary_key_value=primary_key_value, now_time=time.time(), now_monotonic=time.monotonic())
+
+    def import_records(
+            self, replacing_raw_records: List[SnapshotRawRecord], missing_raw_records: List[SnapshotRawRecord],
+            removed_primary_keys_values: List[str]
+    ) -> None:
+        # The replacing records have been written by a session, and replace the records of this store, whereas the missing
+        # records have only been retrieved by a session, and are only added if they are not in this store. The records
+        # with pending operations in this store are never replaced, since their pending operations have not been sent.
+        with self._lock:
+            for primary_key_value in removed_primary_keys_values:
+                if self._is_record_evictable(primary_key_value):
+                    self.remove_record(primary_key_value=primary_key_value)
+            for raw_records, is_replacing in ((replacing_raw_records, True), (missing_raw_records, False)):
+                for primary_key_value, cached_time, record_bytes in raw_records:
+                    if not self._is_record_evictable(primary_key_value):
+                        continue
+                    if is_replacing is not True and self._get_local_or_shared_record(primary_key_value=primary_key_value) is not None:
+                        continue
+                    self.pop_record(primary_key_value=primary_key_value)
+                    snapshot_record: SnapshotRecord = deserialize_snapshot_record(cached_time=cached_time, record_bytes=record_bytes)
+                    if self._add_snapshot_record(primary_key_value=primary_key_value, snapshot_record=snapshot_record) is not None:
+                        self._mark_record_modified(primary_key_value=primary_key_value)
+            self.publish_modified_records()
+
+    def merge_into_parent_store(self, with_written_records: bool) -> None:
+        # The records written by the session are only merged if its operations have been committed (otherwise they are
+        # removed from the parent store, since the session might have written some of them), and the records that have
+        # only been read from the parent store are not merged, since the parent store might have a more recent version.
+        with self._lock:
+            now_time: float = time.time()
+            now_monotonic: float = time.monotonic()
+            replacing_raw_records: List[SnapshotRawRecord] = []
+            missing_raw_records: List[SnapshotRawRecord] = []
+            removed_primary_keys_values: List[str] = []
+            for primary_key_value in self._detached_records_keys:
+                is_written: bool = primary_key_value in self._written_records_keys
+                if is_written is not True and primary_key_value in self._parent_records_keys:
+                    continue
+                raw_record: Optional[SnapshotRawRecord] = (
+                    self._serialize_record(primary_key_value=primary_key_value, now_time=now_time, now_monotonic=now_monotonic)
+                    if is_written is not True or with_written_records is True else None
+                )
+                if raw_record is not None:
+                    (replacing_raw_records if is_written is True else missing_raw_records).append(raw_record)
+                elif is_written is True:
+                    removed_primary_keys_values.append(primary_key_value)
+            self.parent_store.import_records(
+                replacing_raw_records=replacing_raw_records, missing_raw_records=missing_raw_records,
+                removed_primary_keys_values=removed_primary_keys_values
+            )
+
+    def _update_modified_records_bytes_sizes(self) -> None:
+        for primary_key_value in self._modified_records_keys:
+            record_data: Optional[CachedRecordData] = self._records.get(primary_key_value, None)
+            if record_data is not None:
+                record_bytes_size: int = approximate_bytes_size(unwrap_cached_record_data(record_data))
+                self._total_bytes_size += record_bytes_size - self._records_bytes_sizes.get(primary_key_value, 0)
+                self._records_bytes_sizes[primary_key_value] = record_bytes_size
+        self._modified_records_keys.clear()
+
+    def _is_over_bounds(self, records_count: int, total_bytes_size: int) -> bool:
+        max_records: Optional[int] = self.eviction_policy.max_records
+        max_bytes: Optional[int] = self.eviction_policy.max_bytes
+        return (
+            (max_records is not None and records_count > max_records) or
+            (max_bytes is not None and total_bytes_size > max_bytes)
+        )
+
+    def _iterate_eviction_candidates(self) -> Iterator[str]:
+        if self._use_lfu_ordering is not True:
+            yield from self._records.keys()
+        else:
+            for frequency in sorted(self._frequencies_records.keys()):
+                yield from self._frequencies_records[frequency].keys()
+
+    def _enforce_bounds(self, excluded_primary_key_value: str) -> None:
+        # The record being accessed is never evicted, since the caching table is about to use its cached data
+        if self.eviction_policy.max_bytes is not None:
+            self._update_modified_records_bytes_sizes()
+        records_count: int = len(self._records)
+        total_bytes_size: int = self._total_bytes_size
+        if not self._is_over_bounds(records_count=records_count, total_bytes_size=total_bytes_size):
+            return
+
+        # The records to evict are selected before being removed, since the candidates are iterated from the store
+        evicted_primary_keys_values: List[str] = []
+        for primary_key_value in self._iterate_eviction_candidates():
+            if not self._is_over_bounds(records_count=records_count, total_bytes_size=total_bytes_size):
+                break
+            if primary_key_value == excluded_primary_key_value or not self._is_record_evictable(primary_key_value):
+                continue
+            evicted_primary_keys_values.append(primary_key_value)
+            records_count -= 1
+            total_bytes_size -= self._records_bytes_sizes.get(primary_key_value, 0)
+
+        for primary_key_value in evicted_primary_keys_values:
+            self.pop_record(primary_key_value=primary_key_value)
+        self.evictions_count += len(evicted_primary_keys_values)
+
+    def _mark_record_modified(self, primary_key_value: str) -> None:
+        if self.parent_store is not None:
+            self._written_records_keys.add(primary_key_value)
+        if self.eviction_policy.max_bytes is not None:
+            self._modified_records_keys.add(primary_key_value)
+        if self.shared_backend is not None:
+            self._unpublished_records_keys.add(primary_key_value)
+
+    def index_record(self, primary_key_value: str, is_for_write: bool = True) -> CachedRecordData:
+        # Returns the cached data of the record, and creates an empty cached data if the record was not in the cache
+        with self._lock:
+            local_record_data: Optional[CachedRecordData] = self._records.get(primary_key_value, None)
+            record_data: Optional[CachedRecordData] = self._get_local_or_shared_record(primary_key_value=primary_key_value)
+            if record_data is None:
+                record_data = self._add_record(primary_key_value=primary_key_value, record_data={})
+            elif record_data is local_record_data:
+                # The records loaded from the shared backend have already been used when being added
+                self._use_record(primary_key_value=primary_key_value)
+            self._enforce_bounds(excluded_primary_key_value=primary_key_value)
+            if is_for_write is True:
+                self._mark_record_modified(primary_key_value=primary_key_value)
+            return record_data
+
+    def get_record_data(self, primary_key_value: str) -> Optional[dict]:
+        # Unlike the index_record, does not count as a use of the record, and does not create the record if missing
+        with self._lock:
+            record_data: Optional[CachedRecordData] = self._get_local_or_shared_record(primary_key_value=primary_key_value)
+            return unwrap_cached_record_data(record_data) if record_data is not None else None
+
+    def put_record(self, primary_key_value: str, record_data: dict) -> None:
+        with self._lock:
+            self.pop_record(primary_key_value=primary_key_value)
+            self._add_record(primary_key_value=primary_key_value, record_data=record_data)
+            self._mark_record_modified(primary_key_value=primary_key_value)
+            self._enforce_bounds(excluded_primary_key_value=primary_key_value)
+
+    def pop_record(self, primary_key_value: str) -> Optional[dict]:
+        with self._lock:
+            if self._snapshot is not None:
+                # The snapshot record is older than the popped record, or than the record that is about to replace it
+                self._snapshot.discard_record(primary_key_value=primary_key_value)
+            record_data: Optional[CachedRecordData] = self._records.pop(primary_key_value, None)
+            if record_data is None:
+                return None
+            self._records_shared_versions.pop(primary_key_value, None)
+            self._unpublished_records_keys.discard(primary_key_value)
+            self._records_complete_paths.pop(primary_key_value, None)
+            self._records_negative_paths.pop(primary_key_value, None)
+            self._records_expiration_times.pop(primary_key_value, None)
+            self._records_cached_times.pop(primary_key_value, None)
+            self._modified_records_keys.discard(primary_key_value)
+            self._total_bytes_size -= self._records_bytes_sizes.pop(primary_key_value, 0)
+            frequency: Optional[int] = self._records_frequencies.pop(primary_key_value, None)
+            if frequency is not None:
+                frequency_records: Dict[str, None] = self._frequencies_records[frequency]
+                frequency_records.pop(primary_key_value)
+                if not len(frequency_records) > 0:
+                    self._frequencies_records.pop(frequency)
+            return unwrap_cached_record_data(record_data)
+
+    def remove_record(self, primary_key_value: str) -> Optional[dict]:
+        # Unlike the pop_record (used to evict a record from this process), also removes the record from the shared backend
+        with self._lock:
+            if self.shared_backend is not None:
+                self.shared_backend.invalidate_record(primary_key_value=primary_key_value)
+            if self.parent_store is not None:
+                self._detached_records_keys.add(primary_key_value)
+                self._written_records_keys.add(primary_key_value)
+            return self.pop_record(primary_key_value=primary_key_value)
+
+    def publish_modified_records(self) -> None:
+        with self._lock:
+            if self.shared_backend is None or not len(self._unpublished_records_keys) > 0:
+                return
+            for primary_key_value in list(self._unpublished_records_keys):
+                if not self._is_record_evictable(primary_key_value):
+                    # The pending operations of the record have not been committed yet
+                    continue
+                self._unpublished_records_keys.discard(primary_key_value)
+                record_data: Optional[CachedRecordData] = self._records.get(primary_key_value, None)
+                if record_data is not None:
+                    self._records_shared_versions[primary_key_value] = self.shared_backend.publish_record(
+                        primary_key_value=primary_key_value, record_data=unwrap_cached_record_data(record_data)
+                    )
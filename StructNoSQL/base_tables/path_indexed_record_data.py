@@ -0,0 +1,148 @@
+from typing import Optional, Dict, Any, Set, Tuple
+
+
+_MISSING = object()
+
+
+def _get_child_value(parent_value: Any, element_key: str) -> Any:
+    parent_type = type(parent_value)
+    if parent_type is dict:
+        return parent_value.get(element_key, _MISSING)
+    if parent_type is list and element_key.isdigit():
+        element_index: int = int(element_key)
+        return parent_value[element_index] if element_index < len(parent_value) else _MISSING
+    # The items of the sets (and of the primitive values) cannot be targeted by a path
+    return _MISSING
+
+
+class PathIndexedRecordData:
+    # The cached data of a record, for the caching tables which CacheEvictionPolicy uses the PATH_INDEXED_LAYOUT. The data
+    # itself is still stored as a nested dict (so that reading a map returns its data without having to rebuild it), but
+    # each path that has been used is indexed by the tuple of its stringed element keys, so that reading an already used
+    # path is a single lookup instead of the navigation of each of its parents. Each indexed path also has the keys of its
+    # indexed children, so that replacing the data of a path only un-indexes the children that have been indexed. The
+    # paths are only indexed when being read (starting from their deepest indexed parent), so that the writes of fields
+    # that are not read again do not pay for their indexing.
+
+    __slots__ = ('record_data', '_indexed_values', '_indexed_children_keys')
+
+    def __init__(self, record_data: dict):
+        self.record_data = record_data
+        self._indexed_values: Dict[Tuple[str, ...], Any] = {(): record_data}
+        self._indexed_children_keys: Dict[Tuple[str, ...], Set[str]] = {}
+
+    def _navigate_path(self, path_keys: Tuple[str, ...], index_navigated_paths: bool) -> Tuple[int, Any]:
+        # Returns the number of keys of the deepest existing parent of the path (or of the path itself), with its value
+        indexed_value: Any = self._indexed_values.get(path_keys, _MISSING)
+        if indexed_value is not _MISSING:
+            return len(path_keys), indexed_value
+
+        # The parents of an indexed path are always indexed, so the deepest indexed parent can be found by bisection
+        num_navigated_keys: int = 0
+        max_num_indexed_keys: int = len(path_keys) - 1
+        while num_navigated_keys < max_num_indexed_keys:
+            middle_num_keys: int = (num_navigated_keys + max_num_indexed_keys + 1) // 2
+            if path_keys[:middle_num_keys] in self._indexed_values:
+                num_navigated_keys = middle_num_keys
+            else:
+                max_num_indexed_keys = middle_num_keys - 1
+
+        navigated_value: Any = self._indexed_values[path_keys[:num_navigated_keys]]
+        while num_navigated_keys < len(path_keys):
+            element_key: str = path_keys[num_navigated_keys]
+            child_value: Any = _get_child_value(parent_value=navigated_value, element_key=element_key)
+            if child_value is _MISSING:
+                break
+            if index_navigated_paths is True:
+                self._indexed_values[path_keys[:num_navigated_keys + 1]] = child_value
+                self._indexed_children_keys.setdefault(path_keys[:num_navigated_keys], set()).add(element_key)
+            navigated_value = child_value
+            num_navigated_keys += 1
+        return num_navigated_keys, navigated_value
+
+    def get(self, path_keys: Tuple[str, ...]) -> Tuple[bool, Any]:
+        num_navigated_keys, navigated_value = self._navigate_path(path_keys=path_keys, index_navigated_paths=True)
+        if num_navigated_keys == len(path_keys):
+            return True, navigated_value
+        return False, None
+
+    def _unindex_children(self, path_keys: Tuple[str, ...]) -> None:
+        children_keys: Optional[Set[str]] = self._indexed_children_keys.pop(path_keys, None)
+        if children_keys is not None:
+            for child_key in children_keys:
+                child_path_keys: Tuple[str, ...] = (*path_keys, child_key)
+                self._unindex_children(path_keys=child_path_keys)
+                self._indexed_values.pop(child_path_keys, None)
+
+    def remove(self, path_keys: Tuple[str, ...]) -> None:
+        if not len(path_keys) > 0:
+            return
+        num_navigated_keys, parent_value = self._navigate_path(path_keys=path_keys[:-1], index_navigated_paths=False)
+        if num_navigated_keys != len(path_keys) - 1:
+            return
+        if type(parent_value) is dict:
+            parent_value.pop(path_keys[-1], None)
+            self._unindex_children(path_keys=path_keys)
+            self._indexed_values.pop(path_keys, None)
+            parent_children_keys: Optional[Set[str]] = self._indexed_children_keys.get(path_keys[:-1], None)
+            if parent_children_keys is not None:
+                parent_children_keys.discard(path_keys[-1])
+        elif type(parent_value) is list:
+            # Removing an item would shift the indexes of the next items, so the entire list is removed from the cache
+            self.remove(path_keys=path_keys[:-1])
+
+    def _set_child_value(self, path_keys: Tuple[str, ...], parent_value: Any, data: Any) -> bool:
+        element_key: str = path_keys[-1]
+        if type(parent_value) is list:
+            element_index: Optional[int] = int(element_key) if element_key.isdigit() else None
+            # The caching table caches a None for the removed fields, but removing an item from a list shifts its next items
+            if data is None or element_index is None or element_index > len(parent_value):
+                self.remove(path_keys=path_keys[:-1])
+                return False
+            if element_index == len(parent_value):
+                parent_value.append(data)
+            else:
+                parent_value[element_index] = data
+        else:
+            parent_value[element_key] = data
+
+        self._unindex_children(path_keys=path_keys)
+        if path_keys in self._indexed_values:
+            self._indexed_values[path_keys] = data
+        return True
+
+    def _get_or_create_parent_value(self, parent_path_keys: Tuple[str, ...]) -> Optional[Any]:
+        num_navigated_keys, navigated_value = self._navigate_path(path_keys=parent_path_keys, index_navigated_paths=False)
+        if type(navigated_value) not in (dict, list):
+            if navigated_value is not None:
+                # A primitive value or a set cannot have children, so its cached data cannot be trusted anymore
+                self.remove(path_keys=parent_path_keys[:num_navigated_keys])
+                return None
+            # The removed parents are replaced by a new map (the root of the record is always a dict)
+            num_navigated_keys -= 1
+            _, parent_value = self._navigate_path(path_keys=parent_path_keys[:num_navigated_keys], index_navigated_paths=False)
+            navigated_value = {}
+            if self._set_child_value(path_keys=parent_path_keys[:num_navigated_keys + 1], parent_value=parent_value, data=navigated_value) is not True:
+                return None
+            num_navigated_keys += 1
+
+        # Like the database with the initialization of the missing parents, the missing parents are created as maps
+        while num_navigated_keys < len(parent_path_keys):
+            child_value: dict = {}
+            if type(navigated_value) is dict:
+                # The paths missing from the data are never indexed, so they can be created without updating the index
+                navigated_value[parent_path_keys[num_navigated_keys]] = child_value
+            elif self._set_child_value(path_keys=parent_path_keys[:num_navigated_keys + 1], parent_value=navigated_value, data=child_value) is not True:
+                return None
+            navigated_value = child_value
+            num_navigated_keys += 1
+        return navigated_value
+
+    def put(self, path_keys: Tuple[str, ...], data: Any) -> bool:
+        # Returns whether the data has been cached, since the items of a list can only be replaced or appended
+        if not len(path_keys) > 0:
+            return False
+        parent_value: Optional[Any] = self._get_or_create_parent_value(parent_path_keys=path_keys[:-1])
+        if parent_value is None:
+            return False
+        return self._set_child_value(path_keys=path_keys, parent_value=parent_value, data=data)
@@ -0,0 +1,103 @@
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable
+
+from StructNoSQL.base_tables.cached_records_store import approximate_bytes_size
+
+
+@dataclass(frozen=True)
+class AutoFlushPolicy:
+    # Thresholds after which the pending operations of a caching table are committed, without waiting for a call to its
+    # commit_operations function : when a record has more than max_record_pending_operations pending operations, when the
+    # pending operations of all the records are bigger than max_pending_bytes (an approximation computed like the max_bytes
+    # of the CacheEvictionPolicy), or when the oldest pending operation is older than max_pending_age_seconds. The thresholds
+    # are checked after each operation adding pending operations, and every check_interval_seconds by a background thread
+    # (only with the sync tables), so that the pending operations of an idle table are still committed. With flush_on_exit,
+    # the pending operations left when the interpreter exits are committed (only with the sync tables).
+    max_record_pending_operations: Optional[int] = None
+    max_pending_bytes: Optional[int] = None
+    max_pending_age_seconds: Optional[float] = None
+    check_interval_seconds: Optional[float] = None
+    flush_on_exit: bool = True
+
+
+class PendingOperationsTracker:
+    # The pending operations are already coalesced by the caching table, which keys them by their joined field path, so
+    # the repeated writes of a same field only count once. The tracked records are kept in the order in which they got
+    # their first pending operation, so that the first tracked record is always the one with the oldest pending operation.
+
+    def __init__(self, auto_flush_policy: AutoFlushPolicy):
+        self.auto_flush_policy = auto_flush_policy
+        self._records_first_pending_times: Dict[str, float] = {}
+        self._records_num_pending_operations: Dict[str, int] = {}
+        self._records_pending_bytes_sizes: Dict[str, int] = {}
+        self._total_pending_bytes_size: int = 0
+
+    @property
+    def total_pending_bytes_size(self) -> int:
+        return self._total_pending_bytes_size
+
+    @property
+    def oldest_pending_age_seconds(self) -> Optional[float]:
+        for first_pending_time in self._records_first_pending_times.values():
+            return time.monotonic() - first_pending_time
+        return None
+
+    def clear(self) -> None:
+        self._records_first_pending_times.clear()
+        self._records_num_pending_operations.clear()
+        self._records_pending_bytes_sizes.clear()
+        self._total_pending_bytes_size = 0
+
+    def track_record(self, primary_key_value: str, pending_update_operations: dict, pending_remove_operations: dict) -> None:
+        num_pending_operations: int = len(pending_update_operations) + len(pending_remove_operations)
+        if not num_pending_operations > 0:
+            self._records_first_pending_times.pop(primary_key_value, None)
+            self._records_num_pending_operations.pop(primary_key_value, None)
+            self._total_pending_bytes_size -= self._records_pending_bytes_sizes.pop(primary_key_value, 0)
+            return
+
+        if primary_key_value not in self._records_first_pending_times:
+            self._records_first_pending_times[primary_key_value] = time.monotonic()
+        self._records_num_pending_operations[primary_key_value] = num_pending_operations
+        if self.auto_flush_policy.max_pending_bytes is not None:
+            record_pending_bytes_size: int = sum(
+                len(joined_field_path) + approximate_bytes_size(setter.value_to_set)
+                for joined_field_path, setter in pending_update_operations.items()
+            ) + sum(len(joined_field_path) for joined_field_path in pending_remove_operations.keys())
+            self._total_pending_bytes_size += record_pending_bytes_size - self._records_pending_bytes_sizes.get(primary_key_value, 0)
+            self._records_pending_bytes_sizes[primary_key_value] = record_pending_bytes_size
+
+    def should_flush(self, primary_key_value: Optional[str] = None) -> bool:
+        max_record_pending_operations: Optional[int] = self.auto_flush_policy.max_record_pending_operations
+        if max_record_pending_operations is not None and primary_key_value is not None:
+            if self._records_num_pending_operations.get(primary_key_value, 0) > max_record_pending_operations:
+                return True
+        max_pending_bytes: Optional[int] = self.auto_flush_policy.max_pending_bytes
+        if max_pending_bytes is not None and self._total_pending_bytes_size > max_pending_bytes:
+            return True
+        max_pending_age_seconds: Optional[float] = self.auto_flush_policy.max_pending_age_seconds
+        if max_pending_age_seconds is not None:
+            oldest_pending_age_seconds: Optional[float] = self.oldest_pending_age_seconds
+            if oldest_pending_age_seconds is not None and not oldest_pending_age_seconds < max_pending_age_seconds:
+                return True
+        return False
+
+
+def run_auto_flush_thread(
+        table_reference: weakref.ReferenceType, check_interval_seconds: float,
+        flush_if_need_to: Callable[[Any], None], stop_event: threading.Event
+) -> None:
+    # Only a weak reference to the table is kept between the checks, so that the thread
+    # stops by itself once the table is no longer used (or when its stop_event is set).
+    while not stop_event.wait(timeout=check_interval_seconds):
+        table: Optional[Any] = table_reference()
+        if table is None:
+            return
+        try:
+            flush_if_need_to(table)
+        except Exception as e:
+            print(f"Failed to auto flush the pending operations. Exception of type {type(e).__name__} occurred: {str(e)}")
+        del table
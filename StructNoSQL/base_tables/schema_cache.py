@@ -0,0 +1,218 @@
+import hashlib
+import io
+import os
+import pickle
+import struct
+import sys
+from typing import Optional, Dict, Tuple, List, Any
+
+from StructNoSQL.fields import BaseField, MapItem, MapModel, DictModel, BaseItem
+from StructNoSQL.practical_logger import message_with_vars
+
+
+# The processing of a model (the rendering of the fields paths and database paths of all its fields) can be cached in a
+# schema file, so that the tables of a new process (like after the cold start of a serverless function) rehydrate the
+# processed schema instead of processing the model again. A schema file only contains the attributes set by the
+# processing, that are restored on the fields of the model of the table, the MapItem's created by the processing, and the
+# recursive {i} fields (whose levels are expanded when first used, like after a processing). The schema files are keyed
+# by the hash of the sources of the modules that define the classes of the model (and of the modules doing the
+# processing), so that a modified model is processed again. The schema files are serialized with pickle, so they must
+# only be loaded from trusted sources.
+
+SCHEMA_CACHE_FORMAT_VERSION = 2
+_SCHEMA_HEADER = struct.Struct('<8s32s')  # magic, sha256 digest of the sources of the model
+_SCHEMA_MAGIC = b'SNSQLM01'
+
+# The attributes of the fields and of the DictModel's that are set by the Processor of the BaseTable
+_PROCESSED_FIELD_ATTRIBUTES = ('_field_name', '_key_name', '_database_path', '_items_excepted_type')
+_PROCESSED_DICT_MODEL_ATTRIBUTES = ('key_name', '_database_path', 'required_fields')
+
+# An object of the model is addressed by the index of its class in the walk of the model and by its variable name, and
+# a DictModel (the items type of a typed Dict field) by the address of its field, followed by 'items'.
+ModelObjectAddress = Tuple[Any, ...]
+
+
+class UncacheableSchemaException(Exception):
+    pass
+
+
+def _walk_model(model_class: type) -> Tuple[List[type], Dict[ModelObjectAddress, BaseItem]]:
+    # Mirrors the discovery of the fields by the Processor of the BaseTable, without processing them. The walk must find
+    # the same classes in the same order, whether the fields have already been processed or not, since the nested classes
+    # of a model are shared by all the copies of the model (where as ActiveSelf is replaced by its class when processed).
+    classes: List[type] = []
+    classes_indexes: Dict[type, int] = {}
+    objects: Dict[ModelObjectAddress, BaseItem] = {}
+
+    def add_items_type(items_type: Any, owner_address: ModelObjectAddress):
+        if isinstance(items_type, DictModel):
+            address: ModelObjectAddress = (*owner_address, 'items')
+            objects[address] = items_type
+            add_items_type(items_type=items_type.item_type, owner_address=address)
+        elif MapModel in getattr(items_type, '__mro__', ()) and items_type not in classes_indexes:
+            classes_indexes[items_type] = len(classes)
+            classes.append(items_type)
+
+    add_items_type(items_type=model_class, owner_address=())
+    i_class = 0
+    while i_class < len(classes):
+        deep_class_variables: dict = {}
+        for component_class in classes[i_class].__mro__:
+            deep_class_variables.update(component_class.__dict__)
+        if '__setup__' in deep_class_variables:
+            # The fields created by a __setup__ function are new objects each time the model is processed
+            raise UncacheableSchemaException(message_with_vars(
+                message="The schema of a model with a __setup__ function cannot be cached",
+                vars_dict={'className': classes[i_class].__qualname__}
+            ))
+        for variable_key_name, variable_item in deep_class_variables.items():
+            if isinstance(variable_item, BaseField):
+                address: ModelObjectAddress = (i_class, variable_key_name)
+                objects[address] = variable_item
+                add_items_type(items_type=variable_item.map_model, owner_address=address)
+                add_items_type(items_type=variable_item.items_excepted_type, owner_address=address)
+        i_class += 1
+    return classes, objects
+
+
+def compute_model_source_hash(data_model: type) -> Optional[bytes]:
+    # Returns None when the source of a class of the model cannot be found (like the classes created dynamically)
+    try:
+        classes, _ = _walk_model(model_class=data_model)
+    except UncacheableSchemaException:
+        return None
+    modules_names: List[str] = list(dict.fromkeys([
+        BaseItem.__module__, __name__, 'StructNoSQL.base_tables.base_table',
+        *(class_type.__module__ for class_type in classes)
+    ]))
+    source_hash = hashlib.sha256(f"{SCHEMA_CACHE_FORMAT_VERSION}:{sys.version_info[:2]}:{data_model.__qualname__}".encode('utf-8'))
+    for module_name in modules_names:
+        module_file_path: Optional[str] = getattr(sys.modules.get(module_name, None), '__file__', None)
+        if module_file_path is None or not os.path.isfile(module_file_path):
+            return None
+        with open(module_file_path, 'rb') as module_file:
+            source_hash.update(module_name.encode('utf-8'))
+            source_hash.update(module_file.read())
+    return source_hash.digest()
+
+
+def make_schema_cache_file_path(directory_path: str, data_model: type, source_hash: bytes) -> str:
+    return os.path.join(directory_path, f"{data_model.__name__}_{source_hash.hex()[:32]}.schema")
+
+
+class _SchemaPickler(pickle.Pickler):
+    # The classes and the objects of the model are referenced by their address, instead of being serialized
+    def __init__(self, file: io.BytesIO, classes: List[type], objects: Dict[ModelObjectAddress, BaseItem]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._classes_indexes: Dict[type, int] = {class_type: i_class for i_class, class_type in enumerate(classes)}
+        self._objects_addresses: Dict[int, ModelObjectAddress] = {}
+        for address, model_object in objects.items():
+            self._objects_addresses.setdefault(id(model_object), address)
+
+    def persistent_id(self, obj: Any) -> Optional[tuple]:
+        if isinstance(obj, type):
+            i_class: Optional[int] = self._classes_indexes.get(obj, None)
+            return ('class', i_class) if i_class is not None else None
+        address: Optional[ModelObjectAddress] = self._objects_addresses.get(id(obj), None)
+        if address is not None:
+            return ('object', address)
+        if isinstance(obj, BaseItem) and type(obj) is not MapItem:
+            # Only the MapItem's are created by the processing, the other fields must be found in the model
+            raise UncacheableSchemaException(message_with_vars(
+                message="A field of the processed schema has not been found in the model",
+                vars_dict={'fieldType': type(obj).__name__, 'databasePath': obj.database_path}
+            ))
+        return None
+
+
+class _SchemaUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, classes: List[type], objects: Dict[ModelObjectAddress, BaseItem]):
+        super().__init__(file)
+        self._classes = classes
+        self._objects = objects
+
+    def persistent_load(self, persistent_id: tuple) -> Any:
+        reference_kind, reference = persistent_id
+        if reference_kind == 'class':
+            return self._classes[reference]
+        return self._objects[reference]
+
+
+def _get_processed_state(model_object: BaseItem) -> Dict[str, Any]:
+    processed_attributes: Tuple[str, ...] = (
+        _PROCESSED_DICT_MODEL_ATTRIBUTES if isinstance(model_object, DictModel) else _PROCESSED_FIELD_ATTRIBUTES
+    )
+    return {
+        attribute_name: model_object.__dict__[attribute_name]
+        for attribute_name in processed_attributes if attribute_name in model_object.__dict__
+    }
+
+
+def export_processed_schema(model_class: type, fields_switch: dict, source_hash: bytes) -> bytes:
+    classes, objects = _walk_model(model_class=model_class)
+    schema_buffer = io.BytesIO()
+    schema_buffer.write(_SCHEMA_HEADER.pack(_SCHEMA_MAGIC, source_hash))
+    _SchemaPickler(file=schema_buffer, classes=classes, objects=objects).dump({
+        'fieldsSwitch': list(fields_switch.items()),
+        'recursiveFields': [(recursive_field.field_path, recursive_field.field) for recursive_field in fields_switch.recursive_fields.values()],
+        'objectsStates': {address: _get_processed_state(model_object) for address, model_object in objects.items()},
+        'classesRequiredFields': {
+            i_class: vars(class_type)['required_fields']
+            for i_class, class_type in enumerate(classes) if 'required_fields' in vars(class_type)
+        }
+    })
+    return schema_buffer.getvalue()
+
+
+def load_processed_schema(model_class: type, fields_switch: dict, schema_bytes: bytes, source_hash: bytes) -> None:
+    # The schema is entirely de-serialized before modifying the model, so that a failed load can fallback to processing
+    if not len(schema_bytes) >= _SCHEMA_HEADER.size:
+        raise Exception(message_with_vars(
+            message="The schema file is too small to contain its header",
+            vars_dict={'schemaBytesSize': len(schema_bytes)}
+        ))
+    magic, schema_source_hash = _SCHEMA_HEADER.unpack_from(schema_bytes, 0)
+    if magic != _SCHEMA_MAGIC:
+        raise Exception(message_with_vars(
+            message="The schema file has not been exported by a table, or by an unsupported version",
+            vars_dict={'magic': magic, 'supportedMagic': _SCHEMA_MAGIC}
+        ))
+    if schema_source_hash != source_hash:
+        raise Exception(message_with_vars(
+            message="The schema file has been exported from different sources of the model",
+            vars_dict={'schemaSourceHash': schema_source_hash.hex(), 'sourceHash': source_hash.hex()}
+        ))
+    classes, objects = _walk_model(model_class=model_class)
+    payload: dict = _SchemaUnpickler(file=io.BytesIO(schema_bytes[_SCHEMA_HEADER.size:]), classes=classes, objects=objects).load()
+    missing_addresses: List[ModelObjectAddress] = [address for address in payload['objectsStates'].keys() if address not in objects]
+    if len(missing_addresses) > 0:
+        raise Exception(message_with_vars(
+            message="Some fields of the schema file have not been found in the model",
+            vars_dict={'missingAddresses': missing_addresses}
+        ))
+
+    for address, processed_state in payload['objectsStates'].items():
+        objects[address].__dict__.update(processed_state)
+    for i_class, required_fields in payload['classesRequiredFields'].items():
+        setattr(classes[i_class], 'required_fields', required_fields)
+    for field_path, field_object in payload['fieldsSwitch']:
+        dict.__setitem__(fields_switch, field_path, field_object)
+    for field_path, field_object in payload['recursiveFields']:
+        fields_switch.add_recursive_field(field_path=field_path, field=field_object)
+    fields_switch.paths_compiler.clear()
+
+
+def read_schema_file(file_path: str) -> Optional[bytes]:
+    if not os.path.isfile(file_path):
+        return None
+    with open(file_path, 'rb') as schema_file:
+        return schema_file.read()
+
+
+def write_schema_file(file_path: str, schema_bytes: bytes) -> None:
+    # The file is replaced atomically, so that a process loading the schema never reads a partially written schema
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+    temporary_file_path: str = f"{file_path}.{os.getpid()}.tmp"
+    with open(temporary_file_path, 'wb') as schema_file:
+        schema_file.write(schema_bytes)
+    os.replace(temporary_file_path, file_path)
@@ -0,0 +1,253 @@
+from decimal import Decimal
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Callable
+
+from StructNoSQL.fields import BaseItem, BaseField, MapItem, MapModel, DictModel
+from StructNoSQL.tables_clients.backend.dynamodb_utils import DynamoDBSerializers, make_generic_dynamodb_serializers
+from StructNoSQL.utils.decimals import float_to_decimal, decimal_to_python
+from StructNoSQL.utils.objects import NoneType
+
+
+# The serializers are compiled once from the field types of the table model, instead of walking every value with
+# the isinstance checks of the DynamoDBUtils.python_to_dynamodb and DynamoDBUtils.dynamodb_to_python functions.
+# The values of the fields that can only contain strings or booleans are not walked at all, the fields of the
+# MapModel's are unrolled into a dict of serializers per field name, and the floats conversions are only done
+# where the field type accept floats. Since the data validation can be disabled, each compiled serializer checks
+# the type of its value, and fallback to the generic serializers if the value does not have an expected type.
+
+_PRIMITIVE_SERIALIZABLE_TYPES: FrozenSet[type] = frozenset({str, bool, int, float, bytes, Decimal, NoneType})
+_NUMBER_TYPES: FrozenSet[type] = frozenset({int, float, Decimal})
+_SET_TYPES: FrozenSet[type] = frozenset({set, frozenset})
+
+
+def _get_model_fields(model_class: type) -> Optional[Dict[str, BaseField]]:
+    # Same retrieval of the fields of a model as the Processor of the BaseTable. The models using a
+    # __setup__ function are not compiled, since their __setup__ function would have to be called again.
+    deep_class_variables: dict = {}
+    for component_class in getattr(model_class, '__mro__', ()):
+        deep_class_variables.update(component_class.__dict__)
+    if deep_class_variables.get('__setup__', None) is not None:
+        return None
+
+    return {
+        (variable_item.field_name if variable_item.field_name is not None else variable_key_name): variable_item
+        for variable_key_name, variable_item in deep_class_variables.items()
+        if isinstance(variable_item, BaseField)
+    }
+
+
+class SchemaSerializersCompiler:
+    def __init__(self, float_to_decimal_function: Callable[[float], Decimal] = float_to_decimal):
+        self.float_to_decimal_function = float_to_decimal_function
+        self.generic_serializers: DynamoDBSerializers = make_generic_dynamodb_serializers(
+            float_to_decimal_function=float_to_decimal_function
+        )
+        # Each MapModel is compiled only once, even if it is used by multiple fields
+        self._compiled_models: Dict[type, DynamoDBSerializers] = {}
+
+    def _compile_primitives_serializers(self, accepted_types: FrozenSet[type]) -> DynamoDBSerializers:
+        # The floats are the only primitive values modified by the encoding, and the Decimal's returned
+        # by boto3 for the number fields, are the only primitive values modified by the decoding.
+        encode_passthrough_types: FrozenSet[type] = accepted_types - {float}
+        decode_passthrough_types: FrozenSet[type] = accepted_types - _NUMBER_TYPES
+        float_to_decimal_function = self.float_to_decimal_function
+        generic_encode = self.generic_serializers.encode
+        generic_decode = self.generic_serializers.decode
+
+        if float in accepted_types:
+            def encode(value: Any) -> Any:
+                value_type = type(value)
+                if value_type is float:
+                    return float_to_decimal_function(value)
+                return value if value_type in encode_passthrough_types else generic_encode(value)
+        else:
+            def encode(value: Any) -> Any:
+                return value if type(value) in encode_passthrough_types else generic_encode(value)
+
+        if len(accepted_types & _NUMBER_TYPES) > 0:
+            def decode(value: Any) -> Any:
+                value_type = type(value)
+                if value_type is Decimal:
+                    return decimal_to_python(decimal_number=value)
+                return value if value_type in decode_passthrough_types else generic_decode(value)
+        else:
+            def decode(value: Any) -> Any:
+                return value if type(value) in decode_passthrough_types else generic_decode(value)
+
+        return DynamoDBSerializers(
+            encode=encode, decode=decode,
+            encode_passthrough_types=encode_passthrough_types,
+            decode_passthrough_types=decode_passthrough_types
+        )
+
+    def _compile_sets_serializers(self, nullable: bool) -> DynamoDBSerializers:
+        # The sets are sent and returned as is by boto3 (including the Decimal's of the numbers sets)
+        passthrough_types: FrozenSet[type] = _SET_TYPES | {NoneType} if nullable is True else _SET_TYPES
+        generic_encode = self.generic_serializers.encode
+        generic_decode = self.generic_serializers.decode
+
+        def encode(value: Any) -> Any:
+            return value if type(value) in passthrough_types else generic_encode(value)
+
+        def decode(value: Any) -> Any:
+            return value if type(value) in passthrough_types else generic_decode(value)
+
+        return DynamoDBSerializers(
+            encode=encode, decode=decode,
+            encode_passthrough_types=passthrough_types, decode_passthrough_types=passthrough_types
+        )
+
+    def _compile_list_serializers(self, items_serializers: DynamoDBSerializers) -> DynamoDBSerializers:
+        if items_serializers is self.generic_serializers:
+            return self.generic_serializers
+
+        encode_item = items_serializers.encode
+        decode_item = items_serializers.decode
+        items_encode_passthrough_types: Optional[FrozenSet[type]] = items_serializers.encode_passthrough_types
+        items_decode_passthrough_types: Optional[FrozenSet[type]] = items_serializers.decode_passthrough_types
+        generic_encode = self.generic_serializers.encode
+        generic_decode = self.generic_serializers.decode
+
+        def encode(value: Any) -> Any:
+            if type(value) is not list:
+                return generic_encode(value)
+            if items_encode_passthrough_types is not None and all(type(item) in items_encode_passthrough_types for item in value):
+                # Like the generic encoding, a new list is always returned
+                return list(value)
+            return list(map(encode_item, value))
+
+        def decode(value: Any) -> Any:
+            if type(value) is not list:
+                return generic_decode(value)
+            if items_decode_passthrough_types is not None and all(type(item) in items_decode_passthrough_types for item in value):
+                return value
+            # Like the generic decoding, the list is modified in place
+            value[:] = map(decode_item, value)
+            return value
+
+        return DynamoDBSerializers(encode=encode, decode=decode)
+
+    def _compile_dict_serializers(self, items_serializers: DynamoDBSerializers) -> DynamoDBSerializers:
+        if items_serializers is self.generic_serializers:
+            return self.generic_serializers
+
+        encode_item = items_serializers.encode
+        decode_item = items_serializers.decode
+        items_encode_passthrough_types: Optional[FrozenSet[type]] = items_serializers.encode_passthrough_types
+        items_decode_passthrough_types: Optional[FrozenSet[type]] = items_serializers.decode_passthrough_types
+        generic_encode = self.generic_serializers.encode
+        generic_decode = self.generic_serializers.decode
+
+        def encode(value: Any) -> Any:
+            if type(value) is not dict:
+                return generic_encode(value)
+            if items_encode_passthrough_types is not None and all(type(item) in items_encode_passthrough_types for item in value.values()):
+                return dict(value)
+            return {key: encode_item(item) for key, item in value.items()}
+
+        def decode(value: Any) -> Any:
+            if type(value) is not dict:
+                return generic_decode(value)
+            if items_decode_passthrough_types is not None and all(type(item) in items_decode_passthrough_types for item in value.values()):
+                return value
+            for key, item in value.items():
+                value[key] = decode_item(item)
+            return value
+
+        return DynamoDBSerializers(encode=encode, decode=decode)
+
+    def _compile_map_model_serializers(self, model_class: type) -> DynamoDBSerializers:
+        existing_serializers: Optional[DynamoDBSerializers] = self._compiled_models.get(model_class, None)
+        if existing_serializers is not None:
+            # Also prevents an infinite recursion on the models that reference themselves (like with ActiveSelf)
+            return existing_serializers
+
+        model_fields: Optional[Dict[str, BaseField]] = _get_model_fields(model_class=model_class)
+        if model_fields is None:
+            self._compiled_models[model_class] = self.generic_serializers
+            return self.generic_serializers
+
+        # The dicts of the fields functions are filled after the serializers have been registered in the compiled models
+        fields_encoders: Dict[str, Callable[[Any], Any]] = {}
+        fields_decoders: Dict[str, Callable[[Any], Any]] = {}
+        generic_encode = self.generic_serializers.encode
+        generic_decode = self.generic_serializers.decode
+
+        def encode(value: Any) -> Any:
+            if type(value) is not dict:
+                return generic_encode(value)
+            return {key: fields_encoders.get(key, generic_encode)(item) for key, item in value.items()}
+
+        def decode(value: Any) -> Any:
+            if type(value) is not dict:
+                return generic_decode(value)
+            for key, item in value.items():
+                value[key] = fields_decoders.get(key, generic_decode)(item)
+            return value
+
+        model_serializers = DynamoDBSerializers(encode=encode, decode=decode)
+        self._compiled_models[model_class] = model_serializers
+
+        for field_name, field_object in model_fields.items():
+            field_serializers: DynamoDBSerializers = self.compile_field(field=field_object)
+            fields_encoders[field_name] = field_serializers.encode
+            fields_decoders[field_name] = field_serializers.decode
+        return model_serializers
+
+    def _compile_item_type_serializers(self, item_type: Any) -> DynamoDBSerializers:
+        # The item_type can be the items_excepted_type of a dict, list or set field, or the map_model of a MapItem
+        if isinstance(item_type, DictModel):
+            return self._compile_dict_serializers(items_serializers=self._compile_item_type_serializers(item_type=item_type.item_type))
+        if MapModel in getattr(item_type, '__mro__', ()):
+            return self._compile_map_model_serializers(model_class=item_type)
+        if isinstance(item_type, (tuple, list)):
+            if all(item in _PRIMITIVE_SERIALIZABLE_TYPES for item in item_type):
+                return self._compile_primitives_serializers(accepted_types=frozenset(item_type))
+            return self.generic_serializers
+        if item_type in _PRIMITIVE_SERIALIZABLE_TYPES:
+            return self._compile_primitives_serializers(accepted_types=frozenset({item_type}))
+        # The Any type, the untyped dict's and list's, and the types that are not known by the compiler
+        return self.generic_serializers
+
+    def compile_field(self, field: BaseItem) -> DynamoDBSerializers:
+        if isinstance(field, DictModel):
+            return self._compile_item_type_serializers(item_type=field)
+        if isinstance(field, MapItem):
+            return self._compile_item_type_serializers(item_type=field.map_model)
+
+        field_types: Tuple[Any, ...] = tuple(field.field_type) if isinstance(field.field_type, (tuple, list)) else (field.field_type,)
+        non_null_field_types: List[Any] = [item for item in field_types if item is not NoneType]
+        if len(non_null_field_types) != 1:
+            # A field without types, or with multiple types, can only be compiled if all its types are primitives
+            if len(non_null_field_types) > 0 and all(item in _PRIMITIVE_SERIALIZABLE_TYPES for item in field_types):
+                return self._compile_primitives_serializers(accepted_types=frozenset(field_types))
+            return self.generic_serializers
+
+        field_type: Any = non_null_field_types[0]
+        if field.map_model is not None:
+            return self._compile_map_model_serializers(model_class=field.map_model)
+        if field_type is dict:
+            return self._compile_dict_serializers(items_serializers=self._compile_item_type_serializers(item_type=field.items_excepted_type))
+        if field_type is list:
+            return self._compile_list_serializers(items_serializers=self._compile_item_type_serializers(item_type=field.items_excepted_type))
+        if field_type is set:
+            return self._compile_sets_serializers(nullable=len(field_types) > 1)
+        if field_type in _PRIMITIVE_SERIALIZABLE_TYPES:
+            return self._compile_primitives_serializers(accepted_types=frozenset(field_types))
+        return self.generic_serializers
+
+
+def compile_field_serializers(field: BaseItem) -> DynamoDBSerializers:
+    return SchemaSerializersCompiler().compile_field(field=field)
+
+
+def compile_table_serializers(
+        model_virtual_map_field: BaseField, fields_switch: Dict[str, BaseItem],
+        float_to_decimal_function: Callable[[float], Decimal] = float_to_decimal
+) -> DynamoDBSerializers:
+    # Compiles the serializers of the records of the table, and of each field of the fields_switch. All the
+    # serializers share the same compiler, so each MapModel of the table model is compiled only once.
+    compiler = SchemaSerializersCompiler(float_to_decimal_function=float_to_decimal_function)
+    record_serializers: DynamoDBSerializers = compiler.compile_field(field=model_virtual_map_field)
+    for field_object in fields_switch.values():
+        field_object.dynamodb_serializers = compiler.compile_field(field=field_object)
+    return record_serializers
@@ -0,0 +1,186 @@
+import abc
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+from StructNoSQL.practical_logger import message_with_vars
+
+
+# A shared cache backend is used by the CachedRecordsStore of a caching table, to share the cached records between the
+# processes of a same host (like the workers of a gunicorn server). Each process keeps its own in-memory copy of the
+# records it uses, along with the version of the shared record it has been loaded from, and only reloads a record when
+# its shared version has changed. Checking the version of a record does not copy the record, so the cached records
+# that are not modified by other processes are read at the same cost than without a shared cache backend.
+
+@dataclass
+class SharedCachedRecord:
+    version: int
+    record_data: dict
+    published_time: float
+
+
+class BaseSharedCacheBackend(abc.ABC):
+    @abc.abstractmethod
+    def get_record_version(self, primary_key_value: str) -> int:
+        # Any change of the record (or of the records sharing its storage) must change the returned version
+        raise Exception("get_record_version not implemented")
+
+    @abc.abstractmethod
+    def load_record(self, primary_key_value: str) -> Optional[SharedCachedRecord]:
+        raise Exception("load_record not implemented")
+
+    @abc.abstractmethod
+    def publish_record(self, primary_key_value: str, record_data: dict) -> int:
+        # Returns the version of the record after its publication
+        raise Exception("publish_record not implemented")
+
+    @abc.abstractmethod
+    def invalidate_record(self, primary_key_value: str) -> int:
+        raise Exception("invalidate_record not implemented")
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        raise Exception("clear not implemented")
+
+
+_FILE_HEADER = struct.Struct('<8sII')  # magic, num_slots, max_record_bytes_size
+_SLOT_HEADER = struct.Struct('<QQdII')  # version, key hash, published time, key bytes size, data bytes size
+_SLOT_VERSION = struct.Struct('<Q')
+_FILE_MAGIC = b'SNSQLC01'
+_MAX_READ_ATTEMPTS = 100
+
+
+def _key_hash(key_bytes: bytes) -> int:
+    # The builtin hash of the strings is randomized per process, so a stable hash is required to share the slots
+    return int.from_bytes(hashlib.blake2b(key_bytes, digest_size=8).digest(), 'little')
+
+
+class MmapSharedCacheBackend(BaseSharedCacheBackend):
+    # Stores the records in a memory mapped file (put it in /dev/shm to keep it in memory), opened with the same file_path
+    # by all the processes. The file is made of num_slots fixed size slots, and each record is stored in the slot of the
+    # hash of its primary key value. A record stored in the same slot than another record replaces it, and the records
+    # larger than max_record_bytes_size are not shared. Each slot has a version, which is made odd while a process writes
+    # into the slot (under a lock of the slot), so that the readers never need a lock, and only retry if the version of
+    # the slot changed while they were reading it. The records are serialized with pickle, so the file must only be
+    # writable by the processes of the application. Only supported on the platforms with fcntl (Linux and macOS).
+
+    def __init__(self, file_path: str, num_slots: int = 4096, max_record_bytes_size: int = 64 * 1024):
+        try:
+            import fcntl
+        except ImportError:
+            raise Exception("The MmapSharedCacheBackend requires the fcntl module, which is not available on this platform")
+        self._fcntl = fcntl
+        self.file_path = file_path
+        self.num_slots = num_slots
+        self.max_record_bytes_size = max_record_bytes_size
+        self.slot_bytes_size: int = _SLOT_HEADER.size + max_record_bytes_size
+        file_bytes_size: int = _FILE_HEADER.size + num_slots * self.slot_bytes_size
+
+        self._file_descriptor: int = os.open(file_path, os.O_RDWR | os.O_CREAT, 0o600)
+        # The locks of fcntl are only between processes, so the threads of a process also need to share a lock
+        self._threads_lock = threading.Lock()
+        fcntl.lockf(self._file_descriptor, fcntl.LOCK_EX, _FILE_HEADER.size, 0)
+        try:
+            if os.fstat(self._file_descriptor).st_size == 0:
+                os.ftruncate(self._file_descriptor, file_bytes_size)
+                os.pwrite(self._file_descriptor, _FILE_HEADER.pack(_FILE_MAGIC, num_slots, max_record_bytes_size), 0)
+            else:
+                file_header: tuple = _FILE_HEADER.unpack(os.pread(self._file_descriptor, _FILE_HEADER.size, 0))
+                if file_header != (_FILE_MAGIC, num_slots, max_record_bytes_size):
+                    raise Exception(message_with_vars(
+                        message="The shared cache file has been created with another configuration",
+                        vars_dict={'filePath': file_path, 'fileHeader': file_header, 'numSlots': num_slots, 'maxRecordBytesSize': max_record_bytes_size}
+                    ))
+        finally:
+            fcntl.lockf(self._file_descriptor, fcntl.LOCK_UN, _FILE_HEADER.size, 0)
+        self._mmap = mmap.mmap(self._file_descriptor, file_bytes_size)
+
+    def close(self) -> None:
+        self._mmap.close()
+        os.close(self._file_descriptor)
+
+    def _slot_offset(self, key_hash: int) -> int:
+        return _FILE_HEADER.size + (key_hash % self.num_slots) * self.slot_bytes_size
+
+    def get_record_version(self, primary_key_value: str) -> int:
+        key_hash: int = _key_hash(str(primary_key_value).encode('utf-8'))
+        return _SLOT_VERSION.unpack_from(self._mmap, self._slot_offset(key_hash=key_hash))[0]
+
+    def load_record(self, primary_key_value: str) -> Optional[SharedCachedRecord]:
+        key_bytes: bytes = str(primary_key_value).encode('utf-8')
+        key_hash: int = _key_hash(key_bytes)
+        slot_offset: int = self._slot_offset(key_hash=key_hash)
+        payload_offset: int = slot_offset + _SLOT_HEADER.size
+        for _ in range(_MAX_READ_ATTEMPTS):
+            version, slot_key_hash, published_time, key_bytes_size, data_bytes_size = _SLOT_HEADER.unpack_from(self._mmap, slot_offset)
+            if version % 2 == 1:
+                # Another process is writing into the slot
+                time.sleep(0)
+                continue
+            if slot_key_hash != key_hash or key_bytes_size != len(key_bytes) or not data_bytes_size > 0:
+                return None
+            payload: bytes = self._mmap[payload_offset:payload_offset + key_bytes_size + data_bytes_size]
+            if _SLOT_VERSION.unpack_from(self._mmap, slot_offset)[0] != version:
+                continue
+            if payload[:key_bytes_size] != key_bytes:
+                return None
+            return SharedCachedRecord(
+                version=version, record_data=pickle.loads(payload[key_bytes_size:]), published_time=published_time
+            )
+        return None
+
+    @contextmanager
+    def _locked_slot(self, slot_offset: int):
+        with self._threads_lock:
+            self._fcntl.lockf(self._file_descriptor, self._fcntl.LOCK_EX, self.slot_bytes_size, slot_offset)
+            try:
+                yield
+            finally:
+                self._fcntl.lockf(self._file_descriptor, self._fcntl.LOCK_UN, self.slot_bytes_size, slot_offset)
+
+    def _write_locked_slot(self, slot_offset: int, key_hash: int, key_bytes: bytes, data_bytes: Optional[bytes]) -> int:
+        version: int = _SLOT_VERSION.unpack_from(self._mmap, slot_offset)[0]
+        # An odd version means that a process stopped while writing into the slot, and that the slot must be re-written
+        stable_version: int = version + 1 if version % 2 == 1 else version
+        _SLOT_VERSION.pack_into(self._mmap, slot_offset, stable_version + 1)
+        if data_bytes is not None:
+            _SLOT_HEADER.pack_into(self._mmap, slot_offset, stable_version + 1, key_hash, time.time(), len(key_bytes), len(data_bytes))
+            payload_offset: int = slot_offset + _SLOT_HEADER.size
+            self._mmap[payload_offset:payload_offset + len(key_bytes) + len(data_bytes)] = key_bytes + data_bytes
+        else:
+            _SLOT_HEADER.pack_into(self._mmap, slot_offset, stable_version + 1, 0, 0.0, 0, 0)
+        _SLOT_VERSION.pack_into(self._mmap, slot_offset, stable_version + 2)
+        return stable_version + 2
+
+    def _write_slot(self, key_bytes: bytes, data_bytes: Optional[bytes], only_if_same_key: bool) -> int:
+        key_hash: int = _key_hash(key_bytes)
+        slot_offset: int = self._slot_offset(key_hash=key_hash)
+        with self._locked_slot(slot_offset=slot_offset):
+            if only_if_same_key is True and _SLOT_HEADER.unpack_from(self._mmap, slot_offset)[1] != key_hash:
+                return _SLOT_VERSION.unpack_from(self._mmap, slot_offset)[0]
+            return self._write_locked_slot(slot_offset=slot_offset, key_hash=key_hash, key_bytes=key_bytes, data_bytes=data_bytes)
+
+    def publish_record(self, primary_key_value: str, record_data: dict) -> int:
+        key_bytes: bytes = str(primary_key_value).encode('utf-8')
+        data_bytes: bytes = pickle.dumps(record_data, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(key_bytes) + len(data_bytes) > self.max_record_bytes_size:
+            # The previous version of the record must not be loaded by the other processes
+            return self._write_slot(key_bytes=key_bytes, data_bytes=None, only_if_same_key=True)
+        return self._write_slot(key_bytes=key_bytes, data_bytes=data_bytes, only_if_same_key=False)
+
+    def invalidate_record(self, primary_key_value: str) -> int:
+        return self._write_slot(key_bytes=str(primary_key_value).encode('utf-8'), data_bytes=None, only_if_same_key=True)
+
+    def clear(self) -> None:
+        for i_slot in range(self.num_slots):
+            slot_offset: int = _FILE_HEADER.size + i_slot * self.slot_bytes_size
+            if _SLOT_HEADER.unpack_from(self._mmap, slot_offset)[1] != 0:
+                with self._locked_slot(slot_offset=slot_offset):
+                    self._write_locked_slot(slot_offset=slot_offset, key_hash=0, key_bytes=b'', data_bytes=None)
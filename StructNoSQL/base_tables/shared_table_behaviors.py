@@ -1,4 +1,4 @@
-from typing import Callable, List, Dict, Optional, Any, Tuple, Iterable
+from typing import Callable, List, Dict, Optional, Any, Tuple, Iterable, Generator
 
 from StructNoSQL import BaseField
 from StructNoSQL.models import DatabasePathElement, FieldGetter, QueryMetadata
@@ -140,7 +140,7 @@ def _inner_query_fields_secondary_index(
         middleware: Callable[[List[List[DatabasePathElement]]], Tuple[Optional[List[Any]], QueryMetadata]],
         primary_index_name: str, get_primary_key_database_path: Callable[[], List[DatabasePathElement]],
         fields_paths_elements: List[List[DatabasePathElement]]
-) -> Tuple[Optional[dict], QueryMetadata]:
+) -> Generator[Any, Any, Tuple[Optional[dict], QueryMetadata]]:
     """
     This function will force the retrieving of the primary key of the records returned by a
     secondary index query operations and retrieve a dict with the primary key of each record as key.
@@ -153,7 +153,7 @@ def _inner_query_fields_secondary_index(
         fields_paths_elements if primary_key_is_being_requested_by_client is True else
         [*fields_paths_elements, get_primary_key_database_path()]
     )
-    retrieved_records_items_data, query_metadata = middleware(super_fields_path_elements)
+    retrieved_records_items_data, query_metadata = yield middleware(super_fields_path_elements)
     if retrieved_records_items_data is None:
         return None, query_metadata
 
@@ -1,3 +1,6 @@
+from StructNoSQL.models import CommitOperationsReport
+
+
 class DataValidationException(Exception):
     def __init__(self, message: str):
         super().__init__(message)
@@ -21,3 +24,12 @@ class UsageOfUntypedSetException(Exception):
             "\nuse typed Set's instead of classic set, a crashing request that will be denied by DynamoDB could be send by"
             "\nStructNoSQL if you tried to add items of different type inside the same set.",
         )
+
+class SessionCommitException(Exception):
+    # Raised when exiting a session of a caching table which pending operations could not all be committed. Since the
+    # pending operations of a session are discarded with the session, the failed records are listed in its commit_report.
+    def __init__(self, commit_report: CommitOperationsReport):
+        super().__init__(
+            f"Failed to commit the pending operations of the session for the records {commit_report.failed_records_keys}"
+        )
+        self.commit_report = commit_report
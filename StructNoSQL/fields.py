@@ -109,6 +109,7 @@ class BaseItem:
     _database_path: Optional[List[DatabasePathElement]] = None
     _key_expected_type: Optional[type] = None
     _items_excepted_type: Optional[type or MapModel] = None
+    _dynamodb_serializers = None
     # We set the _database_path as static, so that the assign_internal_mapping_from_class can setup the path only once,
     # only by having access to the inheritor class type, not even the instance. Yet, when set the _database_path
     # statically, the value is not attributed to the BaseField class (which would cause to have multiple classes override
@@ -263,6 +264,20 @@ class BaseItem:
     def database_path(self) -> Optional[List[DatabasePathElement]]:
         return self._database_path
 
+    @property
+    def dynamodb_serializers(self):
+        """ :return: DynamoDBSerializers """
+        if self._dynamodb_serializers is None:
+            # The fields of the fields_switch of a table are compiled when the table is created. The other
+            # fields (like the MapItem's created by the dict_item property) are compiled when first used.
+            from StructNoSQL.base_tables.schema_serializers import compile_field_serializers
+            self._dynamodb_serializers = compile_field_serializers(field=self)
+        return self._dynamodb_serializers
+
+    @dynamodb_serializers.setter
+    def dynamodb_serializers(self, value):
+        self._dynamodb_serializers = value
+
     @staticmethod
     def instantiate_default_value_type(value_type: type) -> Optional[Any]:
         if value_type == Any:
@@ -412,6 +427,36 @@ class BaseField(BaseItem):
         # todo: find a better name than max_nested
         return self._max_nested
 
+class VersionField(BaseField):
+    # Opt-in optimistic concurrency of the caching tables, by adding a VersionField at the root of a TableDataModel. The
+    # version of a record is captured when the record is first retrieved from the database, and the pending operations
+    # of the record are only committed if its version has not been changed by another writer since, while incrementing
+    # its version. On a version conflict, with REPLAY_PENDING_OPERATIONS the cached data of the record is discarded, its
+    # new version is retrieved, and its pending operations are committed again (up to max_conflict_replays times). With
+    # REPORT_CONFLICTS, the cached data and the pending operations of the record are discarded, and the conflict is
+    # reported in the CommitOperationsReport, so that the caller can read the record again and redo its changes. The
+    # records that have only been written (without their version having been captured) are committed without condition,
+    # while still incrementing their version, so that the other writers of these records can detect their changes.
+    REPLAY_PENDING_OPERATIONS = 'REPLAY_PENDING_OPERATIONS'
+    REPORT_CONFLICTS = 'REPORT_CONFLICTS'
+    CONFLICT_RESOLUTIONS = [REPLAY_PENDING_OPERATIONS, REPORT_CONFLICTS]
+
+    def __init__(self, conflict_resolution: str = REPORT_CONFLICTS, max_conflict_replays: int = 3, custom_field_name: Optional[str] = None):
+        super().__init__(field_type=int, required=False, custom_field_name=custom_field_name)
+        if conflict_resolution not in VersionField.CONFLICT_RESOLUTIONS:
+            raise Exception(message_with_vars(
+                message="conflict_resolution not supported",
+                vars_dict={'conflict_resolution': conflict_resolution, 'CONFLICT_RESOLUTIONS': VersionField.CONFLICT_RESOLUTIONS}
+            ))
+        if not max_conflict_replays > 0:
+            raise Exception(message_with_vars(
+                message="max_conflict_replays must be greater than zero",
+                vars_dict={'max_conflict_replays': max_conflict_replays}
+            ))
+        self.conflict_resolution = conflict_resolution
+        self.max_conflict_replays = max_conflict_replays
+
+
 class MapItem(BaseField):
     _default_primitive_type = dict
 
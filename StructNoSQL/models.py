@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional, Any, List, Dict
+from dataclasses import dataclass, field
+from typing import Optional, Any, List, Dict, Callable
 
 
 @dataclass
@@ -55,6 +55,8 @@ class FieldRemover:
 class FieldPathSetter:
     field_path_elements: List[DatabasePathElement]
     value_to_set: Any
+    # The compiled encode function of the field, used instead of the generic DynamoDBUtils.python_to_dynamodb
+    value_serializer: Optional[Callable[[Any], Any]] = None
 
     def serialize(self) -> dict:
         return {
@@ -89,3 +91,27 @@ class QueryMetadata:
             'hasReachedEnd': self.has_reached_end,
             'lastEvaluatedKey': self.last_evaluated_key
         }
+
+
+@dataclass
+class CommitOperationsReport:
+    # The commit success of each record that had pending operations. The operations of the records that failed to
+    # be committed are kept pending, so that they will be sent again by the next commit of the table, except for the
+    # records rejected because of a version conflict (with a VersionField), listed in the conflicted_records_keys.
+    records_successes: Dict[str, bool]
+    conflicted_records_keys: List[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return all(self.records_successes.values())
+
+    @property
+    def failed_records_keys(self) -> List[str]:
+        return [record_key for record_key, record_success in self.records_successes.items() if record_success is not True]
+
+    def serialize(self) -> dict:
+        return {
+            'success': self.success,
+            'recordsSuccesses': self.records_successes,
+            'conflictedRecordsKeys': self.conflicted_records_keys
+        }
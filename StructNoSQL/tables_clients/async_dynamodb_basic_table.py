@@ -0,0 +1,50 @@
+from typing import Optional, Dict, Any, Tuple, AsyncGenerator
+
+from StructNoSQL.models import FieldGetter, QueryMetadata
+from StructNoSQL.tables_clients.backend.async_dynamodb_core import AsyncDynamoDbCoreAdapter
+from StructNoSQL.tables_clients.dynamodb_basic_table import DynamoDBBasicTable
+
+
+class AsyncDynamoDBBasicTable(DynamoDBBasicTable):
+    # All the operations functions of the DynamoDBBasicTable are executed by the AsyncDynamoDbCoreAdapter,
+    # and return an awaitable of their result. The boto_session must be an aioboto3.Session instead of a boto3.Session.
+    _DYNAMODB_CLIENT_CLASS = AsyncDynamoDbCoreAdapter
+
+    async def paginated_query_field(
+            self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None, index_name: Optional[str] = None,
+            filter_expression: Optional[Any] = None, pagination_records_limit: Optional[int] = None, exclusive_start_key: Optional[Any] = None,
+            data_validation: bool = True, **additional_kwargs
+    ) -> AsyncGenerator[Tuple[Optional[dict], QueryMetadata], None]:
+        current_exclusive_start_key: Optional[Any] = exclusive_start_key
+        while True:
+            records_data, query_metadata = await self.query_field(
+                index_name=index_name, key_value=key_value, field_path=field_path, query_kwargs=query_kwargs,
+                pagination_records_limit=pagination_records_limit, filter_expression=filter_expression,
+                exclusive_start_key=current_exclusive_start_key, data_validation=data_validation, **additional_kwargs
+            )
+            yield records_data, query_metadata
+            if query_metadata.last_evaluated_key is None:
+                break
+            current_exclusive_start_key = query_metadata.last_evaluated_key
+
+    async def paginated_query_multiple_fields(
+            self, key_value: str, getters: Dict[str, FieldGetter], index_name: Optional[str] = None,
+            filter_expression: Optional[Any] = None, pagination_records_limit: Optional[int] = None, exclusive_start_key: Optional[Any] = None,
+            data_validation: bool = True, **additional_kwargs
+    ) -> AsyncGenerator[Tuple[Optional[Dict[str, dict]], QueryMetadata], None]:
+        current_exclusive_start_key: Optional[Any] = exclusive_start_key
+        while True:
+            records_data, query_metadata = await self.query_multiple_fields(
+                key_value=key_value, getters=getters, index_name=index_name,
+                pagination_records_limit=pagination_records_limit,
+                filter_expression=filter_expression,
+                exclusive_start_key=current_exclusive_start_key,
+                data_validation=data_validation, **additional_kwargs
+            )
+            yield records_data, query_metadata
+            if query_metadata.last_evaluated_key is None:
+                break
+            current_exclusive_start_key = query_metadata.last_evaluated_key
+
+    async def close(self) -> None:
+        await self.dynamodb_client.close()
@@ -0,0 +1,87 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Tuple, AsyncGenerator, AsyncIterator
+
+from StructNoSQL.base_tables.pending_operations_auto_flush import AutoFlushPolicy
+
+from StructNoSQL.models import FieldSetter, UnsafeFieldSetter, FieldRemover, QueryMetadata, CommitOperationsReport
+from StructNoSQL.exceptions import SessionCommitException
+from StructNoSQL.tables_clients.backend.async_dynamodb_core import AsyncDynamoDbCoreAdapter
+from StructNoSQL.tables_clients.dynamodb_caching_table import DynamoDBCachingTable
+
+
+class AsyncDynamoDBCachingTable(DynamoDBCachingTable):
+    # All the operations functions of the DynamoDBCachingTable are executed by the AsyncDynamoDbCoreAdapter,
+    # and return an awaitable of their result. The boto_session must be an aioboto3.Session instead of a boto3.Session.
+    _DYNAMODB_CLIENT_CLASS = AsyncDynamoDbCoreAdapter
+    _auto_flush_task: Optional[asyncio.Future] = None
+
+    def _start_auto_flush(self, auto_flush_policy: AutoFlushPolicy) -> None:
+        # The requests of the async tables can only be sent from their event loop, so their pending operations are only
+        # auto flushed after the operations adding them (without background thread, nor flush when the interpreter exits).
+        pass
+
+    def _auto_flush_pending_operations(self) -> None:
+        # The commit runs in the background of the event loop, and only one auto flush commit is running at a time
+        if self._auto_flush_task is None or self._auto_flush_task.done():
+            self._auto_flush_task = asyncio.ensure_future(self.commit_operations())
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator['AsyncDynamoDBCachingTable']:
+        session: AsyncDynamoDBCachingTable = self._make_session()
+        session._auto_flush_task = None
+        commit_report: Optional[CommitOperationsReport] = None
+        try:
+            yield session
+            commit_report = await session.commit_operations_with_report()
+        finally:
+            session._close_session(is_committed=commit_report is not None and commit_report.success)
+        if commit_report.success is not True:
+            raise SessionCommitException(commit_report=commit_report)
+
+    async def paginated_query_field(
+            self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None, index_name: Optional[str] = None,
+            filter_expression: Optional[Any] = None, pagination_records_limit: Optional[int] = None, exclusive_start_key: Optional[Any] = None,
+            data_validation: bool = True, **additional_kwargs
+    ) -> AsyncGenerator[Tuple[Optional[dict], QueryMetadata], None]:
+        current_exclusive_start_key: Optional[Any] = exclusive_start_key
+        while True:
+            records_data, query_metadata = await self.query_field(
+                index_name=index_name, key_value=key_value, field_path=field_path, query_kwargs=query_kwargs,
+                pagination_records_limit=pagination_records_limit, filter_expression=filter_expression,
+                exclusive_start_key=current_exclusive_start_key, data_validation=data_validation, **additional_kwargs
+            )
+            yield records_data, query_metadata
+            if query_metadata.last_evaluated_key is None:
+                break
+            current_exclusive_start_key = query_metadata.last_evaluated_key
+
+    # The following operations are only applied to the cache and to the pending operations (which
+    # will be sent to the database with the commit functions), yet they are still awaitable, in order
+    # for all the operations functions of the async caching table to be used in the same way.
+
+    async def update_field(self, key_value: str, field_path: str, value_to_set: Any, query_kwargs: Optional[dict] = None) -> bool:
+        return super().update_field(key_value=key_value, field_path=field_path, value_to_set=value_to_set, query_kwargs=query_kwargs)
+
+    async def update_multiple_fields(self, key_value: str, setters: List[FieldSetter or UnsafeFieldSetter]) -> bool:
+        return super().update_multiple_fields(key_value=key_value, setters=setters)
+
+    async def delete_field(self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None) -> bool:
+        return super().delete_field(key_value=key_value, field_path=field_path, query_kwargs=query_kwargs)
+
+    async def delete_multiple_fields(self, key_value: str, removers: Dict[str, FieldRemover]) -> Dict[str, bool]:
+        return {
+            key: super(AsyncDynamoDBCachingTable, self).delete_field(
+                key_value=key_value,
+                field_path=remover_item.field_path,
+                query_kwargs=remover_item.query_kwargs
+            ) for key, remover_item in removers.items()
+        }
+
+    async def grouped_delete_multiple_fields(self, key_value: str, removers: List[FieldRemover]) -> bool:
+        return super().grouped_delete_multiple_fields(key_value=key_value, removers=removers)
+
+    async def close(self) -> None:
+        if self._auto_flush_task is not None and not self._auto_flush_task.done():
+            await self._auto_flush_task
+        await self.dynamodb_client.close()
@@ -1 +1,3 @@
-from .models import PrimaryIndex, GlobalSecondaryIndex, Response, GetItemResponse, CreateTableQueryKwargs, HASH_KEY_TYPE, SORT_KEY_TYPE, EXPRESSION_MAX_BYTES_SIZE
+from .models import PrimaryIndex, GlobalSecondaryIndex, Response, GetItemResponse, CreateTableQueryKwargs, HASH_KEY_TYPE, SORT_KEY_TYPE, EXPRESSION_MAX_BYTES_SIZE, \
+    EXPRESSION_ATTRIBUTES_MAX_BYTES_SIZE, ITEM_MAX_BYTES_SIZE, BATCH_GET_ITEM_MAX_KEYS, BATCH_WRITE_ITEM_MAX_ITEMS, \
+    ConnectionPoolConfig, DEFAULT_MAX_POOL_CONNECTIONS, RetryPolicy, DEFAULT_RETRYABLE_ERROR_CODES
@@ -0,0 +1,128 @@
+import asyncio
+from typing import List, Optional, Any, Awaitable, Callable
+
+from botocore.config import Config
+
+from StructNoSQL.tables_clients.backend.dynamodb_core import DynamoDbCoreAdapter
+from StructNoSQL.tables_clients.backend.dynamodb_utils import DynamoDBSerializers
+from StructNoSQL.tables_clients.backend.models import GlobalSecondaryIndex, PrimaryIndex, ConnectionPoolConfig, RetryPolicy, \
+    BOTOCORE_RETRIES_CONFIG
+from StructNoSQL.tables_clients.backend.low_level_client import make_low_level_request_kwargs, low_level_response_to_python
+from StructNoSQL.tables_clients.backend.operations import DynamoDBRequest, AsyncOperationsDriver
+
+
+def _make_default_aioboto3_session() -> Any:
+    try:
+        import aioboto3
+    except ImportError:
+        raise ImportError(
+            "The aioboto3 library is required to use the async tables clients. "
+            "Install it with : pip install StructNoSQL[async]"
+        )
+    return aioboto3.Session()
+
+
+def _make_aio_config(connection_pool_config: ConnectionPoolConfig) -> Any:
+    try:
+        from aiobotocore.config import AioConfig
+    except ImportError:
+        # Sessions that are not from aioboto3 (like sessions wrapping a sync boto3 session) use the botocore config
+        return Config(**connection_pool_config.to_config_kwargs(), retries=BOTOCORE_RETRIES_CONFIG)
+    # The aiohttp connector of aiobotocore does not support the tcp_keepalive option, and uses its own keep-alive instead
+    config_kwargs: dict = connection_pool_config.to_config_kwargs()
+    config_kwargs.pop('tcp_keepalive')
+    return AioConfig(**config_kwargs, retries=BOTOCORE_RETRIES_CONFIG, connector_args={'keepalive_timeout': 60})
+
+
+class AsyncDynamoDbCoreAdapter(DynamoDbCoreAdapter):
+    # The operations logic is fully inherited from the DynamoDbCoreAdapter. Only the resource setup and
+    # the requests execution are overridden, which makes all the public functions of the adapter awaitable.
+
+    def __init__(
+            self, table_name: str, region_name: str, primary_index: PrimaryIndex,
+            create_table: bool = True, billing_mode: str = DynamoDbCoreAdapter.PAY_PER_REQUEST,
+            global_secondary_indexes: List[GlobalSecondaryIndex] = None,
+            boto_session: Optional[Any] = None,
+            connection_pool_config: Optional[ConnectionPoolConfig] = None,
+            engine: str = DynamoDbCoreAdapter.RESOURCE_ENGINE,
+            record_serializers: Optional[DynamoDBSerializers] = None,
+            retry_policy: Optional[RetryPolicy] = None
+    ):
+        self._resource_context_manager: Optional[Any] = None
+        self._low_level_client_context_manager: Optional[Any] = None
+        self._table_resource: Optional[Any] = None
+        self._resource_setup_lock: Optional[asyncio.Lock] = None
+        self._async_requests_semaphore: Optional[asyncio.Semaphore] = None
+        super().__init__(
+            table_name=table_name, region_name=region_name, primary_index=primary_index,
+            create_table=create_table, billing_mode=billing_mode,
+            global_secondary_indexes=global_secondary_indexes, boto_session=boto_session,
+            connection_pool_config=connection_pool_config, engine=engine,
+            record_serializers=record_serializers, retry_policy=retry_policy
+        )
+
+    def _setup_dynamodb_resource(self, region_name: str, boto_session: Optional[Any]) -> None:
+        # The aioboto3 resource can only be opened inside a running event loop,
+        # so it is lazily opened when the first request is being executed.
+        self.boto_session = boto_session if boto_session is not None else _make_default_aioboto3_session()
+        self.dynamodb = None
+        self.dynamodb_low_level_client = None
+
+    def _create_table_if_not_exists(self) -> None:
+        # The table creation is done by _async_create_table_if_not_exists when the resource is opened
+        pass
+
+    async def _async_create_table_if_not_exists(self) -> None:
+        if self.create_table:
+            create_table_query_kwargs = self._make_create_table_query_kwargs()
+            try:
+                await self.dynamodb.create_table(**create_table_query_kwargs.data)
+            except Exception as e:
+                if e.__class__.__name__ != "ResourceInUseException":
+                    raise Exception(f"Request to create the table if not exist failed: Exception of type {type(e).__name__} occurred {str(e)}")
+
+    async def _get_table_resource(self) -> Any:
+        if self._table_resource is None:
+            if self._resource_setup_lock is None:
+                self._resource_setup_lock = asyncio.Lock()
+            async with self._resource_setup_lock:
+                # The table resource is checked again, in case it has been opened by a concurrent request while waiting for the lock
+                if self._table_resource is None:
+                    client_config: Any = _make_aio_config(connection_pool_config=self.connection_pool_config)
+                    self._resource_context_manager = self.boto_session.resource('dynamodb', region_name=self.region_name, config=client_config)
+                    self.dynamodb = await self._resource_context_manager.__aenter__()
+                    if self.engine == DynamoDbCoreAdapter.CLIENT_ENGINE:
+                        self._low_level_client_context_manager = self.boto_session.client('dynamodb', region_name=self.region_name, config=client_config)
+                        self.dynamodb_low_level_client = await self._low_level_client_context_manager.__aenter__()
+                    await self._async_create_table_if_not_exists()
+                    self._table_resource = await self.dynamodb.Table(self.table_name)
+        return self._table_resource
+
+    def _make_operations_driver(self, request_executor: Callable[[DynamoDBRequest], Awaitable[Any]], max_concurrency: int) -> AsyncOperationsDriver:
+        return AsyncOperationsDriver(request_executor=request_executor, max_concurrency=max_concurrency)
+
+    async def _execute_request(self, request: DynamoDBRequest) -> Any:
+        table_resource = await self._get_table_resource()
+        if self._async_requests_semaphore is None:
+            # Like the resource setup lock, the semaphore is created inside the event loop of the requests
+            self._async_requests_semaphore = asyncio.Semaphore(self.connection_pool_config.max_pool_connections)
+        async with self._async_requests_semaphore:
+            self._count_round_trip()
+            if self.engine == DynamoDbCoreAdapter.CLIENT_ENGINE:
+                response: dict = await getattr(self.dynamodb_low_level_client, request.method_name)(
+                    **make_low_level_request_kwargs(request=request, table_name=self.table_name)
+                )
+                return low_level_response_to_python(response=response)
+            request_target = table_resource if request.table_level is True else self.dynamodb
+            return await getattr(request_target, request.method_name)(**request.kwargs)
+
+    async def close(self) -> None:
+        if self._low_level_client_context_manager is not None:
+            await self._low_level_client_context_manager.__aexit__(None, None, None)
+            self._low_level_client_context_manager = None
+            self.dynamodb_low_level_client = None
+        if self._resource_context_manager is not None:
+            await self._resource_context_manager.__aexit__(None, None, None)
+            self._resource_context_manager = None
+            self._table_resource = None
+            self.dynamodb = None
@@ -1,35 +1,117 @@
 import logging
-from sys import getsizeof
-from concurrent.futures.thread import ThreadPoolExecutor
+import random
+import threading
 
 import boto3
 from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 from boto3.exceptions import ResourceNotExistsError
-from typing import List, Optional, Any, Dict, Tuple
+from typing import List, Optional, Any, Dict, Tuple, Generator, Callable
 
 from botocore.exceptions import ClientError
 
-from StructNoSQL.tables_clients.backend.dynamodb_utils import DynamoDBUtils
+from StructNoSQL.tables_clients.backend.dynamodb_utils import DynamoDBUtils, DynamoDBSerializers, GENERIC_DYNAMODB_SERIALIZERS
+from StructNoSQL.tables_clients.backend.expressions_paths import ExpressionPathsBuilder
+from StructNoSQL.tables_clients.backend.expressions_sizes import ExpressionClause, pack_expression_clauses, \
+    join_expression_clauses, can_fit_in_single_request, join_multiple_actions_expression_clauses, add_condition_clause
+from StructNoSQL.tables_clients.backend.low_level_client import make_low_level_request_kwargs, low_level_response_to_python
+from StructNoSQL.tables_clients.backend.operations import DynamoDBRequest, ConcurrentOperations, OperationDelay, \
+    SyncOperationsDriver
 from StructNoSQL.tables_clients.backend.models import GlobalSecondaryIndex, PrimaryIndex, CreateTableQueryKwargs, \
-    GetItemResponse, Response, EXPRESSION_MAX_BYTES_SIZE
+    GetItemResponse, Response, BATCH_GET_ITEM_MAX_KEYS, BATCH_GET_MAX_CONCURRENT_REQUESTS, BATCH_OPERATIONS_MAX_RETRIES, \
+    BATCH_OPERATIONS_RETRY_BASE_DELAY, BATCH_OPERATIONS_RETRY_MAX_DELAY, BATCH_WRITE_ITEM_MAX_ITEMS, \
+    BATCH_WRITE_MAX_CONCURRENT_REQUESTS, ConnectionPoolConfig, RetryPolicy, BOTOCORE_RETRIES_CONFIG
+from StructNoSQL.tables_clients.backend.retries import RequestsRetrier, get_exception_error_code
 from StructNoSQL.models import DatabasePathElement, FieldPathSetter, MapItemInitializer, \
     MapItemInitializerContainer, QueryMetadata
 from StructNoSQL.practical_logger import message_with_vars
-from StructNoSQL.utils.data_processing import navigate_into_data_with_field_path_elements
+from StructNoSQL.utils.data_processing import navigate_into_data_with_field_path_elements, deep_merge_dicts
+
+
+def _batch_retry_delay(i_attempt: int) -> float:
+    # Exponential backoff with full jitter, as recommended by AWS for the retries of unprocessed batch items.
+    max_delay: float = min(BATCH_OPERATIONS_RETRY_MAX_DELAY, BATCH_OPERATIONS_RETRY_BASE_DELAY * (2 ** (i_attempt - 1)))
+    return random.uniform(0, max_delay)
+
+def _serialize_setter_value(setter: FieldPathSetter) -> Any:
+    if setter.value_serializer is not None:
+        return setter.value_serializer(setter.value_to_set)
+    return DynamoDBUtils.python_to_dynamodb(python_object=setter.value_to_set)
+
+def _have_overlapping_paths(first_paths_elements: List[List[DatabasePathElement]], second_paths_elements: List[List[DatabasePathElement]]) -> bool:
+    # Two paths overlap if they are equal, or if one of them is the parent of the other
+    first_paths: List[tuple] = [tuple(element.element_key for element in path_elements) for path_elements in first_paths_elements]
+    first_paths_prefixes: set = {path[:i] for path in first_paths for i in range(1, len(path) + 1)}
+    first_full_paths: set = set(first_paths)
+    for path_elements in second_paths_elements:
+        path: tuple = tuple(element.element_key for element in path_elements)
+        if path in first_paths_prefixes or any(path[:i] in first_full_paths for i in range(1, len(path))):
+            return True
+    return False
+
+
+def _split_setters_in_non_overlapping_layers(setters: List[FieldPathSetter]) -> List[List[int]]:
+    # Returns the indexes of the setters of each layer, where no two setters of a same layer have overlapping paths (which
+    # DynamoDB would reject in a same request). Each setter is put in the layer following the layers of the previous
+    # setters that overlap its path, so that the layers sent one after another apply the setters in their original order.
+    layers_indexes_per_full_path: Dict[tuple, int] = {}
+    layers_indexes_per_prefix: Dict[tuple, int] = {}
+    setters_indexes_per_layer: List[List[int]] = []
+    for i_setter, setter in enumerate(setters):
+        path: tuple = tuple(element.element_key for element in setter.field_path_elements)
+        # The previous setters with the same path or a child path, and the previous setters of the parents of the path
+        overlapping_layers_indexes: List[int] = [layers_indexes_per_prefix.get(path, -1)] + [
+            layers_indexes_per_full_path.get(path[:i], -1) for i in range(1, len(path))
+        ]
+        i_layer: int = 1 + max(overlapping_layers_indexes)
+        layers_indexes_per_full_path[path] = max(layers_indexes_per_full_path.get(path, -1), i_layer)
+        for i in range(1, len(path) + 1):
+            layers_indexes_per_prefix[path[:i]] = max(layers_indexes_per_prefix.get(path[:i], -1), i_layer)
+        if i_layer == len(setters_indexes_per_layer):
+            setters_indexes_per_layer.append([])
+        setters_indexes_per_layer[i_layer].append(i_setter)
+    return setters_indexes_per_layer
+
+
+def _has_primary_key_in_fields_path_elements(index_name: str, fields_path_elements: List[List[DatabasePathElement]]) -> bool:
+    for field_path_elements in fields_path_elements:
+        if len(field_path_elements) == 1 and field_path_elements[0].element_key == index_name:
+            return True
+    return False
 
 
 class DynamoDbCoreAdapter:
     _EXISTING_DATABASE_CLIENTS = {}
     PAY_PER_REQUEST = "PAY_PER_REQUEST"
     PROVISIONED = "PROVISIONED"
+    # The resource engine sends the requests with the boto3 resource, where as the client engine sends them with the
+    # low level DynamoDB client, and converts the requests and responses from and to the DynamoDB wire format itself.
+    RESOURCE_ENGINE = "resource"
+    CLIENT_ENGINE = "client"
 
     def __init__(
             self, table_name: str, region_name: str, primary_index: PrimaryIndex,
             create_table: bool = True, billing_mode: str = PAY_PER_REQUEST,
             global_secondary_indexes: List[GlobalSecondaryIndex] = None,
-            boto_session: Optional[boto3.Session] = None
+            boto_session: Optional[boto3.Session] = None,
+            connection_pool_config: Optional[ConnectionPoolConfig] = None,
+            engine: str = RESOURCE_ENGINE,
+            record_serializers: Optional[DynamoDBSerializers] = None,
+            retry_policy: Optional[RetryPolicy] = None
     ):
+        if engine not in [DynamoDbCoreAdapter.RESOURCE_ENGINE, DynamoDbCoreAdapter.CLIENT_ENGINE]:
+            raise Exception(message_with_vars(
+                message="Unsupported DynamoDB engine",
+                vars_dict={'engine': engine, 'supportedEngines': [DynamoDbCoreAdapter.RESOURCE_ENGINE, DynamoDbCoreAdapter.CLIENT_ENGINE]}
+            ))
+        self.engine = engine
+        # The serializers compiled from the table model, used for the records sent and returned with the resource engine
+        self.record_serializers = record_serializers if record_serializers is not None else GENERIC_DYNAMODB_SERIALIZERS
         self.table_name = table_name
+        self.region_name = region_name
+        self.connection_pool_config = connection_pool_config if connection_pool_config is not None else ConnectionPoolConfig()
+        # Each adapter has its own retrier, so that the retry budget and the rate limiter are per table
+        self.requests_retrier = RequestsRetrier(retry_policy=retry_policy if retry_policy is not None else RetryPolicy())
         self.primary_index = primary_index
         self.create_table = create_table
         self.billing_mode = billing_mode
@@ -39,31 +121,98 @@ class DynamoDbCoreAdapter:
             for secondary_index in self.global_secondary_indexes:
                 self._global_secondary_indexes_hash_keys.append(secondary_index.hash_key_name)
 
-        # We store the database clients in a static variable, so that if we init the class with
-        # the same region_name, we do not need to wait for a new initialization of the client.
-        if region_name in self._EXISTING_DATABASE_CLIENTS.keys():
-            self.dynamodb = self._EXISTING_DATABASE_CLIENTS[region_name]
-            # print(f"Re-using the already created dynamodb client for region {region_name}")
-        elif "default" in self._EXISTING_DATABASE_CLIENTS.keys():
-            self.dynamodb = self._EXISTING_DATABASE_CLIENTS["default"]
-            # print(f"Re-using the already created dynamodb client for the default region")
+        # Number of requests sent to DynamoDB (including the retries), used to monitor the cost of the operations
+        self._round_trips_count: int = 0
+        self._round_trips_count_lock = threading.Lock()
+        # Number of retrieval operations that failed (instead of finding no item), so that the caching tables can
+        # tell apart a missing item and a failed request, since the retrieval operations return None in both cases.
+        self._failed_retrievals_count: int = 0
+
+        # All the operations of the adapter share the same drivers, and the same bound of concurrent requests, so that the
+        # nested concurrent operations (like the records of a commit, each with its packed setters and its initializers)
+        # never send more requests at the same time than the max_pool_connections of the connection_pool_config.
+        max_concurrency: int = self.connection_pool_config.max_pool_connections
+        self._requests_semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._operations_driver = self._make_operations_driver(request_executor=self._execute_request_with_retries, max_concurrency=max_concurrency)
+        self._requests_retries_driver = self._make_operations_driver(request_executor=self._execute_request, max_concurrency=max_concurrency)
+
+        self._setup_dynamodb_resource(region_name=region_name, boto_session=boto_session)
+        self._create_table_if_not_exists()
+
+    @property
+    def round_trips_count(self) -> int:
+        return self._round_trips_count
+
+    def reset_round_trips_count(self) -> None:
+        with self._round_trips_count_lock:
+            self._round_trips_count = 0
+
+    def _count_round_trip(self) -> None:
+        with self._round_trips_count_lock:
+            self._round_trips_count += 1
+
+    @property
+    def failed_retrievals_count(self) -> int:
+        return self._failed_retrievals_count
+
+    def _count_failed_retrieval(self) -> None:
+        with self._round_trips_count_lock:
+            self._failed_retrievals_count += 1
+
+    def _setup_dynamodb_resource(self, region_name: str, boto_session: Optional[boto3.Session]) -> None:
+        self.dynamodb = self._get_or_create_database_client(
+            region_name=region_name, boto_session=boto_session, client_kind=DynamoDbCoreAdapter.RESOURCE_ENGINE
+        )
+        # The Table handle is created only once per adapter, instead of re-creating a Table resource for each request.
+        self._table_resource = self.dynamodb.Table(self.table_name)
+        # The low level client cannot be the client of the resource (self.dynamodb.meta.client), since the
+        # resource registers on its client the handlers that serialize and deserialize the requests.
+        self.dynamodb_low_level_client = self._get_or_create_database_client(
+            region_name=region_name, boto_session=boto_session, client_kind=DynamoDbCoreAdapter.CLIENT_ENGINE
+        ) if self.engine == DynamoDbCoreAdapter.CLIENT_ENGINE else None
+
+    def _get_or_create_database_client(self, region_name: str, boto_session: Optional[boto3.Session], client_kind: str) -> Any:
+        # We store the database clients in a static variable, so that if we init the class with the same boto_session,
+        # region_name and connection_pool_config, we do not need to wait for a new initialization of the client, and
+        # all the tables share the same pool of connections.
+        database_client_key: Tuple[Optional[boto3.Session], str, ConnectionPoolConfig, str] = (
+            boto_session, region_name, self.connection_pool_config, client_kind
+        )
+        existing_database_client: Optional[Any] = self._EXISTING_DATABASE_CLIENTS.get(database_client_key, None)
+        if existing_database_client is not None:
+            return existing_database_client
+
+        # print(f"Initializing the {self}. For local development, make sure that you are connected to internet."
+        #       f"\nOtherwise the DynamoDB client will get stuck at initializing the {self}")
+        used_boto_session: boto3.Session = boto3.Session() if boto_session is None else boto_session
+        client_factory = used_boto_session.resource if client_kind == DynamoDbCoreAdapter.RESOURCE_ENGINE else used_boto_session.client
+        client_config = Config(**self.connection_pool_config.to_config_kwargs(), retries=BOTOCORE_RETRIES_CONFIG)
+        dynamodb_regions = used_boto_session.get_available_regions('dynamodb')
+        if region_name in dynamodb_regions:
+            database_client = client_factory('dynamodb', region_name=region_name, config=client_config)
         else:
-            # print(f"Initializing the {self}. For local development, make sure that you are connected to internet."
-            #       f"\nOtherwise the DynamoDB client will get stuck at initializing the {self}")
-
-            used_boto_session: boto3.Session = boto3.Session() if boto_session is None else boto_session
-            dynamodb_regions = used_boto_session.get_available_regions('dynamodb')
-            if region_name in dynamodb_regions:
-                self.dynamodb = used_boto_session.resource('dynamodb', region_name=region_name)
-                self._EXISTING_DATABASE_CLIENTS[region_name] = self.dynamodb
-            else:
-                self.dynamodb = used_boto_session.resource('dynamodb')
-                self._EXISTING_DATABASE_CLIENTS['default'] = self.dynamodb
-                logging.debug(
-                    f"Warning ! The specified dynamodb region_name {region_name} is not a valid region_name."
-                    f"The dynamodb client has been initialized without specifying the region.")
+            database_client = client_factory('dynamodb', config=client_config)
+            logging.debug(
+                f"Warning ! The specified dynamodb region_name {region_name} is not a valid region_name."
+                f"The dynamodb client has been initialized without specifying the region.")
+        self._EXISTING_DATABASE_CLIENTS[database_client_key] = database_client
+        return database_client
+
+    def _make_create_table_query_kwargs(self) -> CreateTableQueryKwargs:
+        create_table_query_kwargs = CreateTableQueryKwargs(table_name=self.table_name, billing_mode=self.billing_mode)
+        create_table_query_kwargs.add_hash_key(
+            key_name=self.primary_index.hash_key_name,
+            key_python_variable_type=self.primary_index.hash_key_variable_python_type
+        )
+        if self.primary_index.sort_key_name is not None and self.primary_index.sort_key_variable_python_type is not None:
+            create_table_query_kwargs.add_hash_key(
+                key_name=self.primary_index.sort_key_name,
+                key_python_variable_type=self.primary_index.sort_key_variable_python_type
+            )
 
-        self._create_table_if_not_exists()
+        if self.global_secondary_indexes is not None:
+            create_table_query_kwargs.add_all_global_secondary_indexes(global_secondary_indexes=self.global_secondary_indexes)
+        return create_table_query_kwargs
 
     def _create_table_if_not_exists(self) -> None:
         """
@@ -71,30 +220,62 @@ class DynamoDbCoreAdapter:
         :raises: PersistenceException: When `create_table` fails on dynamodb resource.
         """
         if self.create_table:
-            create_table_query_kwargs = CreateTableQueryKwargs(table_name=self.table_name, billing_mode=self.billing_mode)
-            create_table_query_kwargs.add_hash_key(
-                key_name=self.primary_index.hash_key_name,
-                key_python_variable_type=self.primary_index.hash_key_variable_python_type
-            )
-            if self.primary_index.sort_key_name is not None and self.primary_index.sort_key_variable_python_type is not None:
-                create_table_query_kwargs.add_hash_key(
-                    key_name=self.primary_index.sort_key_name,
-                    key_python_variable_type=self.primary_index.sort_key_variable_python_type
-                )
-
-            if self.global_secondary_indexes is not None:
-                create_table_query_kwargs.add_all_global_secondary_indexes(global_secondary_indexes=self.global_secondary_indexes)
+            create_table_query_kwargs = self._make_create_table_query_kwargs()
             try:
                 self.dynamodb.create_table(**create_table_query_kwargs.data)
             except Exception as e:
                 if e.__class__.__name__ != "ResourceInUseException":
                     raise Exception(f"Request to create the table if not exist failed: Exception of type {type(e).__name__} occurred {str(e)}")
 
+    def _make_operations_driver(self, request_executor: Callable[[DynamoDBRequest], Any], max_concurrency: int) -> SyncOperationsDriver:
+        # The AsyncDynamoDbCoreAdapter overrides this function to execute the operations with an AsyncOperationsDriver
+        return SyncOperationsDriver(request_executor=request_executor, max_concurrency=max_concurrency)
+
+    def _execute_request(self, request: DynamoDBRequest) -> Any:
+        with self._requests_semaphore:
+            self._count_round_trip()
+            if self.engine == DynamoDbCoreAdapter.CLIENT_ENGINE:
+                response: dict = getattr(self.dynamodb_low_level_client, request.method_name)(
+                    **make_low_level_request_kwargs(request=request, table_name=self.table_name)
+                )
+                return low_level_response_to_python(response=response)
+            request_target = self._table_resource if request.table_level is True else self.dynamodb
+            return getattr(request_target, request.method_name)(**request.kwargs)
+
+    def _execute_request_with_retries(self, request: DynamoDBRequest) -> Any:
+        return self._requests_retries_driver.execute_operation(operation=self.requests_retrier.request_operation(request=request))
+
+    def record_to_python(self, record: Any) -> Any:
+        # With the client engine, the responses have already been converted to their final Python values
+        return record if self.engine == DynamoDbCoreAdapter.CLIENT_ENGINE else self.record_serializers.decode(record)
+
+    def record_to_dynamodb(self, record: Any) -> Any:
+        # The client engine also uses the encoded records, since its wire format serializer supports the Decimal's
+        return self.record_serializers.encode(record)
+
+    def query_response_to_python(self, response: dict) -> dict:
+        if self.engine == DynamoDbCoreAdapter.CLIENT_ENGINE:
+            return response
+        items: Optional[List[dict]] = response.get('Items', None)
+        if items is not None:
+            response['Items'] = [self.record_serializers.decode(item) for item in items]
+        last_evaluated_key: Optional[dict] = response.get('LastEvaluatedKey', None)
+        if last_evaluated_key is not None:
+            response['LastEvaluatedKey'] = DynamoDBUtils.dynamodb_to_python(last_evaluated_key)
+        return response
+
+    def execute_operation(self, operation: Generator) -> Any:
+        # With the AsyncDynamoDbCoreAdapter, the operations driver returns an awaitable
+        # instead of the result, which makes all the public functions below awaitable.
+        return self._operations_driver.execute_operation(operation=operation)
+
     def put_record(self, item_dict: dict) -> bool:
-        serialized_item_dict = DynamoDBUtils.python_to_dynamodb(python_object=item_dict)
+        return self.execute_operation(self.put_record_operation(item_dict=item_dict))
+
+    def put_record_operation(self, item_dict: dict) -> Generator[Any, Any, bool]:
+        serialized_item_dict = self.record_to_dynamodb(item_dict)
         try:
-            table = self.dynamodb.Table(self.table_name)
-            response = table.put_item(Item=serialized_item_dict)
+            response = yield DynamoDBRequest(method_name='put_item', kwargs={'Item': serialized_item_dict})
             return True if response is not None else False
         except ResourceNotExistsError:
             raise Exception(f"DynamoDb table {self.table_name} doesn't exist. Failed to save attributes to DynamoDb table.")
@@ -102,10 +283,85 @@ class DynamoDbCoreAdapter:
             print(f"Failed to save attributes to DynamoDb table. Exception of type {type(e).__name__} occurred: {str(e)}")
         return False
 
+    def _index_keys_tuple(self, item: dict) -> tuple:
+        return (
+            (item.get(self.primary_index.hash_key_name, None),) if self.primary_index.sort_key_name is None else
+            (item.get(self.primary_index.hash_key_name, None), item.get(self.primary_index.sort_key_name, None))
+        )
+
+    def _batch_write_chunk_operation(self, write_requests: List[dict]) -> Generator[Any, Any, List[dict]]:
+        request_items: Dict[str, List[dict]] = {self.table_name: write_requests}
+        for i_attempt in range(BATCH_OPERATIONS_MAX_RETRIES + 1):
+            if i_attempt > 0:
+                yield OperationDelay(seconds=_batch_retry_delay(i_attempt=i_attempt))
+            try:
+                response: dict = yield DynamoDBRequest(
+                    method_name='batch_write_item', kwargs={'RequestItems': request_items}, table_level=False
+                )
+            except ResourceNotExistsError:
+                raise Exception(f"DynamoDb table {self.table_name} doesn't exist. Failed to batch write items to DynamoDb table.")
+            except Exception as e:
+                print(f"Failed to batch write items to DynamoDb table. Exception of type {type(e).__name__} occurred: {str(e)}")
+                return request_items[self.table_name]
+
+            request_items = response.get('UnprocessedItems', None)
+            if not request_items:
+                return []
+
+        print(message_with_vars(
+            message="Some write requests were still unprocessed after all the retries of a batch write operation.",
+            vars_dict={'unprocessedItems': request_items, 'maxRetries': BATCH_OPERATIONS_MAX_RETRIES}
+        ))
+        return request_items[self.table_name]
+
+    def _batch_write_operation(self, write_requests: List[dict]) -> Generator[Any, Any, List[dict]]:
+        chunks_write_requests: List[List[dict]] = [
+            write_requests[i_chunk:i_chunk + BATCH_WRITE_ITEM_MAX_ITEMS]
+            for i_chunk in range(0, len(write_requests), BATCH_WRITE_ITEM_MAX_ITEMS)
+        ]
+        chunks_failed_write_requests: List[List[dict]] = yield ConcurrentOperations(
+            operations=[self._batch_write_chunk_operation(write_requests=chunk) for chunk in chunks_write_requests],
+            max_concurrency=BATCH_WRITE_MAX_CONCURRENT_REQUESTS
+        )
+        return [failed_write_request for chunk_failed_write_requests in chunks_failed_write_requests for failed_write_request in chunk_failed_write_requests]
+
+    def put_records(self, items_dicts: List[dict]) -> List[dict]:
+        return self.execute_operation(self.put_records_operation(items_dicts=items_dicts))
+
+    def put_records_operation(self, items_dicts: List[dict]) -> Generator[Any, Any, List[dict]]:
+        # Returns the items that could not be written. A BatchWriteItem request cannot contain multiple operations on the same item.
+        # If the same record is present multiple times, only its last version is written.
+        items_per_index_keys: Dict[tuple, dict] = {self._index_keys_tuple(item=item): item for item in items_dicts}
+        failed_write_requests: List[dict] = yield from self._batch_write_operation(write_requests=[
+            {'PutRequest': {'Item': self.record_to_dynamodb(item)}}
+            for item in items_per_index_keys.values()
+        ])
+        failed_items_index_keys: set = {
+            self._index_keys_tuple(item=write_request['PutRequest']['Item']) for write_request in failed_write_requests
+        }
+        return [item for index_keys, item in items_per_index_keys.items() if index_keys in failed_items_index_keys]
+
+    def delete_records(self, indexes_keys_selectors_list: List[dict]) -> List[dict]:
+        return self.execute_operation(self.delete_records_operation(indexes_keys_selectors_list=indexes_keys_selectors_list))
+
+    def delete_records_operation(self, indexes_keys_selectors_list: List[dict]) -> Generator[Any, Any, List[dict]]:
+        # Returns the indexes keys selectors of the records that could not be deleted
+        unique_indexes_keys_selectors: Dict[tuple, dict] = {
+            self._index_keys_tuple(item=indexes_keys_selectors): indexes_keys_selectors
+            for indexes_keys_selectors in indexes_keys_selectors_list
+        }
+        failed_write_requests: List[dict] = yield from self._batch_write_operation(write_requests=[
+            {'DeleteRequest': {'Key': indexes_keys_selectors}}
+            for indexes_keys_selectors in unique_indexes_keys_selectors.values()
+        ])
+        return [write_request['DeleteRequest']['Key'] for write_request in failed_write_requests]
+
     def delete_record(self, indexes_keys_selectors: dict) -> bool:
+        return self.execute_operation(self.delete_record_operation(indexes_keys_selectors=indexes_keys_selectors))
+
+    def delete_record_operation(self, indexes_keys_selectors: dict) -> Generator[Any, Any, bool]:
         try:
-            table = self.dynamodb.Table(self.table_name)
-            response_data: Optional[dict] = table.delete_item(Key=indexes_keys_selectors)
+            response_data: Optional[dict] = yield DynamoDBRequest(method_name='delete_item', kwargs={'Key': indexes_keys_selectors})
             return True if response_data is not None else False
         except ResourceNotExistsError:
             raise Exception(f"DynamoDb table {self.table_name} doesn't exist. Failed to delete_record in DynamoDb table.")
@@ -114,15 +370,19 @@ class DynamoDbCoreAdapter:
         return False
 
     def remove_record(self, indexes_keys_selectors: dict) -> Optional[dict]:
+        return self.execute_operation(self.remove_record_operation(indexes_keys_selectors=indexes_keys_selectors))
+
+    def remove_record_operation(self, indexes_keys_selectors: dict) -> Generator[Any, Any, Optional[dict]]:
         try:
-            table = self.dynamodb.Table(self.table_name)
-            response_data: dict = table.delete_item(Key=indexes_keys_selectors, ReturnValues='ALL_OLD')
+            response_data: dict = yield DynamoDBRequest(
+                method_name='delete_item', kwargs={'Key': indexes_keys_selectors, 'ReturnValues': 'ALL_OLD'}
+            )
             if response_data is None:
                 return None
             response_attributes: Optional[dict] = response_data.get('Attributes', None)
             if response_attributes is None:
                 return None
-            return DynamoDBUtils.dynamodb_to_python(response_attributes)
+            return self.record_to_python(response_attributes)
         except ResourceNotExistsError:
             raise Exception(f"DynamoDb table {self.table_name} doesn't exist. Failed to remove_record in DynamoDb table.")
         except Exception as e:
@@ -130,6 +390,13 @@ class DynamoDbCoreAdapter:
         return None
 
     def get_item_by_primary_key(self, index_name: str, key_value: any, fields_path_elements: Optional[List[List[DatabasePathElement]]]) -> Optional[GetItemResponse]:
+        return self.execute_operation(self.get_item_by_primary_key_operation(
+            index_name=index_name, key_value=key_value, fields_path_elements=fields_path_elements
+        ))
+
+    def get_item_by_primary_key_operation(
+            self, index_name: str, key_value: any, fields_path_elements: Optional[List[List[DatabasePathElement]]]
+    ) -> Generator[Any, Any, Optional[GetItemResponse]]:
         if fields_path_elements is not None:
             kwargs = self._fields_paths_elements_to_expressions(fields_path_elements=fields_path_elements)
         else:
@@ -138,10 +405,9 @@ class DynamoDbCoreAdapter:
         kwargs['ConsistentRead'] = True
 
         try:
-            table = self.dynamodb.Table(self.table_name)
-            response = table.get_item(**kwargs)
+            response = yield DynamoDBRequest(method_name='get_item', kwargs=kwargs)
             if 'Item' in response:
-                processed_item = DynamoDBUtils.dynamodb_to_python(dynamodb_object=response['Item'])
+                processed_item = self.record_to_python(response['Item'])
                 return GetItemResponse(item=processed_item, success=True)
             else:
                 return GetItemResponse(item=None, success=False)
@@ -149,15 +415,102 @@ class DynamoDbCoreAdapter:
             raise Exception(f"DynamoDb table {self.table_name} do not exist or in the process of being created. Failed to get attributes from DynamoDb table.")
         except Exception as e:
             print(f"Failed to retrieve attributes from DynamoDb table. Exception of type {type(e).__name__} occurred: {str(e)}")
+            self._count_failed_retrieval()
             return None
 
+    def batch_get_items_by_primary_keys(
+            self, index_name: str, keys_values: List[Any],
+            fields_path_elements: Optional[List[List[DatabasePathElement]]]
+    ) -> Dict[Any, dict]:
+        return self.execute_operation(self.batch_get_items_by_primary_keys_operation(
+            index_name=index_name, keys_values=keys_values, fields_path_elements=fields_path_elements
+        ))
+
+    def batch_get_items_by_primary_keys_operation(
+            self, index_name: str, keys_values: List[Any],
+            fields_path_elements: Optional[List[List[DatabasePathElement]]]
+    ) -> Generator[Any, Any, Dict[Any, dict]]:
+        if fields_path_elements is not None:
+            if not _has_primary_key_in_fields_path_elements(index_name=index_name, fields_path_elements=fields_path_elements):
+                # The items of a BatchGetItem response are not returned in the same order as the requested keys.
+                # The primary key must always be part of the projection, so that we can match each item to its key.
+                fields_path_elements = [*fields_path_elements, [DatabasePathElement(element_key=index_name, default_type=str)]]
+            base_request_kwargs = self._fields_paths_elements_to_expressions(fields_path_elements=fields_path_elements)
+        else:
+            base_request_kwargs = {}
+        base_request_kwargs['ConsistentRead'] = True
+
+        # BatchGetItem will refuse a request containing the same key multiple times.
+        unique_keys_values: List[Any] = list(dict.fromkeys(keys_values))
+        chunks_keys_values: List[List[Any]] = [
+            unique_keys_values[i_chunk:i_chunk + BATCH_GET_ITEM_MAX_KEYS]
+            for i_chunk in range(0, len(unique_keys_values), BATCH_GET_ITEM_MAX_KEYS)
+        ]
+        # A chunk that fails only loses its own keys. The items of the other chunks (and the items
+        # already retrieved by the failed chunk before its failure) are still part of the output.
+        chunks_results: List[Tuple[Dict[Any, dict], int]] = yield ConcurrentOperations(
+            operations=[self._batch_get_chunk_operation(
+                index_name=index_name, chunk_keys_values=chunk_keys_values, base_request_kwargs=base_request_kwargs
+            ) for chunk_keys_values in chunks_keys_values],
+            max_concurrency=BATCH_GET_MAX_CONCURRENT_REQUESTS
+        )
+        output_items: Dict[Any, dict] = {}
+        num_failed_keys: int = 0
+        for chunk_items, chunk_num_failed_keys in chunks_results:
+            output_items.update(chunk_items)
+            num_failed_keys += chunk_num_failed_keys
+        if num_failed_keys > 0:
+            print(message_with_vars(
+                message="Some keys could not be retrieved by a batch get operation. Their items will be missing from the output.",
+                vars_dict={'numFailedKeys': num_failed_keys, 'numKeys': len(unique_keys_values), 'numRetrievedItems': len(output_items)}
+            ))
+        return output_items
+
+    def _batch_get_chunk_operation(
+            self, index_name: str, chunk_keys_values: List[Any], base_request_kwargs: dict
+    ) -> Generator[Any, Any, Tuple[Dict[Any, dict], int]]:
+        # Returns the retrieved items of the chunk, and the number of its keys that could not be retrieved
+        chunk_items: Dict[Any, dict] = {}
+        request_items: Dict[str, dict] = {self.table_name: {
+            **base_request_kwargs, 'Keys': [{index_name: key_value} for key_value in chunk_keys_values]
+        }}
+        for i_attempt in range(BATCH_OPERATIONS_MAX_RETRIES + 1):
+            if i_attempt > 0:
+                yield OperationDelay(seconds=_batch_retry_delay(i_attempt=i_attempt))
+            try:
+                response: dict = yield DynamoDBRequest(
+                    method_name='batch_get_item', kwargs={'RequestItems': request_items}, table_level=False
+                )
+            except ResourceNotExistsError:
+                raise Exception(f"DynamoDb table {self.table_name} do not exist or in the process of being created. Failed to get attributes from DynamoDb table.")
+            except Exception as e:
+                print(f"Failed to batch retrieve attributes from DynamoDb table. Exception of type {type(e).__name__} occurred: {str(e)}")
+                self._count_failed_retrieval()
+                return chunk_items, len(request_items[self.table_name]['Keys'])
+
+            for item in response.get('Responses', {}).get(self.table_name, []):
+                processed_item: dict = self.record_to_python(item)
+                chunk_items[processed_item.get(index_name, None)] = processed_item
+
+            request_items = response.get('UnprocessedKeys', None)
+            if not request_items:
+                return chunk_items, 0
+
+        print(message_with_vars(
+            message="Some keys were still unprocessed after all the retries of a batch get operation.",
+            vars_dict={'unprocessedKeys': request_items, 'maxRetries': BATCH_OPERATIONS_MAX_RETRIES}
+        ))
+        self._count_failed_retrieval()
+        return chunk_items, len(request_items[self.table_name]['Keys'])
+
     def check_if_item_exist_by_primary_key(self, index_name: str, key_value: str, fields_path_elements: Optional[List[str]]) -> Optional[bool]:
         raise Exception("Not implemented")  # todo: implement
 
-    def _execute_update_query(self, query_kwargs_dict: dict, allow_validation_exception: bool = False) -> Optional[Response]:
+    def _execute_update_query(
+            self, query_kwargs_dict: dict, allow_validation_exception: bool = False, idempotent: bool = True
+    ) -> Generator[Any, Any, Optional[Response]]:
         try:
-            table = self.dynamodb.Table(self.table_name)
-            response = table.update_item(**query_kwargs_dict)
+            response = yield DynamoDBRequest(method_name='update_item', kwargs=query_kwargs_dict, idempotent=idempotent)
             return Response(response)
         except ResourceNotExistsError:
             raise Exception(f"DynamoDb table {self.table_name} do not exist or in the process of being created. Failed to get attributes from DynamoDb table.")
@@ -171,6 +524,13 @@ class DynamoDbCoreAdapter:
             return None
 
     def add_data_elements_to_list(self, index_name: str, key_value: Any, object_path: str, element_values: List[dict]) -> Optional[Response]:
+        return self.execute_operation(self.add_data_elements_to_list_operation(
+            index_name=index_name, key_value=key_value, object_path=object_path, element_values=element_values
+        ))
+
+    def add_data_elements_to_list_operation(
+            self, index_name: str, key_value: Any, object_path: str, element_values: List[dict]
+    ) -> Generator[Any, Any, Optional[Response]]:
         serialized_elements_values: List[Any] = DynamoDBUtils.python_to_dynamodb(python_object=element_values)
         kwargs = {
             'TableName': self.table_name,
@@ -184,9 +544,17 @@ class DynamoDbCoreAdapter:
                 ':emptyList': []
             }
         }
-        return self._execute_update_query(query_kwargs_dict=kwargs)
+        # Sending the request twice would add the newItems twice
+        return (yield from self._execute_update_query(query_kwargs_dict=kwargs, idempotent=False))
 
     def remove_data_elements_from_list(self, index_name: str, key_value: Any, list_object_path: str, indexes_to_remove: list) -> Optional[Response]:
+        return self.execute_operation(self.remove_data_elements_from_list_operation(
+            index_name=index_name, key_value=key_value, list_object_path=list_object_path, indexes_to_remove=indexes_to_remove
+        ))
+
+    def remove_data_elements_from_list_operation(
+            self, index_name: str, key_value: Any, list_object_path: str, indexes_to_remove: list
+    ) -> Generator[Any, Any, Optional[Response]]:
         kwargs = {
             'TableName': self.table_name,
             'Key': {index_name: key_value},
@@ -199,73 +567,77 @@ class DynamoDbCoreAdapter:
                 update_expression += ", "
         kwargs['UpdateExpression'] = update_expression
 
-        return self._execute_update_query(query_kwargs_dict=kwargs)
+        return (yield from self._execute_update_query(query_kwargs_dict=kwargs))
 
     def remove_data_elements_from_map(
             self, index_name: str, key_value: Any,
             targets_path_elements: List[List[DatabasePathElement]],
             retrieve_removed_elements: bool = False
     ) -> Optional[Dict[str, Any]]:
+        return self.execute_operation(self.remove_data_elements_from_map_operation(
+            index_name=index_name, key_value=key_value, targets_path_elements=targets_path_elements,
+            retrieve_removed_elements=retrieve_removed_elements
+        ))
 
-        consumed_targets_path_elements: List[List[DatabasePathElement]] = []
-        expression_attribute_names_dict = {}
-        update_expression = "REMOVE "
+    def remove_data_elements_from_map_operation(
+            self, index_name: str, key_value: Any,
+            targets_path_elements: List[List[DatabasePathElement]],
+            retrieve_removed_elements: bool = False, condition_clause: Optional[ExpressionClause] = None
+    ) -> Generator[Any, Any, Optional[Dict[str, Any]]]:
 
-        for i_target, target in enumerate(targets_path_elements):
-            current_target_num_path_elements = len(target)
-            current_setter_attribute_names = {}
-            current_remover_update_expression = ""
-
-            for i_path_element, path_element in enumerate(target):
-                current_path_key = f"#target{i_target}_pathKey{i_path_element}"
-                current_remover_update_expression += current_path_key
-                current_setter_attribute_names[current_path_key] = path_element.element_key
-                if i_path_element + 1 < current_target_num_path_elements:
-                    current_remover_update_expression += "."
-
-            complete_update_expression_bytes_size = getsizeof(update_expression)
-            current_setter_update_expression_bytes_size = getsizeof(current_remover_update_expression)
-            update_expression_bytes_size_if_setter_is_added = complete_update_expression_bytes_size + current_setter_update_expression_bytes_size
-            if update_expression_bytes_size_if_setter_is_added < EXPRESSION_MAX_BYTES_SIZE:
-                if i_target > 0:
-                    update_expression += ", "
-                expression_attribute_names_dict = {**expression_attribute_names_dict, **current_setter_attribute_names}
-                update_expression += current_remover_update_expression
-                consumed_targets_path_elements.append(target)
-            else:
-                break
+        if not len(targets_path_elements) > 0:
+            return {}
 
-        update_query_kwargs = {
-            'TableName': self.table_name,
-            'Key': {index_name: key_value},
-            'ReturnValues': "UPDATED_OLD" if retrieve_removed_elements is True else "NONE",
-            'UpdateExpression': update_expression,
-            'ExpressionAttributeNames': expression_attribute_names_dict,
-        }
-        response = self._execute_update_query(query_kwargs_dict=update_query_kwargs, allow_validation_exception=True)
-        if response is None:
-            return None
+        removers_clauses: List[ExpressionClause] = self._make_removers_clauses(
+            targets_path_elements=targets_path_elements, paths_builder=ExpressionPathsBuilder()
+        )
+        # The removers are packed in the fewest requests possible, that are executed concurrently
+        requests_clauses_indexes: List[List[int]] = pack_expression_clauses(clauses=removers_clauses, action_keyword="REMOVE")
+        responses: List[Optional[Response]] = yield ConcurrentOperations(operations=[
+            self._execute_update_query(query_kwargs_dict=add_condition_clause(query_kwargs={
+                'TableName': self.table_name,
+                'Key': {index_name: key_value},
+                'ReturnValues': "UPDATED_OLD" if retrieve_removed_elements is True else "NONE",
+                **join_expression_clauses(
+                    clauses=[removers_clauses[i_clause] for i_clause in request_clauses_indexes], action_keyword="REMOVE"
+                )
+            }, condition_clause=condition_clause), allow_validation_exception=True)
+            for request_clauses_indexes in requests_clauses_indexes
+        ])
 
         # Even if we return an empty output_response_attributes dict, we do not want to return None instead of a dict, because since this function only returns a dict, a return
         # value of None indicates that the operation failed. Where as, for example in delete operation, we will not request the removed attributes from the database, which will
         # give us an empty output_response_attributes dict, but the delete operation will base itself on the presence of the dict to judge if the operation failed or not.
-        output_response_attributes: dict = DynamoDBUtils.dynamodb_to_python(response.attributes) if response.attributes is not None else {}
-        if len(targets_path_elements) == len(consumed_targets_path_elements):
-            return output_response_attributes
-        else:
-            for current_target_path_elements in consumed_targets_path_elements:
-                targets_path_elements.remove(current_target_path_elements)
+        if any(response is None for response in responses):
+            # The removal is only reported as succeeded if all of its requests succeeded
+            return None
+        output_response_attributes: dict = {}
+        for response in responses:
+            response_attributes: dict = self.record_to_python(response.attributes) if response.attributes is not None else {}
+            output_response_attributes = deep_merge_dicts(base_dict=output_response_attributes, other_dict=response_attributes)
+        return output_response_attributes
 
-            request_continuation_response_attributes = self.remove_data_elements_from_map(
-                index_name=index_name, key_value=key_value,
-                targets_path_elements=targets_path_elements,
-                retrieve_removed_elements=retrieve_removed_elements
-            )
-            combined_output_response_attributes = {
-                **(output_response_attributes or {}),
-                **(request_continuation_response_attributes or {})
-            }
-            return combined_output_response_attributes
+    @staticmethod
+    def _make_removers_clauses(
+            targets_path_elements: List[List[DatabasePathElement]], paths_builder: ExpressionPathsBuilder
+    ) -> List[ExpressionClause]:
+        removers_clauses: List[ExpressionClause] = []
+        for target in targets_path_elements:
+            target_expression, target_attribute_names = paths_builder.build_update_path(path_elements=target)
+            removers_clauses.append(ExpressionClause(expression=target_expression, attribute_names=target_attribute_names))
+        return removers_clauses
+
+    @staticmethod
+    def _make_setters_clauses(setters: List[FieldPathSetter], paths_builder: ExpressionPathsBuilder) -> List[ExpressionClause]:
+        setters_clauses: List[ExpressionClause] = []
+        for i_setter, current_setter in enumerate(setters):
+            setter_expression, setter_attribute_names = paths_builder.build_update_path(path_elements=current_setter.field_path_elements)
+            setters_clauses.append(ExpressionClause(
+                expression=f"{setter_expression} = :item{i_setter}",
+                attribute_names=setter_attribute_names,
+                attribute_values={f":item{i_setter}": _serialize_setter_value(setter=current_setter)}
+            ))
+        return setters_clauses
 
     @staticmethod
     def _add_database_path_element_to_string_expression(
@@ -317,61 +689,18 @@ class DynamoDbCoreAdapter:
             if previous_element_initializer_container is not None else new_expression_attribute_names
         )
 
-        item_default_value = overriding_init_value or current_path_element.get_default_value()
+        item_default_value = overriding_init_value if overriding_init_value is not None else current_path_element.get_default_value()
         return MapItemInitializer(
             path_target=current_path_target, last_item_element_key=current_path_element.element_key,
             item_default_value=item_default_value, expression_attribute_names=expression_attribute_names
         )
 
-    def initialize_element_in_map_target(
-            self, index_name: str, key_value: Any, initializer: MapItemInitializer, is_last_path_element: bool = False
-    ) -> Optional[Response]:
-
-        base_query_kwargs = {
-            'TableName': self.table_name,
-            'Key': {index_name: key_value},
-            'ExpressionAttributeNames': initializer.expression_attribute_names,
-            'ExpressionAttributeValues': {
-                ':item': initializer.item_default_value
-            },
-            'ReturnValues': 'UPDATED_NEW' if is_last_path_element else 'NONE'
-            # We do not need to waste retrieving the UPDATED_NEW value when we know we we
-            # will it only for the last path element (we use right after the loop ended)
-        }
-        current_update_expression = f"SET {initializer.path_target} = if_not_exists({initializer.path_target}, :item)"
-        current_set_potentially_missing_object_query_kwargs = {**base_query_kwargs, 'UpdateExpression': current_update_expression}
-        response = self._execute_update_query(query_kwargs_dict=current_set_potentially_missing_object_query_kwargs)
-        if is_last_path_element is True:
-            # If the last item attribute value in the database does (retrieved thanks to the "UPDATED_NEW" ReturnValues),
-            # do not equal its default_value (which is either the field type default value, or the
-            # last_item_custom_overriding_init_value parameter), we want to initialize again the item, because this means
-            # that the attribute existed, so the SET update expression with if_not_exists did not performed, and we do
-            # not currently have the value we want in the database. We perform this operation only for the last path
-            # element in the request, to avoid overriding and scratching list or dictionary that are expected to exist.
-            field_existing_attribute_in_database = response.attributes.get(initializer.last_item_element_key) if response is not None else None
-            if field_existing_attribute_in_database is None or field_existing_attribute_in_database != initializer.item_default_value:
-                # It is possible for the field to already exist, and yet, to not have
-                current_update_expression = f"SET {initializer.path_target} = :item"
-                current_override_existing_object_value_query_kwargs = {**base_query_kwargs, 'UpdateExpression': current_update_expression}
-                override_object_value_response = self._execute_update_query(query_kwargs_dict=current_override_existing_object_value_query_kwargs)
-                return override_object_value_response
-        return response
-
     def _construct_update_data_element_to_map_query_kwargs(
             self, index_name: str, key_value: Any, field_path_elements: List[DatabasePathElement], value: Any, return_old_value: bool = False
     ) -> dict:
 
-        expression_attribute_names_dict: Dict[str, str] = {}
-        update_expression = "SET "
-
-        for i, path_element in enumerate(field_path_elements):
-            current_path_key = f"#pathKey{i}"
-            update_expression += current_path_key
-            expression_attribute_names_dict[current_path_key] = path_element.element_key
-            if i + 1 < len(field_path_elements):
-                update_expression += "."
-            else:
-                update_expression += " = :item"
+        target_expression, expression_attribute_names_dict = ExpressionPathsBuilder().build_update_path(path_elements=field_path_elements)
+        update_expression = f"SET {target_expression} = :item"
 
         serialized_value = DynamoDBUtils.python_to_dynamodb(python_object=value)
         update_query_kwargs = {
@@ -389,21 +718,36 @@ class DynamoDbCoreAdapter:
     def set_update_data_element_to_map_with_default_initialization(
             self, index_name: str, key_value: Any, field_path_elements: List[DatabasePathElement], value: Any, return_old_value: bool = False
     ) -> Optional[Response]:
+        return self.execute_operation(self.set_update_data_element_to_map_with_default_initialization_operation(
+            index_name=index_name, key_value=key_value, field_path_elements=field_path_elements,
+            value=value, return_old_value=return_old_value
+        ))
+
+    def set_update_data_element_to_map_with_default_initialization_operation(
+            self, index_name: str, key_value: Any, field_path_elements: List[DatabasePathElement], value: Any, return_old_value: bool = False
+    ) -> Generator[Any, Any, Optional[Response]]:
         update_query_kwargs = self._construct_update_data_element_to_map_query_kwargs(
             index_name=index_name, key_value=key_value, field_path_elements=field_path_elements, value=value, return_old_value=return_old_value
         )
-        return self._execute_update_query_with_initialization_if_missing(
+        return (yield from self._execute_update_query_with_initialization_if_missing(
             index_name=index_name, key_value=key_value, update_query_kwargs=update_query_kwargs,
             setters=[FieldPathSetter(field_path_elements=field_path_elements, value_to_set=value)],
-        )
+        ))
 
     def set_update_data_element_to_map_without_default_initialization(
             self, index_name: str, key_value: Any, field_path_elements: List[DatabasePathElement], value: Any
     ) -> Optional[Response]:
+        return self.execute_operation(self.set_update_data_element_to_map_without_default_initialization_operation(
+            index_name=index_name, key_value=key_value, field_path_elements=field_path_elements, value=value
+        ))
+
+    def set_update_data_element_to_map_without_default_initialization_operation(
+            self, index_name: str, key_value: Any, field_path_elements: List[DatabasePathElement], value: Any
+    ) -> Generator[Any, Any, Optional[Response]]:
         update_query_kwargs = self._construct_update_data_element_to_map_query_kwargs(
             index_name=index_name, key_value=key_value, field_path_elements=field_path_elements, value=value
         )
-        return self._execute_update_query(query_kwargs_dict=update_query_kwargs)
+        return (yield from self._execute_update_query(query_kwargs_dict=update_query_kwargs))
 
     @staticmethod
     def _setters_to_tidied_initializers(setters: List[FieldPathSetter]) -> Dict[str, MapItemInitializerContainer]:
@@ -413,7 +757,7 @@ class DynamoDbCoreAdapter:
         for setter in setters:
             current_absolute_target_path: str = ""
             last_map_initializer_container: Optional[MapItemInitializerContainer] = None
-            setter_serialized_value_to_set = DynamoDBUtils.python_to_dynamodb(python_object=setter.value_to_set)
+            setter_serialized_value_to_set = _serialize_setter_value(setter=setter)
 
             for i_path, path_element in enumerate(setter.field_path_elements):
                 current_absolute_target_path = DynamoDbCoreAdapter._add_database_path_element_to_string_path(
@@ -455,136 +799,331 @@ class DynamoDbCoreAdapter:
                     ))
         return root_initializers_containers
 
-    def _initializer_task_executor(self, index_name: str, key_value: str, initializer_container: MapItemInitializerContainer) -> Optional[Response]:
-        # todo: group fields initialization in single request
-        is_last_path_element = not len(initializer_container.nexts_in_line) > 0
-        initialization_response = self.initialize_element_in_map_target(
-            index_name=index_name, key_value=key_value,
-            initializer=initializer_container.item,
-            is_last_path_element=is_last_path_element
-        )
-        if initialization_response is None:
-            logging.error(message_with_vars(
-                message="Initialized a field after a set/update multiple data elements in map request had failed.",
-                vars_dict={'initializer_container': initializer_container}
+    @staticmethod
+    def _plan_initializers_levels(root_initializers_containers: Dict[str, MapItemInitializerContainer]) -> List[List[MapItemInitializerContainer]]:
+        # The initializers are grouped by depth level, across all the setters. Since all the initializers of a level have
+        # different paths that cannot overlap each other, all of them can be initialized in the same request, and all
+        # their parents will have been initialized by the requests of the previous levels.
+        initializers_levels: List[List[MapItemInitializerContainer]] = []
+        current_level_containers: List[MapItemInitializerContainer] = list(root_initializers_containers.values())
+        while len(current_level_containers) > 0:
+            initializers_levels.append(current_level_containers)
+            current_level_containers = [
+                next_container for container in current_level_containers
+                for next_container in container.nexts_in_line.values()
+            ]
+        return initializers_levels
+
+    def _make_initializers_level_queries_kwargs(
+            self, index_name: str, key_value: Any, level_initializers_containers: List[MapItemInitializerContainer],
+            condition_clause: Optional[ExpressionClause]
+    ) -> List[dict]:
+        initializers_clauses: List[ExpressionClause] = []
+        for i_initializer, initializer_container in enumerate(level_initializers_containers):
+            initializer: MapItemInitializer = initializer_container.item
+            # The path keys of each initializer are prefixed, since they all start at #pathKey0
+            initializer_path_keys_prefix = f"#init{i_initializer}_pathKey"
+            path_target: str = initializer.path_target.replace("#pathKey", initializer_path_keys_prefix)
+            item_value_key = f":init{i_initializer}"
+
+            is_last_path_element = not len(initializer_container.nexts_in_line) > 0
+            # The last path elements are directly set to their values, where as the parents elements are only initialized if
+            # missing, in order to avoid overriding and scratching list or dictionary that are expected to exist.
+            initializers_clauses.append(ExpressionClause(
+                expression=(
+                    f"{path_target} = {item_value_key}" if is_last_path_element is True else
+                    f"{path_target} = if_not_exists({path_target}, {item_value_key})"
+                ),
+                attribute_names={
+                    path_key.replace("#pathKey", initializer_path_keys_prefix): element_key
+                    for path_key, element_key in initializer.expression_attribute_names.items()
+                },
+                attribute_values={item_value_key: initializer.item_default_value}
             ))
 
-        if len(initializer_container.nexts_in_line) > 0:
-            results = self._run_initializers_in_executors(
+        return [add_condition_clause(query_kwargs={
+            'TableName': self.table_name,
+            'Key': {index_name: key_value},
+            'ReturnValues': 'NONE',
+            **join_expression_clauses(
+                clauses=[initializers_clauses[i_clause] for i_clause in request_clauses_indexes], action_keyword="SET"
+            )
+        }, condition_clause=condition_clause) for request_clauses_indexes in pack_expression_clauses(clauses=initializers_clauses, action_keyword="SET")]
+
+    def _run_initializers_operation(
+            self, index_name: str, key_value: Any, initializers: Dict[str, MapItemInitializerContainer],
+            condition_clause: Optional[ExpressionClause] = None
+    ) -> Generator[Any, Any, Optional[Response]]:
+        last_response: Optional[Response] = None
+        all_requests_succeeded: bool = True
+        for level_initializers_containers in self._plan_initializers_levels(root_initializers_containers=initializers):
+            level_queries_kwargs: List[dict] = self._make_initializers_level_queries_kwargs(
                 index_name=index_name, key_value=key_value,
-                initializers=initializer_container.nexts_in_line
+                level_initializers_containers=level_initializers_containers, condition_clause=condition_clause
             )
-        return initialization_response
-
-    def _run_initializers_in_executors(self, index_name: str, key_value: str, initializers: Dict[str, MapItemInitializerContainer]) -> Optional[List[Optional[Response]]]:
-        initializers_values = initializers.values()
-        num_initializers = len(initializers_values)
-        with ThreadPoolExecutor(max_workers=num_initializers) as executor:
-            results: List[Optional[Response]] = [executor.submit(
-                self._initializer_task_executor, index_name, key_value, item
-            ).result() for i, item in enumerate(initializers_values)]
-        return results
+            # A level will only require multiple requests if its expression is too big to fit in a single request
+            level_responses: List[Optional[Response]] = yield ConcurrentOperations(operations=[
+                self._execute_update_query(query_kwargs_dict=query_kwargs)
+                for query_kwargs in level_queries_kwargs
+            ])
+            for response in level_responses:
+                if response is None:
+                    all_requests_succeeded = False
+                    logging.error(message_with_vars(
+                        message="Failed to initialize fields after a set/update data elements in map request had failed.",
+                        vars_dict={'levelInitializersContainers': level_initializers_containers}
+                    ))
+                last_response = response
+        return last_response if all_requests_succeeded is True else None
 
     def _execute_update_query_with_initialization_if_missing(
-            self, index_name: str, key_value: Any, update_query_kwargs: dict, setters: List[FieldPathSetter]
-    ) -> Optional[Response]:
-
-        response = self._execute_update_query(query_kwargs_dict=update_query_kwargs)
+            self, index_name: str, key_value: Any, update_query_kwargs: dict, setters: List[FieldPathSetter],
+            condition_clause: Optional[ExpressionClause] = None
+    ) -> Generator[Any, Any, Optional[Response]]:
+        # The condition_clause is the ConditionExpression of the update query, and of the requests of its initializers
+        response = yield from self._execute_update_query(query_kwargs_dict=add_condition_clause(
+            query_kwargs=update_query_kwargs, condition_clause=condition_clause
+        ))
         if response is None:
             # If the response is None, it means that one of the path of the target path has not been found and need to be initialized.
+            # The initialization of the last path elements will also set the values of the setters, which means that the update
+            # query does not need to be executed again. Only one request per depth level of the setters paths will be executed.
             database_paths_initializers = self._setters_to_tidied_initializers(setters=setters)
-            results = self._run_initializers_in_executors(
+            return (yield from self._run_initializers_operation(
                 index_name=index_name, key_value=key_value,
-                initializers=database_paths_initializers
-            )
-            last_response = results[-1]
-            # This function can only be triggered if there is at least one item in setters List, so we do not need to worry about accessing
-            # the last element in result List without checking if the len of the setters or of the results is superior to zero.
-            return last_response
+                initializers=database_paths_initializers, condition_clause=condition_clause
+            ))
         return response
 
     def set_update_multiple_data_elements_to_map(
             self, index_name: str, key_value: Any, setters: List[FieldPathSetter], return_old_values: bool
     ) -> Optional[Response]:
+        return self.execute_operation(self.set_update_multiple_data_elements_to_map_operation(
+            index_name=index_name, key_value=key_value, setters=setters, return_old_values=return_old_values
+        ))
+
+    def set_update_multiple_data_elements_to_map_operation(
+            self, index_name: str, key_value: Any, setters: List[FieldPathSetter], return_old_values: bool,
+            condition_clause: Optional[ExpressionClause] = None
+    ) -> Generator[Any, Any, Optional[Response]]:
 
         if not len(setters) > 0:
             # If we tried to run the query with no object setter,
             # she will crash when executed. So we return None.
             return None
 
-        update_query_kwargs = {
-            'TableName': self.table_name,
-            'Key': {index_name: key_value},
-            'ReturnValues': "UPDATED_OLD" if return_old_values is True else "NONE"
-        }
-        update_expression = "SET "
-        expression_attribute_names_dict, expression_attribute_values_dict = {}, {}
-
-        consumed_setters: List[FieldPathSetter] = []
-        for i_setter, current_setter in enumerate(setters):
-            current_setter_update_expression = ""
-            current_setter_attribute_names, current_setter_attribute_values = {}, {}
-            setter_serialized_value_to_set = DynamoDBUtils.python_to_dynamodb(python_object=current_setter.value_to_set)
-
-            for i_path, current_path_element in enumerate(current_setter.field_path_elements):
-                current_path_key = f"#setter{i_setter}_pathKey{i_path}"
-                current_setter_update_expression, new_expression_attribute_names = DynamoDbCoreAdapter._add_database_path_element_to_string_expression(
-                    base_string=current_setter_update_expression, database_path_element=current_path_element, path_key=current_path_key
-                )
-                current_setter_attribute_names = {**current_setter_attribute_names, **new_expression_attribute_names}
-
-                if i_path >= (len(current_setter.field_path_elements) - 1):
-                    current_setter_update_expression += f" = :item{i_setter}"
-                    current_setter_attribute_values[f":item{i_setter}"] = setter_serialized_value_to_set
-
-            complete_update_expression_bytes_size = getsizeof(update_expression)
-            # complete_update_query_attribute_names_bytes_size = getsizeof(expression_attribute_names_dict)
-            # complete_update_query_attribute_values_bytes_size = getsizeof(expression_attribute_values_dict)
-            current_setter_update_expression_bytes_size = getsizeof(current_setter_update_expression)
-            # current_setter_attribute_names_bytes_size = getsizeof(current_setter_attribute_names)
-            # current_setter_attribute_values_bytes_size = getsizeof(current_setter_attribute_values)
-            update_expression_bytes_size_if_setter_is_added = complete_update_expression_bytes_size + current_setter_update_expression_bytes_size
-            # attributes_names_bytes_size_if_setter_is_added = complete_update_query_attribute_names_bytes_size + current_setter_attribute_names_bytes_size
-            # attributes_values_bytes_size_if_setter_is_added = complete_update_query_attribute_values_bytes_size + current_setter_attribute_values_bytes_size
-            if update_expression_bytes_size_if_setter_is_added < EXPRESSION_MAX_BYTES_SIZE:
-                if i_setter > 0:
-                    update_expression += ", "
-                update_expression += current_setter_update_expression
-                expression_attribute_names_dict = {**expression_attribute_names_dict, **current_setter_attribute_names}
-                expression_attribute_values_dict = {**expression_attribute_values_dict, **current_setter_attribute_values}
-                consumed_setters.append(current_setter)
-            else:
-                print(message_with_vars(
-                    message="Update operation expression size has reached over 4kb. "
-                            "The operation will be divided in a secondary operation (which could also be divided)",
-                    vars_dict={
-                        'index_name': index_name, 'key_value': key_value,
-                        'setters': setters, 'update_expression': update_expression,
-                        'current_setter_update_expression': current_setter_update_expression,
-                        'current_setter_attribute_names': current_setter_attribute_names,
-                        'current_setter_attribute_values': current_setter_attribute_values
-                    }
+        # The setters with overlapping paths (like a parent and its child) are split in layers that are sent one after
+        # another, in the order of the setters. The setters of each layer are packed in the fewest requests possible,
+        # that are executed concurrently. When the setters are divided in multiple requests, the update is not atomic,
+        # and the setters of the requests that succeeded are kept even if the other requests failed.
+        responses: List[Optional[Response]] = []
+        for layer_setters_indexes in _split_setters_in_non_overlapping_layers(setters=setters):
+            layer_setters: List[FieldPathSetter] = [setters[i_setter] for i_setter in layer_setters_indexes]
+            setters_clauses: List[ExpressionClause] = self._make_setters_clauses(setters=layer_setters, paths_builder=ExpressionPathsBuilder())
+            requests_clauses_indexes: List[List[int]] = pack_expression_clauses(clauses=setters_clauses, action_keyword="SET")
+            if len(requests_clauses_indexes) > 1:
+                logging.info(message_with_vars(
+                    message="Update operation expression size is over the DynamoDB limits. The operation will be divided in multiple requests.",
+                    vars_dict={'index_name': index_name, 'key_value': key_value, 'numRequests': len(requests_clauses_indexes)}
                 ))
+            layer_responses: List[Optional[Response]] = yield ConcurrentOperations(operations=[
+                self._execute_update_query_with_initialization_if_missing(
+                    index_name=index_name, key_value=key_value,
+                    update_query_kwargs={
+                        'TableName': self.table_name,
+                        'Key': {index_name: key_value},
+                        'ReturnValues': "UPDATED_OLD" if return_old_values is True else "NONE",
+                        **join_expression_clauses(
+                            clauses=[setters_clauses[i_clause] for i_clause in request_clauses_indexes], action_keyword="SET"
+                        )
+                    },
+                    setters=[layer_setters[i_clause] for i_clause in request_clauses_indexes],
+                    condition_clause=condition_clause
+                )
+                for request_clauses_indexes in requests_clauses_indexes
+            ])
+            responses.extend(layer_responses)
+            if any(response is None for response in layer_responses):
+                # The setters of the next layers must be applied after the setters of the failed requests
                 break
+        if len(responses) == 1:
+            return responses[0]
+        if any(response is None for response in responses):
+            return None
 
-        update_query_kwargs['UpdateExpression'] = update_expression
-        update_query_kwargs['ExpressionAttributeValues'] = expression_attribute_values_dict
-        if len(expression_attribute_names_dict) > 0:
-            update_query_kwargs['ExpressionAttributeNames'] = expression_attribute_names_dict
+        # The old values retrieved by each request are combined, as if they had been retrieved by a single request
+        combined_attributes: Optional[dict] = None
+        for response in responses:
+            if response.attributes is not None:
+                combined_attributes = deep_merge_dicts(base_dict=combined_attributes or {}, other_dict=response.attributes)
+        return Response({'Attributes': combined_attributes} if combined_attributes is not None else {})
+
+    def set_update_and_remove_data_elements_in_map(
+            self, index_name: str, key_value: Any, setters: List[FieldPathSetter], targets_path_elements: List[List[DatabasePathElement]]
+    ) -> bool:
+        return self.execute_operation(self.set_update_and_remove_data_elements_in_map_operation(
+            index_name=index_name, key_value=key_value, setters=setters, targets_path_elements=targets_path_elements
+        ))
+
+    def set_update_and_remove_data_elements_in_map_operation(
+            self, index_name: str, key_value: Any, setters: List[FieldPathSetter], targets_path_elements: List[List[DatabasePathElement]],
+            condition_clause: Optional[ExpressionClause] = None
+    ) -> Generator[Any, Any, bool]:
+        # The setters and the removers are sent in a single 'SET ... REMOVE ...' request when their paths do not overlap
+        # (which DynamoDB would reject) and when they fit in the limits of a single request. Otherwise, or if the single
+        # request failed (like when a parent of a setter does not exist yet), the setters are sent before the removers,
+        # by the set_update_multiple_data_elements_to_map and remove_data_elements_from_map operations. The optional
+        # condition_clause is the ConditionExpression of all the requests (including the requests of the initializers).
+        if len(setters) > 0 and len(targets_path_elements) > 0:
+            # The setters and the removers share their paths builder, since they can be sent in the same request
+            paths_builder = ExpressionPathsBuilder()
+            clauses_per_action_keyword: Dict[str, List[ExpressionClause]] = {
+                'SET': self._make_setters_clauses(setters=setters, paths_builder=paths_builder),
+                'REMOVE': self._make_removers_clauses(targets_path_elements=targets_path_elements, paths_builder=paths_builder)
+            }
+            has_overlapping_paths: bool = _have_overlapping_paths(
+                first_paths_elements=[setter.field_path_elements for setter in setters], second_paths_elements=targets_path_elements
+            )
+            if has_overlapping_paths is not True and can_fit_in_single_request(clauses_per_action_keyword=clauses_per_action_keyword):
+                response: Optional[Response] = yield from self._execute_update_query(query_kwargs_dict=add_condition_clause(query_kwargs={
+                    'TableName': self.table_name,
+                    'Key': {index_name: key_value},
+                    'ReturnValues': "NONE",
+                    **join_multiple_actions_expression_clauses(clauses_per_action_keyword=clauses_per_action_keyword)
+                }, condition_clause=condition_clause))
+                if response is not None:
+                    return True
+
+        if len(setters) > 0:
+            setters_response: Optional[Response] = yield from self.set_update_multiple_data_elements_to_map_operation(
+                index_name=index_name, key_value=key_value, setters=setters, return_old_values=False,
+                condition_clause=condition_clause
+            )
+            if setters_response is None:
+                return False
+        if len(targets_path_elements) > 0:
+            removers_response: Optional[dict] = yield from self.remove_data_elements_from_map_operation(
+                index_name=index_name, key_value=key_value, targets_path_elements=targets_path_elements,
+                condition_clause=condition_clause
+            )
+            if removers_response is None:
+                return False
+        return True
 
-        response = self._execute_update_query_with_initialization_if_missing(
-            index_name=index_name, key_value=key_value,
-            update_query_kwargs=update_query_kwargs, setters=consumed_setters
-        )
-        if len(consumed_setters) == len(setters):
-            return response
-        else:
-            for setter in consumed_setters:
-                setters.remove(setter)
-            return self.set_update_multiple_data_elements_to_map(
-                index_name=index_name, key_value=key_value,
-                setters=setters, return_old_values=return_old_values
+    def _execute_conditional_update_query(self, query_kwargs_dict: dict, idempotent: bool = True) -> Generator[Any, Any, Tuple[Optional[Response], bool]]:
+        # Like the _execute_update_query, but also returns whether the request has been rejected by its ConditionExpression
+        try:
+            response = yield DynamoDBRequest(method_name='update_item', kwargs=query_kwargs_dict, idempotent=idempotent)
+            return Response(response), False
+        except ResourceNotExistsError:
+            raise Exception(f"DynamoDb table {self.table_name} do not exist or in the process of being created. Failed to get attributes from DynamoDb table.")
+        except Exception as e:
+            if get_exception_error_code(exception=e) == 'ConditionalCheckFailedException':
+                return None, True
+            print(f"Failed to update attributes in DynamoDb table. Exception of type {type(e).__name__} occurred: {str(e)}")
+            return None, False
+
+    def versioned_set_update_and_remove_data_elements_in_map(
+            self, index_name: str, key_value: Any, setters: List[FieldPathSetter], targets_path_elements: List[List[DatabasePathElement]],
+            version_field_name: str, expected_version: Optional[int]
+    ) -> Tuple[bool, bool, Optional[int]]:
+        return self.execute_operation(self.versioned_set_update_and_remove_data_elements_in_map_operation(
+            index_name=index_name, key_value=key_value, setters=setters, targets_path_elements=targets_path_elements,
+            version_field_name=version_field_name, expected_version=expected_version
+        ))
+
+    def versioned_set_update_and_remove_data_elements_in_map_operation(
+            self, index_name: str, key_value: Any, setters: List[FieldPathSetter], targets_path_elements: List[List[DatabasePathElement]],
+            version_field_name: str, expected_version: Optional[int]
+    ) -> Generator[Any, Any, Tuple[bool, bool, Optional[int]]]:
+        # Optimistic concurrency of the records with a version attribute. With an expected_version (the version captured
+        # when the record has been read), the version of the record must still be the expected_version (a missing version
+        # attribute being the version 0), and is incremented. Without an expected_version (when the record has only been
+        # written, and its writes cannot have been based on outdated data), the version is incremented without condition,
+        # so the writes are not protected against the writes of the other writers, which can only detect them afterward.
+        # When the setters and the removers fit in a single request, the version is checked and incremented by that same
+        # request. Otherwise, the version is first claimed by its own request, and the setters and removers are then sent
+        # by the set_update_and_remove_data_elements_in_map operation, with all its requests conditioned on the claimed
+        # version, so that they are rejected if another writer has claimed the next version of the record in between.
+        # Returns whether the operations succeeded, whether they have been rejected because of a version conflict, and
+        # the version of the record after the operations (if the version has been incremented).
+        version_attribute_names: Dict[str, str] = {'#recordVersion': version_field_name}
+        if expected_version is not None:
+            next_version: int = expected_version + 1
+            version_clause = ExpressionClause(
+                expression="#recordVersion = :nextRecordVersion", attribute_names=version_attribute_names,
+                attribute_values={':nextRecordVersion': next_version}
+            )
+            condition_expression: str = (
+                "attribute_not_exists(#recordVersion) OR #recordVersion = :expectedRecordVersion"
+                if expected_version == 0 else "#recordVersion = :expectedRecordVersion"
             )
+            paths_builder = ExpressionPathsBuilder()
+            clauses_per_action_keyword: Dict[str, List[ExpressionClause]] = {
+                'SET': [*self._make_setters_clauses(setters=setters, paths_builder=paths_builder), version_clause],
+                'REMOVE': self._make_removers_clauses(targets_path_elements=targets_path_elements, paths_builder=paths_builder)
+            }
+            has_overlapping_paths: bool = _have_overlapping_paths(
+                first_paths_elements=[setter.field_path_elements for setter in setters], second_paths_elements=targets_path_elements
+            )
+            if has_overlapping_paths is not True and can_fit_in_single_request(clauses_per_action_keyword=clauses_per_action_keyword):
+                query_kwargs: dict = {
+                    'TableName': self.table_name,
+                    'Key': {index_name: key_value},
+                    'ReturnValues': "NONE",
+                    'ConditionExpression': condition_expression,
+                    **join_multiple_actions_expression_clauses(clauses_per_action_keyword=clauses_per_action_keyword)
+                }
+                query_kwargs['ExpressionAttributeValues'][':expectedRecordVersion'] = expected_version
+                response, has_version_conflict = yield from self._execute_conditional_update_query(query_kwargs_dict=query_kwargs)
+                if response is not None:
+                    return True, False, next_version
+                if has_version_conflict is True:
+                    return False, True, None
+                # Like when a parent of a setter does not exist yet, which requires the initialization of the missing parents
+
+            claim_query_kwargs: dict = {
+                'TableName': self.table_name,
+                'Key': {index_name: key_value},
+                'ReturnValues': "NONE",
+                'ConditionExpression': condition_expression,
+                **join_expression_clauses(clauses=[version_clause], action_keyword="SET")
+            }
+            claim_query_kwargs['ExpressionAttributeValues'][':expectedRecordVersion'] = expected_version
+        else:
+            next_version: Optional[int] = None
+            claim_query_kwargs: dict = {
+                'TableName': self.table_name,
+                'Key': {index_name: key_value},
+                'ReturnValues': "UPDATED_NEW",
+                'UpdateExpression': "SET #recordVersion = if_not_exists(#recordVersion, :zeroRecordVersion) + :oneRecordVersion",
+                'ExpressionAttributeNames': version_attribute_names,
+                'ExpressionAttributeValues': {':zeroRecordVersion': 0, ':oneRecordVersion': 1}
+            }
+
+        # The increment of the version without condition would increment the version twice if the request was sent twice
+        claim_response, has_version_conflict = yield from self._execute_conditional_update_query(
+            query_kwargs_dict=claim_query_kwargs, idempotent=expected_version is not None
+        )
+        if claim_response is None:
+            return False, has_version_conflict, None
+        if next_version is None:
+            claimed_attributes: dict = self.record_to_python(claim_response.attributes or {})
+            next_version = int(claimed_attributes[version_field_name]) if version_field_name in claimed_attributes else None
+        if not len(setters) > 0 and not len(targets_path_elements) > 0:
+            return True, False, next_version
+        if next_version is None:
+            # The claimed version is required for the condition of the following requests
+            return False, False, None
+        claimed_version_clause = ExpressionClause(
+            expression="#recordVersion = :claimedRecordVersion", attribute_names=version_attribute_names,
+            attribute_values={':claimedRecordVersion': next_version}
+        )
+        operations_success: bool = yield from self.set_update_and_remove_data_elements_in_map_operation(
+            index_name=index_name, key_value=key_value, setters=setters, targets_path_elements=targets_path_elements,
+            condition_clause=claimed_version_clause
+        )
+        return operations_success, False, next_version
 
     def query_response_by_key(
             self, index_name: str, key_value: Any,
@@ -592,6 +1131,18 @@ class DynamoDbCoreAdapter:
             filter_expression: Optional[Any] = None, pagination_records_limit: Optional[int] = None,
             exclusive_start_key: Optional[str] = None, **additional_kwargs
     ) -> Response:
+        return self.execute_operation(self.query_response_by_key_operation(
+            index_name=index_name, key_value=key_value, fields_path_elements=fields_path_elements,
+            filter_expression=filter_expression, pagination_records_limit=pagination_records_limit,
+            exclusive_start_key=exclusive_start_key, **additional_kwargs
+        ))
+
+    def query_response_by_key_operation(
+            self, index_name: str, key_value: Any,
+            fields_path_elements: Optional[List[List[DatabasePathElement]]] = None,
+            filter_expression: Optional[Any] = None, pagination_records_limit: Optional[int] = None,
+            exclusive_start_key: Optional[str] = None, **additional_kwargs
+    ) -> Generator[Any, Any, Response]:
         if fields_path_elements is not None:
             kwargs = self._fields_paths_elements_to_expressions(fields_path_elements=fields_path_elements)
         else:
@@ -615,9 +1166,8 @@ class DynamoDbCoreAdapter:
             kwargs['ExclusiveStartKey'] = exclusive_start_key
 
         try:
-            table = self.dynamodb.Table(self.table_name)
-            response = table.query(**kwargs)
-            return Response(DynamoDBUtils.dynamodb_to_python(response))
+            response = yield DynamoDBRequest(method_name='query', kwargs=kwargs)
+            return Response(self.query_response_to_python(response))
         except ResourceNotExistsError:
             raise Exception(f"DynamoDb table {self.table_name} do not exist or in the process"
                             "of being created. Failed to get attributes from DynamoDb table.")
@@ -630,7 +1180,18 @@ class DynamoDbCoreAdapter:
             filter_expression: Optional[Any] = None, pagination_records_limit: Optional[int] = None,
             exclusive_start_key: Optional[str] = None, **additional_kwargs
     ) -> Tuple[Optional[List[Any]], QueryMetadata]:
-        response = self.query_response_by_key(
+        return self.execute_operation(self.query_items_by_key_operation(
+            index_name=index_name, key_value=key_value, fields_path_elements=fields_path_elements,
+            filter_expression=filter_expression, pagination_records_limit=pagination_records_limit,
+            exclusive_start_key=exclusive_start_key, **additional_kwargs
+        ))
+
+    def query_items_by_key_operation(
+            self, index_name: str, key_value: Any, fields_path_elements: List[List[DatabasePathElement]],
+            filter_expression: Optional[Any] = None, pagination_records_limit: Optional[int] = None,
+            exclusive_start_key: Optional[str] = None, **additional_kwargs
+    ) -> Generator[Any, Any, Tuple[Optional[List[Any]], QueryMetadata]]:
+        response = yield from self.query_response_by_key_operation(
             index_name=index_name, key_value=key_value, fields_path_elements=fields_path_elements,
             filter_expression=filter_expression, pagination_records_limit=pagination_records_limit,
             exclusive_start_key=exclusive_start_key, **additional_kwargs
@@ -666,10 +1227,20 @@ class DynamoDbCoreAdapter:
             fields_path_elements: Optional[List[List[DatabasePathElement]]] = None,
             filter_expression: Optional[Any] = None
     ) -> Optional[dict]:
+        return self.execute_operation(self.query_single_item_by_key_operation(
+            index_name=index_name, key_value=key_value,
+            fields_path_elements=fields_path_elements, filter_expression=filter_expression
+        ))
+
+    def query_single_item_by_key_operation(
+            self, index_name: str, key_value: Any,
+            fields_path_elements: Optional[List[List[DatabasePathElement]]] = None,
+            filter_expression: Optional[Any] = None
+    ) -> Generator[Any, Any, Optional[dict]]:
         # Yes, a query request is heavier than a get request that we could do with the _get_item_by_primary_key function.
         # Yet, in a get request, we cannot specify an index_name to query on. So, the _query_single_item_by_key should be
         # used when we want to get an item based on another index that the primary one. Otherwise, use _get_item_by_primary_key
-        response = self.query_response_by_key(
+        response = yield from self.query_response_by_key_operation(
             index_name=index_name, key_value=key_value,
             fields_path_elements=fields_path_elements,
             filter_expression=filter_expression, pagination_records_limit=1
@@ -684,8 +1255,15 @@ class DynamoDbCoreAdapter:
             return response.items[0]
 
     def get_or_query_single_item(self, index_name: str, key_value: str, fields_path_elements: List[List[DatabasePathElement]]) -> Optional[dict]:
+        return self.execute_operation(self.get_or_query_single_item_operation(
+            index_name=index_name, key_value=key_value, fields_path_elements=fields_path_elements
+        ))
+
+    def get_or_query_single_item_operation(
+            self, index_name: str, key_value: str, fields_path_elements: List[List[DatabasePathElement]]
+    ) -> Generator[Any, Any, Optional[dict]]:
         if self.primary_index.hash_key_name == index_name:
-            response: Optional[GetItemResponse] = self.get_item_by_primary_key(
+            response: Optional[GetItemResponse] = yield from self.get_item_by_primary_key_operation(
                 index_name=index_name, key_value=key_value, fields_path_elements=fields_path_elements
             )
             return response.item if response is not None else None
@@ -700,12 +1278,14 @@ class DynamoDbCoreAdapter:
                         'index_name': index_name, 'key_value': key_value, "fields_path_elements": fields_path_elements
                     }
                 ))
+                self._count_failed_retrieval()
                 return None
             else:
-                response_items: Optional[List[dict]] = self.query_response_by_key(
+                response: Response = yield from self.query_response_by_key_operation(
                     index_name=index_name, key_value=key_value,
                     fields_path_elements=fields_path_elements, pagination_records_limit=1
-                ).items
+                )
+                response_items: Optional[List[dict]] = response.items
                 if isinstance(response_items, list) and len(response_items) > 0:
                     return response_items[0]
                 else:
@@ -716,8 +1296,18 @@ class DynamoDbCoreAdapter:
             field_path_elements: List[DatabasePathElement],
             num_keys_to_navigation_into: int
     ) -> Optional[any]:
+        return self.execute_operation(self.get_data_in_path_target_operation(
+            index_name=index_name, key_value=key_value, field_path_elements=field_path_elements,
+            num_keys_to_navigation_into=num_keys_to_navigation_into
+        ))
 
-        response_item = self.get_or_query_single_item(
+    def get_data_in_path_target_operation(
+            self, index_name: str, key_value: str,
+            field_path_elements: List[DatabasePathElement],
+            num_keys_to_navigation_into: int
+    ) -> Generator[Any, Any, Optional[any]]:
+
+        response_item = yield from self.get_or_query_single_item_operation(
             index_name=index_name, key_value=key_value,
             fields_path_elements=[field_path_elements]
         )
@@ -727,18 +1317,32 @@ class DynamoDbCoreAdapter:
         )
 
     def get_value_in_path_target(self, index_name: str, key_value: str, field_path_elements: List[DatabasePathElement]) -> Optional[any]:
-        return self.get_data_in_path_target(
+        return self.execute_operation(self.get_value_in_path_target_operation(
+            index_name=index_name, key_value=key_value, field_path_elements=field_path_elements
+        ))
+
+    def get_value_in_path_target_operation(
+            self, index_name: str, key_value: str, field_path_elements: List[DatabasePathElement]
+    ) -> Generator[Any, Any, Optional[any]]:
+        return (yield from self.get_data_in_path_target_operation(
             index_name=index_name, key_value=key_value,
             field_path_elements=field_path_elements,
             num_keys_to_navigation_into=len(field_path_elements)
-        )
+        ))
 
     def get_item_in_path_target(self, index_name: str, key_value: str, field_path_elements: List[DatabasePathElement]) -> Optional[dict]:
-        return self.get_data_in_path_target(
+        return self.execute_operation(self.get_item_in_path_target_operation(
+            index_name=index_name, key_value=key_value, field_path_elements=field_path_elements
+        ))
+
+    def get_item_in_path_target_operation(
+            self, index_name: str, key_value: str, field_path_elements: List[DatabasePathElement]
+    ) -> Generator[Any, Any, Optional[dict]]:
+        return (yield from self.get_data_in_path_target_operation(
             index_name=index_name, key_value=key_value,
             field_path_elements=field_path_elements,
             num_keys_to_navigation_into=len(field_path_elements) - 1
-        )
+        ))
 
     @staticmethod
     def _unpack_multiple_retrieved_fields(
@@ -766,8 +1370,19 @@ class DynamoDbCoreAdapter:
             num_keys_to_stop_at_before_reaching_end_of_item: int, index_name: Optional[str] = None,
             metadata: bool = False
     ) -> Optional[Dict[str, Any]]:
+        return self.execute_operation(self.get_data_from_multiple_fields_in_path_target_operation(
+            key_value=key_value, fields_path_elements=fields_path_elements,
+            num_keys_to_stop_at_before_reaching_end_of_item=num_keys_to_stop_at_before_reaching_end_of_item,
+            index_name=index_name, metadata=metadata
+        ))
 
-        response_item: Optional[dict] = self.get_or_query_single_item(
+    def get_data_from_multiple_fields_in_path_target_operation(
+            self, key_value: str, fields_path_elements: Dict[str, List[DatabasePathElement]],
+            num_keys_to_stop_at_before_reaching_end_of_item: int, index_name: Optional[str] = None,
+            metadata: bool = False
+    ) -> Generator[Any, Any, Optional[Dict[str, Any]]]:
+
+        response_item: Optional[dict] = yield from self.get_or_query_single_item_operation(
             index_name=index_name, key_value=key_value,
             fields_path_elements=list(fields_path_elements.values())
         )
@@ -785,22 +1400,42 @@ class DynamoDbCoreAdapter:
             fields_path_elements: Dict[str, List[DatabasePathElement]],
             metadata: bool = False
     ):
-        return self.get_data_from_multiple_fields_in_path_target(
+        return self.execute_operation(self.get_values_in_multiple_path_target_operation(
+            index_name=index_name, key_value=key_value,
+            fields_path_elements=fields_path_elements, metadata=metadata
+        ))
+
+    def get_values_in_multiple_path_target_operation(
+            self, index_name: str, key_value: str,
+            fields_path_elements: Dict[str, List[DatabasePathElement]],
+            metadata: bool = False
+    ) -> Generator[Any, Any, Optional[Dict[str, Any]]]:
+        return (yield from self.get_data_from_multiple_fields_in_path_target_operation(
             index_name=index_name, key_value=key_value,
             fields_path_elements=fields_path_elements,
             num_keys_to_stop_at_before_reaching_end_of_item=0, metadata=metadata
-        )
+        ))
 
     def get_items_in_multiple_path_target(
             self, index_name: str, key_value: str,
             fields_path_elements: Dict[str, List[DatabasePathElement]],
             metadata: bool = False
     ):
-        return self.get_data_from_multiple_fields_in_path_target(
+        return self.execute_operation(self.get_items_in_multiple_path_target_operation(
+            index_name=index_name, key_value=key_value,
+            fields_path_elements=fields_path_elements, metadata=metadata
+        ))
+
+    def get_items_in_multiple_path_target_operation(
+            self, index_name: str, key_value: str,
+            fields_path_elements: Dict[str, List[DatabasePathElement]],
+            metadata: bool = False
+    ) -> Generator[Any, Any, Optional[Dict[str, Any]]]:
+        return (yield from self.get_data_from_multiple_fields_in_path_target_operation(
             index_name=index_name, key_value=key_value,
             fields_path_elements=fields_path_elements,
             num_keys_to_stop_at_before_reaching_end_of_item=1, metadata=metadata
-        )
+        ))
 
     @staticmethod
     def _add_to_filter_expression(expression, condition):
@@ -810,43 +1445,18 @@ class DynamoDbCoreAdapter:
 
     @staticmethod
     def _fields_paths_elements_to_expressions(fields_path_elements: List[List[DatabasePathElement]]) -> dict:
+        # Each element key is passed as an attribute name (see the ExpressionPathsBuilder), with a single attribute
+        # name per distinct element key, where as the same key can be used by multiple fields (like their parent map).
+        # A field requested multiple times is only projected once, since DynamoDB rejects the overlapping paths.
+        paths_builder = ExpressionPathsBuilder()
+        projection_expression: str = ", ".join(dict.fromkeys(
+            paths_builder.build_projection_path(path_elements=field_elements) for field_elements in fields_path_elements
+        ))
+
         output_kwargs = {}
-        expression_attribute_names = {}
-        projection_expression = ""
-
-        # In DynamoDB, when trying to get some fields, certain type of values (like values with - in them,
-        # or big numbers like an UUID), can not work and provoke in error while executing the query. In
-        # order to fix that, we need to pass the variable name in the ExpressionAttributeNames instead of
-        # putting it directly in the ProjectionExpression. Yet, when using a map path like myMap.data.item1
-        # we must declare each path element (myMap, data, item1) as separate ExpressionAttributeNames,
-        # otherwise it will not work. So, we define an 'id' for each path of each attribute name
-        # (f"#f{i_field}_{i_path}") we add our path as the dict value, and then we build the condition
-        # expression to use the ids of our attributes names.
-        for i_field, field_elements in enumerate(fields_path_elements):
-            for i_path_element, path_element in enumerate(field_elements):
-                if i_path_element > 0:
-                    last_field_path_element = field_elements[i_path_element - 1]
-                    if last_field_path_element.default_type == list:
-                        projection_expression += f'[{path_element.element_key}]'
-                        # We set the index of a list directly inside the projection expression, because a variable can
-                        # be passed the expression_attribute_names only if it is a str, where as our index will be an int.
-                        continue
-                    elif last_field_path_element.default_type == set:
-                        raise Exception("Selection by index in set type's not yet supported")
-
-                # If we reach this point, the continue keyword has not been triggered, which means that the current
-                # path_element has not yet been handled by a special case handler, like an list index handler.
-                current_field_path_expression_name = f"#f{i_field}_{i_path_element}"
-                expression_attribute_names[current_field_path_expression_name] = path_element.element_key
-                projection_expression += f'{"." if i_path_element > 0 else ""}{current_field_path_expression_name}'
-
-            if i_field + 1 < len(fields_path_elements):
-                projection_expression += ", "
-
-        if len(expression_attribute_names) > 0:
-            output_kwargs["ExpressionAttributeNames"] = expression_attribute_names
+        if len(paths_builder.attribute_names) > 0:
+            output_kwargs["ExpressionAttributeNames"] = paths_builder.attribute_names
         if projection_expression.replace(" ", "") != "":
             output_kwargs["ProjectionExpression"] = projection_expression
-
         return output_kwargs
 
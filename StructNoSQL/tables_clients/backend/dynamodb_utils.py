@@ -1,28 +1,23 @@
-import decimal
-from decimal import Decimal, Context
-from typing import Any, List, Optional, Callable, Set, Union
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, List, Optional, Callable, Set, Union, Dict, FrozenSet
 
 from boto3.dynamodb.types import Binary
 
 from StructNoSQL.practical_logger import message_with_vars
-from StructNoSQL.utils.decimals import float_to_decimal
-
-
-def _decimal_to_python(decimal_number: Decimal) -> float or int:
-    decimal_float = decimal_number.__float__()
-    return decimal_float if decimal_float.is_integer() is not True else int(decimal_float)
-
-
-def _python_to_decimal(python_number: int or float) -> Decimal:
-    return DynamoDBUtils.DECIMAL_DYNAMODB_CONTEXT.create_decimal(python_number)
+from StructNoSQL.utils.decimals import float_to_decimal, decimal_to_python, DECIMAL_DYNAMODB_CONTEXT
 
 
 def _dynamodb_number_to_python(number_string: str):
     float_number = float(number_string)
     if float_number.is_integer():
-        return int(float_number)
-    else:
-        return float_number
+        # Like the decimal_to_python function, the integers are converted from their exact value instead of their float
+        try:
+            return int(number_string)
+        except ValueError:
+            # Numbers with an exponent (like 1E+2) cannot be parsed by int
+            return decimal_to_python(decimal_number=DECIMAL_DYNAMODB_CONTEXT.create_decimal(number_string))
+    return float_number
 
 
 def _dynamodb_binary_to_python(binary_data):
@@ -47,13 +42,7 @@ class DynamoDBUtils:
     ]
     ALL_TYPES_WHERE_VALUE_DO_NOT_NEED_MODIFICATIONS = [TYPE_STRING, TYPE_BOOLEAN]
 
-    DECIMAL_DYNAMODB_CONTEXT = Context(
-        prec=38, rounding=decimal.ROUND_HALF_EVEN,
-        Emin=-128, Emax=126,
-        capitals=1, clamp=0,
-        flags=[], traps=[]
-    )
-    # 38 is the maximum numbers of Decimals numbers that DynamoDB can support.
+    DECIMAL_DYNAMODB_CONTEXT = DECIMAL_DYNAMODB_CONTEXT
 
     from boto3.dynamodb.types import TypeSerializer, TypeDeserializer
     # The serializer and deserializer can be static, even in a lambda,
@@ -76,7 +65,7 @@ class DynamoDBUtils:
     @staticmethod
     def dynamodb_to_python(dynamodb_object: Any):
         if isinstance(dynamodb_object, Decimal):
-            return _decimal_to_python(decimal_number=dynamodb_object)
+            return decimal_to_python(decimal_number=dynamodb_object)
         elif isinstance(dynamodb_object, list):
             for i, item in enumerate(dynamodb_object):
                 dynamodb_object[i] = DynamoDBUtils.dynamodb_to_python(dynamodb_object=item)
@@ -89,16 +78,49 @@ class DynamoDBUtils:
         return dynamodb_object
 
     @staticmethod
-    def python_to_dynamodb(python_object: Any):
+    def python_to_dynamodb(python_object: Any, float_to_decimal_function: Callable[[float], Decimal] = float_to_decimal):
         if isinstance(python_object, float):
-            return float_to_decimal(float_number=python_object)
+            return float_to_decimal_function(python_object)
         elif isinstance(python_object, list):
-            return [DynamoDBUtils.python_to_dynamodb(python_object=item) for item in python_object]
+            return [
+                DynamoDBUtils.python_to_dynamodb(python_object=item, float_to_decimal_function=float_to_decimal_function)
+                for item in python_object
+            ]
         elif isinstance(python_object, dict):
             # If the dict was a classic dict, with its first key not in the keys used by DynamoDB
-            return {key: DynamoDBUtils.python_to_dynamodb(python_object=item) for key, item in python_object.items()}
+            return {
+                key: DynamoDBUtils.python_to_dynamodb(python_object=item, float_to_decimal_function=float_to_decimal_function)
+                for key, item in python_object.items()
+            }
         return python_object
 
+
+@dataclass(frozen=True)
+class DynamoDBSerializers:
+    # The encode function converts a Python value to the value sent with the boto3 resource, and the decode function converts
+    # a value returned by the boto3 resource to its Python value. The passthrough types are the types of the values that are
+    # returned unchanged by the functions, which allows the serializers of a list or a dict to skip the calls on their items.
+    encode: Callable[[Any], Any]
+    decode: Callable[[Any], Any]
+    encode_passthrough_types: Optional[FrozenSet[type]] = None
+    decode_passthrough_types: Optional[FrozenSet[type]] = None
+
+
+# Walks any value. Used for the values without a known field type, and as the fallback of the schema compiled serializers.
+GENERIC_DYNAMODB_SERIALIZERS = DynamoDBSerializers(
+    encode=DynamoDBUtils.python_to_dynamodb,
+    decode=DynamoDBUtils.dynamodb_to_python
+)
+
+def make_generic_dynamodb_serializers(float_to_decimal_function: Callable[[float], Decimal]) -> DynamoDBSerializers:
+    if float_to_decimal_function is float_to_decimal:
+        return GENERIC_DYNAMODB_SERIALIZERS
+
+    def encode(python_object: Any) -> Any:
+        return DynamoDBUtils.python_to_dynamodb(python_object=python_object, float_to_decimal_function=float_to_decimal_function)
+    return DynamoDBSerializers(encode=encode, decode=DynamoDBUtils.dynamodb_to_python)
+
+
 class DynamoDBToPythonValuesConvertor:
     """This class deserializes DynamoDB types to Python types."""
     """
@@ -106,7 +128,7 @@ class DynamoDBToPythonValuesConvertor:
     --------                                ------
     {'NULL': True}                          None
     {'BOOL': True/False}                    True/False
-    {'N': str(value)}                       Decimal(str(value))
+    {'N': str(value)}                       int/float
     {'S': string}                           string
     {'B': bytes}                            Binary(bytes)
     {'NS': [str(value)]}                    set([Decimal(str(value))])
@@ -115,6 +137,8 @@ class DynamoDBToPythonValuesConvertor:
     {'L': list}                             list
     {'M': dict}                             dict
     """
+    # Used by the low level client engine, to convert the DynamoDB wire format straight to the same Python values
+    # that are returned by the resource engine after the TypeDeserializer and the DynamoDBUtils.dynamodb_to_python.
 
     @staticmethod
     def _handler_n(value: str):
@@ -130,18 +154,18 @@ class DynamoDBToPythonValuesConvertor:
 
     @staticmethod
     def _handler_m(value: dict):
-        return dict([(key, DynamoDBUtils.dynamodb_to_python(element)) for key, element in value.items()])
+        return {key: DynamoDBToPythonValuesConvertor.convert_item(element) for key, element in value.items()}
 
     @staticmethod
     def _handler_l(value: list):
-        return [DynamoDBUtils.dynamodb_to_python(element) for element in value]
+        return [DynamoDBToPythonValuesConvertor.convert_item(element) for element in value]
 
     @staticmethod
     def _handler_b(value: Any):
         return _dynamodb_binary_to_python(binary_data=value)
 
     @staticmethod
-    def _handler_ns(value: Any) -> Set[int or float]:
+    def _handler_ns(value: Any) -> Set[Decimal]:
         return set(map(DynamoDBUtils.DECIMAL_DYNAMODB_CONTEXT.create_decimal, value))
 
     @staticmethod
@@ -158,11 +182,39 @@ class DynamoDBToPythonValuesConvertor:
 
     @staticmethod
     def convert(first_key: str, dynamodb_item: Any):
-        handler: Optional[Callable[[Any], dict]] = getattr(DynamoDBToPythonValuesConvertor, f'_${first_key.lower()}_handler', None)
+        handler: Optional[Callable[[Any], Any]] = _DYNAMODB_TO_PYTHON_HANDLERS.get(first_key, None)
         if handler is None:
             raise Exception(f"Type {first_key} not supported")
         return handler(dynamodb_item)
 
+    @staticmethod
+    def convert_item(dynamodb_item: Dict[str, Any]):
+        # A DynamoDB wire value is a dict with a single key, which is its DynamoDB type
+        for first_key, value in dynamodb_item.items():
+            return DynamoDBToPythonValuesConvertor.convert(first_key=first_key, dynamodb_item=value)
+        raise Exception(message_with_vars(
+            message="DynamoDB to Python values conversion failed. The DynamoDB value does not have any type key",
+            vars_dict={'dynamodbItem': dynamodb_item}
+        ))
+
+    @staticmethod
+    def convert_attributes(dynamodb_attributes: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        return {key: DynamoDBToPythonValuesConvertor.convert_item(element) for key, element in dynamodb_attributes.items()}
+
+
+_DYNAMODB_TO_PYTHON_HANDLERS: Dict[str, Callable[[Any], Any]] = {
+    DynamoDBUtils.TYPE_STRING: DynamoDBToPythonValuesConvertor._handler_s,
+    DynamoDBUtils.TYPE_NUMBER: DynamoDBToPythonValuesConvertor._handler_n,
+    DynamoDBUtils.TYPE_BINARY: DynamoDBToPythonValuesConvertor._handler_b,
+    DynamoDBUtils.TYPE_STRING_SET: DynamoDBToPythonValuesConvertor._handler_ss,
+    DynamoDBUtils.TYPE_NUMBER_SET: DynamoDBToPythonValuesConvertor._handler_ns,
+    DynamoDBUtils.TYPE_BINARY_SET: DynamoDBToPythonValuesConvertor._handler_bs,
+    DynamoDBUtils.TYPE_NULL: DynamoDBToPythonValuesConvertor._handler_null,
+    DynamoDBUtils.TYPE_BOOLEAN: DynamoDBToPythonValuesConvertor._handler_bool,
+    DynamoDBUtils.TYPE_MAP: DynamoDBToPythonValuesConvertor._handler_m,
+    DynamoDBUtils.TYPE_LIST: DynamoDBToPythonValuesConvertor._handler_l,
+}
+
 
 class PythonToDynamoDBValuesConvertor:
     """This class serializes Python types to DynamoDB types."""
@@ -171,40 +223,43 @@ class PythonToDynamoDBValuesConvertor:
     ------                                  --------
     None                                    {'NULL': True}
     True/False                              {'BOOL': True/False}
-    int/Decimal                             {'N': str(value)}
+    int/float/Decimal                       {'N': str(value)}
     string                                  {'S': string}
     Binary/bytearray/bytes (py3 only)       {'B': bytes}
-    set([int/Decimal])                      {'NS': [str(value)]}
+    set([int/float/Decimal])                {'NS': [str(value)]}
     set([string])                           {'SS': [string])
     set([Binary/bytearray/bytes])           {'BS': [bytes]}
-    list                                    {'L': list}
+    list/tuple                              {'L': list}
     dict                                    {'M': dict}
     """
+    # Used by the low level client engine. The python_object is never modified, since it can be used after the request.
 
     @staticmethod
-    def _number_handler(python_object: Union[int, float]):
-        return {DynamoDBUtils.TYPE_NUMBER: _python_to_decimal(python_number=python_object)}
+    def _number_to_string(python_object: Union[int, float, Decimal]) -> str:
+        if isinstance(python_object, float):
+            return str(float_to_decimal(float_number=python_object))
+        return str(python_object)
 
     @staticmethod
-    def _int_handler(python_object: int):
-        return {DynamoDBUtils.TYPE_NUMBER: python_object}
-        # return PythonToDynamoDBValuesConvertor._number_handler(python_object=python_object)
+    def _number_handler(python_object: Union[int, float, Decimal]):
+        return {DynamoDBUtils.TYPE_NUMBER: PythonToDynamoDBValuesConvertor._number_to_string(python_object)}
 
     @staticmethod
-    def _float_handler(python_object: float):
-        return PythonToDynamoDBValuesConvertor._number_handler(python_object=python_object)
+    def _list_handler(python_object: Union[list, tuple]):
+        return {DynamoDBUtils.TYPE_LIST: [PythonToDynamoDBValuesConvertor.convert(python_object=item) for item in python_object]}
 
     @staticmethod
-    def _list_handler(python_object: list):
-        for i, item in enumerate(python_object):
-            python_object[i] = PythonToDynamoDBValuesConvertor.convert(python_object=item)
-        return {DynamoDBUtils.TYPE_LIST: python_object}
+    def _dict_handler(python_object: dict):
+        return {DynamoDBUtils.TYPE_MAP: PythonToDynamoDBValuesConvertor.convert_attributes(python_attributes=python_object)}
 
     @staticmethod
-    def _dict_handler(python_object: dict):
-        for key, item in python_object.items():
-            python_object[key] = PythonToDynamoDBValuesConvertor.convert(python_object=item)
-        return {DynamoDBUtils.TYPE_MAP: python_object}
+    def _set_handler(python_object: Union[set, frozenset]):
+        first_item: Any = next(iter(python_object), None)
+        if isinstance(first_item, str):
+            return {DynamoDBUtils.TYPE_STRING_SET: list(python_object)}
+        elif isinstance(first_item, (bytes, bytearray, Binary)):
+            return {DynamoDBUtils.TYPE_BINARY_SET: [PythonToDynamoDBValuesConvertor._binary_value(item) for item in python_object]}
+        return {DynamoDBUtils.TYPE_NUMBER_SET: [PythonToDynamoDBValuesConvertor._number_to_string(item) for item in python_object]}
 
     @staticmethod
     def _bool_handler(python_object: bool):
@@ -215,27 +270,56 @@ class PythonToDynamoDBValuesConvertor:
         return {DynamoDBUtils.TYPE_STRING: python_object}
 
     @staticmethod
-    def _bytes_handler(python_object: bytes):
-        return {DynamoDBUtils.TYPE_BINARY: python_object}
+    def _binary_value(python_object: Union[bytes, bytearray, Binary]) -> bytes:
+        return python_object.value if isinstance(python_object, Binary) else bytes(python_object)
 
     @staticmethod
-    def _nonetype_handler(python_object: None):
-        return {DynamoDBUtils.TYPE_NULL: True}
+    def _bytes_handler(python_object: Union[bytes, bytearray, Binary]):
+        return {DynamoDBUtils.TYPE_BINARY: PythonToDynamoDBValuesConvertor._binary_value(python_object)}
 
     @staticmethod
-    def _default_handler(python_object: Any):
-        return python_object
+    def _nonetype_handler(python_object: None):
+        return {DynamoDBUtils.TYPE_NULL: True}
 
     @staticmethod
     def convert(python_object: Any):
-        object_type: type = type(python_object)
-        handler: Callable[[Any], dict] = getattr(
-            PythonToDynamoDBValuesConvertor,
-            f'_{object_type.__name__.lower()}_handler',
-            PythonToDynamoDBValuesConvertor._default_handler
-        )
+        handler: Optional[Callable[[Any], dict]] = _PYTHON_TO_DYNAMODB_HANDLERS.get(type(python_object), None)
+        if handler is None:
+            # Subclasses of the supported types (like an IntEnum) are resolved with their first supported parent class
+            for python_type, type_handler in _PYTHON_TO_DYNAMODB_HANDLERS.items():
+                if isinstance(python_object, python_type):
+                    handler = type_handler
+                    break
+            else:
+                raise Exception(message_with_vars(
+                    message="Python to DynamoDB values conversion failed. The Python type is not supported",
+                    vars_dict={'pythonObjectType': type(python_object)}
+                ))
         return handler(python_object)
 
+    @staticmethod
+    def convert_attributes(python_attributes: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        return {key: PythonToDynamoDBValuesConvertor.convert(python_object=item) for key, item in python_attributes.items()}
+
+
+_PYTHON_TO_DYNAMODB_HANDLERS: Dict[type, Callable[[Any], dict]] = {
+    type(None): PythonToDynamoDBValuesConvertor._nonetype_handler,
+    # The bool handler must be before the number handler, since bool is a subclass of int
+    bool: PythonToDynamoDBValuesConvertor._bool_handler,
+    str: PythonToDynamoDBValuesConvertor._str_handler,
+    int: PythonToDynamoDBValuesConvertor._number_handler,
+    float: PythonToDynamoDBValuesConvertor._number_handler,
+    Decimal: PythonToDynamoDBValuesConvertor._number_handler,
+    dict: PythonToDynamoDBValuesConvertor._dict_handler,
+    list: PythonToDynamoDBValuesConvertor._list_handler,
+    tuple: PythonToDynamoDBValuesConvertor._list_handler,
+    set: PythonToDynamoDBValuesConvertor._set_handler,
+    frozenset: PythonToDynamoDBValuesConvertor._set_handler,
+    bytes: PythonToDynamoDBValuesConvertor._bytes_handler,
+    bytearray: PythonToDynamoDBValuesConvertor._bytes_handler,
+    Binary: PythonToDynamoDBValuesConvertor._bytes_handler,
+}
+
 
 class PythonToDynamoDBTypesConvertor:
     """
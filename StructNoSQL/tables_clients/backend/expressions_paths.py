@@ -0,0 +1,59 @@
+from typing import Dict, List, Tuple, Any, Optional
+
+from StructNoSQL.models import DatabasePathElement
+
+
+class ExpressionPathsBuilder:
+    # Builds the paths used by the expressions of a request (the fields of a ProjectionExpression, or the targets of the
+    # SET and REMOVE clauses of an UpdateExpression). Instead of an attribute name placeholder per element of each path,
+    # each distinct element key of the request gets a single placeholder, that is reused by all the paths of the request
+    # (like the 'textsDict' key shared by hundreds of setters), and each path is built in a single pass by joining its
+    # fragments, so that the construction of a request is linear in its number of path elements. A builder must be shared
+    # by all the clauses that can end up in a same request, so that their placeholders never collide. The placeholders
+    # start with '#k', so that they never collide with the placeholders of the boto3 conditions (starting with '#n').
+
+    def __init__(self):
+        # All the attribute names of the request, where as each built path returns the attribute names that it uses, since
+        # DynamoDB rejects the requests with unused attribute names, and the clauses of an update can be split in requests.
+        self.attribute_names: Dict[str, str] = {}
+        self._element_keys_placeholders: Dict[Any, str] = {}
+
+    def get_placeholder(self, element_key: Any) -> str:
+        placeholder: Optional[str] = self._element_keys_placeholders.get(element_key, None)
+        if placeholder is None:
+            placeholder = f"#k{len(self._element_keys_placeholders)}"
+            self._element_keys_placeholders[element_key] = placeholder
+            self.attribute_names[placeholder] = element_key
+        return placeholder
+
+    def build_update_path(self, path_elements: List[DatabasePathElement]) -> Tuple[str, Dict[str, str]]:
+        # The int element keys are indexes of a list, which are set right away in the path with the index access notation,
+        # since boto3 only accepts strings as attribute names. The element keys of other types are not part of the path.
+        path_fragments: List[str] = []
+        path_attribute_names: Dict[str, str] = {}
+        for path_element in path_elements:
+            element_key = path_element.element_key
+            if isinstance(element_key, str):
+                placeholder: str = self.get_placeholder(element_key)
+                path_attribute_names[placeholder] = element_key
+                path_fragments.append(f".{placeholder}" if len(path_fragments) > 0 else placeholder)
+            elif isinstance(element_key, int):
+                path_fragments.append(f"[{element_key}]")
+        return ''.join(path_fragments), path_attribute_names
+
+    def build_projection_path(self, path_elements: List[DatabasePathElement]) -> str:
+        # In DynamoDB, certain field names (like names with - in them, or big numbers like an UUID) cannot be used directly
+        # in a ProjectionExpression, so each element key is passed as an attribute name. The elements following a list are
+        # indexes of that list, which are set right away in the path with the index access notation.
+        path_fragments: List[str] = []
+        previous_path_element: Optional[DatabasePathElement] = None
+        for path_element in path_elements:
+            if previous_path_element is not None and previous_path_element.default_type == list:
+                path_fragments.append(f"[{path_element.element_key}]")
+            elif previous_path_element is not None and previous_path_element.default_type == set:
+                raise Exception("Selection by index in set type's not yet supported")
+            else:
+                placeholder: str = self.get_placeholder(path_element.element_key)
+                path_fragments.append(f".{placeholder}" if previous_path_element is not None else placeholder)
+            previous_path_element = path_element
+        return ''.join(path_fragments)
@@ -0,0 +1,182 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from StructNoSQL.tables_clients.backend.models import EXPRESSION_MAX_BYTES_SIZE, EXPRESSION_ATTRIBUTES_MAX_BYTES_SIZE, \
+    ITEM_MAX_BYTES_SIZE
+
+
+# DynamoDB enforces its size limits on the UTF-8 encoded expressions and on the size of the attributes values as stored
+# by DynamoDB (see https://docs.aws.amazon.com/amazondynamodb/latest/developerguide/CapacityUnitCalculations.html),
+# which are not related to the in memory size of the Python objects that represent them.
+
+def utf8_bytes_size(text: str) -> int:
+    return len(text.encode('utf-8'))
+
+
+def _number_bytes_size(number: Any) -> int:
+    # DynamoDB stores the significant digits of a number, two digits per byte, plus one byte.
+    digits = Decimal(str(number)).normalize().as_tuple().digits
+    num_significant_digits = len(digits) if digits != (0,) else 1
+    return (num_significant_digits + 1) // 2 + 1
+
+
+def dynamodb_value_bytes_size(value: Any) -> int:
+    if value is None or isinstance(value, bool):
+        return 1
+    elif isinstance(value, str):
+        return utf8_bytes_size(value)
+    elif isinstance(value, (int, float, Decimal)):
+        return _number_bytes_size(value)
+    elif isinstance(value, (bytes, bytearray)):
+        return len(value)
+    elif isinstance(value, dict):
+        # A map costs 3 bytes, plus 1 byte per element, plus the size of its keys and of its values
+        return 3 + sum(
+            1 + utf8_bytes_size(str(key)) + dynamodb_value_bytes_size(item)
+            for key, item in value.items()
+        )
+    elif isinstance(value, (list, tuple)):
+        return 3 + sum(1 + dynamodb_value_bytes_size(item) for item in value)
+    elif isinstance(value, (set, frozenset)):
+        return sum(dynamodb_value_bytes_size(item) for item in value)
+    # Unknown types (like boto3 Binary objects) are measured from their string representation
+    return utf8_bytes_size(str(value))
+
+
+@dataclass
+class ExpressionClause:
+    # A single clause of an update expression (like '#k0.#k1 = :item0'), with the expression attribute names and values
+    # that it requires. The names keys can be shared by multiple clauses that can be packed together (when they are the
+    # names of the same element key), where as the values keys must be unique across all these clauses. The sizes of the
+    # shared names are counted by each of their clauses, which can only over-estimate the size of a request.
+    expression: str
+    attribute_names: Dict[str, str]
+    attribute_values: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.expression_bytes_size: int = utf8_bytes_size(self.expression)
+        self.values_bytes_size: int = sum(dynamodb_value_bytes_size(value) for value in self.attribute_values.values())
+        self.substitutions_bytes_size: int = self.values_bytes_size + sum(
+            utf8_bytes_size(key) + utf8_bytes_size(value) for key, value in self.attribute_names.items()
+        ) + sum(utf8_bytes_size(key) for key in self.attribute_values.keys())
+
+
+class _ExpressionClausesBin:
+    def __init__(self, action_keyword: str):
+        self.clauses: List[ExpressionClause] = []
+        self.expression_bytes_size: int = utf8_bytes_size(f"{action_keyword} ")
+        self.values_bytes_size: int = 0
+        self.substitutions_bytes_size: int = 0
+
+    def _expression_bytes_size_if_added(self, clause: ExpressionClause) -> int:
+        # Each clause after the first one is preceded by a ', ' separator
+        return self.expression_bytes_size + clause.expression_bytes_size + (2 if len(self.clauses) > 0 else 0)
+
+    def can_fit(self, clause: ExpressionClause) -> bool:
+        return (
+            self._expression_bytes_size_if_added(clause) <= EXPRESSION_MAX_BYTES_SIZE and
+            self.values_bytes_size + clause.values_bytes_size <= ITEM_MAX_BYTES_SIZE and
+            self.substitutions_bytes_size + clause.substitutions_bytes_size <= EXPRESSION_ATTRIBUTES_MAX_BYTES_SIZE
+        )
+
+    def add(self, clause: ExpressionClause):
+        self.expression_bytes_size = self._expression_bytes_size_if_added(clause)
+        self.values_bytes_size += clause.values_bytes_size
+        self.substitutions_bytes_size += clause.substitutions_bytes_size
+        self.clauses.append(clause)
+
+
+def pack_expression_clauses(clauses: List[ExpressionClause], action_keyword: str) -> List[List[int]]:
+    # First fit decreasing bin packing of the clauses into the fewest requests that respect the DynamoDB limits.
+    # Returns the indexes of the clauses of each request, in their original order. A clause that would not
+    # fit in any request on its own, is still put alone in its own request, where it will be rejected by DynamoDB.
+    bins: List[_ExpressionClausesBin] = []
+    clauses_indexes_per_bin: List[List[int]] = []
+    sorted_clauses_indexes: List[int] = sorted(
+        range(len(clauses)), key=lambda i: (clauses[i].expression_bytes_size, clauses[i].values_bytes_size), reverse=True
+    )
+    for i_clause in sorted_clauses_indexes:
+        clause = clauses[i_clause]
+        for i_bin, clauses_bin in enumerate(bins):
+            if clauses_bin.can_fit(clause):
+                clauses_bin.add(clause)
+                clauses_indexes_per_bin[i_bin].append(i_clause)
+                break
+        else:
+            new_bin = _ExpressionClausesBin(action_keyword=action_keyword)
+            new_bin.add(clause)
+            bins.append(new_bin)
+            clauses_indexes_per_bin.append([i_clause])
+    return [sorted(clauses_indexes) for clauses_indexes in clauses_indexes_per_bin]
+
+
+def join_expression_clauses(clauses: List[ExpressionClause], action_keyword: str) -> dict:
+    # Returns the UpdateExpression, ExpressionAttributeNames and ExpressionAttributeValues kwargs of the clauses
+    expression_kwargs: dict = {'UpdateExpression': f"{action_keyword} {', '.join(clause.expression for clause in clauses)}"}
+    expression_attribute_names: Dict[str, str] = {
+        key: value for clause in clauses for key, value in clause.attribute_names.items()
+    }
+    expression_attribute_values: Dict[str, Any] = {
+        key: value for clause in clauses for key, value in clause.attribute_values.items()
+    }
+    if len(expression_attribute_names) > 0:
+        expression_kwargs['ExpressionAttributeNames'] = expression_attribute_names
+    if len(expression_attribute_values) > 0:
+        expression_kwargs['ExpressionAttributeValues'] = expression_attribute_values
+    return expression_kwargs
+
+
+def can_fit_in_single_request(clauses_per_action_keyword: Dict[str, List[ExpressionClause]]) -> bool:
+    # An update expression can contain multiple actions (like 'SET ... REMOVE ...'), separated by a space, which
+    # all share the limits of the request.
+    expression_bytes_size: int = 0
+    values_bytes_size: int = 0
+    substitutions_bytes_size: int = 0
+    for action_keyword, clauses in clauses_per_action_keyword.items():
+        if not len(clauses) > 0:
+            continue
+        action_clauses_bin = _ExpressionClausesBin(action_keyword=action_keyword)
+        for clause in clauses:
+            action_clauses_bin.add(clause)
+        expression_bytes_size += action_clauses_bin.expression_bytes_size + (1 if expression_bytes_size > 0 else 0)
+        values_bytes_size += action_clauses_bin.values_bytes_size
+        substitutions_bytes_size += action_clauses_bin.substitutions_bytes_size
+    return (
+        expression_bytes_size <= EXPRESSION_MAX_BYTES_SIZE and
+        values_bytes_size <= ITEM_MAX_BYTES_SIZE and
+        substitutions_bytes_size <= EXPRESSION_ATTRIBUTES_MAX_BYTES_SIZE
+    )
+
+
+def join_multiple_actions_expression_clauses(clauses_per_action_keyword: Dict[str, List[ExpressionClause]]) -> dict:
+    # Like the join_expression_clauses, but with one action per action keyword in the same UpdateExpression
+    expression_kwargs: dict = {}
+    for action_keyword, clauses in clauses_per_action_keyword.items():
+        if not len(clauses) > 0:
+            continue
+        action_expression_kwargs: dict = join_expression_clauses(clauses=clauses, action_keyword=action_keyword)
+        expression_kwargs['UpdateExpression'] = ' '.join(filter(None, [
+            expression_kwargs.get('UpdateExpression', None), action_expression_kwargs['UpdateExpression']
+        ]))
+        for kwarg_key in ['ExpressionAttributeNames', 'ExpressionAttributeValues']:
+            if kwarg_key in action_expression_kwargs:
+                expression_kwargs[kwarg_key] = {**expression_kwargs.get(kwarg_key, {}), **action_expression_kwargs[kwarg_key]}
+    return expression_kwargs
+
+
+def add_condition_clause(query_kwargs: dict, condition_clause: Optional[ExpressionClause]) -> dict:
+    # Returns the kwargs of the request with the clause as its ConditionExpression, along with the expression attribute
+    # names and values of the clause (which keys must not be used by the UpdateExpression of the request).
+    if condition_clause is None:
+        return query_kwargs
+    conditioned_query_kwargs: dict = {**query_kwargs, 'ConditionExpression': condition_clause.expression}
+    if len(condition_clause.attribute_names) > 0:
+        conditioned_query_kwargs['ExpressionAttributeNames'] = {
+            **query_kwargs.get('ExpressionAttributeNames', {}), **condition_clause.attribute_names
+        }
+    if len(condition_clause.attribute_values) > 0:
+        conditioned_query_kwargs['ExpressionAttributeValues'] = {
+            **query_kwargs.get('ExpressionAttributeValues', {}), **condition_clause.attribute_values
+        }
+    return conditioned_query_kwargs
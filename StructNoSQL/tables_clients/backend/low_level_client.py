@@ -0,0 +1,113 @@
+from typing import Any, Dict, List, Optional
+
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+
+from StructNoSQL.tables_clients.backend.dynamodb_utils import PythonToDynamoDBValuesConvertor, DynamoDBToPythonValuesConvertor
+from StructNoSQL.tables_clients.backend.operations import DynamoDBRequest
+
+
+# The low level client engine sends the requests with the DynamoDB client instead of the boto3 resource, which
+# avoids the TypeSerializer and TypeDeserializer of the resource layer. The requests kwargs are the same as the
+# kwargs of the resource requests, and are converted to the DynamoDB wire format in a single pass, as well as the
+# responses, which are directly converted to their final Python values (numbers as int or float instead of Decimal).
+
+_CONDITIONS_EXPRESSIONS_KEYS: Dict[str, bool] = {
+    # Expression key: whether the expression is a key condition
+    'KeyConditionExpression': True,
+    'FilterExpression': False,
+    'ConditionExpression': False,
+}
+_ATTRIBUTES_KEYS: List[str] = ['Item', 'Key', 'ExclusiveStartKey', 'ExpressionAttributeValues']
+_RESPONSE_ATTRIBUTES_KEYS: List[str] = ['Item', 'Attributes', 'LastEvaluatedKey']
+
+
+def _build_conditions_expressions(request_kwargs: dict) -> None:
+    # Like the resource layer, the conditions objects (like Key(index_name).eq(key_value)) are built into expressions
+    conditions_expressions_builder: Optional[ConditionExpressionBuilder] = None
+    for expression_key, is_key_condition in _CONDITIONS_EXPRESSIONS_KEYS.items():
+        condition: Optional[Any] = request_kwargs.get(expression_key, None)
+        if isinstance(condition, ConditionBase):
+            if conditions_expressions_builder is None:
+                conditions_expressions_builder = ConditionExpressionBuilder()
+            built_expression = conditions_expressions_builder.build_expression(condition, is_key_condition=is_key_condition)
+            request_kwargs[expression_key] = built_expression.condition_expression
+            if len(built_expression.attribute_name_placeholders) > 0:
+                request_kwargs['ExpressionAttributeNames'] = {
+                    **request_kwargs.get('ExpressionAttributeNames', {}), **built_expression.attribute_name_placeholders
+                }
+            if len(built_expression.attribute_value_placeholders) > 0:
+                request_kwargs['ExpressionAttributeValues'] = {
+                    **request_kwargs.get('ExpressionAttributeValues', {}), **built_expression.attribute_value_placeholders
+                }
+
+
+def _serialize_write_request(write_request: Dict[str, dict]) -> Dict[str, dict]:
+    if 'PutRequest' in write_request:
+        return {'PutRequest': {'Item': PythonToDynamoDBValuesConvertor.convert_attributes(write_request['PutRequest']['Item'])}}
+    elif 'DeleteRequest' in write_request:
+        return {'DeleteRequest': {'Key': PythonToDynamoDBValuesConvertor.convert_attributes(write_request['DeleteRequest']['Key'])}}
+    return write_request
+
+
+def _serialize_request_items(request_items: Dict[str, Any]) -> Dict[str, Any]:
+    serialized_request_items: Dict[str, Any] = {}
+    for table_name, table_request_items in request_items.items():
+        if isinstance(table_request_items, list):
+            # batch_write_item requests
+            serialized_request_items[table_name] = [_serialize_write_request(write_request) for write_request in table_request_items]
+        else:
+            # batch_get_item requests
+            serialized_request_items[table_name] = {**table_request_items, 'Keys': [
+                PythonToDynamoDBValuesConvertor.convert_attributes(key) for key in table_request_items['Keys']
+            ]}
+    return serialized_request_items
+
+
+def make_low_level_request_kwargs(request: DynamoDBRequest, table_name: str) -> dict:
+    request_kwargs: dict = {**request.kwargs}
+    if request.table_level is True:
+        # The TableName was automatically added by the Table resource
+        request_kwargs.setdefault('TableName', table_name)
+    _build_conditions_expressions(request_kwargs=request_kwargs)
+    for attributes_key in _ATTRIBUTES_KEYS:
+        attributes: Optional[dict] = request_kwargs.get(attributes_key, None)
+        if attributes is not None:
+            request_kwargs[attributes_key] = PythonToDynamoDBValuesConvertor.convert_attributes(attributes)
+    if 'RequestItems' in request_kwargs:
+        request_kwargs['RequestItems'] = _serialize_request_items(request_kwargs['RequestItems'])
+    return request_kwargs
+
+
+def _deserialize_write_request(write_request: Dict[str, dict]) -> Dict[str, dict]:
+    if 'PutRequest' in write_request:
+        return {'PutRequest': {'Item': DynamoDBToPythonValuesConvertor.convert_attributes(write_request['PutRequest']['Item'])}}
+    elif 'DeleteRequest' in write_request:
+        return {'DeleteRequest': {'Key': DynamoDBToPythonValuesConvertor.convert_attributes(write_request['DeleteRequest']['Key'])}}
+    return write_request
+
+
+def low_level_response_to_python(response: dict) -> dict:
+    for attributes_key in _RESPONSE_ATTRIBUTES_KEYS:
+        attributes: Optional[dict] = response.get(attributes_key, None)
+        if attributes is not None:
+            response[attributes_key] = DynamoDBToPythonValuesConvertor.convert_attributes(attributes)
+    if 'Items' in response:
+        response['Items'] = [DynamoDBToPythonValuesConvertor.convert_attributes(item) for item in response['Items']]
+    if 'Responses' in response:
+        response['Responses'] = {
+            table_name: [DynamoDBToPythonValuesConvertor.convert_attributes(item) for item in table_items]
+            for table_name, table_items in response['Responses'].items()
+        }
+    if 'UnprocessedKeys' in response:
+        # The unprocessed keys and items are converted back to Python values, since they will be sent again in a new request
+        response['UnprocessedKeys'] = {
+            table_name: {**table_keys_and_attributes, 'Keys': [
+                DynamoDBToPythonValuesConvertor.convert_attributes(key) for key in table_keys_and_attributes['Keys']
+            ]} for table_name, table_keys_and_attributes in response['UnprocessedKeys'].items()
+        }
+    if 'UnprocessedItems' in response:
+        response['UnprocessedItems'] = {
+            table_name: [_deserialize_write_request(write_request) for write_request in table_write_requests]
+            for table_name, table_write_requests in response['UnprocessedItems'].items()
+        }
+    return response
@@ -1,10 +1,70 @@
-from typing import Optional, List, Type, Any, Dict
+from dataclasses import dataclass
+from typing import Optional, List, Type, Any, Dict, FrozenSet
 from pydantic import BaseModel, validate_arguments
 
 
 HASH_KEY_TYPE = "HASH"
 SORT_KEY_TYPE = "RANGE"
 EXPRESSION_MAX_BYTES_SIZE = 4000  # DynamoDB max expression size is 4kb
+EXPRESSION_ATTRIBUTES_MAX_BYTES_SIZE = 2 * 1024 * 1024  # DynamoDB max size of all the expression attribute names and values is 2mb
+ITEM_MAX_BYTES_SIZE = 400 * 1024  # DynamoDB max item size is 400kb
+BATCH_GET_ITEM_MAX_KEYS = 100  # DynamoDB max number of keys in a single BatchGetItem request
+BATCH_WRITE_ITEM_MAX_ITEMS = 25  # DynamoDB max number of put or delete requests in a single BatchWriteItem request
+BATCH_GET_MAX_CONCURRENT_REQUESTS = 8
+BATCH_WRITE_MAX_CONCURRENT_REQUESTS = 8
+BATCH_OPERATIONS_MAX_RETRIES = 8
+BATCH_OPERATIONS_RETRY_BASE_DELAY = 0.05  # Delay in seconds before the first retry of unprocessed batch items
+BATCH_OPERATIONS_RETRY_MAX_DELAY = 2.0
+DEFAULT_MAX_POOL_CONNECTIONS = 50  # botocore only keeps 10 pooled connections by default
+# The requests are retried by the RetryPolicy of the tables, so the retries of botocore are disabled to not retry twice
+BOTOCORE_RETRIES_CONFIG = {'total_max_attempts': 1}
+DEFAULT_RETRYABLE_ERROR_CODES: FrozenSet[str] = frozenset({
+    'ProvisionedThroughputExceededException', 'ThrottlingException', 'RequestLimitExceeded',
+    'LimitExceededException', 'TransactionConflictException', 'TransactionInProgressException',
+    'InternalServerError', 'InternalFailure', 'ServiceUnavailable'
+})
+
+
+@dataclass(frozen=True)
+class ConnectionPoolConfig:
+    # The max_pool_connections is also used as the max number of requests that a table client will send concurrently
+    # (like the initializers of missing fields or the removers of multiple fields), so that the threads of the
+    # concurrent operations never have to wait for a free connection. The config is frozen, since the clients
+    # are shared between all the tables with the same boto session, region and connection pool config.
+    max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS
+    connect_timeout: float = 5.0
+    read_timeout: float = 10.0
+    tcp_keepalive: bool = True
+
+    def to_config_kwargs(self) -> Dict[str, Any]:
+        return {
+            'max_pool_connections': self.max_pool_connections,
+            'connect_timeout': self.connect_timeout,
+            'read_timeout': self.read_timeout,
+            'tcp_keepalive': self.tcp_keepalive
+        }
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    # The requests failing with one of the retryable_error_codes (or with a connection error) are retried up to max_retries
+    # times, with a decorrelated jitter backoff between base_delay and max_delay seconds. Each table has its own retry
+    # budget (like the retry quota of the AWS SDKs) : every retry costs retry_cost, every successful request gives back
+    # one unit, and the requests are no longer retried while the budget is empty, so that an outage does not multiply
+    # the load on the table. If rate_limit_requests_per_second is set, the requests of the table are spread with a token
+    # bucket of rate_limit_burst_capacity requests, which rate is reduced when throttled and raised back on success,
+    # so that a PROVISIONED table can be used up to its capacity without falling into retries storms. The requests that are
+    # not idempotent (like the appends to a list) are only retried after the errors rejecting them before being applied.
+    max_retries: int = 8
+    base_delay: float = 0.025
+    max_delay: float = 5.0
+    retry_budget_capacity: int = 500
+    retry_cost: int = 5
+    rate_limit_requests_per_second: Optional[float] = None
+    rate_limit_burst_capacity: Optional[float] = None
+    rate_limit_min_requests_per_second: float = 1.0
+    rate_limit_throttled_decrease_factor: float = 0.7
+    retryable_error_codes: FrozenSet[str] = DEFAULT_RETRYABLE_ERROR_CODES
 
 
 class GetItemResponse(BaseModel):
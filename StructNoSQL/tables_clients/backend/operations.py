@@ -0,0 +1,202 @@
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from time import sleep
+from types import GeneratorType
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import Any, Callable, Generator, List, Optional, Awaitable, Iterator
+
+
+# The database operations (in the DynamoDbCoreAdapter and in the base tables) are written as generators, which yield
+# the requests to send to DynamoDB, and receive back their responses. This allows the same operations logic to be
+# executed by a sync driver (boto3) or by an async driver (aioboto3), without duplicating any of the operations logic.
+# An operation generator can yield:
+# - a DynamoDBRequest, which will be executed by the request executor of the driver.
+# - another operation generator, which will be executed by the same driver.
+# - a ConcurrentOperations, which will execute all of its operations concurrently, and return the list of their results.
+# - an OperationDelay, to wait before continuing the operation (for example before a retry).
+# - any other value (or an awaitable with the async driver), which will be directly sent back to the operation.
+# The exceptions raised by a request, by a nested operation or by a ConcurrentOperations are thrown inside the operation.
+# The max_concurrency of the drivers bounds the ConcurrentOperations that do not specify their own max_concurrency.
+
+
+@dataclass
+class DynamoDBRequest:
+    method_name: str
+    kwargs: dict
+    table_level: bool = True
+    # If table_level is False, the request will be executed on the DynamoDB service resource
+    # instead of the table resource (required for operations like batch_get_item).
+    idempotent: bool = True
+    # If idempotent is False (like an update appending to a list or incrementing a number), the request is only retried
+    # after the errors that guarantee it has not been applied (like throttling), and never after a 5xx or a connection error.
+
+
+@dataclass
+class ConcurrentOperations:
+    operations: List[Generator]
+    max_concurrency: Optional[int] = None
+
+
+@dataclass
+class OperationDelay:
+    seconds: float
+
+
+class SyncOperationsDriver:
+    # Executes the operation generators with a sync request executor. All the ConcurrentOperations executed by a driver
+    # (including the ones nested inside other concurrent operations) share the same pool of threads, so that the number
+    # of threads does not multiply with each nested level. The thread that executes a ConcurrentOperations also executes
+    # its operations (instead of only waiting for the threads of the pool), so that the nested concurrent operations are
+    # always executed, even when all the threads of the pool are already waiting for their own concurrent operations.
+
+    def __init__(self, request_executor: Callable[[DynamoDBRequest], Any], max_concurrency: Optional[int] = None):
+        self.request_executor = request_executor
+        self.max_concurrency = max_concurrency
+        self._threads_pool: Optional[ThreadPoolExecutor] = None
+        self._threads_pool_lock = threading.Lock()
+
+    def _get_threads_pool(self) -> ThreadPoolExecutor:
+        # The threads pool is lazily created, since most drivers never execute concurrent operations
+        if self._threads_pool is None:
+            with self._threads_pool_lock:
+                if self._threads_pool is None:
+                    self._threads_pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='StructNoSQL')
+        return self._threads_pool
+
+    def execute_operation(self, operation: Generator) -> Any:
+        value_to_send: Any = None
+        exception_to_throw: Optional[Exception] = None
+        while True:
+            try:
+                yielded_item: Any = (
+                    operation.send(value_to_send) if exception_to_throw is None else
+                    operation.throw(exception_to_throw)
+                )
+            except StopIteration as stop:
+                return stop.value
+
+            value_to_send, exception_to_throw = None, None
+            # The exceptions are thrown inside the operation generator, so
+            # that they can be handled by the try/except around the yield.
+            if isinstance(yielded_item, DynamoDBRequest):
+                try:
+                    value_to_send = self.request_executor(yielded_item)
+                except Exception as e:
+                    exception_to_throw = e
+            elif isinstance(yielded_item, GeneratorType):
+                try:
+                    value_to_send = self.execute_operation(operation=yielded_item)
+                except Exception as e:
+                    exception_to_throw = e
+            elif isinstance(yielded_item, ConcurrentOperations):
+                try:
+                    value_to_send = self._execute_concurrent_operations(concurrent_operations=yielded_item)
+                except Exception as e:
+                    exception_to_throw = e
+            elif isinstance(yielded_item, OperationDelay):
+                sleep(yielded_item.seconds)
+            else:
+                value_to_send = yielded_item
+
+    def _execute_concurrent_operations(self, concurrent_operations: ConcurrentOperations) -> List[Any]:
+        operations: List[Generator] = concurrent_operations.operations
+        num_operations: int = len(operations)
+        if not num_operations > 0:
+            return []
+        if num_operations == 1:
+            return [self.execute_operation(operation=operations[0])]
+
+        operations_results: List[Any] = [None] * num_operations
+        operations_exceptions: List[Optional[Exception]] = [None] * num_operations
+        operations_indexes: Iterator[int] = iter(range(num_operations))
+        operations_indexes_lock = threading.Lock()
+
+        def operations_worker() -> None:
+            while True:
+                with operations_indexes_lock:
+                    i_operation: Optional[int] = next(operations_indexes, None)
+                if i_operation is None:
+                    return
+                try:
+                    operations_results[i_operation] = self.execute_operation(operation=operations[i_operation])
+                except Exception as e:
+                    operations_exceptions[i_operation] = e
+
+        max_concurrency: int = concurrent_operations.max_concurrency or self.max_concurrency or num_operations
+        threads_pool: ThreadPoolExecutor = self._get_threads_pool()
+        # The current thread is one of the workers of the operations
+        workers_futures: List[Future] = [threads_pool.submit(operations_worker) for _ in range(min(num_operations, max_concurrency) - 1)]
+        operations_worker()
+        for worker_future in workers_futures:
+            # A worker that has not been started yet has no operation left to execute
+            if not worker_future.cancel():
+                worker_future.result()
+        for operation_exception in operations_exceptions:
+            if operation_exception is not None:
+                raise operation_exception
+        return operations_results
+
+
+class AsyncOperationsDriver:
+    # Executes the operation generators with an async request executor. The concurrent operations are executed as tasks
+    # of the event loop, so the nested concurrent operations do not need any thread. The number of requests that are
+    # sent concurrently by all the operations of a table is bounded by the table adapter itself.
+
+    def __init__(self, request_executor: Callable[[DynamoDBRequest], Awaitable[Any]], max_concurrency: Optional[int] = None):
+        self.request_executor = request_executor
+        self.max_concurrency = max_concurrency
+
+    async def execute_operation(self, operation: Generator) -> Any:
+        value_to_send: Any = None
+        exception_to_throw: Optional[Exception] = None
+        while True:
+            try:
+                yielded_item: Any = (
+                    operation.send(value_to_send) if exception_to_throw is None else
+                    operation.throw(exception_to_throw)
+                )
+            except StopIteration as stop:
+                return stop.value
+
+            value_to_send, exception_to_throw = None, None
+            if isinstance(yielded_item, DynamoDBRequest):
+                try:
+                    value_to_send = await self.request_executor(yielded_item)
+                except Exception as e:
+                    exception_to_throw = e
+            elif isinstance(yielded_item, GeneratorType):
+                try:
+                    value_to_send = await self.execute_operation(operation=yielded_item)
+                except Exception as e:
+                    exception_to_throw = e
+            elif isinstance(yielded_item, ConcurrentOperations):
+                try:
+                    value_to_send = await self._execute_concurrent_operations(concurrent_operations=yielded_item)
+                except Exception as e:
+                    exception_to_throw = e
+            elif isinstance(yielded_item, OperationDelay):
+                await asyncio.sleep(yielded_item.seconds)
+            elif inspect.isawaitable(yielded_item):
+                value_to_send = await yielded_item
+            else:
+                value_to_send = yielded_item
+
+    async def _execute_concurrent_operations(self, concurrent_operations: ConcurrentOperations) -> List[Any]:
+        max_concurrency: Optional[int] = concurrent_operations.max_concurrency or self.max_concurrency
+        if max_concurrency is None:
+            return list(await asyncio.gather(*[
+                self.execute_operation(operation=item_operation) for item_operation in concurrent_operations.operations
+            ]))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded_operation_executor(item_operation: Generator) -> Any:
+            async with semaphore:
+                return await self.execute_operation(operation=item_operation)
+
+        return list(await asyncio.gather(*[
+            bounded_operation_executor(item_operation) for item_operation in concurrent_operations.operations
+        ]))
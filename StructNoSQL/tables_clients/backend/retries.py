@@ -0,0 +1,144 @@
+import random
+import threading
+import time
+from typing import Optional, Any, Generator
+
+from botocore.exceptions import ClientError, ConnectionError as BotocoreConnectionError, HTTPClientError
+
+from StructNoSQL.tables_clients.backend.models import RetryPolicy
+from StructNoSQL.tables_clients.backend.operations import DynamoDBRequest, OperationDelay
+from StructNoSQL.practical_logger import message_with_vars
+
+
+# The RetryPolicy is a frozen config that can be shared between tables, where as the RequestsRetrier holds the
+# state of the retries of a single table (its retry budget and its rate limiter). The retries of a request are
+# written as an operation generator, so that they are executed by both the sync and the async operations drivers.
+
+THROTTLING_ERROR_CODES = frozenset({
+    'ProvisionedThroughputExceededException', 'ThrottlingException', 'RequestLimitExceeded', 'LimitExceededException'
+})
+# The errors returned before a request has been applied. The 5xx and the connection errors can happen after a request has
+# been applied, which is why the requests that are not idempotent are only retried after one of these errors.
+REJECTED_REQUEST_ERROR_CODES = THROTTLING_ERROR_CODES | frozenset({'TransactionConflictException', 'TransactionInProgressException'})
+
+
+def get_exception_error_code(exception: Exception) -> Optional[str]:
+    if isinstance(exception, ClientError):
+        return exception.response.get('Error', {}).get('Code', None)
+    return None
+
+
+class TokenBucketRateLimiter:
+    def __init__(self, requests_per_second: float, burst_capacity: float, min_requests_per_second: float, throttled_decrease_factor: float):
+        self.max_requests_per_second = requests_per_second
+        self.min_requests_per_second = min(min_requests_per_second, requests_per_second)
+        self.burst_capacity = burst_capacity
+        self.throttled_decrease_factor = throttled_decrease_factor
+        self._requests_per_second = requests_per_second
+        self._tokens = burst_capacity
+        self._last_refill_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def requests_per_second(self) -> float:
+        return self._requests_per_second
+
+    def reserve(self) -> float:
+        # Takes a token, and returns the number of seconds to wait before sending the request. The tokens can become
+        # negative, so that the waiting requests are spread over time, instead of all being sent when a token is added.
+        with self._lock:
+            current_time: float = time.monotonic()
+            self._tokens = min(self.burst_capacity, self._tokens + (current_time - self._last_refill_time) * self._requests_per_second)
+            self._last_refill_time = current_time
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._requests_per_second
+
+    def on_throttled(self) -> None:
+        # Multiplicative decrease of the rate when DynamoDB throttles the table
+        with self._lock:
+            self._requests_per_second = max(self.min_requests_per_second, self._requests_per_second * self.throttled_decrease_factor)
+
+    def on_success(self) -> None:
+        # Additive increase of the rate (by 1% of the max rate) after each successful request
+        with self._lock:
+            self._requests_per_second = min(self.max_requests_per_second, self._requests_per_second + self.max_requests_per_second / 100)
+
+
+class RequestsRetrier:
+    def __init__(self, retry_policy: RetryPolicy):
+        self.retry_policy = retry_policy
+        self._retry_budget: int = retry_policy.retry_budget_capacity
+        self._retry_budget_lock = threading.Lock()
+        self.rate_limiter: Optional[TokenBucketRateLimiter] = TokenBucketRateLimiter(
+            requests_per_second=retry_policy.rate_limit_requests_per_second,
+            burst_capacity=(
+                retry_policy.rate_limit_burst_capacity if retry_policy.rate_limit_burst_capacity is not None
+                else retry_policy.rate_limit_requests_per_second
+            ),
+            min_requests_per_second=retry_policy.rate_limit_min_requests_per_second,
+            throttled_decrease_factor=retry_policy.rate_limit_throttled_decrease_factor
+        ) if retry_policy.rate_limit_requests_per_second is not None else None
+
+    @property
+    def retry_budget(self) -> int:
+        return self._retry_budget
+
+    def is_retryable_exception(self, exception: Exception, request: DynamoDBRequest) -> bool:
+        error_code: Optional[str] = get_exception_error_code(exception=exception)
+        if request.idempotent is not True and error_code not in REJECTED_REQUEST_ERROR_CODES:
+            return False
+        if isinstance(exception, (BotocoreConnectionError, HTTPClientError)):
+            return True
+        return error_code in self.retry_policy.retryable_error_codes
+
+    def _acquire_retry_budget(self) -> bool:
+        with self._retry_budget_lock:
+            if self._retry_budget < self.retry_policy.retry_cost:
+                return False
+            self._retry_budget -= self.retry_policy.retry_cost
+            return True
+
+    def _release_retry_budget(self, amount: int) -> None:
+        with self._retry_budget_lock:
+            self._retry_budget = min(self.retry_policy.retry_budget_capacity, self._retry_budget + amount)
+
+    def _next_retry_delay(self, previous_delay: Optional[float]) -> float:
+        # Decorrelated jitter : each delay is randomly picked between the base delay and three times the previous delay
+        base_delay: float = self.retry_policy.base_delay
+        upper_delay: float = base_delay * 3 if previous_delay is None else previous_delay * 3
+        return min(self.retry_policy.max_delay, random.uniform(base_delay, upper_delay))
+
+    def request_operation(self, request: DynamoDBRequest) -> Generator[Any, Any, Any]:
+        num_retries: int = 0
+        previous_delay: Optional[float] = None
+        while True:
+            if self.rate_limiter is not None:
+                rate_limit_delay: float = self.rate_limiter.reserve()
+                if rate_limit_delay > 0:
+                    yield OperationDelay(seconds=rate_limit_delay)
+            try:
+                response: Any = yield request
+            except Exception as e:
+                if self.rate_limiter is not None and get_exception_error_code(exception=e) in THROTTLING_ERROR_CODES:
+                    self.rate_limiter.on_throttled()
+                if not self.is_retryable_exception(exception=e, request=request):
+                    raise e
+                if not num_retries < self.retry_policy.max_retries or not self._acquire_retry_budget():
+                    print(message_with_vars(
+                        message="Request not retried, since the max retries or the retry budget of the table have been reached.",
+                        vars_dict={
+                            'methodName': request.method_name, 'numRetries': num_retries,
+                            'maxRetries': self.retry_policy.max_retries, 'retryBudget': self._retry_budget
+                        }
+                    ))
+                    raise e
+                previous_delay = self._next_retry_delay(previous_delay=previous_delay)
+                num_retries += 1
+                yield OperationDelay(seconds=previous_delay)
+                continue
+
+            # Like the retry quota of the AWS SDKs, a successful retry gives back its cost, and any other successful request one unit
+            self._release_retry_budget(amount=self.retry_policy.retry_cost if num_retries > 0 else 1)
+            if self.rate_limiter is not None:
+                self.rate_limiter.on_success()
+            return response
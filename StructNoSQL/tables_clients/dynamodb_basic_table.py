@@ -3,8 +3,8 @@ from typing import Optional, List, Dict, Any, Tuple, Union, Generator, Type
 
 from StructNoSQL import TableDataModel
 from StructNoSQL.tables_clients.backend.dynamodb_core import DynamoDbCoreAdapter
-from StructNoSQL.tables_clients.backend.dynamodb_utils import DynamoDBUtils
-from StructNoSQL.tables_clients.backend.models import PrimaryIndex, GlobalSecondaryIndex, Response
+from StructNoSQL.utils.decimals import SHORTEST_FLOAT_CONVERSION
+from StructNoSQL.tables_clients.backend.models import PrimaryIndex, GlobalSecondaryIndex, ConnectionPoolConfig, RetryPolicy, Response
 from StructNoSQL.models import DatabasePathElement, FieldGetter, FieldSetter, UnsafeFieldSetter, FieldRemover, \
     FieldPathSetter, QueryMetadata
 from StructNoSQL.base_tables.base_basic_table import BaseBasicTable
@@ -20,31 +20,51 @@ class DynamoDBBasicTable(BaseBasicTable, DynamoDBLowLevelTableOperations):
             global_secondary_indexes: List[GlobalSecondaryIndex] = None,
             auto_create_table: bool = True,
             boto_session: Optional[boto3.Session] = None,
-            auto_leading_key: Optional[str] = None
+            connection_pool_config: Optional[ConnectionPoolConfig] = None,
+            engine: str = DynamoDbCoreAdapter.RESOURCE_ENGINE,
+            float_conversion: str = SHORTEST_FLOAT_CONVERSION,
+            retry_policy: Optional[RetryPolicy] = None,
+            auto_leading_key: Optional[str] = None,
+            schema_cache_directory_path: Optional[str] = None
     ):
-        super().__init__(data_model=data_model, primary_index=primary_index, auto_leading_key=auto_leading_key)
+        super().__init__(
+            data_model=data_model, primary_index=primary_index,
+            auto_leading_key=auto_leading_key, float_conversion=float_conversion,
+            schema_cache_directory_path=schema_cache_directory_path
+        )
         self.table = self
         super().__setup_connectors__(
             table_name=table_name, region_name=region_name,
             primary_index=primary_index, global_secondary_indexes=global_secondary_indexes,
             billing_mode=billing_mode, auto_create_table=auto_create_table,
-            boto_session=boto_session
+            boto_session=boto_session, connection_pool_config=connection_pool_config, engine=engine,
+            record_serializers=self.record_dynamodb_serializers, retry_policy=retry_policy
         )
 
     def put_record(self, record_dict_data: dict, data_validation: bool = True) -> bool:
         def middleware(validated_record_item: dict) -> bool:
-            return self.dynamodb_client.put_record(item_dict=validated_record_item)
-        return self._put_record(middleware=middleware, record_dict_data=record_dict_data, data_validation=data_validation)
+            return self.dynamodb_client.put_record_operation(item_dict=validated_record_item)
+        return self._execute_operation(self._put_record(middleware=middleware, record_dict_data=record_dict_data, data_validation=data_validation))
 
     def delete_record(self, indexes_keys_selectors: dict) -> bool:
         def middleware(indexes_keys: dict) -> bool:
-            return self.dynamodb_client.delete_record(indexes_keys_selectors=indexes_keys)
-        return self._delete_record(middleware=middleware, indexes_keys_selectors=indexes_keys_selectors)
+            return self.dynamodb_client.delete_record_operation(indexes_keys_selectors=indexes_keys)
+        return self._execute_operation(self._delete_record(middleware=middleware, indexes_keys_selectors=indexes_keys_selectors))
+
+    def put_records(self, records_dicts_data: List[dict], data_validation: bool = True) -> bool:
+        def middleware(validated_records_items: List[dict]) -> List[dict]:
+            return self.dynamodb_client.put_records_operation(items_dicts=validated_records_items)
+        return self._execute_operation(self._put_records(middleware=middleware, records_dicts_data=records_dicts_data, data_validation=data_validation))
+
+    def delete_records(self, indexes_keys_selectors_list: List[dict]) -> bool:
+        def middleware(records_indexes_keys: List[dict]) -> List[dict]:
+            return self.dynamodb_client.delete_records_operation(indexes_keys_selectors_list=records_indexes_keys)
+        return self._execute_operation(self._delete_records(middleware=middleware, indexes_keys_selectors_list=indexes_keys_selectors_list))
 
     def remove_record(self, indexes_keys_selectors: dict, data_validation: bool = True) -> Optional[dict]:
         def middleware(indexes_keys: dict) -> Optional[dict]:
-            return self.dynamodb_client.remove_record(indexes_keys_selectors=indexes_keys)
-        return self._remove_record(middleware=middleware, indexes_keys_selectors=indexes_keys_selectors, data_validation=data_validation)
+            return self.dynamodb_client.remove_record_operation(indexes_keys_selectors=indexes_keys)
+        return self._execute_operation(self._remove_record(middleware=middleware, indexes_keys_selectors=indexes_keys_selectors, data_validation=data_validation))
 
     def get_field(self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None, index_name: Optional[str] = None, data_validation: bool = True) -> Any:
         def middleware(field_path_elements: Union[List[DatabasePathElement], Dict[str, List[DatabasePathElement]]], is_multi_selector: bool):
@@ -53,18 +73,28 @@ class DynamoDBBasicTable(BaseBasicTable, DynamoDBLowLevelTableOperations):
                 field_path_elements=field_path_elements,
                 key_value=key_value, index_name=index_name
             )
-        return self._get_field(middleware=middleware, field_path=field_path, query_kwargs=query_kwargs, data_validation=data_validation)
+        return self._execute_operation(self._get_field(middleware=middleware, field_path=field_path, query_kwargs=query_kwargs, data_validation=data_validation))
 
     def get_multiple_fields(self, key_value: str, getters: Dict[str, FieldGetter], index_name: Optional[str] = None, data_validation: bool = True) -> Optional[dict]:
         def middleware(fields_path_elements: List[List[DatabasePathElement]]):
             primary_key_field = self.table._get_primary_key_field()
             transformed_key_value = primary_key_field.transform_from_write(value=key_value)
-            return self.dynamodb_client.get_or_query_single_item(
+            return self.dynamodb_client.get_or_query_single_item_operation(
                 index_name=index_name or self.primary_index_name,
                 key_value=transformed_key_value,
                 fields_path_elements=fields_path_elements,
             )
-        return self._get_multiple_fields(middleware=middleware, getters=getters, data_validation=data_validation)
+        return self._execute_operation(self._get_multiple_fields(middleware=middleware, getters=getters, data_validation=data_validation))
+
+    def get_multiple_records_fields(self, keys_values: List[str], getters: Dict[str, FieldGetter], data_validation: bool = True) -> Dict[str, Dict[str, Optional[Any]]]:
+        def middleware(fields_path_elements: List[List[DatabasePathElement]], records_keys_values: List[str]) -> Dict[str, Optional[dict]]:
+            return self._get_multiple_records_fields_middleware(
+                fields_path_elements=fields_path_elements, keys_values=records_keys_values
+            )
+        return self._execute_operation(self._get_multiple_records_fields(
+            middleware=middleware, keys_values=keys_values,
+            getters=getters, data_validation=data_validation
+        ))
 
     def query_field(
             self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None, index_name: Optional[str] = None,
@@ -72,17 +102,17 @@ class DynamoDBBasicTable(BaseBasicTable, DynamoDBLowLevelTableOperations):
             data_validation: bool = True, **additional_kwargs
     ) -> Tuple[Optional[dict], QueryMetadata]:
         def middleware(fields_path_elements: List[List[DatabasePathElement]]) -> Tuple[Optional[List[dict]], QueryMetadata]:
-            return self.dynamodb_client.query_items_by_key(
+            return self.dynamodb_client.query_items_by_key_operation(
                 index_name=index_name or self.primary_index_name,
                 key_value=key_value, fields_path_elements=fields_path_elements,
                 pagination_records_limit=pagination_records_limit, filter_expression=filter_expression,
                 exclusive_start_key=exclusive_start_key,
                 **additional_kwargs
             )
-        return self._query_field(
+        return self._execute_operation(self._query_field(
             middleware=middleware, key_value=key_value, field_path=field_path,
             query_kwargs=query_kwargs, index_name=index_name, data_validation=data_validation
-        )
+        ))
 
     def paginated_query_field(
             self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None, index_name: Optional[str] = None,
@@ -107,17 +137,17 @@ class DynamoDBBasicTable(BaseBasicTable, DynamoDBLowLevelTableOperations):
             data_validation: bool = True, **additional_kwargs
     ) -> Tuple[Optional[Dict[str, dict]], QueryMetadata]:
         def middleware(fields_path_elements: List[List[DatabasePathElement]]) -> Tuple[List[dict], QueryMetadata]:
-            return self.dynamodb_client.query_items_by_key(
+            return self.dynamodb_client.query_items_by_key_operation(
                 index_name=index_name or self.primary_index_name, key_value=key_value,
                 fields_path_elements=fields_path_elements,
                 pagination_records_limit=pagination_records_limit, filter_expression=filter_expression,
                 exclusive_start_key=exclusive_start_key,
                 **additional_kwargs
             )
-        return self._query_multiple_fields(
+        return self._execute_operation(self._query_multiple_fields(
             middleware=middleware, key_value=key_value, getters=getters,
             index_name=index_name, data_validation=data_validation
-        )
+        ))
 
     def paginated_query_multiple_fields(
             self, key_value: str, getters: Dict[str, FieldGetter], index_name: Optional[str] = None,
@@ -146,40 +176,43 @@ class DynamoDBBasicTable(BaseBasicTable, DynamoDBLowLevelTableOperations):
         getters_database_paths, single_getters_database_paths_elements, grouped_getters_database_paths_elements = (
             _prepare_getters(fields_switch=self.fields_switch, getters=getters)
         )
-        response = self.dynamodb_client.query_response_by_key(
-            index_name=index_name or self.primary_index_name, key_value=key_value,
-            fields_path_elements=getters_database_paths,
-            pagination_records_limit=pagination_records_limit, filter_expression=filter_expression,
-            **additional_kwargs
-        )
-        if response is None:
-            return None
-
-        output: List[Dict[str, Any]] = [
-            self._unpack_getters_response_item(
-                response_item=record_item_data,
-                single_getters_database_paths_elements=single_getters_database_paths_elements,
-                grouped_getters_database_paths_elements=grouped_getters_database_paths_elements
+
+        def operation() -> Generator[Any, Any, Optional[List[dict]]]:
+            response = yield self.dynamodb_client.query_response_by_key_operation(
+                index_name=index_name or self.primary_index_name, key_value=key_value,
+                fields_path_elements=getters_database_paths,
+                pagination_records_limit=pagination_records_limit, filter_expression=filter_expression,
+                **additional_kwargs
             )
-            # todo: add data validation
-            for record_item_data in response.items
-            if isinstance(record_item_data, dict)
-        ]
-        return output
+            if response is None:
+                return None
+
+            output: List[Dict[str, Any]] = [
+                self._unpack_getters_response_item(
+                    response_item=record_item_data,
+                    single_getters_database_paths_elements=single_getters_database_paths_elements,
+                    grouped_getters_database_paths_elements=grouped_getters_database_paths_elements
+                )
+                # todo: add data validation
+                for record_item_data in response.items
+                if isinstance(record_item_data, dict)
+            ]
+            return output
+        return self._execute_operation(operation())
 
     def update_field(self, key_value: str, field_path: str, value_to_set: Any, query_kwargs: Optional[dict] = None) -> bool:
         def middleware(field_path_elements: List[DatabasePathElement], validated_data: Any):
             return self._update_field_middleware(
                 key_value=key_value, field_path_elements=field_path_elements, validated_data=validated_data
             )
-        return self._update_field(middleware=middleware, field_path=field_path, value_to_set=value_to_set, query_kwargs=query_kwargs)
+        return self._execute_operation(self._update_field(middleware=middleware, field_path=field_path, value_to_set=value_to_set, query_kwargs=query_kwargs))
 
     def update_field_return_old(
             self, key_value: str, field_path: str, value_to_set: Any,
             query_kwargs: Optional[dict] = None, data_validation: bool = True
     ) -> Tuple[bool, Optional[Any]]:
-        def middleware(field_path_elements: List[DatabasePathElement], validated_data: Any) -> Tuple[bool, Optional[dict]]:
-            response: Optional[Response] = self.dynamodb_client.set_update_data_element_to_map_with_default_initialization(
+        def middleware(field_path_elements: List[DatabasePathElement], validated_data: Any) -> Generator[Any, Any, Tuple[bool, Optional[dict]]]:
+            response: Optional[Response] = yield self.dynamodb_client.set_update_data_element_to_map_with_default_initialization_operation(
                 index_name=self.primary_index_name,
                 key_value=key_value, value=validated_data,
                 field_path_elements=field_path_elements,
@@ -189,27 +222,27 @@ class DynamoDBBasicTable(BaseBasicTable, DynamoDBLowLevelTableOperations):
                 return False, None
 
             python_response_attributes: Optional[dict] = (
-                DynamoDBUtils.dynamodb_to_python(response.attributes)
+                self.dynamodb_client.record_to_python(response.attributes)
                 if response.attributes is not None else None
             )
             return True, python_response_attributes
-        return self._update_field_return_old(
+        return self._execute_operation(self._update_field_return_old(
             middleware=middleware, field_path=field_path, value_to_set=value_to_set,
             query_kwargs=query_kwargs, data_validation=data_validation
-        )
+        ))
 
     def update_multiple_fields(self, key_value: str, setters: List[FieldSetter or UnsafeFieldSetter]) -> bool:
-        def middleware(dynamodb_setters: List[FieldPathSetter]) -> bool:
-            response: Optional[Response] = self.dynamodb_client.set_update_multiple_data_elements_to_map(
+        def middleware(dynamodb_setters: List[FieldPathSetter]) -> Generator[Any, Any, bool]:
+            response: Optional[Response] = yield self.dynamodb_client.set_update_multiple_data_elements_to_map_operation(
                 index_name=self.primary_index_name, key_value=key_value,
                 setters=dynamodb_setters, return_old_values=False
             )
             return response is not None
-        return self._update_multiple_fields(middleware=middleware, setters=setters)
+        return self._execute_operation(self._update_multiple_fields(middleware=middleware, setters=setters))
 
     def update_multiple_fields_return_old(self, key_value: str, setters: Dict[str, FieldSetter], data_validation: bool = True) -> Tuple[bool, Dict[str, Optional[Any]]]:
-        def middleware(dynamodb_setters: Dict[str, FieldPathSetter]) -> Tuple[bool, Optional[dict]]:
-            response: Optional[Response] = self.dynamodb_client.set_update_multiple_data_elements_to_map(
+        def middleware(dynamodb_setters: Dict[str, FieldPathSetter]) -> Generator[Any, Any, Tuple[bool, Optional[dict]]]:
+            response: Optional[Response] = yield self.dynamodb_client.set_update_multiple_data_elements_to_map_operation(
                 index_name=self.primary_index_name, key_value=key_value,
                 setters=list(dynamodb_setters.values()), return_old_values=True
             )
@@ -217,34 +250,39 @@ class DynamoDBBasicTable(BaseBasicTable, DynamoDBLowLevelTableOperations):
                 return False, None
 
             python_response_attributes: Optional[dict] = (
-                DynamoDBUtils.dynamodb_to_python(response.attributes)
+                self.dynamodb_client.record_to_python(response.attributes)
                 if response.attributes is not None else None
             )
             return True, python_response_attributes
-        return self._update_multiple_fields_return_old(middleware=middleware, setters=setters, data_validation=data_validation)
+        return self._execute_operation(self._update_multiple_fields_return_old(middleware=middleware, setters=setters, data_validation=data_validation))
 
-    def remove_field(self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None, data_validation: bool = True) -> Optional[Any]:
-        def middleware(fields_path_elements: List[List[DatabasePathElement]]) -> Optional[Dict[str, Any]]:
-            return self.dynamodb_client.remove_data_elements_from_map(
+    def _remove_field_operation(self, key_value: str, field_path: str, query_kwargs: Optional[dict], data_validation: bool) -> Generator[Any, Any, Optional[Any]]:
+        def middleware(fields_path_elements: List[List[DatabasePathElement]]) -> Generator[Any, Any, Optional[Dict[str, Any]]]:
+            return self.dynamodb_client.remove_data_elements_from_map_operation(
                 index_name=self.primary_index_name,
                 key_value=key_value, targets_path_elements=fields_path_elements,
                 retrieve_removed_elements=True
             )
         return self._remove_field(middleware=middleware, field_path=field_path, query_kwargs=query_kwargs, data_validation=data_validation)
 
+    def remove_field(self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None, data_validation: bool = True) -> Optional[Any]:
+        return self._execute_operation(self._remove_field_operation(
+            key_value=key_value, field_path=field_path, query_kwargs=query_kwargs, data_validation=data_validation
+        ))
+
     def remove_multiple_fields(self, key_value: str, removers: Dict[str, FieldRemover], data_validation: bool = True) -> Dict[str, Optional[Any]]:
-        def task_executor(remover_item: FieldRemover):
-            return self.remove_field(
+        def operation_factory(remover_item: FieldRemover):
+            return self._remove_field_operation(
                 key_value=key_value,
                 field_path=remover_item.field_path,
                 query_kwargs=remover_item.query_kwargs,
                 data_validation=data_validation
             )
-        return self._async_field_removers_executor(task_executor=task_executor, removers=removers)
+        return self._execute_operation(self._concurrent_field_removers_operation(operation_factory=operation_factory, removers=removers))
 
-    def delete_field(self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None) -> bool:
-        def middleware(fields_path_elements: List[List[DatabasePathElement]]) -> bool:
-            removed_items = self.dynamodb_client.remove_data_elements_from_map(
+    def _delete_field_operation(self, key_value: str, field_path: str, query_kwargs: Optional[dict]) -> Generator[Any, Any, bool]:
+        def middleware(fields_path_elements: List[List[DatabasePathElement]]) -> Generator[Any, Any, bool]:
+            removed_items = yield self.dynamodb_client.remove_data_elements_from_map_operation(
                 index_name=self.primary_index_name,
                 key_value=key_value, targets_path_elements=fields_path_elements,
                 retrieve_removed_elements=False
@@ -252,29 +290,34 @@ class DynamoDBBasicTable(BaseBasicTable, DynamoDBLowLevelTableOperations):
             return removed_items is not None
         return self._delete_field(middleware=middleware, field_path=field_path, query_kwargs=query_kwargs)
 
+    def delete_field(self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None) -> bool:
+        return self._execute_operation(self._delete_field_operation(
+            key_value=key_value, field_path=field_path, query_kwargs=query_kwargs
+        ))
+
     def delete_multiple_fields(self, key_value: str, removers: Dict[str, FieldRemover]) -> Dict[str, bool]:
-        def task_executor(remover_item: FieldRemover):
-            return self.delete_field(
+        def operation_factory(remover_item: FieldRemover):
+            return self._delete_field_operation(
                 key_value=key_value,
                 field_path=remover_item.field_path,
                 query_kwargs=remover_item.query_kwargs
             )
-        return self._async_field_removers_executor(task_executor=task_executor, removers=removers)
+        return self._execute_operation(self._concurrent_field_removers_operation(operation_factory=operation_factory, removers=removers))
 
     def grouped_remove_multiple_fields(self, key_value: str, removers: Dict[str, FieldRemover], data_validation: bool = True) -> Optional[Dict[str, Any]]:
         def middleware(fields_path_elements: List[List[DatabasePathElement]]):
-            return self.dynamodb_client.remove_data_elements_from_map(
+            return self.dynamodb_client.remove_data_elements_from_map_operation(
                 index_name=self.primary_index_name,
                 key_value=key_value, targets_path_elements=fields_path_elements,
                 retrieve_removed_elements=True
             )
-        return self._grouped_remove_multiple_fields(middleware=middleware, removers=removers, data_validation=data_validation)
+        return self._execute_operation(self._grouped_remove_multiple_fields(middleware=middleware, removers=removers, data_validation=data_validation))
 
     def grouped_delete_multiple_fields(self, key_value: str, removers: List[FieldRemover]) -> bool:
         def middleware(fields_path_elements: List[List[DatabasePathElement]]):
-            return self.dynamodb_client.remove_data_elements_from_map(
+            return self.dynamodb_client.remove_data_elements_from_map_operation(
                 index_name=self.primary_index_name,
                 key_value=key_value, targets_path_elements=fields_path_elements,
                 retrieve_removed_elements=False
             )
-        return self._grouped_delete_multiple_fields(middleware=middleware, removers=removers)
+        return self._execute_operation(self._grouped_delete_multiple_fields(middleware=middleware, removers=removers))
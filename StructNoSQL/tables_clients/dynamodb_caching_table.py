@@ -1,14 +1,24 @@
+import atexit
+import threading
+import weakref
+from contextlib import contextmanager
+
 import boto3
-from typing import Optional, List, Dict, Any, Tuple, Union, Generator, Type
+from typing import Optional, List, Dict, Any, Tuple, Union, Generator, Type, Iterator
 
-from StructNoSQL import TableDataModel, PrimaryIndex, GlobalSecondaryIndex
+from StructNoSQL import TableDataModel, VersionField, PrimaryIndex, GlobalSecondaryIndex
 from StructNoSQL.tables_clients.backend.dynamodb_core import DynamoDbCoreAdapter
-from StructNoSQL.tables_clients.backend.dynamodb_utils import DynamoDBUtils
-from StructNoSQL.tables_clients.backend.models import Response
+from StructNoSQL.utils.decimals import SHORTEST_FLOAT_CONVERSION
+from StructNoSQL.tables_clients.backend.models import Response, GetItemResponse, ConnectionPoolConfig, RetryPolicy
 from StructNoSQL.models import DatabasePathElement, FieldGetter, FieldSetter, UnsafeFieldSetter, FieldRemover, \
-    FieldPathSetter, QueryMetadata
+    FieldPathSetter, QueryMetadata, CommitOperationsReport
+from StructNoSQL.exceptions import SessionCommitException
 from StructNoSQL.base_tables.base_caching_table import BaseCachingTable
+from StructNoSQL.base_tables.cached_records_store import CacheEvictionPolicy
+from StructNoSQL.base_tables.shared_cache_backends import BaseSharedCacheBackend
+from StructNoSQL.base_tables.pending_operations_auto_flush import AutoFlushPolicy, run_auto_flush_thread
 from StructNoSQL.tables_clients.dynamodb_low_level_table_operations import DynamoDBLowLevelTableOperations
+from StructNoSQL.tables_clients.backend.operations import ConcurrentOperations
 
 
 class DynamoDBCachingTable(BaseCachingTable, DynamoDBLowLevelTableOperations):
@@ -19,71 +29,331 @@ class DynamoDBCachingTable(BaseCachingTable, DynamoDBLowLevelTableOperations):
             global_secondary_indexes: List[GlobalSecondaryIndex] = None,
             auto_create_table: bool = True,
             boto_session: Optional[boto3.Session] = None,
-            auto_leading_key: Optional[str] = None
+            connection_pool_config: Optional[ConnectionPoolConfig] = None,
+            engine: str = DynamoDbCoreAdapter.RESOURCE_ENGINE,
+            float_conversion: str = SHORTEST_FLOAT_CONVERSION,
+            retry_policy: Optional[RetryPolicy] = None,
+            cache_eviction_policy: Optional[CacheEvictionPolicy] = None,
+            shared_cache_backend: Optional[BaseSharedCacheBackend] = None,
+            auto_flush_policy: Optional[AutoFlushPolicy] = None,
+            auto_leading_key: Optional[str] = None,
+            schema_cache_directory_path: Optional[str] = None
     ):
-        super().__init__(data_model=data_model, primary_index=primary_index, auto_leading_key=auto_leading_key)
+        super().__init__(
+            data_model=data_model, primary_index=primary_index,
+            auto_leading_key=auto_leading_key, float_conversion=float_conversion,
+            cache_eviction_policy=cache_eviction_policy, shared_cache_backend=shared_cache_backend,
+            auto_flush_policy=auto_flush_policy, schema_cache_directory_path=schema_cache_directory_path
+        )
         self.table = self
         super().__setup_connectors__(
             table_name=table_name, region_name=region_name, primary_index=primary_index,
             billing_mode=billing_mode, global_secondary_indexes=global_secondary_indexes,
             auto_create_table=auto_create_table,
-            boto_session=boto_session
+            boto_session=boto_session, connection_pool_config=connection_pool_config, engine=engine,
+            record_serializers=self.record_dynamodb_serializers, retry_policy=retry_policy
         )
+        self._auto_flush_stop_event: Optional[threading.Event] = None
+        if auto_flush_policy is not None:
+            self._start_auto_flush(auto_flush_policy=auto_flush_policy)
 
-    def commit_update_operations(self) -> bool:
-        for primary_key_value, dynamodb_setters in self._pending_update_operations_per_primary_key.items():
-            response = self.dynamodb_client.set_update_multiple_data_elements_to_map(
-                index_name=self.primary_index_name, key_value=primary_key_value,
-                setters=list(dynamodb_setters.values()), return_old_values=False
+    def _start_auto_flush(self, auto_flush_policy: AutoFlushPolicy) -> None:
+        table_reference: weakref.ReferenceType = weakref.ref(self)
+        if auto_flush_policy.check_interval_seconds is not None:
+            self._auto_flush_stop_event = threading.Event()
+            threading.Thread(
+                target=run_auto_flush_thread, daemon=True, name="StructNoSQL-auto-flush",
+                kwargs={
+                    'table_reference': table_reference, 'check_interval_seconds': auto_flush_policy.check_interval_seconds,
+                    'flush_if_need_to': DynamoDBCachingTable._background_flush_if_need_to, 'stop_event': self._auto_flush_stop_event
+                }
+            ).start()
+        if auto_flush_policy.flush_on_exit is True:
+            atexit.register(DynamoDBCachingTable._flush_on_exit, table_reference)
+
+    @contextmanager
+    def session(self) -> Iterator['DynamoDBCachingTable']:
+        # The pending operations of the session are committed when exiting the context without an exception. Sessions can
+        # be nested, in which case the cache of the inner session reads through (and is merged into) the outer session.
+        # If some of the operations failed to be committed, a SessionCommitException with the report of the commit is
+        # raised, since the operations left pending are discarded along with the session.
+        session: DynamoDBCachingTable = self._make_session()
+        session._auto_flush_stop_event = None
+        commit_report: Optional[CommitOperationsReport] = None
+        try:
+            yield session
+            commit_report = session.commit_operations_with_report()
+        finally:
+            session._close_session(is_committed=commit_report is not None and commit_report.success)
+        if commit_report.success is not True:
+            raise SessionCommitException(commit_report=commit_report)
+
+    def stop_auto_flush_thread(self) -> None:
+        if self._auto_flush_stop_event is not None:
+            self._auto_flush_stop_event.set()
+
+    @staticmethod
+    def _background_flush_if_need_to(table: 'DynamoDBCachingTable') -> None:
+        # When a commit is already running, the pending operations will be flushed by a next check if still need to. The
+        # commit only holds the pending operations lock while copying and discarding the pending operations (not during its
+        # requests), so the operations of the table can keep adding pending operations while the commit is running. The
+        # committed records are published to the shared_cache_backend after the next operation of the table, instead of
+        # from this thread.
+        if not table._commit_lock.acquire(blocking=False):
+            return
+        try:
+            with table._pending_operations_lock:
+                should_flush: bool = table._pending_operations_tracker.should_flush()
+            if should_flush is True:
+                table.dynamodb_client.execute_operation(table._commit_records_operations(
+                    with_update_operations=True, with_remove_operations=True
+                ))
+        finally:
+            table._commit_lock.release()
+
+    @staticmethod
+    def _flush_on_exit(table_reference: weakref.ReferenceType) -> None:
+        table: Optional[DynamoDBCachingTable] = table_reference()
+        if table is not None and table.has_pending_operations():
+            table.commit_operations()
+
+    def _auto_flush_pending_operations(self) -> None:
+        # When a commit is already running (like from the background thread), the pending operations are left to a next auto flush
+        if self._commit_lock.acquire(blocking=False):
+            try:
+                self.commit_operations()
+            finally:
+                self._commit_lock.release()
+
+    def _on_pending_operations_added(self, primary_key_value: str) -> None:
+        # Must be called without holding the pending operations lock, since the auto flush acquires the commit lock
+        if self._pending_operations_tracker is not None:
+            with self._pending_operations_lock:
+                self._track_pending_operations(primary_key_value=primary_key_value)
+                should_flush: bool = self._pending_operations_tracker.should_flush(primary_key_value=primary_key_value)
+            if should_flush is True:
+                self._auto_flush_pending_operations()
+
+    def _with_pending_operations_tracking(self, operation: Generator, primary_key_value: str) -> Generator:
+        # For the operations that send requests, and that can also add pending operations (when the old values of
+        # their fields have been found in the cache), the pending operations are tracked once they have completed.
+        operation_result: Any = yield from operation
+        self._on_pending_operations_added(primary_key_value=primary_key_value)
+        return operation_result
+
+    def _execute_operation(self, operation: Generator) -> Any:
+        if self.shared_cache_backend is not None:
+            operation = self._with_cached_records_publication(operation=operation)
+        return super()._execute_operation(operation=operation)
+
+    def _commit_records_operations(self, with_update_operations: bool, with_remove_operations: bool) -> Generator[Any, Any, CommitOperationsReport]:
+        # The pending setters and removers of each record are sent together (in a single request when possible), and the
+        # records are committed concurrently, bounded by the max_pool_connections of the connection_pool_config.
+        # The commit lock is held for the whole commit, where as the pending operations lock is only held while copying
+        # the pending operations, and while discarding the committed ones, so that the operations of the table are not
+        # blocked by the requests of the commit. Both locks are reentrant locks of the thread running the commit, so in the
+        # async tables (where the commit holds them across its await points) they do not exclude the other coroutines,
+        # and the operations added while the commit was running are kept pending by _discard_committed_pending_operations.
+        with self._commit_lock:
+            return (yield from self._locked_commit_records_operations(
+                with_update_operations=with_update_operations, with_remove_operations=with_remove_operations
+            ))
+
+    def _locked_commit_records_operations(self, with_update_operations: bool, with_remove_operations: bool) -> Generator[Any, Any, CommitOperationsReport]:
+        with self._pending_operations_lock:
+            committed_setters_per_primary_key: Dict[str, Dict[str, FieldPathSetter]] = (
+                {key: dict(setters) for key, setters in self._pending_update_operations_per_primary_key.items()}
+                if with_update_operations is True else {}
             )
-        self._pending_update_operations_per_primary_key = {}
-        return True  # todo: create a real success status instead of always True
+            committed_removers_per_primary_key: Dict[str, Dict[str, List[DatabasePathElement]]] = (
+                {key: dict(removers) for key, removers in self._pending_remove_operations_per_primary_key.items()}
+                if with_remove_operations is True else {}
+            )
+            primary_keys_values: List[str] = []
+            for primary_key_value in {**committed_setters_per_primary_key, **committed_removers_per_primary_key}.keys():
+                if len(committed_setters_per_primary_key.get(primary_key_value, {})) > 0 or len(committed_removers_per_primary_key.get(primary_key_value, {})) > 0:
+                    primary_keys_values.append(primary_key_value)
+                else:
+                    # Records without any operation left (like when an update has been cancelled by a delete)
+                    self._discard_committed_pending_operations(self._pending_update_operations_per_primary_key, primary_key_value, {})
+                    self._discard_committed_pending_operations(self._pending_remove_operations_per_primary_key, primary_key_value, {})
+                    self._track_pending_operations(primary_key_value=primary_key_value)
 
-    def commit_remove_operations(self) -> bool:
-        for primary_key_value, dynamodb_setters in self._pending_remove_operations_per_primary_key.items():
-            response = self.dynamodb_client.remove_data_elements_from_map(
-                index_name=self.primary_index_name, key_value=primary_key_value,
-                targets_path_elements=list(dynamodb_setters.values())
+        if self.version_field is None:
+            records_successes: List[bool] = yield ConcurrentOperations(operations=[
+                self.dynamodb_client.set_update_and_remove_data_elements_in_map_operation(
+                    index_name=self.primary_index_name, key_value=primary_key_value,
+                    setters=list(committed_setters_per_primary_key.get(primary_key_value, {}).values()),
+                    targets_path_elements=list(committed_removers_per_primary_key.get(primary_key_value, {}).values())
+                ) for primary_key_value in primary_keys_values
+            ])
+            conflicted_records_keys: List[str] = []
+        else:
+            records_successes, conflicted_records_keys = yield from self._commit_versioned_records_operations(
+                primary_keys_values=primary_keys_values,
+                setters_per_primary_key=committed_setters_per_primary_key,
+                removers_per_primary_key=committed_removers_per_primary_key
+            )
+        with self._pending_operations_lock:
+            for primary_key_value, record_success in zip(primary_keys_values, records_successes):
+                if record_success is True or primary_key_value in conflicted_records_keys:
+                    if record_success is not True:
+                        # The conflicted operations are discarded, along with the cached data of their record (that could have
+                        # been changed by the other writer), so that the record will be read again before being changed.
+                        self._cached_data_per_primary_key.remove_record(primary_key_value=primary_key_value)
+                    self._discard_committed_pending_operations(
+                        self._pending_update_operations_per_primary_key, primary_key_value,
+                        committed_setters_per_primary_key.get(primary_key_value, {})
+                    )
+                    self._discard_committed_pending_operations(
+                        self._pending_remove_operations_per_primary_key, primary_key_value,
+                        committed_removers_per_primary_key.get(primary_key_value, {})
+                    )
+                    self._track_pending_operations(primary_key_value=primary_key_value)
+        return CommitOperationsReport(
+            records_successes=dict(zip(primary_keys_values, records_successes)),
+            conflicted_records_keys=conflicted_records_keys
+        )
+
+    def _commit_versioned_records_operations(
+            self, primary_keys_values: List[str], setters_per_primary_key: Dict[str, Dict[str, FieldPathSetter]],
+            removers_per_primary_key: Dict[str, Dict[str, List[DatabasePathElement]]]
+    ) -> Generator[Any, Any, Tuple[List[bool], List[str]]]:
+        # Returns the commit success of each record, and the keys of the records rejected because of a version conflict.
+        # The requests of the records are sent from other threads, so the cache is only modified between the requests.
+        records_successes: Dict[str, bool] = {}
+        primary_keys_values_to_commit: List[str] = primary_keys_values
+        conflicted_records_keys: List[str] = []
+        for i_attempt in range(self.version_field.max_conflict_replays + 1):
+            records_results: List[Tuple[bool, bool, Optional[int]]] = yield ConcurrentOperations(operations=[
+                self.dynamodb_client.versioned_set_update_and_remove_data_elements_in_map_operation(
+                    index_name=self.primary_index_name, key_value=primary_key_value,
+                    setters=list(setters_per_primary_key.get(primary_key_value, {}).values()),
+                    targets_path_elements=list(removers_per_primary_key.get(primary_key_value, {}).values()),
+                    version_field_name=self.version_field.field_name,
+                    expected_version=self._get_captured_record_version(primary_key_value=primary_key_value)
+                ) for primary_key_value in primary_keys_values_to_commit
+            ])
+            conflicted_records_keys = []
+            with self._pending_operations_lock:
+                for primary_key_value, (record_success, has_version_conflict, record_version) in zip(primary_keys_values_to_commit, records_results):
+                    records_successes[primary_key_value] = record_success
+                    if record_version is not None:
+                        self._cache_record_version(primary_key_value=primary_key_value, record_version=record_version)
+                    if has_version_conflict is True:
+                        conflicted_records_keys.append(primary_key_value)
+
+            if (
+                not len(conflicted_records_keys) > 0 or i_attempt == self.version_field.max_conflict_replays or
+                self.version_field.conflict_resolution != VersionField.REPLAY_PENDING_OPERATIONS
+            ):
+                break
+            primary_keys_values_to_commit = yield from self._prepare_records_operations_replay(
+                primary_keys_values=conflicted_records_keys,
+                setters_per_primary_key=setters_per_primary_key, removers_per_primary_key=removers_per_primary_key
             )
-            # delete operations can be cached, where as remove operations need to be executed immediately
-        self._pending_remove_operations_per_primary_key = {}
-        return True  # todo: create a real success status instead of always True
+            # The records which new version could not be retrieved are left as conflicted
+            conflicted_records_keys = [key for key in conflicted_records_keys if key not in primary_keys_values_to_commit]
+            if not len(primary_keys_values_to_commit) > 0:
+                break
+        return [records_successes[primary_key_value] for primary_key_value in primary_keys_values], conflicted_records_keys
+
+    def _prepare_records_operations_replay(
+            self, primary_keys_values: List[str], setters_per_primary_key: Dict[str, Dict[str, FieldPathSetter]],
+            removers_per_primary_key: Dict[str, Dict[str, List[DatabasePathElement]]]
+    ) -> Generator[Any, Any, List[str]]:
+        # The fields touched by the pending operations will be overwritten by their replay, so only the new version of
+        # the records is retrieved. The other cached fields of the records could have been changed by the other writer,
+        # so the cached data of the records is replaced by their new version and the values of their pending operations.
+        # Returns the keys of the records ready to be replayed.
+        versions_responses: List[Optional[GetItemResponse]] = yield ConcurrentOperations(operations=[
+            self.dynamodb_client.get_item_by_primary_key_operation(
+                index_name=self.primary_index_name, key_value=primary_key_value,
+                fields_path_elements=[self.version_field.database_path]
+            ) for primary_key_value in primary_keys_values
+        ])
+        replayable_primary_keys_values: List[str] = []
+        with self._pending_operations_lock:
+            for primary_key_value, version_response in zip(primary_keys_values, versions_responses):
+                if version_response is None:
+                    continue
+                self._cached_data_per_primary_key.remove_record(primary_key_value=primary_key_value)
+                self._cache_record_version(
+                    primary_key_value=primary_key_value,
+                    record_version=(version_response.item or {}).get(self.version_field.field_name, None)
+                )
+                for setter in setters_per_primary_key.get(primary_key_value, {}).values():
+                    self._cache_put_data(primary_key_value=primary_key_value, field_path_elements=setter.field_path_elements, data=setter.value_to_set)
+                for remover_path_elements in removers_per_primary_key.get(primary_key_value, {}).values():
+                    self._cache_put_data(primary_key_value=primary_key_value, field_path_elements=remover_path_elements, data=None)
+                replayable_primary_keys_values.append(primary_key_value)
+        return replayable_primary_keys_values
 
-    def commit_operations(self):
-        self.commit_update_operations()
-        self.commit_remove_operations()
-        return True
+    def _commit_update_operations(self) -> Generator[Any, Any, bool]:
+        commit_report: CommitOperationsReport = yield from self._commit_records_operations(with_update_operations=True, with_remove_operations=False)
+        return commit_report.success
+
+    def _commit_remove_operations(self) -> Generator[Any, Any, bool]:
+        # delete operations can be cached, where as remove operations need to be executed immediately
+        commit_report: CommitOperationsReport = yield from self._commit_records_operations(with_update_operations=False, with_remove_operations=True)
+        return commit_report.success
+
+    def _commit_operations(self) -> Generator[Any, Any, bool]:
+        commit_report: CommitOperationsReport = yield from self._commit_records_operations(with_update_operations=True, with_remove_operations=True)
+        return commit_report.success
+
+    def commit_update_operations(self) -> bool:
+        return self._execute_operation(self._commit_update_operations())
+
+    def commit_remove_operations(self) -> bool:
+        return self._execute_operation(self._commit_remove_operations())
+
+    def commit_operations(self) -> bool:
+        return self._execute_operation(self._commit_operations())
+
+    def commit_operations_with_report(self) -> CommitOperationsReport:
+        return self._execute_operation(self._commit_records_operations(with_update_operations=True, with_remove_operations=True))
 
     def put_record(self, record_dict_data: dict, data_validation: bool = True) -> bool:
         def middleware(validated_record_item: dict) -> bool:
-            return self.dynamodb_client.put_record(item_dict=validated_record_item)
-        return self._put_record(middleware=middleware, record_dict_data=record_dict_data, data_validation=data_validation)
+            return self.dynamodb_client.put_record_operation(item_dict=validated_record_item)
+        return self._execute_operation(self._put_record(middleware=middleware, record_dict_data=record_dict_data, data_validation=data_validation))
 
     def delete_record(self, indexes_keys_selectors: dict) -> bool:
         def middleware(indexes_keys: dict) -> bool:
-            return self.dynamodb_client.delete_record(indexes_keys_selectors=indexes_keys)
-        return self._delete_record(middleware=middleware, indexes_keys_selectors=indexes_keys_selectors)
+            return self.dynamodb_client.delete_record_operation(indexes_keys_selectors=indexes_keys)
+        return self._execute_operation(self._delete_record(middleware=middleware, indexes_keys_selectors=indexes_keys_selectors))
+
+    def put_records(self, records_dicts_data: List[dict], data_validation: bool = True) -> bool:
+        def middleware(validated_records_items: List[dict]) -> List[dict]:
+            return self.dynamodb_client.put_records_operation(items_dicts=validated_records_items)
+        return self._execute_operation(self._put_records(middleware=middleware, records_dicts_data=records_dicts_data, data_validation=data_validation))
+
+    def delete_records(self, indexes_keys_selectors_list: List[dict]) -> bool:
+        def middleware(records_indexes_keys: List[dict]) -> List[dict]:
+            return self.dynamodb_client.delete_records_operation(indexes_keys_selectors_list=records_indexes_keys)
+        return self._execute_operation(self._delete_records(middleware=middleware, indexes_keys_selectors_list=indexes_keys_selectors_list))
 
     def remove_record(self, indexes_keys_selectors: dict, data_validation: bool = True) -> Optional[dict]:
         def middleware(indexes_keys: dict) -> Optional[dict]:
-            return self.dynamodb_client.remove_record(indexes_keys_selectors=indexes_keys)
-        return self._remove_record(middleware=middleware, indexes_keys_selectors=indexes_keys_selectors, data_validation=data_validation)
+            return self.dynamodb_client.remove_record_operation(indexes_keys_selectors=indexes_keys)
+        return self._execute_operation(self._remove_record(middleware=middleware, indexes_keys_selectors=indexes_keys_selectors, data_validation=data_validation))
 
     def query_field(
             self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None, index_name: Optional[str] = None,
             pagination_records_limit: Optional[int] = None, filter_expression: Optional[Any] = None, data_validation: bool = True, **additional_kwargs
     ) -> Tuple[Optional[dict], QueryMetadata]:
         def middleware(fields_path_elements: List[List[DatabasePathElement]]) -> Tuple[Optional[List[dict]], QueryMetadata]:
-            return self.dynamodb_client.query_items_by_key(
+            return self.dynamodb_client.query_items_by_key_operation(
                 index_name=index_name or self.primary_index_name,
                 key_value=key_value, fields_path_elements=fields_path_elements,
                 pagination_records_limit=pagination_records_limit, filter_expression=filter_expression,
                 **additional_kwargs
             )
-        return self._query_field(
+        return self._execute_operation(self._query_field(
             middleware=middleware, key_value=key_value, field_path=field_path,
             query_kwargs=query_kwargs, index_name=index_name, data_validation=data_validation
-        )
+        ))
 
     def paginated_query_field(
             self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None, index_name: Optional[str] = None,
@@ -107,16 +377,19 @@ class DynamoDBCachingTable(BaseCachingTable, DynamoDBLowLevelTableOperations):
             pagination_records_limit: Optional[int] = None, filter_expression: Optional[Any] = None, data_validation: bool = True, **additional_kwargs
     ) -> Tuple[Optional[Dict[str, dict]], QueryMetadata]:
         def middleware(fields_path_elements: List[List[DatabasePathElement]]) -> Tuple[Optional[List[dict]], QueryMetadata]:
-            return self.dynamodb_client.query_items_by_key(
+            return self.dynamodb_client.query_items_by_key_operation(
                 index_name=index_name or self.primary_index_name,
                 key_value=key_value, fields_path_elements=fields_path_elements,
                 pagination_records_limit=pagination_records_limit, filter_expression=filter_expression,
                 **additional_kwargs
             )
-        return self._query_multiple_fields(
+        return self._execute_operation(self._query_multiple_fields(
             middleware=middleware, key_value=key_value, getters=getters,
             index_name=index_name, data_validation=data_validation
-        )
+        ))
+
+    def _get_failed_retrievals_count(self) -> int:
+        return self.dynamodb_client.failed_retrievals_count
 
     def get_field(self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None, data_validation: bool = True) -> Any:
         def middleware(field_path_elements: Union[List[DatabasePathElement], Dict[str, List[DatabasePathElement]]], is_multi_selector: bool):
@@ -125,30 +398,83 @@ class DynamoDBCachingTable(BaseCachingTable, DynamoDBLowLevelTableOperations):
                 field_path_elements=field_path_elements,
                 key_value=key_value
             )
-        return self._get_field(middleware=middleware, key_value=key_value, field_path=field_path, query_kwargs=query_kwargs, data_validation=data_validation)
+        return self._execute_operation(self._get_field(middleware=middleware, key_value=key_value, field_path=field_path, query_kwargs=query_kwargs, data_validation=data_validation))
 
     def get_multiple_fields(self, key_value: str, getters: Dict[str, FieldGetter], index_name: Optional[str] = None, data_validation: bool = True) -> Optional[dict]:
         primary_key_field = self.table._get_primary_key_field()
         transformed_key_value = primary_key_field.transform_from_write(value=key_value)
 
         def middleware(fields_path_elements: List[List[DatabasePathElement]]):
-            return self.dynamodb_client.get_or_query_single_item(
+            return self.dynamodb_client.get_or_query_single_item_operation(
                 index_name=index_name or self.primary_index_name,
                 key_value=transformed_key_value, fields_path_elements=fields_path_elements,
             )
-        return self._get_multiple_fields(middleware=middleware, key_value=transformed_key_value, getters=getters, data_validation=data_validation)
+        return self._execute_operation(self._get_multiple_fields(middleware=middleware, key_value=transformed_key_value, getters=getters, data_validation=data_validation))
+
+    def get_multiple_records_fields(self, keys_values: List[str], getters: Dict[str, FieldGetter], data_validation: bool = True) -> Dict[str, Dict[str, Optional[Any]]]:
+        primary_key_field = self.table._get_primary_key_field()
+        keys_values_per_transformed_key_value: Dict[str, str] = {
+            primary_key_field.transform_from_write(value=key_value): key_value for key_value in keys_values
+        }
+
+        def middleware(fields_path_elements: List[List[DatabasePathElement]], transformed_keys_values: List[str]) -> Generator[Any, Any, Dict[str, Optional[dict]]]:
+            retrieved_items: Optional[Dict[Any, dict]] = yield self.dynamodb_client.batch_get_items_by_primary_keys_operation(
+                index_name=self.primary_index_name, keys_values=transformed_keys_values,
+                fields_path_elements=fields_path_elements
+            )
+            return retrieved_items if retrieved_items is not None else {}
+
+        def operation() -> Generator[Any, Any, Dict[str, Dict[str, Optional[Any]]]]:
+            records_values: Dict[str, Dict[str, Optional[Any]]] = yield from self._get_multiple_records_fields(
+                middleware=middleware, keys_values=list(keys_values_per_transformed_key_value.keys()),
+                getters=getters, data_validation=data_validation
+            )
+            return {
+                key_value: records_values[transformed_key_value]
+                for transformed_key_value, key_value in keys_values_per_transformed_key_value.items()
+            }
+        return self._execute_operation(operation())
+
+    def prefetch_records(self, keys_values: List[str], getters: Optional[Dict[str, FieldGetter]] = None, data_validation: bool = True) -> Dict[str, Optional[bool]]:
+        # Returns True for the records that have been prefetched, False for the records that do not exist, and None for the
+        # records that have not been prefetched (the records with pending operations, or which retrieval has failed).
+        primary_key_field = self.table._get_primary_key_field()
+        keys_values_per_transformed_key_value: Dict[str, str] = {
+            primary_key_field.transform_from_write(value=key_value): key_value for key_value in keys_values
+        }
+
+        def middleware(fields_path_elements: Optional[List[List[DatabasePathElement]]], transformed_keys_values: List[str]) -> Generator[Any, Any, Dict[str, Optional[dict]]]:
+            retrieved_items: Optional[Dict[Any, dict]] = yield self.dynamodb_client.batch_get_items_by_primary_keys_operation(
+                index_name=self.primary_index_name, keys_values=transformed_keys_values,
+                fields_path_elements=fields_path_elements
+            )
+            return retrieved_items if retrieved_items is not None else {}
+
+        def operation() -> Generator[Any, Any, Dict[str, Optional[bool]]]:
+            records_found: Dict[str, Optional[bool]] = yield from self._prefetch_records(
+                middleware=middleware, keys_values=list(keys_values_per_transformed_key_value.keys()),
+                getters=getters, data_validation=data_validation
+            )
+            return {
+                key_value: records_found[transformed_key_value]
+                for transformed_key_value, key_value in keys_values_per_transformed_key_value.items()
+            }
+        return self._execute_operation(operation())
 
     def update_field(self, key_value: str, field_path: str, value_to_set: Any, query_kwargs: Optional[dict] = None) -> bool:
         primary_key_field = self.table._get_primary_key_field()
         transformed_key_value = primary_key_field.transform_from_write(value=key_value)
-        return self._update_field(key_value=transformed_key_value, field_path=field_path, value_to_set=value_to_set, query_kwargs=query_kwargs)
+        with self._pending_operations_lock:
+            update_success: bool = self._update_field(key_value=transformed_key_value, field_path=field_path, value_to_set=value_to_set, query_kwargs=query_kwargs)
+        self._on_pending_operations_added(primary_key_value=transformed_key_value)
+        return update_success
 
     def update_field_return_old(
             self, key_value: str, field_path: str, value_to_set: Any,
             query_kwargs: Optional[dict] = None, data_validation: bool = True
     ) -> Tuple[bool, Optional[Any]]:
         def middleware(field_path_elements: List[DatabasePathElement], validated_data: Any):
-            response: Optional[Response] = self.dynamodb_client.set_update_data_element_to_map_with_default_initialization(
+            response: Optional[Response] = yield self.dynamodb_client.set_update_data_element_to_map_with_default_initialization_operation(
                 index_name=self.primary_index_name,
                 key_value=key_value, value=validated_data,
                 field_path_elements=field_path_elements,
@@ -158,21 +484,24 @@ class DynamoDBCachingTable(BaseCachingTable, DynamoDBLowLevelTableOperations):
                 return False, None
 
             python_response_attributes: Optional[dict] = (
-                DynamoDBUtils.dynamodb_to_python(response.attributes)
+                self.dynamodb_client.record_to_python(response.attributes)
                 if response.attributes is not None else None
             )
             return True, python_response_attributes
-        return self._update_field_return_old(
+        return self._execute_operation(self._with_pending_operations_tracking(self._update_field_return_old(
             middleware=middleware, key_value=key_value, field_path=field_path, value_to_set=value_to_set,
             query_kwargs=query_kwargs, data_validation=data_validation
-        )
+        ), primary_key_value=key_value))
 
     def update_multiple_fields(self, key_value: str, setters: List[FieldSetter or UnsafeFieldSetter]) -> bool:
-        return self._update_multiple_fields(key_value=key_value, setters=setters)
+        with self._pending_operations_lock:
+            update_success: bool = self._update_multiple_fields(key_value=key_value, setters=setters)
+        self._on_pending_operations_added(primary_key_value=key_value)
+        return update_success
 
     def update_multiple_fields_return_old(self, key_value: str, setters: Dict[str, FieldSetter], data_validation: bool = True) -> Tuple[bool, Dict[str, Optional[Any]]]:
-        def middleware(dynamodb_setters: Dict[str, FieldPathSetter]) -> Tuple[bool, Optional[dict]]:
-            response: Optional[Response] = self.dynamodb_client.set_update_multiple_data_elements_to_map(
+        def middleware(dynamodb_setters: Dict[str, FieldPathSetter]) -> Generator[Any, Any, Tuple[bool, Optional[dict]]]:
+            response: Optional[Response] = yield self.dynamodb_client.set_update_multiple_data_elements_to_map_operation(
                 index_name=self.primary_index_name, key_value=key_value,
                 setters=list(dynamodb_setters.values()), return_old_values=True
             )
@@ -180,51 +509,72 @@ class DynamoDBCachingTable(BaseCachingTable, DynamoDBLowLevelTableOperations):
                 return False, None
 
             python_response_attributes: Optional[dict] = (
-                DynamoDBUtils.dynamodb_to_python(response.attributes)
+                self.dynamodb_client.record_to_python(response.attributes)
                 if response.attributes is not None else None
             )
             return True, python_response_attributes
-        return self._update_multiple_fields_return_old(middleware=middleware, key_value=key_value, setters=setters, data_validation=data_validation)
+        return self._execute_operation(self._with_pending_operations_tracking(
+            self._update_multiple_fields_return_old(middleware=middleware, key_value=key_value, setters=setters, data_validation=data_validation),
+            primary_key_value=key_value
+        ))
 
-    def remove_field(self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None, data_validation: bool = True) -> Optional[Any]:
+    def _remove_field_operation(self, key_value: str, field_path: str, query_kwargs: Optional[dict], data_validation: bool) -> Generator[Any, Any, Optional[Any]]:
         def middleware(fields_path_elements: List[List[DatabasePathElement]]):
-            return self.dynamodb_client.remove_data_elements_from_map(
+            return self.dynamodb_client.remove_data_elements_from_map_operation(
                 index_name=self.primary_index_name,
                 key_value=key_value, targets_path_elements=fields_path_elements,
                 retrieve_removed_elements=True
             )
         return self._remove_field(middleware=middleware, key_value=key_value, field_path=field_path, query_kwargs=query_kwargs, data_validation=data_validation)
 
+    def remove_field(self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None, data_validation: bool = True) -> Optional[Any]:
+        return self._execute_operation(self._with_pending_operations_tracking(self._remove_field_operation(
+            key_value=key_value, field_path=field_path, query_kwargs=query_kwargs, data_validation=data_validation
+        ), primary_key_value=key_value))
+
     def remove_multiple_fields(self, key_value: str, removers: Dict[str, FieldRemover], data_validation: bool = True) -> Dict[str, Optional[Any]]:
-        def task_executor(remover_item: FieldRemover):
-            return self.remove_field(
+        def operation_factory(remover_item: FieldRemover):
+            return self._remove_field_operation(
                 key_value=key_value,
                 field_path=remover_item.field_path,
                 query_kwargs=remover_item.query_kwargs,
                 data_validation=data_validation
             )
-        return self._async_field_removers_executor(task_executor=task_executor, removers=removers)
+        return self._execute_operation(self._with_pending_operations_tracking(
+            self._concurrent_field_removers_operation(operation_factory=operation_factory, removers=removers),
+            primary_key_value=key_value
+        ))
 
     def delete_field(self, key_value: str, field_path: str, query_kwargs: Optional[dict] = None) -> bool:
-        return self._delete_field(key_value=key_value, field_path=field_path, query_kwargs=query_kwargs)
+        with self._pending_operations_lock:
+            delete_success: bool = self._delete_field(key_value=key_value, field_path=field_path, query_kwargs=query_kwargs)
+        self._on_pending_operations_added(primary_key_value=key_value)
+        return delete_success
 
     def delete_multiple_fields(self, key_value: str, removers: Dict[str, FieldRemover]) -> Dict[str, bool]:
-        def task_executor(remover_item: FieldRemover):
-            return self.delete_field(
+        # The delete operations are only added to the pending remove operations, no database request is required
+        return {
+            key: self.delete_field(
                 key_value=key_value,
                 field_path=remover_item.field_path,
                 query_kwargs=remover_item.query_kwargs
-            )
-        return self._async_field_removers_executor(task_executor=task_executor, removers=removers)
+            ) for key, remover_item in removers.items()
+        }
 
     def grouped_remove_multiple_fields(self, key_value: str, removers: Dict[str, FieldRemover], data_validation: bool = True) -> Optional[Dict[str, Any]]:
         def middleware(fields_path_elements: List[List[DatabasePathElement]]):
-            return self.dynamodb_client.remove_data_elements_from_map(
+            return self.dynamodb_client.remove_data_elements_from_map_operation(
                 index_name=self.primary_index_name,
                 key_value=key_value, targets_path_elements=fields_path_elements,
                 retrieve_removed_elements=True
              )
-        return self._grouped_remove_multiple_fields(middleware=middleware, key_value=key_value, removers=removers, data_validation=data_validation)
+        return self._execute_operation(self._with_pending_operations_tracking(
+            self._grouped_remove_multiple_fields(middleware=middleware, key_value=key_value, removers=removers, data_validation=data_validation),
+            primary_key_value=key_value
+        ))
 
     def grouped_delete_multiple_fields(self, key_value: str, removers: List[FieldRemover]) -> bool:
-        return self._grouped_delete_multiple_fields(key_value=key_value, removers=removers)
+        with self._pending_operations_lock:
+            delete_success: bool = self._grouped_delete_multiple_fields(key_value=key_value, removers=removers)
+        self._on_pending_operations_added(primary_key_value=key_value)
+        return delete_success
@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Generator
 
 from StructNoSQL.base_tables import BaseTable
 from StructNoSQL.tables_clients.backend import Response
@@ -14,20 +14,20 @@ class DynamoDBLowLevelTableOperations(DynamoDBTableConnectors):
             self, is_multi_selector: bool,
             field_path_elements: Union[List[DatabasePathElement], Dict[str, List[DatabasePathElement]]],
             key_value: str, index_name: Optional[str] = None
-    ) -> Any:
+    ) -> Generator[Any, Any, Any]:
         primary_key_field = self.table._get_primary_key_field()
         transformed_key_value = primary_key_field.transform_from_write(value=key_value)
 
         if is_multi_selector is not True:
             field_path_elements: List[DatabasePathElement]
-            response_data: Optional[Any] = self.dynamodb_client.get_value_in_path_target(
+            response_data: Optional[Any] = yield self.dynamodb_client.get_value_in_path_target_operation(
                 index_name=index_name or self.primary_index_name,
                 key_value=transformed_key_value, field_path_elements=field_path_elements
             )
             return response_data
         else:
             field_path_elements: Dict[str, List[DatabasePathElement]]
-            response_data: Optional[Dict[str, Any]] = self.dynamodb_client.get_values_in_multiple_path_target(
+            response_data: Optional[Dict[str, Any]] = yield self.dynamodb_client.get_values_in_multiple_path_target_operation(
                 index_name=index_name or self.primary_index_name,
                 key_value=transformed_key_value, fields_path_elements=field_path_elements
             )
@@ -41,10 +41,10 @@ class DynamoDBLowLevelTableOperations(DynamoDBTableConnectors):
                 # 'getters' keys present, hence why the dict with None values if the response_data is None.
                 return {key: None for key in field_path_elements.keys()}
 
-    def _update_field_middleware(self, key_value: str, field_path_elements: List[DatabasePathElement], validated_data: Any) -> bool:
+    def _update_field_middleware(self, key_value: str, field_path_elements: List[DatabasePathElement], validated_data: Any) -> Generator[Any, Any, bool]:
         primary_key_field = self.table._get_primary_key_field()
         transformed_key_value = primary_key_field.transform_from_write(value=key_value)
-        response: Optional[Response] = self.dynamodb_client.set_update_data_element_to_map_with_default_initialization(
+        response: Optional[Response] = yield self.dynamodb_client.set_update_data_element_to_map_with_default_initialization_operation(
             index_name=self.primary_index_name,
             key_value=transformed_key_value, value=validated_data,
             field_path_elements=field_path_elements
@@ -54,11 +54,30 @@ class DynamoDBLowLevelTableOperations(DynamoDBTableConnectors):
     def _get_multiple_fields_middleware(
             self, fields_path_elements: List[List[DatabasePathElement]],
             key_value: str, index_name: Optional[str] = None
-    ):
+    ) -> Generator[Any, Any, Optional[dict]]:
         primary_key_field = self.table._get_primary_key_field()
         transformed_key_value = primary_key_field.transform_from_write(value=key_value)
-        return self.dynamodb_client.get_or_query_single_item(
+        return self.dynamodb_client.get_or_query_single_item_operation(
             index_name=index_name or self.primary_index_name,
             key_value=transformed_key_value,
             fields_path_elements=fields_path_elements,
         )
+
+    def _get_multiple_records_fields_middleware(
+            self, fields_path_elements: List[List[DatabasePathElement]], keys_values: List[str]
+    ) -> Generator[Any, Any, Dict[str, Optional[dict]]]:
+        primary_key_field = self.table._get_primary_key_field()
+        keys_values_per_transformed_key_value: Dict[str, str] = {
+            primary_key_field.transform_from_write(value=key_value): key_value for key_value in keys_values
+        }
+        retrieved_items: Optional[Dict[Any, dict]] = yield self.dynamodb_client.batch_get_items_by_primary_keys_operation(
+            index_name=self.primary_index_name,
+            keys_values=list(keys_values_per_transformed_key_value.keys()),
+            fields_path_elements=fields_path_elements
+        )
+        if retrieved_items is None:
+            return {key_value: None for key_value in keys_values}
+        return {
+            key_value: retrieved_items.get(transformed_key_value, None)
+            for transformed_key_value, key_value in keys_values_per_transformed_key_value.items()
+        }
@@ -1,24 +1,38 @@
 import boto3
-from typing import List, Optional
-from StructNoSQL.tables_clients.backend.models import PrimaryIndex, GlobalSecondaryIndex
+from typing import List, Optional, Type, Generator, Any
+from StructNoSQL.tables_clients.backend.models import PrimaryIndex, GlobalSecondaryIndex, ConnectionPoolConfig, RetryPolicy
 from StructNoSQL.tables_clients.backend.dynamodb_core import DynamoDbCoreAdapter
+from StructNoSQL.utils.decimals import SHORTEST_FLOAT_CONVERSION, EXACT_FLOAT_CONVERSION
+from StructNoSQL.tables_clients.backend.dynamodb_utils import DynamoDBSerializers
 
 
 class DynamoDBTableConnectors:
+    # Overridden by the async tables clients to use the AsyncDynamoDbCoreAdapter
+    _DYNAMODB_CLIENT_CLASS: Type[DynamoDbCoreAdapter] = DynamoDbCoreAdapter
+    RESOURCE_ENGINE = DynamoDbCoreAdapter.RESOURCE_ENGINE
+    CLIENT_ENGINE = DynamoDbCoreAdapter.CLIENT_ENGINE
+    SHORTEST_FLOAT_CONVERSION = SHORTEST_FLOAT_CONVERSION
+    EXACT_FLOAT_CONVERSION = EXACT_FLOAT_CONVERSION
+
     def __setup_connectors__(
         self, table_name: str, region_name: str, primary_index: PrimaryIndex,
         billing_mode: str = DynamoDbCoreAdapter.PAY_PER_REQUEST,
         global_secondary_indexes: List[GlobalSecondaryIndex] = None,
         auto_create_table: bool = True,
-        boto_session: Optional[boto3.Session] = None
+        boto_session: Optional[boto3.Session] = None,
+        connection_pool_config: Optional[ConnectionPoolConfig] = None,
+        engine: str = DynamoDbCoreAdapter.RESOURCE_ENGINE,
+        record_serializers: Optional[DynamoDBSerializers] = None,
+        retry_policy: Optional[RetryPolicy] = None
     ):
         self._table_name = table_name
         self._region_name = region_name
-        self._dynamodb_client = DynamoDbCoreAdapter(
+        self._dynamodb_client = self._DYNAMODB_CLIENT_CLASS(
             table_name=table_name, region_name=region_name, billing_mode=billing_mode,
             primary_index=primary_index, global_secondary_indexes=global_secondary_indexes,
             create_table=auto_create_table,
-            boto_session=boto_session
+            boto_session=boto_session, connection_pool_config=connection_pool_config, engine=engine,
+            record_serializers=record_serializers, retry_policy=retry_policy
         )
         self._primary_index_name = primary_index.index_custom_name or primary_index.hash_key_name
 
@@ -37,3 +51,16 @@ class DynamoDBTableConnectors:
     @property
     def dynamodb_client(self) -> DynamoDbCoreAdapter:
         return self._dynamodb_client
+
+    @property
+    def round_trips_count(self) -> int:
+        # Number of requests sent to DynamoDB by the table since its creation or since the last reset_round_trips_count
+        return self.dynamodb_client.round_trips_count
+
+    def reset_round_trips_count(self) -> None:
+        self.dynamodb_client.reset_round_trips_count()
+
+    def _execute_operation(self, operation: Generator) -> Any:
+        # With a sync dynamodb_client the result of the operation is returned, and with
+        # an async dynamodb_client, an awaitable of the result of the operation is returned.
+        return self.dynamodb_client.execute_operation(operation=operation)
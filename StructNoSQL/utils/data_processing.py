@@ -41,3 +41,15 @@ def navigate_into_data_with_field_path_elements(
                     # and then we will return the response_item, so we will return None.
                     break
     return data
+
+
+def deep_merge_dicts(base_dict: dict, other_dict: dict) -> dict:
+    # The values of the other_dict override the values of the base_dict, except for the nested dicts, which are merged together
+    output_dict = {**base_dict}
+    for key, value in other_dict.items():
+        existing_value = output_dict.get(key, None)
+        if isinstance(existing_value, dict) and isinstance(value, dict):
+            output_dict[key] = deep_merge_dicts(base_dict=existing_value, other_dict=value)
+        else:
+            output_dict[key] = value
+    return output_dict
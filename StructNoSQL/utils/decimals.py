@@ -1,47 +1,87 @@
-from typing import Any
+import decimal
+from decimal import Decimal, Context
+from typing import Any, Optional, Callable, Dict
 
-# todo: finish a correct float to decimal convertor, because currently, the float_to_decimal that
-#  simply convert the float to a string and load it into a decimal, is limited to 18 decimals
-#  instead of 38, because the string representation of a float will be rounded after 18 decimals.
+from StructNoSQL.practical_logger import message_with_vars
 
-"""
-from decimal import Context, ROUND_HALF_EVEN, Decimal, getcontext
 
 DECIMAL_DYNAMODB_CONTEXT = Context(
-    prec=38, rounding=ROUND_HALF_EVEN,
+    prec=38, rounding=decimal.ROUND_HALF_EVEN,
     Emin=-128, Emax=126,
     capitals=1, clamp=0,
     flags=[], traps=[]
 )
+# 38 is the maximum numbers of Decimals numbers that DynamoDB can support. The context is
+# created only once, instead of creating a context or using the thread local context per conversion.
 
-def float_to_decimal(float_number: float):
-    split_float = str(float_number).split(".")
-    if len(split_float) > 1:
-        num_decimals = len(split_float[1])
-        if num_decimals <= 38:
-            return Decimal(f"{float_number}")
-        else:
-            return Decimal(f"{round(float_number, 38)}")
-    else:
-        return Decimal(f"{float_number}")
-"""
-
+# Below 2 ** 53, the integer of an integer float is the same number as its shortest representation, whereas above it, the
+# integer of a float can have binary noise digits, or more than the 38 digits supported by DynamoDB (like with 1e300).
+_MAX_EXACT_FLOAT_INTEGER = float(2 ** 53)
 
-from decimal import Decimal
+# The shortest conversion uses the shortest decimal representation of the float (which, once converted back to a float,
+# gives the exact same float), whereas the exact conversion keeps the binary value of the float up to the 38 digits
+# supported by DynamoDB (for example, 0.1 is stored as 0.10000000000000000555111512312578270212).
+SHORTEST_FLOAT_CONVERSION = "shortest"
+EXACT_FLOAT_CONVERSION = "exact"
 
 
 def float_to_decimal(float_number: float) -> Decimal:
+    if float_number.is_integer() and -_MAX_EXACT_FLOAT_INTEGER <= float_number <= _MAX_EXACT_FLOAT_INTEGER:
+        # Fast path for the integers floats, that does not require to format the float to a string
+        return Decimal(int(float_number))
     return Decimal(f"{float_number}")
 
-def float_to_decimal_serializer(item: Any) -> Any:
+def float_to_exact_decimal(float_number: float) -> Decimal:
+    if float_number.is_integer() and -_MAX_EXACT_FLOAT_INTEGER <= float_number <= _MAX_EXACT_FLOAT_INTEGER:
+        return Decimal(int(float_number))
+    # Converted from the binary value of the float (without any string round-trip) and rounded to 38 digits
+    return DECIMAL_DYNAMODB_CONTEXT.create_decimal_from_float(float_number)
+
+
+FLOAT_TO_DECIMAL_FUNCTIONS: Dict[str, Callable[[float], Decimal]] = {
+    SHORTEST_FLOAT_CONVERSION: float_to_decimal,
+    EXACT_FLOAT_CONVERSION: float_to_exact_decimal,
+}
+
+def get_float_to_decimal_function(float_conversion: str) -> Callable[[float], Decimal]:
+    float_to_decimal_function: Optional[Callable[[float], Decimal]] = FLOAT_TO_DECIMAL_FUNCTIONS.get(float_conversion, None)
+    if float_to_decimal_function is None:
+        raise Exception(message_with_vars(
+            message="Unsupported float conversion",
+            vars_dict={'floatConversion': float_conversion, 'supportedFloatConversions': list(FLOAT_TO_DECIMAL_FUNCTIONS.keys())}
+        ))
+    return float_to_decimal_function
+
+
+def decimal_to_python(decimal_number: Decimal) -> float or int:
+    float_number = float(decimal_number)
+    if float_number.is_integer():
+        if -_MAX_EXACT_FLOAT_INTEGER <= float_number <= _MAX_EXACT_FLOAT_INTEGER:
+            return int(float_number)
+        # Above 2 ** 53, the integers are converted from the Decimal itself, since their float is not exact
+        integer_number = int(decimal_number)
+        return integer_number if integer_number == decimal_number else float_number
+    return float_number
+
+
+def float_to_decimal_serializer(item: Any, float_to_decimal_function: Callable[[float], Decimal] = float_to_decimal) -> Any:
+    # The floats found in a dict or a list are converted without a recursive call, and the
+    # lists that only contains floats (like series of measurements) are converted in bulk.
     if isinstance(item, dict):
         for key, value in item.items():
-            item[key] = float_to_decimal_serializer(item=value)
+            if type(value) is float:
+                item[key] = float_to_decimal_function(value)
+            elif isinstance(value, (dict, list, float)):
+                item[key] = float_to_decimal_serializer(item=value, float_to_decimal_function=float_to_decimal_function)
     elif isinstance(item, list):
-        for i, value in enumerate(item):
-            item[i] = float_to_decimal_serializer(item=value)
+        if all(type(value) is float for value in item):
+            item[:] = map(float_to_decimal_function, item)
+        else:
+            for i, value in enumerate(item):
+                if type(value) is float:
+                    item[i] = float_to_decimal_function(value)
+                elif isinstance(value, (dict, list, float)):
+                    item[i] = float_to_decimal_serializer(item=value, float_to_decimal_function=float_to_decimal_function)
     elif isinstance(item, float):
-        item = float_to_decimal(float_number=item)
+        item = float_to_decimal_function(item)
     return item
-
-
@@ -1,4 +1,6 @@
+import functools
 import re
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Tuple, Union
 from StructNoSQL.models import DatabasePathElement
 from StructNoSQL.exceptions import FieldTargetNotFoundException
@@ -86,6 +88,110 @@ def make_rendered_database_path(database_path_elements: List[DatabasePathElement
                 ))
     return output_database_path_elements
 
+def _render_database_path_kwargs_slots(
+        database_path_elements: List[DatabasePathElement], kwargs_slots: Tuple[Tuple[int, str], ...], query_kwargs: dict
+) -> List[DatabasePathElement]:
+    if not len(kwargs_slots) > 0:
+        return database_path_elements
+    output_database_path_elements: List[DatabasePathElement] = list(database_path_elements)
+    for element_index, kwarg_name in kwargs_slots:
+        matching_kwarg: Optional[Any] = query_kwargs.get(kwarg_name, None)
+        if matching_kwarg is None:
+            # Raises the same exception than the rendering of a field path that has not been compiled
+            return make_rendered_database_path(database_path_elements=database_path_elements, query_kwargs=query_kwargs)
+        path_element: DatabasePathElement = database_path_elements[element_index]
+        output_database_path_elements[element_index] = DatabasePathElement(
+            element_key=matching_kwarg,
+            default_type=path_element.default_type,
+            custom_default_value=path_element.custom_default_value
+        )
+    return output_database_path_elements
+
+
+@dataclass(frozen=True)
+class CompiledFieldPath:
+    # The fields targeted by a field path (multiple fields with an attribute selector), with the indexes of the elements
+    # of their database paths to render with a query kwarg (and the name of the kwarg), and the names of all the kwargs.
+    is_multi_selector: bool
+    fields_objects: Tuple[BaseField, ...]
+    fields_kwargs_slots: Tuple[Tuple[Tuple[int, str], ...], ...]
+    kwargs_names: Tuple[str, ...]
+
+
+class FieldPathsCompiler:
+    # Compiles each field path of a fields_switch once, and keeps the most recently rendered database paths for each field
+    # path and values of the query kwargs used by the field path, so that the operations using the same fields paths do
+    # not parse and render them again. The rendered database paths are shared between the operations (like the database
+    # paths of the fields objects), so they must never be modified. The functools.lru_cache are thread safe, and their
+    # typed keys keep apart the kwargs values that are equal but of different types (like the list index 1 and the "1" key).
+
+    def __init__(self, fields_switch: dict, max_compiled_fields_paths: int = 1024, max_rendered_database_paths: int = 4096):
+        self.fields_switch = fields_switch
+        self.get_compiled_field_path = functools.lru_cache(maxsize=max_compiled_fields_paths)(self._compile_field_path)
+        self._get_rendered_database_paths = functools.lru_cache(maxsize=max_rendered_database_paths, typed=True)(self._render_database_paths)
+
+    def clear(self) -> None:
+        self.get_compiled_field_path.cache_clear()
+        self._get_rendered_database_paths.cache_clear()
+
+    def _compile_field_path(self, field_path: str) -> CompiledFieldPath:
+        field_path_object, is_multi_selector = process_and_get_field_path_object_from_field_path(
+            field_path_key=field_path, fields_switch=self.fields_switch
+        )
+        fields_objects: Tuple[BaseField, ...] = tuple(field_path_object.values()) if is_multi_selector is True else (field_path_object,)
+        fields_kwargs_slots: Tuple[Tuple[Tuple[int, str], ...], ...] = tuple(
+            tuple(
+                (element_index, path_element.element_key.replace('$key$:', ''))
+                for element_index, path_element in enumerate(field_object.database_path)
+                if "$key$:" in path_element.element_key
+            ) for field_object in fields_objects
+        )
+        return CompiledFieldPath(
+            is_multi_selector=is_multi_selector, fields_objects=fields_objects, fields_kwargs_slots=fields_kwargs_slots,
+            kwargs_names=tuple(dict.fromkeys(kwarg_name for kwargs_slots in fields_kwargs_slots for _, kwarg_name in kwargs_slots))
+        )
+
+    def _render_database_paths(self, field_path: str, *kwargs_values: Any) -> Union[
+        Tuple[BaseField, List[DatabasePathElement]],
+        Dict[str, Tuple[BaseField, List[DatabasePathElement]]]
+    ]:
+        compiled_field_path: CompiledFieldPath = self.get_compiled_field_path(field_path)
+        query_kwargs: dict = dict(zip(compiled_field_path.kwargs_names, kwargs_values))
+        rendered_fields: List[Tuple[BaseField, List[DatabasePathElement]]] = [
+            (field_object, _render_database_path_kwargs_slots(
+                database_path_elements=field_object.database_path, kwargs_slots=kwargs_slots, query_kwargs=query_kwargs
+            )) for field_object, kwargs_slots in zip(compiled_field_path.fields_objects, compiled_field_path.fields_kwargs_slots)
+        ]
+        if compiled_field_path.is_multi_selector is not True:
+            return rendered_fields[0]
+        return {field_object.field_name: (field_object, rendered_database_path_elements) for field_object, rendered_database_path_elements in rendered_fields}
+
+    def render(self, field_path: str, query_kwargs: Optional[dict]) -> Tuple[
+        Union[
+            Tuple[BaseField, List[DatabasePathElement]],
+            Dict[str, Tuple[BaseField, List[DatabasePathElement]]]
+        ],
+        bool
+    ]:
+        compiled_field_path: CompiledFieldPath = self.get_compiled_field_path(field_path)
+        if not len(compiled_field_path.kwargs_names) > 0:
+            rendered_database_paths = self._get_rendered_database_paths(field_path)
+        else:
+            if query_kwargs is None:
+                # Raises the same exception than the rendering of a field path that has not been compiled
+                make_rendered_database_path(database_path_elements=compiled_field_path.fields_objects[0].database_path, query_kwargs=query_kwargs)
+            kwargs_values: List[Any] = [query_kwargs.get(kwarg_name, None) for kwarg_name in compiled_field_path.kwargs_names]
+            try:
+                rendered_database_paths = self._get_rendered_database_paths(field_path, *kwargs_values)
+            except TypeError:
+                # The unhashable kwargs values cannot be used as keys of the rendered database paths
+                rendered_database_paths = self._render_database_paths(field_path, *kwargs_values)
+        if compiled_field_path.is_multi_selector is not True:
+            return rendered_database_paths, False
+        # The dict of the fields is copied, since it could be modified by the operation
+        return dict(rendered_database_paths), True
+
+
 def process_and_make_single_rendered_database_path(field_path: str, fields_switch: dict, query_kwargs: dict) -> Tuple[
     Union[
         Tuple[BaseField, List[DatabasePathElement]],
@@ -93,6 +199,10 @@ def process_and_make_single_rendered_database_path(field_path: str, fields_switc
     ],
     bool
 ]:
+    # The fields_switch of the tables have a FieldPathsCompiler, and the other fields_switch are parsed on each call
+    paths_compiler: Optional[FieldPathsCompiler] = getattr(fields_switch, 'paths_compiler', None)
+    if paths_compiler is not None:
+        return paths_compiler.render(field_path=field_path, query_kwargs=query_kwargs)
     field_path_object, is_multi_selector = process_and_get_field_path_object_from_field_path(
         field_path_key=field_path, fields_switch=fields_switch
     )
@@ -117,12 +227,16 @@ def process_transforme_validate_data_from_write_and_make_single_rendered_databas
 ) -> Tuple[BaseField, List[DatabasePathElement], Optional[Any], bool]:
 
     # todo: add support for multiple fields path
-    field_object, is_multi_selector = process_and_get_field_path_object_from_field_path(
-        field_path_key=field_path, fields_switch=fields_switch
-    )
-    rendered_database_path_elements: List[DatabasePathElement] = make_rendered_database_path(
-        database_path_elements=field_object.database_path, query_kwargs=query_kwargs
-    )
+    paths_compiler: Optional[FieldPathsCompiler] = getattr(fields_switch, 'paths_compiler', None)
+    if paths_compiler is not None and paths_compiler.get_compiled_field_path(field_path).is_multi_selector is not True:
+        (field_object, rendered_database_path_elements), _ = paths_compiler.render(field_path=field_path, query_kwargs=query_kwargs)
+    else:
+        field_object, is_multi_selector = process_and_get_field_path_object_from_field_path(
+            field_path_key=field_path, fields_switch=fields_switch
+        )
+        rendered_database_path_elements: List[DatabasePathElement] = make_rendered_database_path(
+            database_path_elements=field_object.database_path, query_kwargs=query_kwargs
+        )
 
     validated_data, valid = field_object.transform_validate_from_write(value=data_to_validate, data_validation=True)
     if valid is True:
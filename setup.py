@@ -6,6 +6,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=["pydantic", "boto3", "requests"],
+    extras_require={"async": ["aioboto3"]},
     url="https://github.com/Robinson04/StructNoSQL",
     license="MIT",
     author="Inoft",
@@ -0,0 +1,119 @@
+import timeit
+from typing import Any, Dict, List, Tuple
+
+from StructNoSQL import BaseField, MapModel, TableDataModel, ActiveSelf, PrimaryIndex, CacheEvictionPolicy
+from StructNoSQL.base_tables.base_caching_table import BaseCachingTable
+from StructNoSQL.models import DatabasePathElement
+from StructNoSQL.utils.process_render_fields_paths import process_and_make_single_rendered_database_path
+
+
+# Compares the nested and the path indexed layouts of the cached records, by writing and reading the deepest fields of a
+# model with {i} recursive fields, directly with the cache functions of a caching table (without any database request).
+# Each read is done ten times per record, like the fields read multiple times during the handling of a request.
+# Run with : python -m tests.benchmark_cached_records_layouts
+
+NUM_RECORDS = 100
+NUM_REPETITIONS = 20
+
+
+class RecursiveTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    class PropertyModel(MapModel):
+        name = BaseField(field_type=str, required=False)
+        childProperties = BaseField(field_type=Dict[str, ActiveSelf], key_name="childPropertyKey{i}", max_nested_depth=12, required=False)
+    properties = BaseField(field_type=Dict[str, PropertyModel], key_name="propertyKey", required=False)
+
+
+class BenchmarkCachingTable(BaseCachingTable):
+    # Only the cache of the table is used, so its operations with the database are never called
+    def commit_update_operations(self) -> bool:
+        raise Exception("The benchmark table has no database")
+
+    def commit_remove_operations(self) -> bool:
+        raise Exception("The benchmark table has no database")
+
+    def _get_failed_retrievals_count(self) -> int:
+        return 0
+
+
+def render_deepest_field_path(table: BenchmarkCachingTable) -> Tuple[List[DatabasePathElement], List[DatabasePathElement]]:
+    # The item of the deepest level of the recursive field (whose levels are created by the fields switch when targeted)
+    deepest_field_path: str = 'properties.{{propertyKey}}.childProperties' + ''.join(
+        f"{'.childProperties' if i > 0 else ''}.{{{{childPropertyKey{i}}}}}" for i in range(12)
+    )
+    query_kwargs: Dict[str, str] = {'propertyKey': "property0", **{f'childPropertyKey{i}': f"child{i}" for i in range(12)}}
+    (_, deepest_path_elements), _ = process_and_make_single_rendered_database_path(
+        field_path=deepest_field_path, fields_switch=table.fields_switch, query_kwargs=query_kwargs
+    )
+    (_, property_path_elements), _ = process_and_make_single_rendered_database_path(
+        field_path='properties.{{propertyKey}}', fields_switch=table.fields_switch, query_kwargs=query_kwargs
+    )
+    return deepest_path_elements, property_path_elements
+
+
+def write_deepest_fields(table: BenchmarkCachingTable, deepest_path_elements: List[DatabasePathElement]) -> None:
+    table.clear_cached_data()
+    for i_record in range(NUM_RECORDS):
+        table._cache_put_data(primary_key_value=f"record{i_record}", field_path_elements=deepest_path_elements, data={'name': "value"})
+
+
+def read_deepest_fields(table: BenchmarkCachingTable, deepest_path_elements: List[DatabasePathElement]) -> List[Tuple[bool, Any]]:
+    return [
+        table._cache_get_data(primary_key_value=f"record{i_record}", field_path_elements=deepest_path_elements)
+        for i_record in range(NUM_RECORDS) for _ in range(10)
+    ]
+
+
+def replace_parents_of_deepest_fields(
+        table: BenchmarkCachingTable, deepest_path_elements: List[DatabasePathElement],
+        property_path_elements: List[DatabasePathElement]
+) -> List[Tuple[bool, Any]]:
+    # Replacing a parent of the deepest field removes the deepest field from the cache
+    retrieved_values: List[Tuple[bool, Any]] = []
+    for i_record in range(NUM_RECORDS):
+        record_key: str = f"record{i_record}"
+        table._cache_put_data(primary_key_value=record_key, field_path_elements=deepest_path_elements, data={'name': "value"})
+        table._cache_get_data(primary_key_value=record_key, field_path_elements=deepest_path_elements)
+        table._cache_put_data(primary_key_value=record_key, field_path_elements=property_path_elements, data={})
+        retrieved_values.append(table._cache_get_data(primary_key_value=record_key, field_path_elements=deepest_path_elements))
+    return retrieved_values
+
+
+def run_benchmark():
+    primary_index = PrimaryIndex(hash_key_name='accountId', hash_key_variable_python_type=str)
+    tables: Dict[str, BenchmarkCachingTable] = {
+        records_layout: BenchmarkCachingTable(
+            data_model=RecursiveTableModel, primary_index=primary_index,
+            cache_eviction_policy=CacheEvictionPolicy(records_layout=records_layout)
+        ) for records_layout in [CacheEvictionPolicy.NESTED_LAYOUT, CacheEvictionPolicy.PATH_INDEXED_LAYOUT]
+    }
+    deepest_path_elements, property_path_elements = render_deepest_field_path(table=tables[CacheEvictionPolicy.NESTED_LAYOUT])
+    layouts_retrieved_values: List[list] = []
+    for table in tables.values():
+        write_deepest_fields(table=table, deepest_path_elements=deepest_path_elements)
+        layouts_retrieved_values.append([
+            *read_deepest_fields(table=table, deepest_path_elements=deepest_path_elements),
+            *replace_parents_of_deepest_fields(
+                table=table, deepest_path_elements=deepest_path_elements, property_path_elements=property_path_elements
+            )
+        ])
+    if layouts_retrieved_values[0] != layouts_retrieved_values[1]:
+        raise Exception("The nested and the path indexed layouts retrieved different values")
+
+    print(f"{NUM_RECORDS} records with fields of depth {len(deepest_path_elements)}")
+    for records_layout, table in tables.items():
+        write_deepest_fields(table=table, deepest_path_elements=deepest_path_elements)
+        benchmarks: Dict[str, Any] = {
+            'reads': lambda: read_deepest_fields(table=table, deepest_path_elements=deepest_path_elements),
+            'writes': lambda: write_deepest_fields(table=table, deepest_path_elements=deepest_path_elements),
+            'parents replacements': lambda: replace_parents_of_deepest_fields(
+                table=table, deepest_path_elements=deepest_path_elements, property_path_elements=property_path_elements
+            ),
+        }
+        for benchmark_name, benchmark_function in benchmarks.items():
+            best_duration: float = min(timeit.repeat(benchmark_function, number=NUM_REPETITIONS, repeat=5)) / NUM_REPETITIONS
+            print(f"{records_layout} layout {benchmark_name}: {best_duration * 1000:.3f}ms")
+
+
+if __name__ == '__main__':
+    run_benchmark()
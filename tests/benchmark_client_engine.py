@@ -0,0 +1,76 @@
+import timeit
+from typing import Any, Dict, List
+
+from boto3.dynamodb.types import TypeSerializer, TypeDeserializer
+
+from StructNoSQL.tables_clients.backend.dynamodb_utils import DynamoDBUtils, DynamoDBToPythonValuesConvertor, \
+    PythonToDynamoDBValuesConvertor
+
+
+# Compares the (de)serialization of a query response and of a put request between the resource engine (the boto3
+# TypeSerializer/TypeDeserializer, followed by the DynamoDBUtils conversion of the Decimals) and the client engine
+# (single pass conversions from and to the DynamoDB wire format). Run with : python -m tests.benchmark_client_engine
+
+NUM_ITEMS = 100
+NUM_REPETITIONS = 200
+
+
+def make_record_item(i_item: int) -> Dict[str, Any]:
+    return {
+        'accountId': f"accountId_{i_item}", 'username': f"username_{i_item}",
+        'moneyBalance': 1000.25 + i_item, 'loginsCount': 42 + i_item, 'isActive': i_item % 2 == 0,
+        'tags': {"one", "two", "three"},
+        'shoppingCartItems': {
+            f"item{i_cart_item}": {'itemId': f"item{i_cart_item}", 'addedToCartTimestamp': 1600000000 + i_cart_item, 'price': 9.99}
+            for i_cart_item in range(10)
+        },
+        'history': [{'timestamp': 1600000000 + i_event, 'amount': 0.5 * i_event} for i_event in range(10)]
+    }
+
+
+def resource_engine_response_decoding(wire_items: List[Dict[str, Any]]) -> List[dict]:
+    deserializer = TypeDeserializer()
+    return [
+        DynamoDBUtils.dynamodb_to_python({key: deserializer.deserialize(value) for key, value in item.items()})
+        for item in wire_items
+    ]
+
+
+def client_engine_response_decoding(wire_items: List[Dict[str, Any]]) -> List[dict]:
+    return [DynamoDBToPythonValuesConvertor.convert_attributes(item) for item in wire_items]
+
+
+def resource_engine_request_encoding(python_items: List[dict]) -> List[dict]:
+    serializer = TypeSerializer()
+    return [
+        {key: serializer.serialize(value) for key, value in DynamoDBUtils.python_to_dynamodb(python_object=item).items()}
+        for item in python_items
+    ]
+
+
+def client_engine_request_encoding(python_items: List[dict]) -> List[dict]:
+    return [
+        PythonToDynamoDBValuesConvertor.convert_attributes(DynamoDBUtils.python_to_dynamodb(python_object=item))
+        for item in python_items
+    ]
+
+
+def run_benchmark():
+    python_items: List[dict] = [make_record_item(i_item=i_item) for i_item in range(NUM_ITEMS)]
+    wire_items: List[dict] = client_engine_request_encoding(python_items=python_items)
+    if resource_engine_response_decoding(wire_items) != client_engine_response_decoding(wire_items):
+        raise Exception("The resource engine and the client engine decoded different values")
+
+    benchmarks: Dict[str, Any] = {
+        'resource engine response decoding': lambda: resource_engine_response_decoding(wire_items),
+        'client engine response decoding': lambda: client_engine_response_decoding(wire_items),
+        'resource engine request encoding': lambda: resource_engine_request_encoding(python_items),
+        'client engine request encoding': lambda: client_engine_request_encoding(python_items),
+    }
+    for benchmark_name, benchmark_function in benchmarks.items():
+        best_duration: float = min(timeit.repeat(benchmark_function, number=NUM_REPETITIONS, repeat=5)) / NUM_REPETITIONS
+        print(f"{benchmark_name}: {best_duration * 1000:.3f}ms for {NUM_ITEMS} items")
+
+
+if __name__ == '__main__':
+    run_benchmark()
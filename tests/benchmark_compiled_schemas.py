@@ -0,0 +1,56 @@
+import timeit
+import tracemalloc
+from typing import Dict, Callable, List
+
+from StructNoSQL import PrimaryIndex
+from StructNoSQL.base_tables.base_table import BaseTable
+from tests.users_table_model import UsersTableModel
+
+
+# Measures the construction time and the memory of the tables of a same model, when each table compiles its schema
+# (the compiled schemas are cleared before each table) and when the tables share the compiled schema of the model,
+# like the tables created per tenant or per request. Run with : python -m tests.benchmark_compiled_schemas
+
+NUM_TABLES = 50
+
+
+def make_table() -> BaseTable:
+    return BaseTable(data_model=UsersTableModel, primary_index=PrimaryIndex(hash_key_name='accountId', hash_key_variable_python_type=str))
+
+
+def make_compiled_tables() -> List[BaseTable]:
+    tables: List[BaseTable] = []
+    for _ in range(NUM_TABLES):
+        BaseTable.clear_compiled_schemas()
+        tables.append(make_table())
+    return tables
+
+
+def make_shared_tables() -> List[BaseTable]:
+    return [make_table() for _ in range(NUM_TABLES)]
+
+
+def measure_tables_memory(tables_factory: Callable[[], List[BaseTable]]) -> int:
+    BaseTable.clear_compiled_schemas()
+    tracemalloc.start()
+    tables: List[BaseTable] = tables_factory()
+    tables_memory_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tables_memory_size
+
+
+def run_benchmark():
+    benchmarks: Dict[str, Callable[[], List[BaseTable]]] = {
+        'compiled schema per table': make_compiled_tables,
+        'shared compiled schema': make_shared_tables,
+    }
+    for benchmark_name, tables_factory in benchmarks.items():
+        best_duration: float = min(timeit.repeat(tables_factory, number=1, repeat=5))
+        print(
+            f"{NUM_TABLES} tables with {benchmark_name}: {best_duration * 1000:.3f}ms, "
+            f"{measure_tables_memory(tables_factory) / 1024:.1f}KiB"
+        )
+
+
+if __name__ == '__main__':
+    run_benchmark()
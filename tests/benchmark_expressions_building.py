@@ -0,0 +1,106 @@
+import timeit
+from typing import Any, Dict, List, Callable
+
+from StructNoSQL.models import DatabasePathElement, FieldPathSetter
+from StructNoSQL.tables_clients.backend.dynamodb_core import DynamoDbCoreAdapter, _serialize_setter_value
+from StructNoSQL.tables_clients.backend.expressions_paths import ExpressionPathsBuilder
+from StructNoSQL.tables_clients.backend.expressions_sizes import ExpressionClause, pack_expression_clauses
+
+
+# Measures the construction of the expressions of the requests (the ProjectionExpression of a get, and the SET and REMOVE
+# clauses of an update, packed in requests), with fields sharing the parent map of a {{key}} parameterized field (like
+# 'textsDict.{{textKey}}.name'). The expressions built with a placeholder per element of each path (the previous
+# construction of the requests) are measured as reference. Run with : python -m tests.benchmark_expressions_building
+
+NUMS_FIELDS = [10, 100, 1000]
+NUM_REPETITIONS = 20
+
+
+def make_fields_path_elements(num_fields: int) -> List[List[DatabasePathElement]]:
+    return [[
+        DatabasePathElement(element_key='textsDict', default_type=dict),
+        DatabasePathElement(element_key=f"text{i_field}", default_type=dict),
+        DatabasePathElement(element_key='name', default_type=str),
+    ] for i_field in range(num_fields)]
+
+
+def build_per_element_placeholders_projection(fields_path_elements: List[List[DatabasePathElement]]) -> dict:
+    expression_attribute_names: Dict[str, str] = {}
+    projection_expression = ""
+    for i_field, field_elements in enumerate(fields_path_elements):
+        for i_path_element, path_element in enumerate(field_elements):
+            current_field_path_expression_name = f"#f{i_field}_{i_path_element}"
+            expression_attribute_names[current_field_path_expression_name] = path_element.element_key
+            projection_expression += f'{"." if i_path_element > 0 else ""}{current_field_path_expression_name}'
+        if i_field + 1 < len(fields_path_elements):
+            projection_expression += ", "
+    return {'ProjectionExpression': projection_expression, 'ExpressionAttributeNames': expression_attribute_names}
+
+
+def build_per_element_placeholders_update(setters: List[FieldPathSetter], targets_path_elements: List[List[DatabasePathElement]]) -> List[List[int]]:
+    setters_clauses: List[ExpressionClause] = []
+    for i_setter, setter in enumerate(setters):
+        setter_expression, setter_attribute_names = "", {}
+        for i_path, path_element in enumerate(setter.field_path_elements):
+            path_key = f"#setter{i_setter}_pathKey{i_path}"
+            setter_expression += f"{'.' if len(setter_expression) > 0 else ''}{path_key}"
+            setter_attribute_names = {**setter_attribute_names, path_key: path_element.element_key}
+        setters_clauses.append(ExpressionClause(
+            expression=f"{setter_expression} = :item{i_setter}", attribute_names=setter_attribute_names,
+            attribute_values={f":item{i_setter}": _serialize_setter_value(setter=setter)}
+        ))
+    removers_clauses: List[ExpressionClause] = []
+    for i_target, target in enumerate(targets_path_elements):
+        target_expression, target_attribute_names = "", {}
+        for i_path, path_element in enumerate(target):
+            path_key = f"#target{i_target}_pathKey{i_path}"
+            target_expression += f"{'.' if len(target_expression) > 0 else ''}{path_key}"
+            target_attribute_names = {**target_attribute_names, path_key: path_element.element_key}
+        removers_clauses.append(ExpressionClause(expression=target_expression, attribute_names=target_attribute_names))
+    return [
+        *pack_expression_clauses(clauses=setters_clauses, action_keyword="SET"),
+        *pack_expression_clauses(clauses=removers_clauses, action_keyword="REMOVE")
+    ]
+
+
+def build_shared_placeholders_update(setters: List[FieldPathSetter], targets_path_elements: List[List[DatabasePathElement]]) -> List[List[int]]:
+    paths_builder = ExpressionPathsBuilder()
+    return [
+        *pack_expression_clauses(clauses=DynamoDbCoreAdapter._make_setters_clauses(setters=setters, paths_builder=paths_builder), action_keyword="SET"),
+        *pack_expression_clauses(clauses=DynamoDbCoreAdapter._make_removers_clauses(
+            targets_path_elements=targets_path_elements, paths_builder=paths_builder
+        ), action_keyword="REMOVE")
+    ]
+
+
+def run_benchmark():
+    for num_fields in NUMS_FIELDS:
+        fields_path_elements: List[List[DatabasePathElement]] = make_fields_path_elements(num_fields=num_fields)
+        setters: List[FieldPathSetter] = [
+            FieldPathSetter(field_path_elements=field_elements, value_to_set=f"value{i_field}")
+            for i_field, field_elements in enumerate(fields_path_elements)
+        ]
+        per_element_projection: dict = build_per_element_placeholders_projection(fields_path_elements=fields_path_elements)
+        shared_projection: dict = DynamoDbCoreAdapter._fields_paths_elements_to_expressions(fields_path_elements=fields_path_elements)
+        print(
+            f"{num_fields} fields projection expression : {len(per_element_projection['ProjectionExpression'])} bytes with a placeholder per element, "
+            f"{len(shared_projection['ProjectionExpression'])} bytes with shared placeholders"
+        )
+        print(
+            f"{num_fields} setters and removers : {len(build_per_element_placeholders_update(setters, fields_path_elements))} requests with a "
+            f"placeholder per element, {len(build_shared_placeholders_update(setters, fields_path_elements))} requests with shared placeholders"
+        )
+
+        benchmarks: Dict[str, Callable[[], Any]] = {
+            'per element placeholders projection': lambda: build_per_element_placeholders_projection(fields_path_elements=fields_path_elements),
+            'shared placeholders projection': lambda: DynamoDbCoreAdapter._fields_paths_elements_to_expressions(fields_path_elements=fields_path_elements),
+            'per element placeholders update': lambda: build_per_element_placeholders_update(setters=setters, targets_path_elements=fields_path_elements),
+            'shared placeholders update': lambda: build_shared_placeholders_update(setters=setters, targets_path_elements=fields_path_elements),
+        }
+        for benchmark_name, benchmark_function in benchmarks.items():
+            best_duration: float = min(timeit.repeat(benchmark_function, number=NUM_REPETITIONS, repeat=5)) / NUM_REPETITIONS
+            print(f"{num_fields} fields {benchmark_name}: {best_duration * 1000:.3f}ms")
+
+
+if __name__ == '__main__':
+    run_benchmark()
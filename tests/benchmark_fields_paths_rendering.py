@@ -0,0 +1,50 @@
+import timeit
+from typing import Any, Dict, List, Tuple
+
+from StructNoSQL import PrimaryIndex
+from StructNoSQL.base_tables.base_table import BaseTable
+from StructNoSQL.utils.process_render_fields_paths import process_and_make_single_rendered_database_path
+from tests.users_table_model import UsersTableModel
+
+
+# Compares the parsing and rendering of the fields paths on each call (with a plain dict as fields_switch), with the
+# FieldPathsCompiler of the fields_switch of the tables, for single, multi selectors and {{key}} parameterized paths
+# of the UsersTableModel of the tests. Run with : python -m tests.benchmark_fields_paths_rendering
+
+NUM_RENDERINGS = 1000
+NUM_REPETITIONS = 20
+
+FIELDS_PATHS_WITH_QUERY_KWARGS: Dict[str, Tuple[str, List[dict]]] = {
+    'single': ('username', [{}]),
+    'multi selector': ('(username, multiTypes, number1, string1, floatTest)', [{}]),
+    # The query kwargs alternate between 10 projects, like the handling of the requests of a few users
+    '{{key}} parameterized': ('projects.{{projectId}}.instancesInfos.ya', [
+        {'projectId': f"project{i_project}"} for i_project in range(10)
+    ]),
+}
+
+
+def render_fields_paths(fields_switch: dict, field_path: str, queries_kwargs: List[dict]) -> List[Any]:
+    return [
+        process_and_make_single_rendered_database_path(
+            field_path=field_path, fields_switch=fields_switch, query_kwargs=queries_kwargs[i_rendering % len(queries_kwargs)]
+        ) for i_rendering in range(NUM_RENDERINGS)
+    ]
+
+
+def run_benchmark():
+    table = BaseTable(data_model=UsersTableModel, primary_index=PrimaryIndex(hash_key_name='accountId', hash_key_variable_python_type=str))
+    fields_switches: Dict[str, dict] = {'parsed': dict(table.fields_switch), 'compiled': table.fields_switch}
+    for benchmark_name, (field_path, queries_kwargs) in FIELDS_PATHS_WITH_QUERY_KWARGS.items():
+        if render_fields_paths(fields_switches['parsed'], field_path, queries_kwargs) != render_fields_paths(fields_switches['compiled'], field_path, queries_kwargs):
+            raise Exception(f"The parsed and the compiled {benchmark_name} fields paths rendered different database paths")
+        for fields_switch_name, fields_switch in fields_switches.items():
+            best_duration: float = min(timeit.repeat(
+                lambda: render_fields_paths(fields_switch=fields_switch, field_path=field_path, queries_kwargs=queries_kwargs),
+                number=NUM_REPETITIONS, repeat=5
+            )) / NUM_REPETITIONS
+            print(f"{fields_switch_name} {benchmark_name} fields paths: {best_duration * 1000:.3f}ms for {NUM_RENDERINGS} renderings")
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,77 @@
+import timeit
+from copy import deepcopy
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from StructNoSQL.utils.decimals import float_to_decimal_serializer, float_to_decimal, float_to_exact_decimal, \
+    decimal_to_python
+
+
+# Compares the previous floats and Decimals conversions (a string round-trip for every float, and a float conversion for
+# every Decimal) with the current shortest and exact conversions, on large nested telemetry payloads.
+# Run with : python -m tests.benchmark_float_conversion
+
+NUM_RECORDS = 20
+NUM_MEASUREMENTS = 500
+NUM_REPETITIONS = 20
+
+
+def legacy_float_to_decimal(float_number: float) -> Decimal:
+    return Decimal(f"{float_number}")
+
+def legacy_float_to_decimal_serializer(item: Any) -> Any:
+    if isinstance(item, dict):
+        for key, value in item.items():
+            item[key] = legacy_float_to_decimal_serializer(item=value)
+    elif isinstance(item, list):
+        for i, value in enumerate(item):
+            item[i] = legacy_float_to_decimal_serializer(item=value)
+    elif isinstance(item, float):
+        item = legacy_float_to_decimal(float_number=item)
+    return item
+
+def legacy_decimal_to_python(decimal_number: Decimal) -> float or int:
+    decimal_float = decimal_number.__float__()
+    return decimal_float if decimal_float.is_integer() is not True else int(decimal_float)
+
+
+def make_telemetry_payload() -> Dict[str, Any]:
+    return {
+        f"device{i_record}": {
+            'deviceId': f"device{i_record}", 'firmwareVersion': 3,
+            'temperatures': [20.0 + (i_measurement % 100) / 7 for i_measurement in range(NUM_MEASUREMENTS)],
+            'counters': [float(i_measurement) for i_measurement in range(NUM_MEASUREMENTS)],
+            'events': [
+                {'timestamp': 1600000000 + i_event, 'voltage': 3.3 + i_event / 1000, 'label': "sample"}
+                for i_event in range(NUM_MEASUREMENTS // 10)
+            ]
+        } for i_record in range(NUM_RECORDS)
+    }
+
+
+def run_benchmark():
+    payload: Dict[str, Any] = make_telemetry_payload()
+    if legacy_float_to_decimal_serializer(deepcopy(payload)) != float_to_decimal_serializer(deepcopy(payload)):
+        raise Exception("The legacy and the current float_to_decimal_serializer returned different values")
+
+    # The serializers modify the payloads in place, so each repetition serializes its own copy of the payload
+    payloads_copies: List[Dict[str, Any]] = [deepcopy(payload) for _ in range(NUM_REPETITIONS * 5 * 3)]
+    decimals: List[Decimal] = [float_to_decimal(value) for value in payload['device0']['temperatures'] + payload['device0']['counters']]
+    numbers_count: int = len(decimals)
+
+    benchmarks: Dict[str, Any] = {
+        'legacy float_to_decimal_serializer': lambda: legacy_float_to_decimal_serializer(payloads_copies.pop()),
+        'shortest float_to_decimal_serializer': lambda: float_to_decimal_serializer(payloads_copies.pop()),
+        'exact float_to_decimal_serializer': lambda: float_to_decimal_serializer(
+            payloads_copies.pop(), float_to_decimal_function=float_to_exact_decimal
+        ),
+        f'legacy decimal to python ({numbers_count} numbers)': lambda: [legacy_decimal_to_python(value) for value in decimals],
+        f'current decimal to python ({numbers_count} numbers)': lambda: [decimal_to_python(value) for value in decimals],
+    }
+    for benchmark_name, benchmark_function in benchmarks.items():
+        best_duration: float = min(timeit.repeat(benchmark_function, number=NUM_REPETITIONS, repeat=5)) / NUM_REPETITIONS
+        print(f"{benchmark_name}: {best_duration * 1000:.3f}ms")
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,66 @@
+import timeit
+import tracemalloc
+from typing import Dict, Type, Callable
+
+from StructNoSQL import BaseField, MapModel, TableDataModel, ActiveSelf, PrimaryIndex
+from StructNoSQL.base_tables.base_table import BaseTable
+from tests.users_table_model import UsersTableModel
+
+
+# Measures the construction time and the memory of a table whose {i} recursive fields are expanded on demand, compared
+# with the same table after the expansion of all the levels of its recursive fields (the fields that were created when
+# the table was constructed, before the on demand expansion), for the UsersTableModel of the tests (which does not have
+# recursive fields) and for a model with a recursive field. Run with : python -m tests.benchmark_recursive_fields_expansion
+
+NUM_REPETITIONS = 10
+
+
+class RecursiveTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    class PropertyModel(MapModel):
+        name = BaseField(field_type=str, required=False)
+        description = BaseField(field_type=str, required=False)
+        childProperties = BaseField(field_type=Dict[str, ActiveSelf], key_name="childPropertyKey{i}", required=False)
+    properties = BaseField(field_type=Dict[str, PropertyModel], key_name="propertyKey", required=False)
+
+
+def make_table(data_model: Type[TableDataModel]) -> BaseTable:
+    return BaseTable(data_model=data_model, primary_index=PrimaryIndex(hash_key_name='accountId', hash_key_variable_python_type=str))
+
+
+def make_expanded_table(data_model: Type[TableDataModel]) -> BaseTable:
+    table: BaseTable = make_table(data_model=data_model)
+    for recursive_field in list(table.fields_switch.recursive_fields.values()):
+        # Targets the deepest level allowed by the max_nested_depth of the field, which expands all the levels of the field
+        table.fields_switch.get(recursive_field.field_path + ''.join(
+            f"{'.' + recursive_field.field.field_name if i_level > 0 else ''}.{{{{{recursive_field.render_level_key_name(i_level)}}}}}"
+            for i_level in range(recursive_field.field.max_nested)
+        ))
+    return table
+
+
+def measure_table_memory(table_factory: Callable[[], BaseTable]) -> int:
+    tracemalloc.start()
+    table: BaseTable = table_factory()
+    table_memory_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return table_memory_size
+
+
+def run_benchmark():
+    for data_model in [UsersTableModel, RecursiveTableModel]:
+        benchmarks: Dict[str, Callable[[], BaseTable]] = {
+            'on demand expansion': lambda: make_table(data_model=data_model),
+            'expanded levels': lambda: make_expanded_table(data_model=data_model),
+        }
+        for benchmark_name, table_factory in benchmarks.items():
+            num_fields: int = len(table_factory().fields_switch)
+            best_duration: float = min(timeit.repeat(table_factory, number=NUM_REPETITIONS, repeat=5)) / NUM_REPETITIONS
+            print(
+                f"{data_model.__name__} with {benchmark_name}: {num_fields} fields, {best_duration * 1000:.3f}ms, "
+                f"{measure_table_memory(table_factory) / 1024:.1f}KiB"
+            )
+
+
+if __name__ == '__main__':
+    run_benchmark()
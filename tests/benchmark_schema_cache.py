@@ -0,0 +1,66 @@
+import contextlib
+import io
+import os
+import tempfile
+import timeit
+from typing import Dict, List, Optional, Type
+
+from StructNoSQL import BaseField, MapModel, TableDataModel, ActiveSelf, PrimaryIndex
+from StructNoSQL.base_tables.base_table import BaseTable
+from tests.users_table_model import UsersTableModel
+
+
+# Compares the construction of a table processing its model, with the construction of a table loading the processed
+# schema of its model from a schema cache file, for the UsersTableModel of the tests, and for a model with {i} recursive
+# fields. Run with : python -m tests.benchmark_schema_cache
+
+NUM_REPETITIONS = 3
+
+
+class RecursiveTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    class PropertyModel(MapModel):
+        name = BaseField(field_type=str, required=False)
+        childProperties = BaseField(field_type=Dict[str, ActiveSelf], key_name="childPropertyKey{i}", max_nested_depth=4, required=False)
+    properties = BaseField(field_type=Dict[str, PropertyModel], key_name="propertyKey", required=False)
+
+
+def describe_fields_switch(table: BaseTable) -> List[tuple]:
+    return [(
+        field_path, type(field_object).__name__, field_object.key_name,
+        [(path_element.element_key, path_element.default_type) for path_element in field_object.database_path]
+    ) for field_path, field_object in table.fields_switch.items()]
+
+
+def make_table(data_model: Type[TableDataModel], schema_cache_directory_path: Optional[str]) -> BaseTable:
+    # The warnings printed while processing the recursive fields are not part of the benchmark output
+    with contextlib.redirect_stdout(io.StringIO()):
+        return BaseTable(
+            data_model=data_model, primary_index=PrimaryIndex(hash_key_name='accountId', hash_key_variable_python_type=str),
+            schema_cache_directory_path=schema_cache_directory_path
+        )
+
+
+def run_benchmark():
+    for data_model in [UsersTableModel, RecursiveTableModel]:
+        with tempfile.TemporaryDirectory() as schema_cache_directory_path:
+            processed_table: BaseTable = make_table(data_model=data_model, schema_cache_directory_path=schema_cache_directory_path)
+            loaded_table: BaseTable = make_table(data_model=data_model, schema_cache_directory_path=schema_cache_directory_path)
+            if describe_fields_switch(processed_table) != describe_fields_switch(loaded_table):
+                raise Exception(f"The processed and the loaded schemas of {data_model.__name__} are different")
+            schema_files_sizes: int = sum(
+                os.path.getsize(os.path.join(schema_cache_directory_path, file_name))
+                for file_name in os.listdir(schema_cache_directory_path)
+            )
+            print(f"{data_model.__name__} : {len(loaded_table.fields_switch)} fields, schema file of {schema_files_sizes} bytes")
+
+            for benchmark_name, schema_directory_path in [('processed', None), ('loaded', schema_cache_directory_path)]:
+                best_duration: float = min(timeit.repeat(
+                    lambda: make_table(data_model=data_model, schema_cache_directory_path=schema_directory_path),
+                    number=NUM_REPETITIONS, repeat=3
+                )) / NUM_REPETITIONS
+                print(f"{data_model.__name__} {benchmark_name} schema table construction: {best_duration * 1000:.3f}ms")
+
+
+if __name__ == '__main__':
+    run_benchmark()
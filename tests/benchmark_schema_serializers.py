@@ -0,0 +1,53 @@
+import timeit
+from copy import deepcopy
+from typing import Any, Dict, List
+
+from StructNoSQL import BaseField
+from StructNoSQL.base_tables.schema_serializers import compile_field_serializers
+from StructNoSQL.tables_clients.backend.dynamodb_utils import DynamoDBUtils, DynamoDBSerializers
+from tests.users_table_model import UsersTableModel
+
+
+# Compares the generic DynamoDBUtils conversions (that walk every value with isinstance checks), with the serializers
+# compiled from the UsersTableModel of the tests. Run with : python -m tests.benchmark_schema_serializers
+
+NUM_ITEMS = 100
+NUM_REPETITIONS = 200
+
+
+def make_record_item(i_item: int) -> Dict[str, Any]:
+    return {
+        'accountId': f"accountId_{i_item}", 'username': f"username_{i_item}",
+        'projects': {
+            f"project{i_project}": {'projectName': f"project{i_project}", 'instancesInfos': {'ya': "yo"}}
+            for i_project in range(10)
+        },
+        'multiTypes': "text", 'number1': 42 + i_item, 'string1': "text", 'floatTest': 0.5 + i_item,
+        'sophisticatedRemoval': {f"id{i_removal}": {'nestedVariable': "text"} for i_removal in range(5)},
+        'testMapModel': {'sampleText': "text"},
+        'testDictWithPrimitiveValue': {f"key{i_key}": i_key % 2 == 0 for i_key in range(20)}
+    }
+
+
+def run_benchmark():
+    record_serializers: DynamoDBSerializers = compile_field_serializers(field=BaseField(field_type=UsersTableModel, required=True))
+    python_items: List[dict] = [make_record_item(i_item=i_item) for i_item in range(NUM_ITEMS)]
+    encoded_items: List[dict] = [DynamoDBUtils.python_to_dynamodb(python_object=item) for item in python_items]
+    if encoded_items != [record_serializers.encode(item) for item in python_items]:
+        raise Exception("The generic and the compiled serializers encoded different values")
+
+    # The decoding modifies the items in place, so each repetition decodes its own copy of the encoded items
+    encoded_items_copies: List[List[dict]] = [deepcopy(encoded_items) for _ in range(NUM_REPETITIONS * 5 * 2)]
+    benchmarks: Dict[str, Any] = {
+        'generic encoding': lambda: [DynamoDBUtils.python_to_dynamodb(python_object=item) for item in python_items],
+        'compiled encoding': lambda: [record_serializers.encode(item) for item in python_items],
+        'generic decoding': lambda: [DynamoDBUtils.dynamodb_to_python(dynamodb_object=item) for item in encoded_items_copies.pop()],
+        'compiled decoding': lambda: [record_serializers.decode(item) for item in encoded_items_copies.pop()],
+    }
+    for benchmark_name, benchmark_function in benchmarks.items():
+        best_duration: float = min(timeit.repeat(benchmark_function, number=NUM_REPETITIONS, repeat=5)) / NUM_REPETITIONS
+        print(f"{benchmark_name}: {best_duration * 1000:.3f}ms for {NUM_ITEMS} items")
+
+
+if __name__ == '__main__':
+    run_benchmark()
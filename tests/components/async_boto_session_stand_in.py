@@ -0,0 +1,66 @@
+import asyncio
+import boto3
+from typing import Optional, Any
+
+
+# In-process stand-in of an aioboto3.Session, used to run the async tables clients tests without requiring
+# aioboto3. Every request is sent with a sync boto3 resource, which is executed in the default executor of
+# the event loop, so that the requests of concurrent operations are still being executed concurrently.
+
+async def _run_in_executor(function, **kwargs) -> Any:
+    event_loop = asyncio.get_event_loop()
+    return await event_loop.run_in_executor(None, lambda: function(**kwargs))
+
+
+class AsyncResourceStandIn:
+    def __init__(self, sync_resource: Any):
+        self._sync_resource = sync_resource
+
+    def __getattr__(self, item: str):
+        sync_function = getattr(self._sync_resource, item)
+
+        async def async_function(**kwargs):
+            return await _run_in_executor(sync_function, **kwargs)
+        return async_function
+
+
+class AsyncDynamoDBResourceStandIn(AsyncResourceStandIn):
+    async def Table(self, name: str) -> AsyncResourceStandIn:
+        return AsyncResourceStandIn(sync_resource=self._sync_resource.Table(name))
+
+
+class AsyncResourceContextManagerStandIn:
+    def __init__(self, sync_resource: Any):
+        self._sync_resource = sync_resource
+
+    async def __aenter__(self) -> AsyncDynamoDBResourceStandIn:
+        return AsyncDynamoDBResourceStandIn(sync_resource=self._sync_resource)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class AsyncClientContextManagerStandIn:
+    def __init__(self, sync_client: Any):
+        self._sync_client = sync_client
+
+    async def __aenter__(self) -> AsyncResourceStandIn:
+        return AsyncResourceStandIn(sync_resource=self._sync_client)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class AsyncBotoSessionStandIn:
+    def __init__(self, boto_session: Optional[boto3.Session] = None):
+        self._boto_session = boto_session if boto_session is not None else boto3.Session()
+
+    def resource(self, service_name: str, region_name: Optional[str] = None, config: Optional[Any] = None) -> AsyncResourceContextManagerStandIn:
+        return AsyncResourceContextManagerStandIn(
+            sync_resource=self._boto_session.resource(service_name, region_name=region_name, config=config)
+        )
+
+    def client(self, service_name: str, region_name: Optional[str] = None, config: Optional[Any] = None) -> AsyncClientContextManagerStandIn:
+        return AsyncClientContextManagerStandIn(
+            sync_client=self._boto_session.client(service_name, region_name=region_name, config=config)
+        )
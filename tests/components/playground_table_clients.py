@@ -1,6 +1,9 @@
 import boto3
 from typing import Optional, Any
-from StructNoSQL import DynamoDBBasicTable, PrimaryIndex, GlobalSecondaryIndex, DynamoDBCachingTable
+from StructNoSQL import DynamoDBBasicTable, PrimaryIndex, GlobalSecondaryIndex, DynamoDBCachingTable, \
+    AsyncDynamoDBBasicTable, AsyncDynamoDBCachingTable, ConnectionPoolConfig, RetryPolicy, CacheEvictionPolicy, \
+    BaseSharedCacheBackend, AutoFlushPolicy
+from tests.components.async_boto_session_stand_in import AsyncBotoSessionStandIn
 
 
 TEST_ACCOUNT_ID = "5ae5938d-d4b5-41a7-ad33-40f3c1476211"
@@ -13,7 +16,11 @@ class PlaygroundDynamoDBBasicTable(DynamoDBBasicTable):
     def __init__(
             self, data_model: Optional[Any] = None,
             auto_create_table: bool = True,
-            boto_session: Optional[boto3.Session] = None
+            boto_session: Optional[boto3.Session] = None,
+            connection_pool_config: Optional[ConnectionPoolConfig] = None,
+            engine: str = DynamoDBBasicTable.RESOURCE_ENGINE,
+            float_conversion: str = DynamoDBBasicTable.SHORTEST_FLOAT_CONVERSION,
+            retry_policy: Optional[RetryPolicy] = None
     ):
         primary_index = PrimaryIndex(hash_key_name='accountId', hash_key_variable_python_type=str)
         globals_secondary_indexes = [
@@ -24,10 +31,52 @@ class PlaygroundDynamoDBBasicTable(DynamoDBBasicTable):
         super().__init__(
             table_name="structnosql-playground", region_name="eu-west-2", data_model=data_model,
             primary_index=primary_index, global_secondary_indexes=globals_secondary_indexes,
-            auto_create_table=auto_create_table, boto_session=boto_session
+            auto_create_table=auto_create_table, boto_session=boto_session,
+            connection_pool_config=connection_pool_config, engine=engine, float_conversion=float_conversion,
+            retry_policy=retry_policy
         )
 
 class PlaygroundDynamoDBCachingTable(DynamoDBCachingTable):
+    def __init__(
+            self, data_model, connection_pool_config: Optional[ConnectionPoolConfig] = None,
+            engine: str = DynamoDBCachingTable.RESOURCE_ENGINE,
+            float_conversion: str = DynamoDBCachingTable.SHORTEST_FLOAT_CONVERSION,
+            retry_policy: Optional[RetryPolicy] = None,
+            cache_eviction_policy: Optional[CacheEvictionPolicy] = None,
+            shared_cache_backend: Optional[BaseSharedCacheBackend] = None,
+            auto_flush_policy: Optional[AutoFlushPolicy] = None,
+            schema_cache_directory_path: Optional[str] = None
+    ):
+        primary_index = PrimaryIndex(hash_key_name="accountId", hash_key_variable_python_type=str)
+        globals_secondary_indexes = [
+            GlobalSecondaryIndex(hash_key_name="username", hash_key_variable_python_type=str, projection_type='ALL'),
+            GlobalSecondaryIndex(hash_key_name="email", hash_key_variable_python_type=str, projection_type='ALL'),
+            GlobalSecondaryIndex(hash_key_name='type', hash_key_variable_python_type=str, projection_type='ALL'),
+        ]
+        super().__init__(
+            table_name="structnosql-playground", region_name="eu-west-2", data_model=data_model,
+            primary_index=primary_index, global_secondary_indexes=globals_secondary_indexes,
+            auto_create_table=True, connection_pool_config=connection_pool_config, engine=engine,
+            float_conversion=float_conversion, retry_policy=retry_policy, cache_eviction_policy=cache_eviction_policy,
+            shared_cache_backend=shared_cache_backend, auto_flush_policy=auto_flush_policy,
+            schema_cache_directory_path=schema_cache_directory_path
+        )
+
+class PlaygroundAsyncDynamoDBBasicTable(AsyncDynamoDBBasicTable):
+    def __init__(self, data_model, engine: str = AsyncDynamoDBBasicTable.RESOURCE_ENGINE):
+        primary_index = PrimaryIndex(hash_key_name='accountId', hash_key_variable_python_type=str)
+        globals_secondary_indexes = [
+            GlobalSecondaryIndex(hash_key_name='username', hash_key_variable_python_type=str, projection_type='ALL'),
+            GlobalSecondaryIndex(hash_key_name='email', hash_key_variable_python_type=str, projection_type='ALL'),
+            GlobalSecondaryIndex(hash_key_name='type', hash_key_variable_python_type=str, projection_type='ALL'),
+        ]
+        super().__init__(
+            table_name="structnosql-playground", region_name="eu-west-2", data_model=data_model,
+            primary_index=primary_index, global_secondary_indexes=globals_secondary_indexes,
+            auto_create_table=True, boto_session=AsyncBotoSessionStandIn(), engine=engine
+        )
+
+class PlaygroundAsyncDynamoDBCachingTable(AsyncDynamoDBCachingTable):
     def __init__(self, data_model):
         primary_index = PrimaryIndex(hash_key_name="accountId", hash_key_variable_python_type=str)
         globals_secondary_indexes = [
@@ -38,7 +87,7 @@ class PlaygroundDynamoDBCachingTable(DynamoDBCachingTable):
         super().__init__(
             table_name="structnosql-playground", region_name="eu-west-2", data_model=data_model,
             primary_index=primary_index, global_secondary_indexes=globals_secondary_indexes,
-            auto_create_table=True
+            auto_create_table=True, boto_session=AsyncBotoSessionStandIn()
         )
 
 
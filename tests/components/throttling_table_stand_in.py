@@ -0,0 +1,42 @@
+from typing import Any, List, Optional
+
+from botocore.exceptions import ClientError
+
+
+# Stand-in of the boto3 Table resource of a table client, that fails its requests with the error codes of an errors
+# schedule (one entry per request, None to let the request go through), and then sends all the next requests to the
+# real Table resource. Used to test the retries of the throttled requests without depending on the capacity of a table.
+
+class ThrottlingTableResourceStandIn:
+    def __init__(self, table_resource: Any, errors_schedule: List[Optional[str]]):
+        self._table_resource = table_resource
+        self.errors_schedule = list(errors_schedule)
+        self.num_requests = 0
+
+    def __getattr__(self, item: str):
+        real_function = getattr(self._table_resource, item)
+
+        def scheduled_function(**kwargs):
+            self.num_requests += 1
+            error_code: Optional[str] = self.errors_schedule.pop(0) if len(self.errors_schedule) > 0 else None
+            if error_code is not None:
+                raise ClientError(error_response={'Error': {'Code': error_code, 'Message': "Scheduled error"}}, operation_name=item)
+            return real_function(**kwargs)
+        return scheduled_function
+
+
+def install_throttling_table_resource_stand_in(table_client: Any, errors_schedule: List[Optional[str]]) -> ThrottlingTableResourceStandIn:
+    dynamodb_client = table_client.dynamodb_client
+    table_resource_stand_in = ThrottlingTableResourceStandIn(
+        table_resource=dynamodb_client._table_resource, errors_schedule=errors_schedule
+    )
+    dynamodb_client._table_resource = table_resource_stand_in
+    return table_resource_stand_in
+
+
+def install_throttling_service_resource_stand_in(table_client: Any, errors_schedule: List[Optional[str]]) -> ThrottlingTableResourceStandIn:
+    # The batch requests are sent with the DynamoDB service resource instead of the Table resource
+    dynamodb_client = table_client.dynamodb_client
+    service_resource_stand_in = ThrottlingTableResourceStandIn(table_resource=dynamodb_client.dynamodb, errors_schedule=errors_schedule)
+    dynamodb_client.dynamodb = service_resource_stand_in
+    return service_resource_stand_in
@@ -0,0 +1,145 @@
+import asyncio
+import unittest
+from typing import Union, Dict, List, Optional, Any
+from uuid import uuid4
+
+from StructNoSQL import AsyncDynamoDBBasicTable, AsyncDynamoDBCachingTable, FieldGetter, FieldRemover, SessionCommitException
+from tests.components.throttling_table_stand_in import install_throttling_table_resource_stand_in
+
+
+def _expected_value(value: Any, is_caching: bool, from_cache: bool = False) -> Any:
+    return value if is_caching is not True else {'fromCache': from_cache, 'value': value}
+
+
+async def test_put_get_update_and_remove_fields(
+        self: unittest.TestCase, users_table: Union[AsyncDynamoDBBasicTable, AsyncDynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    record_key: str = f"recordId_{uuid4()}"
+    simple_text_field_random_value: str = f"simpleTextField_randomValue_{uuid4()}"
+    put_record_success: bool = await users_table.put_record(record_dict_data={
+        primary_key_name: record_key, 'simpleTextField': simple_text_field_random_value
+    })
+    self.assertTrue(put_record_success)
+
+    # The container and the nestedContainer do not exist yet, and will need to be initialized
+    nested_text_field_random_value: str = f"nestedTextField_randomValue_{uuid4()}"
+    update_success: bool = await users_table.update_field(
+        key_value=record_key, field_path='container.nestedContainer.nestedTextField',
+        value_to_set=nested_text_field_random_value
+    )
+    self.assertTrue(update_success)
+
+    if is_caching is True:
+        operations_commit_success: bool = await users_table.commit_operations()
+        self.assertTrue(operations_commit_success)
+        users_table.clear_cached_data()
+
+    retrieved_values: Optional[Dict[str, Any]] = await users_table.get_multiple_fields(key_value=record_key, getters={
+        'simpleTextField': FieldGetter(field_path='simpleTextField'),
+        'nestedTextField': FieldGetter(field_path='container.nestedContainer.nestedTextField')
+    })
+    self.assertEqual({
+        'simpleTextField': _expected_value(simple_text_field_random_value, is_caching=is_caching),
+        'nestedTextField': _expected_value(nested_text_field_random_value, is_caching=is_caching)
+    }, retrieved_values)
+
+    removed_values: Dict[str, Optional[Any]] = await users_table.remove_multiple_fields(key_value=record_key, removers={
+        'simpleTextField': FieldRemover(field_path='simpleTextField'),
+        'nestedTextField': FieldRemover(field_path='container.nestedContainer.nestedTextField')
+    })
+    self.assertEqual({
+        'simpleTextField': _expected_value(simple_text_field_random_value, is_caching=is_caching, from_cache=True),
+        'nestedTextField': _expected_value(nested_text_field_random_value, is_caching=is_caching, from_cache=True)
+    }, removed_values)
+
+    if is_caching is True:
+        operations_commit_success: bool = await users_table.commit_operations()
+        self.assertTrue(operations_commit_success)
+        users_table.clear_cached_data()
+
+    retrieved_values_after_removal: Optional[Dict[str, Any]] = await users_table.get_multiple_fields(key_value=record_key, getters={
+        'simpleTextField': FieldGetter(field_path='simpleTextField'),
+        'nestedTextField': FieldGetter(field_path='container.nestedContainer.nestedTextField')
+    })
+    self.assertEqual({
+        'simpleTextField': _expected_value(None, is_caching=is_caching),
+        'nestedTextField': _expected_value(None, is_caching=is_caching)
+    }, retrieved_values_after_removal)
+
+    delete_record_success: bool = await users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key})
+    self.assertTrue(delete_record_success)
+
+
+async def test_concurrent_records_operations(
+        self: unittest.TestCase, users_table: Union[AsyncDynamoDBBasicTable, AsyncDynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    records_values: Dict[str, str] = {f"recordId_{uuid4()}": f"value_{uuid4()}" for _ in range(10)}
+    put_records_successes: List[bool] = await asyncio.gather(*[
+        users_table.put_record(record_dict_data={primary_key_name: record_key, 'simpleTextField': record_value})
+        for record_key, record_value in records_values.items()
+    ])
+    self.assertTrue(all(put_records_successes))
+
+    if is_caching is True:
+        users_table.clear_cached_data()
+
+    retrieved_values: List[Optional[Any]] = await asyncio.gather(*[
+        users_table.get_field(key_value=record_key, field_path='simpleTextField')
+        for record_key in records_values.keys()
+    ])
+    self.assertEqual(
+        [_expected_value(record_value, is_caching=is_caching) for record_value in records_values.values()],
+        retrieved_values
+    )
+
+    delete_records_success: bool = await users_table.delete_records(indexes_keys_selectors_list=[
+        {primary_key_name: record_key} for record_key in records_values.keys()
+    ])
+    self.assertTrue(delete_records_success)
+
+
+async def test_paginated_query_field(
+        self: unittest.TestCase, users_table: Union[AsyncDynamoDBBasicTable, AsyncDynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    random_type_id: str = f"type_{uuid4()}"
+    records_keys: List[str] = [f"recordId_{uuid4()}" for _ in range(5)]
+    put_records_success: bool = await users_table.put_records(records_dicts_data=[
+        {primary_key_name: record_key, 'type': random_type_id} for record_key in records_keys
+    ])
+    self.assertTrue(put_records_success)
+
+    retrieved_records_keys: List[str] = []
+    async for records_data, query_metadata in users_table.paginated_query_field(
+        index_name='type', key_value=random_type_id,
+        field_path=primary_key_name, pagination_records_limit=2
+    ):
+        if records_data is not None:
+            retrieved_records_keys.extend(records_data.keys())
+    self.assertEqual(set(records_keys), set(retrieved_records_keys))
+
+    delete_records_success: bool = await users_table.delete_records(indexes_keys_selectors_list=[
+        {primary_key_name: record_key} for record_key in records_keys
+    ])
+    self.assertTrue(delete_records_success)
+
+
+async def test_session_commit(self: unittest.TestCase, users_table: AsyncDynamoDBCachingTable, primary_key_name: str, is_caching: bool):
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(await users_table.put_record(record_dict_data={primary_key_name: record_key, 'simpleTextField': "committedValue"}))
+
+    async with users_table.session() as session:
+        self.assertTrue(await session.update_field(key_value=record_key, field_path='simpleTextField', value_to_set="sessionValue"))
+    self.assertEqual(_expected_value("sessionValue", is_caching=is_caching, from_cache=True), await users_table.get_field(key_value=record_key, field_path='simpleTextField'))
+
+    # The operations of the failed records are discarded along with the session, so the failed commit is raised
+    table_resource_stand_in = install_throttling_table_resource_stand_in(table_client=users_table, errors_schedule=["AccessDeniedException"] * 4)
+    with self.assertRaises(SessionCommitException) as raised_context:
+        async with users_table.session() as failed_session:
+            self.assertTrue(await failed_session.update_field(key_value=record_key, field_path='simpleTextField', value_to_set="failedValue"))
+    users_table.dynamodb_client._table_resource = table_resource_stand_in._table_resource
+    self.assertEqual([record_key], raised_context.exception.commit_report.failed_records_keys)
+    self.assertEqual(_expected_value("sessionValue", is_caching=is_caching), await users_table.get_field(key_value=record_key, field_path='simpleTextField'))
+    self.assertTrue(await users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
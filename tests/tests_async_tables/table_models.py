@@ -0,0 +1,14 @@
+from StructNoSQL import TableDataModel, BaseField, MapModel
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    type = BaseField(field_type=str, required=False)
+    simpleTextField = BaseField(field_type=str, required=False)
+    class ContainerModel(MapModel):
+        textFieldOne = BaseField(field_type=str, required=False)
+        textFieldTwo = BaseField(field_type=str, required=False)
+        class NestedContainerModel(MapModel):
+            nestedTextField = BaseField(field_type=str, required=False)
+        nestedContainer = BaseField(field_type=NestedContainerModel, required=False)
+    container = BaseField(field_type=ContainerModel, required=False)
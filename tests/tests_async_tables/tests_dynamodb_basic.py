@@ -0,0 +1,33 @@
+import asyncio
+import unittest
+
+from tests.components.playground_table_clients import PlaygroundAsyncDynamoDBBasicTable
+from tests.tests_async_tables.table_models import DynamoDBTableModel
+
+
+class TestsAsyncDynamoDBBasicTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.users_table = PlaygroundAsyncDynamoDBBasicTable(data_model=DynamoDBTableModel)
+
+        self.DYNAMODB_CASE_KWARGS = {'self': self, 'users_table': self.users_table, 'is_caching': False}
+        self.SHARED_CASE_KWARGS = {**self.DYNAMODB_CASE_KWARGS, 'primary_key_name': 'accountId'}
+
+    def test_put_get_update_and_remove_fields(self):
+        from tests.tests_async_tables.cases_shared import test_put_get_update_and_remove_fields
+        asyncio.run(test_put_get_update_and_remove_fields(**self.SHARED_CASE_KWARGS))
+
+    def test_concurrent_records_operations(self):
+        from tests.tests_async_tables.cases_shared import test_concurrent_records_operations
+        asyncio.run(test_concurrent_records_operations(**self.SHARED_CASE_KWARGS))
+
+    def test_paginated_query_field(self):
+        from tests.tests_async_tables.cases_shared import test_paginated_query_field
+        asyncio.run(test_paginated_query_field(**self.SHARED_CASE_KWARGS))
+
+    def test_put_get_update_and_remove_fields_with_client_engine(self):
+        from tests.tests_async_tables.cases_shared import test_put_get_update_and_remove_fields
+        client_engine_users_table = PlaygroundAsyncDynamoDBBasicTable(
+            data_model=DynamoDBTableModel, engine=PlaygroundAsyncDynamoDBBasicTable.CLIENT_ENGINE
+        )
+        asyncio.run(test_put_get_update_and_remove_fields(**{**self.SHARED_CASE_KWARGS, 'users_table': client_engine_users_table}))
@@ -0,0 +1,168 @@
+import threading
+import time
+import unittest
+import weakref
+from typing import Any, Callable, Optional
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBCachingTable, AutoFlushPolicy
+
+
+class _BlockingTableResourceStandIn:
+    # Stand-in of the boto3 Table resource of a table client, that blocks its requests until being released, in order to
+    # use the table while one of its commits is waiting for its requests.
+    def __init__(self, table_resource: Any):
+        self._table_resource = table_resource
+        self.request_started_event = threading.Event()
+        self.release_event = threading.Event()
+
+    def __getattr__(self, item: str):
+        real_function = getattr(self._table_resource, item)
+
+        def blocking_function(**kwargs):
+            self.request_started_event.set()
+            self.release_event.wait(timeout=10)
+            return real_function(**kwargs)
+        return blocking_function
+
+
+def _put_record(users_table: DynamoDBCachingTable, primary_key_name: str) -> str:
+    record_key: str = f"recordId_{uuid4()}"
+    if users_table.put_record(record_dict_data={primary_key_name: record_key}) is not True:
+        raise Exception(f"Failed to put the record {record_key}")
+    return record_key
+
+def _get_from_database(users_table: DynamoDBCachingTable, record_key: str, field_path: str) -> Optional[str]:
+    users_table.clear_cached_data_for_record(record_primary_key=record_key)
+    retrieved_item: Optional[dict] = users_table.get_field(key_value=record_key, field_path=field_path)
+    return retrieved_item['value'] if retrieved_item is not None else None
+
+
+def test_flush_on_max_record_pending_operations(
+        self: unittest.TestCase, table_factory: Callable[[AutoFlushPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(AutoFlushPolicy(max_record_pending_operations=2, flush_on_exit=False))
+    record_key: str = _put_record(users_table=users_table, primary_key_name=primary_key_name)
+    users_table.reset_round_trips_count()
+    # The repeated writes of a same field are coalesced into a single pending operation
+    for i in range(5):
+        self.assertTrue(users_table.update_field(key_value=record_key, field_path='firstTextField', value_to_set=f"first{i}"))
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='secondTextField', value_to_set="second"))
+    self.assertEqual(0, users_table.round_trips_count)
+    self.assertTrue(users_table.has_pending_operations())
+
+    self.assertTrue(users_table.delete_field(key_value=record_key, field_path='thirdTextField'))
+    self.assertFalse(users_table.has_pending_operations())
+    self.assertEqual(1, users_table.round_trips_count)
+    self.assertEqual("first4", _get_from_database(users_table=users_table, record_key=record_key, field_path='firstTextField'))
+    self.assertEqual("second", _get_from_database(users_table=users_table, record_key=record_key, field_path='secondTextField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_flush_on_max_pending_bytes(
+        self: unittest.TestCase, table_factory: Callable[[AutoFlushPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(AutoFlushPolicy(max_pending_bytes=1000, flush_on_exit=False))
+    first_record_key: str = _put_record(users_table=users_table, primary_key_name=primary_key_name)
+    second_record_key: str = _put_record(users_table=users_table, primary_key_name=primary_key_name)
+    self.assertTrue(users_table.update_field(key_value=first_record_key, field_path='firstTextField', value_to_set="small"))
+    self.assertTrue(users_table.has_pending_operations())
+
+    # The pending bytes are counted across all the records
+    self.assertTrue(users_table.update_field(key_value=second_record_key, field_path='firstTextField', value_to_set="x" * 2000))
+    self.assertFalse(users_table.has_pending_operations())
+    self.assertEqual("small", _get_from_database(users_table=users_table, record_key=first_record_key, field_path='firstTextField'))
+    self.assertEqual("x" * 2000, _get_from_database(users_table=users_table, record_key=second_record_key, field_path='firstTextField'))
+    users_table.delete_records(indexes_keys_selectors_list=[{primary_key_name: first_record_key}, {primary_key_name: second_record_key}])
+
+
+def test_flush_on_max_pending_age_from_background_thread(
+        self: unittest.TestCase, table_factory: Callable[[AutoFlushPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(AutoFlushPolicy(max_pending_age_seconds=0.05, check_interval_seconds=0.01, flush_on_exit=False))
+    self.addCleanup(users_table.stop_auto_flush_thread)
+    record_key: str = _put_record(users_table=users_table, primary_key_name=primary_key_name)
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='firstTextField', value_to_set="aged"))
+
+    # The table is idle, so the pending operations can only be committed by the background thread
+    wait_start_time: float = time.monotonic()
+    while users_table.has_pending_operations() and time.monotonic() - wait_start_time < 5:
+        time.sleep(0.01)
+    self.assertFalse(users_table.has_pending_operations())
+    self.assertEqual("aged", _get_from_database(users_table=users_table, record_key=record_key, field_path='firstTextField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_flush_on_exit(
+        self: unittest.TestCase, table_factory: Callable[[AutoFlushPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(AutoFlushPolicy(max_record_pending_operations=10))
+    record_key: str = _put_record(users_table=users_table, primary_key_name=primary_key_name)
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='firstTextField', value_to_set="atExit"))
+    self.assertTrue(users_table.has_pending_operations())
+
+    # Called by atexit when the interpreter exits
+    DynamoDBCachingTable._flush_on_exit(weakref.ref(users_table))
+    self.assertFalse(users_table.has_pending_operations())
+    self.assertEqual("atExit", _get_from_database(users_table=users_table, record_key=record_key, field_path='firstTextField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_flush_on_max_record_pending_operations_from_return_old_operations(
+        self: unittest.TestCase, table_factory: Callable[[AutoFlushPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(AutoFlushPolicy(max_record_pending_operations=1, flush_on_exit=False))
+    record_key: str = _put_record(users_table=users_table, primary_key_name=primary_key_name)
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='firstTextField', value_to_set="first"))
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='secondTextField', value_to_set="second"))
+    users_table.commit_operations()
+    users_table.reset_round_trips_count()
+
+    # The old values are found in the cache, so the operations only add pending operations, which are tracked as well
+    update_success, old_value = users_table.update_field_return_old(key_value=record_key, field_path='firstTextField', value_to_set="updated")
+    self.assertTrue(update_success)
+    self.assertEqual("first", old_value['value'])
+    self.assertEqual(0, users_table.round_trips_count)
+    self.assertTrue(users_table.has_pending_operations())
+
+    removed_value: Optional[dict] = users_table.remove_field(key_value=record_key, field_path='secondTextField')
+    self.assertEqual("second", removed_value['value'])
+    self.assertFalse(users_table.has_pending_operations())
+    self.assertEqual(1, users_table.round_trips_count)
+    self.assertEqual("updated", _get_from_database(users_table=users_table, record_key=record_key, field_path='firstTextField'))
+    self.assertIsNone(_get_from_database(users_table=users_table, record_key=record_key, field_path='secondTextField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_writes_not_blocked_by_background_flush(
+        self: unittest.TestCase, table_factory: Callable[[AutoFlushPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(AutoFlushPolicy(max_pending_age_seconds=0.05, check_interval_seconds=0.01, flush_on_exit=False))
+    self.addCleanup(users_table.stop_auto_flush_thread)
+    record_key: str = _put_record(users_table=users_table, primary_key_name=primary_key_name)
+    table_resource_stand_in = _BlockingTableResourceStandIn(table_resource=users_table.dynamodb_client._table_resource)
+    users_table.dynamodb_client._table_resource = table_resource_stand_in
+    self.addCleanup(table_resource_stand_in.release_event.set)
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='firstTextField', value_to_set="flushed"))
+    self.assertTrue(table_resource_stand_in.request_started_event.wait(timeout=5))
+
+    # The background thread is waiting for the request of its commit, while the table keeps adding pending operations
+    # (without waiting for the running commit to auto flush them)
+    writer_thread = threading.Thread(target=lambda: users_table.update_field(
+        key_value=record_key, field_path='secondTextField', value_to_set="addedDuringFlush"
+    ))
+    writer_thread.start()
+    writer_thread.join(timeout=2)
+    self.assertFalse(writer_thread.is_alive())
+    self.assertTrue(users_table.has_pending_operations())
+
+    table_resource_stand_in.release_event.set()
+    wait_start_time: float = time.monotonic()
+    while users_table.has_pending_operations() and time.monotonic() - wait_start_time < 5:
+        time.sleep(0.01)
+    self.assertFalse(users_table.has_pending_operations())
+    users_table.stop_auto_flush_thread()
+    users_table.dynamodb_client._table_resource = table_resource_stand_in._table_resource
+    self.assertEqual("flushed", _get_from_database(users_table=users_table, record_key=record_key, field_path='firstTextField'))
+    self.assertEqual("addedDuringFlush", _get_from_database(users_table=users_table, record_key=record_key, field_path='secondTextField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
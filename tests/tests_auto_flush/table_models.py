@@ -0,0 +1,8 @@
+from StructNoSQL import TableDataModel, BaseField
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    firstTextField = BaseField(field_type=str, required=False)
+    secondTextField = BaseField(field_type=str, required=False)
+    thirdTextField = BaseField(field_type=str, required=False)
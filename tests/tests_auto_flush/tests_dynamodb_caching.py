@@ -0,0 +1,41 @@
+import unittest
+
+from StructNoSQL import AutoFlushPolicy
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_auto_flush.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.SHARED_CASE_KWARGS = {'self': self, 'table_factory': self.table_factory, 'primary_key_name': 'accountId'}
+
+    @staticmethod
+    def table_factory(auto_flush_policy: AutoFlushPolicy) -> PlaygroundDynamoDBCachingTable:
+        users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel, auto_flush_policy=auto_flush_policy)
+        users_table.debug = True
+        return users_table
+
+    def test_flush_on_max_record_pending_operations(self):
+        from tests.tests_auto_flush.cases_shared import test_flush_on_max_record_pending_operations
+        test_flush_on_max_record_pending_operations(**self.SHARED_CASE_KWARGS)
+
+    def test_flush_on_max_pending_bytes(self):
+        from tests.tests_auto_flush.cases_shared import test_flush_on_max_pending_bytes
+        test_flush_on_max_pending_bytes(**self.SHARED_CASE_KWARGS)
+
+    def test_flush_on_max_pending_age_from_background_thread(self):
+        from tests.tests_auto_flush.cases_shared import test_flush_on_max_pending_age_from_background_thread
+        test_flush_on_max_pending_age_from_background_thread(**self.SHARED_CASE_KWARGS)
+
+    def test_flush_on_exit(self):
+        from tests.tests_auto_flush.cases_shared import test_flush_on_exit
+        test_flush_on_exit(**self.SHARED_CASE_KWARGS)
+
+    def test_flush_on_max_record_pending_operations_from_return_old_operations(self):
+        from tests.tests_auto_flush.cases_shared import test_flush_on_max_record_pending_operations_from_return_old_operations
+        test_flush_on_max_record_pending_operations_from_return_old_operations(**self.SHARED_CASE_KWARGS)
+
+    def test_writes_not_blocked_by_background_flush(self):
+        from tests.tests_auto_flush.cases_shared import test_writes_not_blocked_by_background_flush
+        test_writes_not_blocked_by_background_flush(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,162 @@
+import unittest
+from typing import Union, Dict, List, Optional, Any
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBBasicTable, DynamoDBCachingTable, FieldGetter
+from tests.components.throttling_table_stand_in import install_throttling_service_resource_stand_in
+
+
+def test_get_multiple_records_fields(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    # More than 100 keys, in order to require multiple BatchGetItem requests
+    records_values: Dict[str, Dict[str, Any]] = {
+        f"recordId_{uuid4()}": {'value': f"value_{uuid4()}", 'index': i} for i in range(130)
+    }
+    for record_key, record_values in records_values.items():
+        put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: record_key, **record_values})
+        self.assertTrue(put_record_success)
+    if is_caching is True:
+        users_table.clear_cached_data()
+
+    missing_record_key: str = f"recordId_{uuid4()}"
+    keys_values: List[str] = [*records_values.keys(), missing_record_key]
+    retrieved_records_values: Dict[str, Dict[str, Optional[Any]]] = users_table.get_multiple_records_fields(
+        keys_values=keys_values, getters={
+            'value': FieldGetter(field_path='value'),
+            'index': FieldGetter(field_path='index')
+        }
+    )
+    self.assertEqual(set(keys_values), set(retrieved_records_values.keys()))
+    for record_key, record_values in records_values.items():
+        self.assertEqual((
+            record_values if is_caching is not True else
+            {key: {'value': value, 'fromCache': False} for key, value in record_values.items()}
+        ), retrieved_records_values[record_key])
+    self.assertEqual({'value': None, 'index': None}, retrieved_records_values[missing_record_key])
+
+    if is_caching is True:
+        # All the existing records values should now be retrieved from the cache
+        first_record_key: str = next(iter(records_values.keys()))
+        cached_records_values: Dict[str, Dict[str, Optional[Any]]] = users_table.get_multiple_records_fields(
+            keys_values=[first_record_key], getters={'value': FieldGetter(field_path='value')}
+        )
+        self.assertEqual(
+            {first_record_key: {'value': {'value': records_values[first_record_key]['value'], 'fromCache': True}}},
+            cached_records_values
+        )
+
+    for record_key in records_values.keys():
+        delete_record_success: bool = users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key})
+        self.assertTrue(delete_record_success)
+
+
+
+def test_get_multiple_records_fields_with_failed_chunk(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    # 130 keys are retrieved with two BatchGetItem requests (of 100 and 30 keys), sent concurrently
+    records_values: Dict[str, Dict[str, Any]] = {
+        f"recordId_{uuid4()}": {'value': f"value_{uuid4()}"} for _ in range(130)
+    }
+    put_records_success: bool = users_table.put_records(records_dicts_data=[
+        {primary_key_name: record_key, **record_values} for record_key, record_values in records_values.items()
+    ])
+    self.assertTrue(put_records_success)
+    if is_caching is True:
+        users_table.clear_cached_data()
+
+    # The first request fails without being retried, which only loses the keys of its own chunk
+    original_service_resource = users_table.dynamodb_client.dynamodb
+    install_throttling_service_resource_stand_in(table_client=users_table, errors_schedule=['ValidationException'])
+    retrieved_records_values: Dict[str, Dict[str, Optional[Any]]] = users_table.get_multiple_records_fields(
+        keys_values=list(records_values.keys()), getters={'value': FieldGetter(field_path='value')}
+    )
+    retrieved_records_keys: List[str] = [
+        record_key for record_key, record_values in retrieved_records_values.items() if record_values['value'] is not None
+    ]
+    self.assertIn(len(retrieved_records_keys), [30, 100])
+    for record_key in retrieved_records_keys:
+        self.assertEqual((
+            records_values[record_key]['value'] if is_caching is not True else
+            {'value': records_values[record_key]['value'], 'fromCache': False}
+        ), retrieved_records_values[record_key]['value'])
+
+    # The records of the failed chunk have not been cached as missing, and are retrieved by the next request
+    all_retrieved_records_values: Dict[str, Dict[str, Optional[Any]]] = users_table.get_multiple_records_fields(
+        keys_values=list(records_values.keys()), getters={'value': FieldGetter(field_path='value')}
+    )
+    for record_key, record_values in records_values.items():
+        retrieved_value: Optional[Any] = all_retrieved_records_values[record_key]['value']
+        self.assertEqual(record_values['value'], retrieved_value if is_caching is not True else retrieved_value['value'])
+
+    users_table.dynamodb_client.dynamodb = original_service_resource
+    delete_records_success: bool = users_table.delete_records(indexes_keys_selectors_list=[
+        {primary_key_name: record_key} for record_key in records_values.keys()
+    ])
+    self.assertTrue(delete_records_success)
+
+
+def test_put_and_delete_records(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    # More than 25 records, in order to require multiple BatchWriteItem requests
+    records_values: Dict[str, Dict[str, Any]] = {
+        f"recordId_{uuid4()}": {'value': f"value_{uuid4()}", 'index': i} for i in range(60)
+    }
+    put_records_success: bool = users_table.put_records(records_dicts_data=[
+        {primary_key_name: record_key, **record_values} for record_key, record_values in records_values.items()
+    ])
+    self.assertTrue(put_records_success)
+
+    if is_caching is True:
+        # The written records should have been put in the cache
+        first_record_key: str = next(iter(records_values.keys()))
+        retrieved_cached_value: Optional[dict] = users_table.get_field(key_value=first_record_key, field_path='value')
+        self.assertEqual({'value': records_values[first_record_key]['value'], 'fromCache': True}, retrieved_cached_value)
+        users_table.clear_cached_data()
+
+    retrieved_records_values: Dict[str, Dict[str, Optional[Any]]] = users_table.get_multiple_records_fields(
+        keys_values=list(records_values.keys()), getters={
+            'value': FieldGetter(field_path='value'),
+            'index': FieldGetter(field_path='index')
+        }
+    )
+    for record_key, record_values in records_values.items():
+        self.assertEqual((
+            record_values if is_caching is not True else
+            {key: {'value': value, 'fromCache': False} for key, value in record_values.items()}
+        ), retrieved_records_values[record_key])
+
+    delete_records_success: bool = users_table.delete_records(indexes_keys_selectors_list=[
+        {primary_key_name: record_key} for record_key in records_values.keys()
+    ])
+    self.assertTrue(delete_records_success)
+    if is_caching is True:
+        users_table.clear_cached_data()
+
+    retrieved_deleted_records_values: Dict[str, Dict[str, Optional[Any]]] = users_table.get_multiple_records_fields(
+        keys_values=list(records_values.keys()), getters={'value': FieldGetter(field_path='value')}
+    )
+    for record_key in records_values.keys():
+        self.assertEqual({'value': None}, retrieved_deleted_records_values[record_key])
+
+
+def test_put_records_with_invalid_record(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    valid_record_key: str = f"recordId_{uuid4()}"
+    put_records_success: bool = users_table.put_records(records_dicts_data=[
+        {primary_key_name: valid_record_key, 'value': f"value_{uuid4()}"},
+        # The index field expects an int, and the required primary key is missing
+        {'index': "notAnInt"}
+    ])
+    self.assertFalse(put_records_success)
+
+    # The valid record should still have been written
+    delete_records_success: bool = users_table.delete_records(indexes_keys_selectors_list=[{primary_key_name: valid_record_key}])
+    self.assertTrue(delete_records_success)
@@ -0,0 +1,30 @@
+import unittest
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_batch_operations.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel)
+        self.users_table.debug = True
+
+        self.DYNAMODB_CASE_KWARGS = {'self': self, 'users_table': self.users_table, 'is_caching': True}
+        self.SHARED_CASE_KWARGS = {**self.DYNAMODB_CASE_KWARGS, 'primary_key_name': 'accountId'}
+
+    def test_get_multiple_records_fields(self):
+        from tests.tests_batch_operations.cases_shared import test_get_multiple_records_fields
+        test_get_multiple_records_fields(**self.SHARED_CASE_KWARGS)
+
+    def test_get_multiple_records_fields_with_failed_chunk(self):
+        from tests.tests_batch_operations.cases_shared import test_get_multiple_records_fields_with_failed_chunk
+        test_get_multiple_records_fields_with_failed_chunk(**self.SHARED_CASE_KWARGS)
+
+    def test_put_and_delete_records(self):
+        from tests.tests_batch_operations.cases_shared import test_put_and_delete_records
+        test_put_and_delete_records(**self.SHARED_CASE_KWARGS)
+
+    def test_put_records_with_invalid_record(self):
+        from tests.tests_batch_operations.cases_shared import test_put_records_with_invalid_record
+        test_put_records_with_invalid_record(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,129 @@
+import random
+import threading
+import time
+import unittest
+from typing import Callable, List
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBCachingTable, CacheEvictionPolicy
+from StructNoSQL.base_tables.cached_records_store import CachedRecordsStore
+
+
+def _put_records(users_table: DynamoDBCachingTable, primary_key_name: str, num_records: int) -> List[str]:
+    records_keys: List[str] = [f"recordId_{uuid4()}" for _ in range(num_records)]
+    for record_key in records_keys:
+        put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': record_key})
+        if put_record_success is not True:
+            raise Exception(f"Failed to put the record {record_key}")
+    return records_keys
+
+def _delete_records(users_table: DynamoDBCachingTable, primary_key_name: str, records_keys: List[str]):
+    users_table.delete_records(indexes_keys_selectors_list=[{primary_key_name: record_key} for record_key in records_keys])
+
+
+def test_lru_max_records_eviction(
+        self: unittest.TestCase, table_factory: Callable[[CacheEvictionPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(CacheEvictionPolicy(max_records=2))
+    records_keys: List[str] = _put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=2)
+    # Using the first record makes the second record the least recently used one
+    self.assertEqual({'fromCache': True, 'value': records_keys[0]}, users_table.get_field(key_value=records_keys[0], field_path='textField'))
+    records_keys.extend(_put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=1))
+
+    self.assertEqual(2, users_table.cached_records_count)
+    self.assertEqual(1, users_table.cache_evictions_count)
+    self.assertEqual({'fromCache': True, 'value': records_keys[0]}, users_table.get_field(key_value=records_keys[0], field_path='textField'))
+    self.assertEqual({'fromCache': False, 'value': records_keys[1]}, users_table.get_field(key_value=records_keys[1], field_path='textField'))
+    self.assertEqual(2, users_table.cache_hits_count)
+    self.assertEqual(1, users_table.cache_misses_count)
+    _delete_records(users_table=users_table, primary_key_name=primary_key_name, records_keys=records_keys)
+
+
+def test_lfu_max_records_eviction(
+        self: unittest.TestCase, table_factory: Callable[[CacheEvictionPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(CacheEvictionPolicy(max_records=2, ordering=CacheEvictionPolicy.LFU_ORDERING))
+    records_keys: List[str] = _put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=2)
+    for _ in range(2):
+        users_table.get_field(key_value=records_keys[0], field_path='textField')
+    users_table.get_field(key_value=records_keys[1], field_path='textField')
+    # Even if the second record is the most recently used one, it is less frequently used than the first record
+    records_keys.extend(_put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=1))
+
+    self.assertEqual(1, users_table.cache_evictions_count)
+    self.assertEqual({'fromCache': True, 'value': records_keys[0]}, users_table.get_field(key_value=records_keys[0], field_path='textField'))
+    self.assertEqual({'fromCache': False, 'value': records_keys[1]}, users_table.get_field(key_value=records_keys[1], field_path='textField'))
+    _delete_records(users_table=users_table, primary_key_name=primary_key_name, records_keys=records_keys)
+
+
+def test_records_with_pending_operations_never_evicted(
+        self: unittest.TestCase, table_factory: Callable[[CacheEvictionPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(CacheEvictionPolicy(max_records=1, record_ttl_seconds=0.05))
+    records_keys: List[str] = _put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=1)
+    self.assertTrue(users_table.update_field(key_value=records_keys[0], field_path='textField', value_to_set="pendingValue"))
+    records_keys.extend(_put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=2))
+    time.sleep(0.1)
+
+    # The record with a pending update is neither evicted by the max_records nor by the records ttl
+    self.assertEqual(2, users_table.cached_records_count)
+    self.assertEqual({'fromCache': True, 'value': "pendingValue"}, users_table.get_field(key_value=records_keys[0], field_path='textField'))
+    self.assertTrue(users_table.commit_operations())
+
+    # Once its operations have been committed, the record can be evicted again
+    self.assertEqual({'fromCache': False, 'value': "pendingValue"}, users_table.get_field(key_value=records_keys[0], field_path='textField'))
+    _delete_records(users_table=users_table, primary_key_name=primary_key_name, records_keys=records_keys)
+
+
+def test_record_ttl_expiration(
+        self: unittest.TestCase, table_factory: Callable[[CacheEvictionPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(CacheEvictionPolicy(record_ttl_seconds=0.05))
+    records_keys: List[str] = _put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=1)
+    self.assertEqual({'fromCache': True, 'value': records_keys[0]}, users_table.get_field(key_value=records_keys[0], field_path='textField'))
+    time.sleep(0.1)
+    self.assertEqual({'fromCache': False, 'value': records_keys[0]}, users_table.get_field(key_value=records_keys[0], field_path='textField'))
+    self.assertEqual(1, users_table.cache_evictions_count)
+    _delete_records(users_table=users_table, primary_key_name=primary_key_name, records_keys=records_keys)
+
+
+def test_max_bytes_eviction(
+        self: unittest.TestCase, table_factory: Callable[[CacheEvictionPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(CacheEvictionPolicy(max_bytes=2000))
+    records_keys: List[str] = _put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=20)
+    self.assertLess(users_table.cached_records_count, 20)
+    self.assertGreater(users_table.cached_records_count, 0)
+    self.assertEqual(20 - users_table.cached_records_count, users_table.cache_evictions_count)
+    self.assertLessEqual(users_table._cached_data_per_primary_key.total_bytes_size, 2000)
+    # The most recently put record is still in the cache
+    self.assertEqual({'fromCache': True, 'value': records_keys[-1]}, users_table.get_field(key_value=records_keys[-1], field_path='textField'))
+    _delete_records(users_table=users_table, primary_key_name=primary_key_name, records_keys=records_keys)
+
+
+def test_records_store_used_from_multiple_threads(self: unittest.TestCase):
+    # Like the store of a caching table used by the thread of its auto flush and by sessions in other threads
+    for ordering in [CacheEvictionPolicy.LRU_ORDERING, CacheEvictionPolicy.LFU_ORDERING]:
+        records_store = CachedRecordsStore(
+            eviction_policy=CacheEvictionPolicy(max_records=16, ordering=ordering), is_record_evictable=lambda primary_key_value: True
+        )
+        threads_exceptions: List[Exception] = []
+
+        def use_records():
+            try:
+                for _ in range(2000):
+                    records_store.index_record(primary_key_value=f"record{random.randint(0, 63)}", is_for_write=False)
+                    records_store.count_hit()
+            except Exception as e:
+                threads_exceptions.append(e)
+
+        threads: List[threading.Thread] = [threading.Thread(target=use_records) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], threads_exceptions)
+        self.assertEqual(8 * 2000, records_store.hits_count)
+        self.assertEqual(16, len(records_store))
+        if ordering == CacheEvictionPolicy.LFU_ORDERING:
+            self.assertEqual(16, sum(len(frequency_records) for frequency_records in records_store._frequencies_records.values()))
@@ -0,0 +1,6 @@
+from StructNoSQL import TableDataModel, BaseField
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    textField = BaseField(field_type=str, required=False)
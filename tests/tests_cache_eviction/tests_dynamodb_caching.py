@@ -0,0 +1,41 @@
+import unittest
+
+from StructNoSQL import CacheEvictionPolicy
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_cache_eviction.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.SHARED_CASE_KWARGS = {'self': self, 'table_factory': self.table_factory, 'primary_key_name': 'accountId'}
+
+    @staticmethod
+    def table_factory(cache_eviction_policy: CacheEvictionPolicy) -> PlaygroundDynamoDBCachingTable:
+        users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel, cache_eviction_policy=cache_eviction_policy)
+        users_table.debug = True
+        return users_table
+
+    def test_lru_max_records_eviction(self):
+        from tests.tests_cache_eviction.cases_shared import test_lru_max_records_eviction
+        test_lru_max_records_eviction(**self.SHARED_CASE_KWARGS)
+
+    def test_lfu_max_records_eviction(self):
+        from tests.tests_cache_eviction.cases_shared import test_lfu_max_records_eviction
+        test_lfu_max_records_eviction(**self.SHARED_CASE_KWARGS)
+
+    def test_records_with_pending_operations_never_evicted(self):
+        from tests.tests_cache_eviction.cases_shared import test_records_with_pending_operations_never_evicted
+        test_records_with_pending_operations_never_evicted(**self.SHARED_CASE_KWARGS)
+
+    def test_record_ttl_expiration(self):
+        from tests.tests_cache_eviction.cases_shared import test_record_ttl_expiration
+        test_record_ttl_expiration(**self.SHARED_CASE_KWARGS)
+
+    def test_max_bytes_eviction(self):
+        from tests.tests_cache_eviction.cases_shared import test_max_bytes_eviction
+        test_max_bytes_eviction(**self.SHARED_CASE_KWARGS)
+
+    def test_records_store_used_from_multiple_threads(self):
+        from tests.tests_cache_eviction.cases_shared import test_records_store_used_from_multiple_threads
+        test_records_store_used_from_multiple_threads(self=self)
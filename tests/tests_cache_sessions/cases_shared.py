@@ -0,0 +1,85 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBCachingTable, SessionCommitException
+from tests.components.throttling_table_stand_in import install_throttling_table_resource_stand_in
+
+
+def test_sessions_isolated_until_committed(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': "committedValue"}))
+
+    users_table.reset_round_trips_count()
+    with users_table.session() as session:
+        # The session reads through the cache of the table, and its writes are only visible from the session
+        self.assertEqual({'fromCache': True, 'value': "committedValue"}, session.get_field(key_value=record_key, field_path='textField'))
+        self.assertTrue(session.update_field(key_value=record_key, field_path='textField', value_to_set="sessionValue"))
+        self.assertEqual({'fromCache': True, 'value': "sessionValue"}, session.get_field(key_value=record_key, field_path='textField'))
+        self.assertEqual({'fromCache': True, 'value': "committedValue"}, users_table.get_field(key_value=record_key, field_path='textField'))
+        self.assertEqual(0, users_table.round_trips_count)
+
+    # The operations of the session have been committed on exit, and the records of the session merged into the table
+    self.assertEqual({'fromCache': True, 'value': "sessionValue"}, users_table.get_field(key_value=record_key, field_path='textField'))
+    users_table.clear_cached_data()
+    self.assertEqual({'fromCache': False, 'value': "sessionValue"}, users_table.get_field(key_value=record_key, field_path='textField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_nested_sessions_and_failed_sessions(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': "committedValue"}))
+
+    with users_table.session() as outer_session:
+        with outer_session.session() as inner_session:
+            self.assertTrue(inner_session.update_field(key_value=record_key, field_path='textField', value_to_set="innerValue"))
+            self.assertEqual({'fromCache': True, 'value': "committedValue"}, outer_session.get_field(key_value=record_key, field_path='textField'))
+        self.assertEqual({'fromCache': True, 'value': "innerValue"}, outer_session.get_field(key_value=record_key, field_path='textField'))
+
+    # The pending operations of a session exited with an exception are discarded, and its written records not merged
+    with self.assertRaises(ValueError):
+        with users_table.session() as failed_session:
+            self.assertTrue(failed_session.update_field(key_value=record_key, field_path='textField', value_to_set="discardedValue"))
+            raise ValueError("Failed request")
+    self.assertEqual({'fromCache': False, 'value': "innerValue"}, users_table.get_field(key_value=record_key, field_path='textField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_concurrent_sessions(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    records_keys: List[str] = [f"recordId_{uuid4()}" for _ in range(16)]
+    self.assertTrue(users_table.put_records(records_dicts_data=[
+        {primary_key_name: record_key, 'textField': "committedValue"} for record_key in records_keys
+    ]))
+
+    def handle_request(record_key: str) -> dict:
+        with users_table.session() as session:
+            self.assertTrue(session.update_field(key_value=record_key, field_path='textField', value_to_set=f"value_{record_key}"))
+            return session.get_field(key_value=record_key, field_path='textField')
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        retrieved_values: List[dict] = list(executor.map(handle_request, records_keys))
+    self.assertEqual([{'fromCache': True, 'value': f"value_{record_key}"} for record_key in records_keys], retrieved_values)
+
+    users_table.reset_round_trips_count()
+    self.assertEqual(
+        [{'fromCache': True, 'value': f"value_{record_key}"} for record_key in records_keys],
+        [users_table.get_field(key_value=record_key, field_path='textField') for record_key in records_keys]
+    )
+    self.assertEqual(0, users_table.round_trips_count)
+    users_table.delete_records(indexes_keys_selectors_list=[{primary_key_name: record_key} for record_key in records_keys])
+
+
+def test_failed_session_commit_raised(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': "committedValue"}))
+
+    # The operations of the failed records are discarded along with the session, so the failed commit is raised
+    table_resource_stand_in = install_throttling_table_resource_stand_in(table_client=users_table, errors_schedule=["AccessDeniedException"] * 4)
+    with self.assertRaises(SessionCommitException) as raised_context:
+        with users_table.session() as failed_session:
+            self.assertTrue(failed_session.update_field(key_value=record_key, field_path='textField', value_to_set="failedValue"))
+    users_table.dynamodb_client._table_resource = table_resource_stand_in._table_resource
+    self.assertEqual([record_key], raised_context.exception.commit_report.failed_records_keys)
+    self.assertEqual({'fromCache': False, 'value': "committedValue"}, users_table.get_field(key_value=record_key, field_path='textField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
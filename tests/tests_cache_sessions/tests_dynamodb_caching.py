@@ -0,0 +1,28 @@
+import unittest
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_cache_sessions.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel)
+        self.users_table.debug = True
+        self.SHARED_CASE_KWARGS = {'self': self, 'users_table': self.users_table, 'primary_key_name': 'accountId'}
+
+    def test_sessions_isolated_until_committed(self):
+        from tests.tests_cache_sessions.cases_shared import test_sessions_isolated_until_committed
+        test_sessions_isolated_until_committed(**self.SHARED_CASE_KWARGS)
+
+    def test_nested_sessions_and_failed_sessions(self):
+        from tests.tests_cache_sessions.cases_shared import test_nested_sessions_and_failed_sessions
+        test_nested_sessions_and_failed_sessions(**self.SHARED_CASE_KWARGS)
+
+    def test_concurrent_sessions(self):
+        from tests.tests_cache_sessions.cases_shared import test_concurrent_sessions
+        test_concurrent_sessions(**self.SHARED_CASE_KWARGS)
+
+    def test_failed_session_commit_raised(self):
+        from tests.tests_cache_sessions.cases_shared import test_failed_session_commit_raised
+        test_failed_session_commit_raised(**self.SHARED_CASE_KWARGS)
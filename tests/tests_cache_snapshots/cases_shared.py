@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+from typing import Callable, Optional
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBCachingTable, CacheEvictionPolicy
+
+
+def test_snapshot_records_loaded_when_used(
+        self: unittest.TestCase, table_factory: Callable[[Optional[CacheEvictionPolicy]], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(None)
+    first_record_key: str = f"recordId_{uuid4()}"
+    second_record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={
+        primary_key_name: first_record_key, 'textField': "firstValue", 'floatField': 1.5, 'setField': {"a", "b"}
+    }))
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: second_record_key, 'textField': "secondValue"}))
+    retrieved_float: dict = users_table.get_field(key_value=first_record_key, field_path='floatField')
+    self.assertIsNone(users_table.get_field(
+        key_value=first_record_key, field_path='mapField.{{mapKey}}', query_kwargs={'mapKey': "missing"}
+    ))
+    snapshot_bytes: bytes = users_table.export_cache_snapshot()
+
+    # The records of the snapshot are only added to the cache when being used
+    loading_users_table = table_factory(None)
+    self.assertTrue(loading_users_table.load_cache_snapshot(snapshot_bytes=snapshot_bytes))
+    self.assertEqual(0, loading_users_table.cached_records_count)
+    loading_users_table.reset_round_trips_count()
+    self.assertEqual({'fromCache': True, 'value': {"a", "b"}}, loading_users_table.get_field(key_value=first_record_key, field_path='setField'))
+    self.assertEqual(retrieved_float, loading_users_table.get_field(key_value=first_record_key, field_path='floatField'))
+    # The fields found missing from the database by the exporting table are also remembered as missing
+    self.assertEqual({'fromCache': True, 'value': None}, loading_users_table.get_field(
+        key_value=first_record_key, field_path='mapField.{{mapKey}}', query_kwargs={'mapKey': "missing"}
+    ))
+    self.assertEqual(0, loading_users_table.round_trips_count)
+    self.assertEqual(1, loading_users_table.cached_records_count)
+
+    # The records of the loaded snapshot that have not been used yet are exported again
+    reloading_users_table = table_factory(None)
+    self.assertTrue(reloading_users_table.load_cache_snapshot(snapshot_bytes=loading_users_table.export_cache_snapshot()))
+    self.assertEqual({'fromCache': True, 'value': "firstValue"}, reloading_users_table.get_field(key_value=first_record_key, field_path='textField'))
+    self.assertEqual({'fromCache': True, 'value': "secondValue"}, reloading_users_table.get_field(key_value=second_record_key, field_path='textField'))
+    users_table.delete_records(indexes_keys_selectors_list=[{primary_key_name: first_record_key}, {primary_key_name: second_record_key}])
+
+
+def test_snapshot_file_and_records_ttl(
+        self: unittest.TestCase, table_factory: Callable[[Optional[CacheEvictionPolicy]], DynamoDBCachingTable], primary_key_name: str
+):
+    snapshot_file_path: str = os.path.join(tempfile.gettempdir(), f"structnosql-cache-snapshot-{uuid4()}")
+    users_table = table_factory(None)
+    # The snapshot file does not exist yet, like on the first start of a serverless function
+    self.assertFalse(users_table.load_cache_snapshot(file_path=snapshot_file_path))
+
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': "value"}))
+    users_table.export_cache_snapshot(file_path=snapshot_file_path)
+    self.addCleanup(os.remove, snapshot_file_path)
+
+    fresh_users_table = table_factory(CacheEvictionPolicy(record_ttl_seconds=60))
+    self.assertTrue(fresh_users_table.load_cache_snapshot(file_path=snapshot_file_path))
+    self.assertEqual({'fromCache': True, 'value': "value"}, fresh_users_table.get_field(key_value=record_key, field_path='textField'))
+
+    # The age of the snapshot records is counted from their caching by the exporting table
+    expired_users_table = table_factory(CacheEvictionPolicy(record_ttl_seconds=0.000001))
+    self.assertTrue(expired_users_table.load_cache_snapshot(file_path=snapshot_file_path))
+    self.assertEqual({'fromCache': False, 'value': "value"}, expired_users_table.get_field(key_value=record_key, field_path='textField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_records_with_pending_operations_not_exported(
+        self: unittest.TestCase, table_factory: Callable[[Optional[CacheEvictionPolicy]], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(None)
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': "committedValue"}))
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='textField', value_to_set="pendingValue"))
+    snapshot_bytes: bytes = users_table.export_cache_snapshot()
+
+    loading_users_table = table_factory(None)
+    self.assertTrue(loading_users_table.load_cache_snapshot(snapshot_bytes=snapshot_bytes))
+    self.assertEqual({'fromCache': False, 'value': "committedValue"}, loading_users_table.get_field(key_value=record_key, field_path='textField'))
+    self.assertTrue(users_table.commit_operations())
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
@@ -0,0 +1,11 @@
+from typing import Dict, Set
+
+from StructNoSQL import TableDataModel, BaseField
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    textField = BaseField(field_type=str, required=False)
+    floatField = BaseField(field_type=float, required=False)
+    setField = BaseField(field_type=Set[str], required=False)
+    mapField = BaseField(field_type=Dict[str, str], key_name='mapKey', required=False)
@@ -0,0 +1,30 @@
+import unittest
+from typing import Optional
+
+from StructNoSQL import CacheEvictionPolicy
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_cache_snapshots.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.SHARED_CASE_KWARGS = {'self': self, 'table_factory': self.table_factory, 'primary_key_name': 'accountId'}
+
+    @staticmethod
+    def table_factory(cache_eviction_policy: Optional[CacheEvictionPolicy]) -> PlaygroundDynamoDBCachingTable:
+        users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel, cache_eviction_policy=cache_eviction_policy)
+        users_table.debug = True
+        return users_table
+
+    def test_snapshot_records_loaded_when_used(self):
+        from tests.tests_cache_snapshots.cases_shared import test_snapshot_records_loaded_when_used
+        test_snapshot_records_loaded_when_used(**self.SHARED_CASE_KWARGS)
+
+    def test_snapshot_file_and_records_ttl(self):
+        from tests.tests_cache_snapshots.cases_shared import test_snapshot_file_and_records_ttl
+        test_snapshot_file_and_records_ttl(**self.SHARED_CASE_KWARGS)
+
+    def test_records_with_pending_operations_not_exported(self):
+        from tests.tests_cache_snapshots.cases_shared import test_records_with_pending_operations_not_exported
+        test_records_with_pending_operations_not_exported(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,55 @@
+import unittest
+from typing import Callable
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBCachingTable, CacheEvictionPolicy
+
+
+PATH_INDEXED_POLICY = CacheEvictionPolicy(records_layout=CacheEvictionPolicy.PATH_INDEXED_LAYOUT)
+
+
+def test_path_indexed_map_fields(
+        self: unittest.TestCase, table_factory: Callable[[CacheEvictionPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(PATH_INDEXED_POLICY)
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key, 'mapField': {'a': "x"}}))
+    self.assertEqual(
+        {'fromCache': True, 'value': "x"},
+        users_table.get_field(key_value=record_key, field_path='mapField.{{mapKey}}', query_kwargs={'mapKey': 'a'})
+    )
+
+    # The writes of a child are visible from its parents, and the writes of a parent from its (already indexed) children
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='mapField.{{mapKey}}', query_kwargs={'mapKey': 'b'}, value_to_set="y"))
+    self.assertEqual({'fromCache': True, 'value': {'a': "x", 'b': "y"}}, users_table.get_field(key_value=record_key, field_path='mapField'))
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='mapField', value_to_set={'c': "z"}))
+    self.assertEqual(
+        {'fromCache': True, 'value': "z"},
+        users_table.get_field(key_value=record_key, field_path='mapField.{{mapKey}}', query_kwargs={'mapKey': 'c'})
+    )
+    self.assertTrue(users_table.commit_operations())
+    users_table.reset_round_trips_count()
+    self.assertIsNone(users_table.get_field(key_value=record_key, field_path='mapField.{{mapKey}}', query_kwargs={'mapKey': 'a'}))
+    self.assertEqual(1, users_table.round_trips_count)
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_path_indexed_list_items(
+        self: unittest.TestCase, table_factory: Callable[[CacheEvictionPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(PATH_INDEXED_POLICY)
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key, 'listField': ["a", "b"]}))
+    self.assertEqual(
+        {'fromCache': True, 'value': "b"},
+        users_table.get_field(key_value=record_key, field_path='listField.{{listIndex}}', query_kwargs={'listIndex': 1})
+    )
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='listField.{{listIndex}}', query_kwargs={'listIndex': 1}, value_to_set="c"))
+    self.assertEqual({'fromCache': True, 'value': ["a", "c"]}, users_table.get_field(key_value=record_key, field_path='listField'))
+    self.assertTrue(users_table.commit_operations())
+
+    # Removing an item shifts the next items of the list, so the entire list is removed from the cache
+    self.assertTrue(users_table.delete_field(key_value=record_key, field_path='listField.{{listIndex}}', query_kwargs={'listIndex': 0}))
+    self.assertTrue(users_table.commit_operations())
+    self.assertEqual({'fromCache': False, 'value': ["c"]}, users_table.get_field(key_value=record_key, field_path='listField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
@@ -0,0 +1,10 @@
+from typing import Dict, List
+
+from StructNoSQL import TableDataModel, BaseField
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    textField = BaseField(field_type=str, required=False)
+    mapField = BaseField(field_type=Dict[str, str], key_name='mapKey', required=False)
+    listField = BaseField(field_type=List[str], key_name='listIndex', required=False)
@@ -0,0 +1,25 @@
+import unittest
+
+from StructNoSQL import CacheEvictionPolicy
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_cached_records_layout.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.SHARED_CASE_KWARGS = {'self': self, 'table_factory': self.table_factory, 'primary_key_name': 'accountId'}
+
+    @staticmethod
+    def table_factory(cache_eviction_policy: CacheEvictionPolicy) -> PlaygroundDynamoDBCachingTable:
+        users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel, cache_eviction_policy=cache_eviction_policy)
+        users_table.debug = True
+        return users_table
+
+    def test_path_indexed_map_fields(self):
+        from tests.tests_cached_records_layout.cases_shared import test_path_indexed_map_fields
+        test_path_indexed_map_fields(**self.SHARED_CASE_KWARGS)
+
+    def test_path_indexed_list_items(self):
+        from tests.tests_cached_records_layout.cases_shared import test_path_indexed_list_items
+        test_path_indexed_list_items(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,90 @@
+import unittest
+from typing import Union, Dict, List, Any
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBBasicTable, DynamoDBCachingTable, FieldGetter, FieldSetter
+
+
+def _values_types(value: Any) -> Any:
+    # The values equality does not check the types of the numbers (since 1 == 1.0 == Decimal(1))
+    if isinstance(value, dict):
+        return {key: _values_types(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [_values_types(item) for item in value]
+    elif isinstance(value, (set, frozenset)):
+        return sorted(type(item).__name__ for item in value)
+    return type(value).__name__
+
+
+def _run_operations_scenario(
+        users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable], primary_key_name: str,
+        records_keys: List[str], type_value: str, is_caching: bool
+) -> List[Any]:
+    users_table.reset_round_trips_count()
+    results: List[Any] = []
+
+    records_data: List[dict] = [{
+        primary_key_name: record_key, 'type': type_value,
+        'floatField': 0.1 + i, 'intField': 42 + i, 'boolField': i % 2 == 0,
+        'stringsSetField': {"one", "two", f"record{i}"},
+        'containersDict': {'containerOne': {'textField': f"text{i}", 'numbersList': [1, 2, 3]}}
+    } for i, record_key in enumerate(records_keys)]
+    results.append(users_table.put_records(records_dicts_data=records_data[1:]))
+    results.append(users_table.put_record(record_dict_data=records_data[0]))
+    if is_caching is True:
+        users_table.clear_cached_data()
+
+    getters: Dict[str, FieldGetter] = {
+        field_key: FieldGetter(field_path=field_key)
+        for field_key in ['floatField', 'intField', 'boolField', 'stringsSetField', 'containersDict']
+    }
+    results.append(users_table.get_multiple_fields(key_value=records_keys[0], getters=getters))
+    results.append(users_table.get_multiple_records_fields(keys_values=records_keys, getters=getters))
+    results.append(users_table.update_field_return_old(key_value=records_keys[0], field_path='floatField', value_to_set=3.14))
+    results.append(users_table.update_multiple_fields(key_value=records_keys[0], setters=[
+        FieldSetter(field_path='containersDict.{{containerKey}}.textField', query_kwargs={'containerKey': "containerTwo"}, value_to_set="textTwo"),
+        FieldSetter(field_path='intField', value_to_set=0),
+    ]))
+    if is_caching is True:
+        results.append(users_table.commit_operations())
+        users_table.clear_cached_data()
+
+    query_results, query_metadata = users_table.query_field(
+        index_name='type', key_value=type_value, field_path='(floatField, intField, containersDict)'
+    )
+    results.append(query_results)
+    results.append(users_table.remove_field(
+        key_value=records_keys[0], field_path='containersDict.{{containerKey}}', query_kwargs={'containerKey': "containerOne"}
+    ))
+    if is_caching is True:
+        results.append(users_table.commit_operations())
+        users_table.clear_cached_data()
+    results.append(users_table.remove_record(indexes_keys_selectors={primary_key_name: records_keys[0]}))
+    results.append(users_table.delete_records(indexes_keys_selectors_list=[
+        {primary_key_name: record_key} for record_key in records_keys[1:]
+    ]))
+    results.append(users_table.get_field(key_value=records_keys[1], field_path='floatField'))
+    results.append(users_table.round_trips_count)
+    return results
+
+
+def test_client_engine_results_match_resource_engine(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        resource_users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    self.assertEqual(DynamoDBBasicTable.CLIENT_ENGINE, users_table.dynamodb_client.engine)
+    records_keys: List[str] = [f"recordId_{uuid4()}" for _ in range(3)]
+    type_value: str = f"type_{uuid4()}"
+
+    # Both engines must return the exact same values (including the int and float types of the numbers), with the same number of requests
+    resource_engine_results: List[Any] = _run_operations_scenario(
+        users_table=resource_users_table, primary_key_name=primary_key_name,
+        records_keys=records_keys, type_value=type_value, is_caching=is_caching
+    )
+    client_engine_results: List[Any] = _run_operations_scenario(
+        users_table=users_table, primary_key_name=primary_key_name,
+        records_keys=records_keys, type_value=type_value, is_caching=is_caching
+    )
+    self.assertEqual(resource_engine_results, client_engine_results)
+    self.assertEqual(_values_types(resource_engine_results), _values_types(client_engine_results))
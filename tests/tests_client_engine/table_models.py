@@ -0,0 +1,16 @@
+from typing import Dict, List, Set
+
+from StructNoSQL import TableDataModel, BaseField, MapModel
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    type = BaseField(field_type=str, required=False)
+    floatField = BaseField(field_type=float, required=False)
+    intField = BaseField(field_type=int, required=False)
+    boolField = BaseField(field_type=bool, required=False)
+    stringsSetField = BaseField(field_type=Set[str], required=False)
+    class ContainerModel(MapModel):
+        textField = BaseField(field_type=str, required=False)
+        numbersList = BaseField(field_type=List[int], required=False)
+    containersDict = BaseField(field_type=Dict[str, ContainerModel], key_name='containerKey', required=False)
@@ -0,0 +1,18 @@
+import unittest
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBBasicTable
+from tests.tests_client_engine.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBBasicTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.users_table = PlaygroundDynamoDBBasicTable(data_model=DynamoDBTableModel, engine=PlaygroundDynamoDBBasicTable.CLIENT_ENGINE)
+        self.resource_users_table = PlaygroundDynamoDBBasicTable(data_model=DynamoDBTableModel, engine=PlaygroundDynamoDBBasicTable.RESOURCE_ENGINE)
+
+        self.DYNAMODB_CASE_KWARGS = {'self': self, 'users_table': self.users_table, 'is_caching': False}
+        self.SHARED_CASE_KWARGS = {**self.DYNAMODB_CASE_KWARGS, 'primary_key_name': 'accountId'}
+
+    def test_client_engine_results_match_resource_engine(self):
+        from tests.tests_client_engine.cases_shared import test_client_engine_results_match_resource_engine
+        test_client_engine_results_match_resource_engine(**self.SHARED_CASE_KWARGS, resource_users_table=self.resource_users_table)
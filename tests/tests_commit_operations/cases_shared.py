@@ -0,0 +1,91 @@
+import unittest
+from typing import List, Optional
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBCachingTable, CommitOperationsReport
+from tests.components.throttling_table_stand_in import install_throttling_table_resource_stand_in
+
+
+def _put_records(users_table: DynamoDBCachingTable, primary_key_name: str, num_records: int) -> List[str]:
+    records_keys: List[str] = [f"recordId_{uuid4()}" for _ in range(num_records)]
+    for record_key in records_keys:
+        put_record_success: bool = users_table.put_record(record_dict_data={
+            primary_key_name: record_key, 'textField': "initialText", 'numberField': 1
+        })
+        if put_record_success is not True:
+            raise Exception(f"Failed to put the record {record_key}")
+    return records_keys
+
+def _get_from_database(users_table: DynamoDBCachingTable, record_key: str, field_path: str):
+    users_table.clear_cached_data_for_record(record_primary_key=record_key)
+    retrieved_item: Optional[dict] = users_table.get_field(key_value=record_key, field_path=field_path)
+    # The missing fields are not wrapped in a debug item
+    return retrieved_item['value'] if retrieved_item is not None else None
+
+
+def test_setters_and_removers_committed_in_single_request(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    record_key: str = _put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=1)[0]
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='textField', value_to_set="updatedText"))
+    self.assertTrue(users_table.delete_field(key_value=record_key, field_path='numberField'))
+
+    users_table.reset_round_trips_count()
+    self.assertTrue(users_table.commit_operations())
+    self.assertEqual(1, users_table.round_trips_count)
+    self.assertFalse(users_table.has_pending_operations())
+
+    self.assertEqual("updatedText", _get_from_database(users_table=users_table, record_key=record_key, field_path='textField'))
+    self.assertIsNone(_get_from_database(users_table=users_table, record_key=record_key, field_path='numberField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_records_committed_concurrently_with_report(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    records_keys: List[str] = _put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=8)
+    for i_record, record_key in enumerate(records_keys):
+        self.assertTrue(users_table.update_field(key_value=record_key, field_path='numberField', value_to_set=i_record))
+        self.assertTrue(users_table.delete_field(key_value=record_key, field_path='textField'))
+
+    users_table.reset_round_trips_count()
+    commit_report: CommitOperationsReport = users_table.commit_operations_with_report()
+    self.assertEqual({record_key: True for record_key in records_keys}, commit_report.records_successes)
+    self.assertTrue(commit_report.success)
+    # One request per record, instead of one request for the setters and another for the removers
+    self.assertEqual(len(records_keys), users_table.round_trips_count)
+
+    for i_record, record_key in enumerate(records_keys):
+        self.assertEqual(i_record, _get_from_database(users_table=users_table, record_key=record_key, field_path='numberField'))
+        self.assertIsNone(_get_from_database(users_table=users_table, record_key=record_key, field_path='textField'))
+    users_table.delete_records(indexes_keys_selectors_list=[{primary_key_name: record_key} for record_key in records_keys])
+
+
+def test_overlapping_setters_and_removers_committed_separately(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    record_key: str = _put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=1)[0]
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='mapField', value_to_set={'first': "a", 'second': "b"}))
+    self.assertTrue(users_table.delete_field(key_value=record_key, field_path='mapField.{{mapKey}}', query_kwargs={'mapKey': 'first'}))
+
+    # DynamoDB rejects the update expressions with overlapping paths, so the setters are sent before the removers
+    users_table.reset_round_trips_count()
+    self.assertTrue(users_table.commit_operations())
+    self.assertEqual(2, users_table.round_trips_count)
+    self.assertEqual({'second': "b"}, _get_from_database(users_table=users_table, record_key=record_key, field_path='mapField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_failed_records_operations_kept_pending(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    record_key: str = _put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=1)[0]
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='textField', value_to_set="updatedText"))
+    self.assertTrue(users_table.delete_field(key_value=record_key, field_path='numberField'))
+
+    table_resource_stand_in = install_throttling_table_resource_stand_in(table_client=users_table, errors_schedule=['ValidationException'] * 10)
+    commit_report: CommitOperationsReport = users_table.commit_operations_with_report()
+    self.assertFalse(commit_report.success)
+    self.assertEqual([record_key], commit_report.failed_records_keys)
+    self.assertTrue(users_table.has_pending_update_operations())
+    self.assertTrue(users_table.has_pending_remove_operations())
+
+    # The operations of the failed record are sent again by the next commit
+    table_resource_stand_in.errors_schedule = []
+    self.assertTrue(users_table.commit_operations())
+    self.assertFalse(users_table.has_pending_operations())
+    self.assertEqual("updatedText", _get_from_database(users_table=users_table, record_key=record_key, field_path='textField'))
+    self.assertIsNone(_get_from_database(users_table=users_table, record_key=record_key, field_path='numberField'))
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
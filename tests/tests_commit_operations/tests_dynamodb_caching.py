@@ -0,0 +1,28 @@
+import unittest
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_commit_operations.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel)
+        self.users_table.debug = True
+        self.SHARED_CASE_KWARGS = {'self': self, 'users_table': self.users_table, 'primary_key_name': 'accountId'}
+
+    def test_setters_and_removers_committed_in_single_request(self):
+        from tests.tests_commit_operations.cases_shared import test_setters_and_removers_committed_in_single_request
+        test_setters_and_removers_committed_in_single_request(**self.SHARED_CASE_KWARGS)
+
+    def test_records_committed_concurrently_with_report(self):
+        from tests.tests_commit_operations.cases_shared import test_records_committed_concurrently_with_report
+        test_records_committed_concurrently_with_report(**self.SHARED_CASE_KWARGS)
+
+    def test_overlapping_setters_and_removers_committed_separately(self):
+        from tests.tests_commit_operations.cases_shared import test_overlapping_setters_and_removers_committed_separately
+        test_overlapping_setters_and_removers_committed_separately(**self.SHARED_CASE_KWARGS)
+
+    def test_failed_records_operations_kept_pending(self):
+        from tests.tests_commit_operations.cases_shared import test_failed_records_operations_kept_pending
+        test_failed_records_operations_kept_pending(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,52 @@
+import unittest
+
+from StructNoSQL import TableDataModel, BaseField, PrimaryIndex
+from StructNoSQL.base_tables.base_table import BaseTable
+from tests.components.playground_table_clients import PlaygroundDynamoDBBasicTable, PlaygroundDynamoDBCachingTable
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    simpleField = BaseField(field_type=str, required=False)
+
+
+class TestsCompiledSchemas(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+
+    @staticmethod
+    def _make_base_table(auto_leading_key=None) -> BaseTable:
+        primary_index = PrimaryIndex(hash_key_name='accountId', hash_key_variable_python_type=str)
+        return BaseTable(data_model=DynamoDBTableModel, primary_index=primary_index, auto_leading_key=auto_leading_key)
+
+    def test_tables_of_same_model_share_compiled_schema(self):
+        BaseTable.clear_compiled_schemas()
+        basic_table = PlaygroundDynamoDBBasicTable(data_model=DynamoDBTableModel)
+        caching_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel)
+        self.assertIs(basic_table.fields_switch, caching_table.fields_switch)
+        self.assertIs(basic_table.model, caching_table.model)
+        self.assertIs(basic_table.model_virtual_map_field, caching_table.model_virtual_map_field)
+
+        # Clearing the compiled schemas makes the next tables of the model compile their schema again
+        BaseTable.clear_compiled_schemas()
+        recompiled_table = PlaygroundDynamoDBBasicTable(data_model=DynamoDBTableModel)
+        self.assertIsNot(basic_table.fields_switch, recompiled_table.fields_switch)
+        self.assertEqual(set(basic_table.fields_switch.keys()), set(recompiled_table.fields_switch.keys()))
+
+    def test_auto_leading_key_compiled_in_separate_schemas(self):
+        BaseTable.clear_compiled_schemas()
+        table_without_leading_key = self._make_base_table()
+        table_with_leading_key = self._make_base_table(auto_leading_key='tenantA#')
+        other_table_with_leading_key = self._make_base_table(auto_leading_key='tenantA#')
+        table_with_other_leading_key = self._make_base_table(auto_leading_key='tenantB#')
+        self.assertIs(table_with_leading_key.fields_switch, other_table_with_leading_key.fields_switch)
+        self.assertIsNot(table_without_leading_key.fields_switch, table_with_leading_key.fields_switch)
+        self.assertIsNot(table_with_leading_key.fields_switch, table_with_other_leading_key.fields_switch)
+
+        # The transformers of the primary key of a table are never added to the fields of the tables of other leading keys
+        self.assertEqual(0, len(table_without_leading_key.fields_switch['accountId'].write_transformers))
+        self.assertEqual(1, len(table_with_leading_key.fields_switch['accountId'].write_transformers))
+        self.assertEqual(1, len(table_with_other_leading_key.fields_switch['accountId'].write_transformers))
+        self.assertEqual('tenantA#id', table_with_leading_key.fields_switch['accountId'].write_transformers[0]('id'))
+        self.assertEqual('tenantB#id', table_with_other_leading_key.fields_switch['accountId'].write_transformers[0]('id'))
+        self.assertIsNot(table_without_leading_key.model, table_with_leading_key.model)
@@ -0,0 +1,131 @@
+import threading
+import time
+import unittest
+from typing import Union, Optional, Any, Callable, Dict, Generator, List, Set
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBBasicTable, DynamoDBCachingTable, ConnectionPoolConfig, FieldRemover
+from StructNoSQL.tables_clients.backend.operations import DynamoDBRequest, ConcurrentOperations
+
+
+class ConcurrencyTrackingTableResourceStandIn:
+    # Stand-in of the Table resource of a table client, that records the max number of its requests executed at the same time
+    def __init__(self, table_resource: Any):
+        self._table_resource = table_resource
+        self._lock = threading.Lock()
+        self.num_requests_in_progress = 0
+        self.max_num_requests_in_progress = 0
+        self.requests_threads_idents: Set[int] = set()
+
+    def __getattr__(self, item: str):
+        real_function = getattr(self._table_resource, item)
+
+        def tracked_function(**kwargs):
+            with self._lock:
+                self.num_requests_in_progress += 1
+                self.max_num_requests_in_progress = max(self.max_num_requests_in_progress, self.num_requests_in_progress)
+                self.requests_threads_idents.add(threading.get_ident())
+            try:
+                time.sleep(0.01)
+                return real_function(**kwargs)
+            finally:
+                with self._lock:
+                    self.num_requests_in_progress -= 1
+        return tracked_function
+
+
+def test_database_client_shared_per_connection_pool_config(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        table_factory: Callable[[Optional[ConnectionPoolConfig]], Union[DynamoDBBasicTable, DynamoDBCachingTable]]
+):
+    other_table_with_default_config = table_factory(None)
+    self.assertIs(users_table.dynamodb_client.dynamodb, other_table_with_default_config.dynamodb_client.dynamodb)
+    self.assertEqual(
+        ConnectionPoolConfig().max_pool_connections,
+        users_table.dynamodb_client.dynamodb.meta.client.meta.config.max_pool_connections
+    )
+
+    custom_connection_pool_config = ConnectionPoolConfig(max_pool_connections=4, read_timeout=3.0)
+    table_with_custom_config = table_factory(custom_connection_pool_config)
+    self.assertIsNot(users_table.dynamodb_client.dynamodb, table_with_custom_config.dynamodb_client.dynamodb)
+    table_client_config = table_with_custom_config.dynamodb_client.dynamodb.meta.client.meta.config
+    self.assertEqual(4, table_client_config.max_pool_connections)
+    self.assertEqual(3.0, table_client_config.read_timeout)
+    # The connection pool configs are compared by value
+    other_table_with_custom_config = table_factory(ConnectionPoolConfig(max_pool_connections=4, read_timeout=3.0))
+    self.assertIs(table_with_custom_config.dynamodb_client.dynamodb, other_table_with_custom_config.dynamodb_client.dynamodb)
+
+
+def test_concurrent_removers_bounded_by_connection_pool(
+        self: unittest.TestCase, table_factory: Callable[[Optional[ConnectionPoolConfig]], Union[DynamoDBBasicTable, DynamoDBCachingTable]],
+        primary_key_name: str, is_caching: bool
+):
+    # The fan-out of the concurrent removers is bounded by the size of the connection pool, and must still complete all the removers
+    users_table = table_factory(ConnectionPoolConfig(max_pool_connections=2))
+    if is_caching is True:
+        users_table.debug = True
+    record_key: str = f"recordId_{uuid4()}"
+    put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': "textValue"})
+    self.assertTrue(put_record_success)
+
+    removers: Dict[str, FieldRemover] = {f"remover{i}": FieldRemover(field_path='textField') for i in range(6)}
+    removed_values: Dict[str, Any] = users_table.remove_multiple_fields(key_value=record_key, removers=removers)
+    self.assertEqual(set(removers.keys()), set(removed_values.keys()))
+    if is_caching is not True:
+        # Only one of the concurrent removers could have retrieved the value before it was removed
+        self.assertIn("textValue", removed_values.values())
+
+    delete_record_success: bool = users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key})
+    self.assertTrue(delete_record_success)
+
+
+def test_nested_concurrent_operations_bounded_by_connection_pool(
+        self: unittest.TestCase, table_factory: Callable[[Optional[ConnectionPoolConfig]], Union[DynamoDBBasicTable, DynamoDBCachingTable]],
+        primary_key_name: str
+):
+    # The nested concurrent operations share the threads and the requests bound of the table, instead of multiplying them
+    users_table = table_factory(ConnectionPoolConfig(max_pool_connections=4))
+    dynamodb_client = users_table.dynamodb_client
+    table_resource_stand_in = ConcurrencyTrackingTableResourceStandIn(table_resource=dynamodb_client._table_resource)
+    dynamodb_client._table_resource = table_resource_stand_in
+
+    def get_item_operation() -> Generator[Any, Any, bool]:
+        response: dict = yield DynamoDBRequest(method_name='get_item', kwargs={'Key': {primary_key_name: f"recordId_{uuid4()}"}})
+        return response is not None
+
+    def nested_operation() -> Generator[Any, Any, List[bool]]:
+        return (yield ConcurrentOperations(operations=[get_item_operation() for _ in range(8)], max_concurrency=8))
+
+    def operation() -> Generator[Any, Any, List[List[bool]]]:
+        return (yield ConcurrentOperations(operations=[nested_operation() for _ in range(8)], max_concurrency=8))
+
+    operations_results: List[List[bool]] = dynamodb_client.execute_operation(operation())
+    self.assertEqual([[True] * 8] * 8, operations_results)
+    self.assertLessEqual(table_resource_stand_in.max_num_requests_in_progress, 4)
+    # The threads of the pool of the table, and the thread of the test itself
+    self.assertLessEqual(len(table_resource_stand_in.requests_threads_idents), 5)
+
+
+def test_nested_operation_exception_thrown_into_parent_operation(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable]
+):
+    def failing_operation() -> Generator[Any, Any, None]:
+        yield None
+        raise ValueError("Nested operation failure")
+
+    def operation() -> Generator[Any, Any, List[str]]:
+        caught_exceptions_messages: List[str] = []
+        try:
+            yield failing_operation()
+        except ValueError as e:
+            caught_exceptions_messages.append(str(e))
+        try:
+            yield ConcurrentOperations(operations=[failing_operation(), failing_operation()])
+        except ValueError as e:
+            caught_exceptions_messages.append(str(e))
+        return caught_exceptions_messages
+
+    self.assertEqual(
+        ["Nested operation failure", "Nested operation failure"],
+        users_table.dynamodb_client.execute_operation(operation())
+    )
@@ -0,0 +1,35 @@
+import unittest
+from typing import Optional
+
+from StructNoSQL import ConnectionPoolConfig
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_connection_pool.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel)
+        self.users_table.debug = True
+
+    @staticmethod
+    def table_factory(connection_pool_config: Optional[ConnectionPoolConfig]) -> PlaygroundDynamoDBCachingTable:
+        return PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel, connection_pool_config=connection_pool_config)
+
+    def test_database_client_shared_per_connection_pool_config(self):
+        from tests.tests_connection_pool.cases_shared import test_database_client_shared_per_connection_pool_config
+        test_database_client_shared_per_connection_pool_config(self=self, users_table=self.users_table, table_factory=self.table_factory)
+
+    def test_concurrent_removers_bounded_by_connection_pool(self):
+        from tests.tests_connection_pool.cases_shared import test_concurrent_removers_bounded_by_connection_pool
+        test_concurrent_removers_bounded_by_connection_pool(
+            self=self, table_factory=self.table_factory, primary_key_name='accountId', is_caching=True
+        )
+
+    def test_nested_concurrent_operations_bounded_by_connection_pool(self):
+        from tests.tests_connection_pool.cases_shared import test_nested_concurrent_operations_bounded_by_connection_pool
+        test_nested_concurrent_operations_bounded_by_connection_pool(self=self, table_factory=self.table_factory, primary_key_name='accountId')
+
+    def test_nested_operation_exception_thrown_into_parent_operation(self):
+        from tests.tests_connection_pool.cases_shared import test_nested_operation_exception_thrown_into_parent_operation
+        test_nested_operation_exception_thrown_into_parent_operation(self=self, users_table=self.users_table)
@@ -0,0 +1,157 @@
+import math
+import unittest
+from typing import Union, Optional, Dict, Any, List
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBBasicTable, DynamoDBCachingTable, FieldSetter, FieldRemover
+from StructNoSQL.tables_clients.backend import EXPRESSION_MAX_BYTES_SIZE
+from tests.components.throttling_table_stand_in import install_throttling_table_resource_stand_in
+
+
+def _expected_num_requests(action_keyword: str, expressions_clauses: List[str]) -> int:
+    # Small clauses are expected to be packed as tightly as possible in the update expressions of the requests
+    total_expressions_bytes_size: int = sum(len(f"{clause}, ".encode('utf-8')) for clause in expressions_clauses)
+    return math.ceil((len(f"{action_keyword} ") + total_expressions_bytes_size) / EXPRESSION_MAX_BYTES_SIZE)
+
+
+def test_setters_packed_in_minimal_requests(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    record_key: str = f"recordId_{uuid4()}"
+    put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: record_key, 'textsDict': {}})
+    self.assertTrue(put_record_success)
+
+    num_setters = 300
+    texts_values: Dict[str, str] = {f"text{i:03d}": f"textValue_{uuid4()}" for i in range(num_setters)}
+    users_table.reset_round_trips_count()
+    update_success: bool = users_table.update_multiple_fields(key_value=record_key, setters=[
+        FieldSetter(field_path='textsDict.{{textKey}}', query_kwargs={'textKey': text_key}, value_to_set=text_value)
+        for text_key, text_value in texts_values.items()
+    ])
+    self.assertTrue(update_success)
+    if is_caching is True:
+        self.assertTrue(users_table.commit_operations())
+        users_table.clear_cached_data()
+
+    expected_num_requests: int = _expected_num_requests(action_keyword="SET", expressions_clauses=[
+        # The 'textsDict' key is shared by all the setters, and gets the first attribute name placeholder
+        f"#k0.#k{i + 1} = :item{i}" for i in range(num_setters)
+    ])
+    self.assertGreater(expected_num_requests, 1)
+    self.assertEqual(expected_num_requests, users_table.round_trips_count)
+
+    retrieved_texts: Optional[Any] = users_table.get_field(key_value=record_key, field_path='textsDict')
+    self.assertEqual((
+        texts_values if is_caching is not True else
+        {'fromCache': False, 'value': texts_values}
+    ), retrieved_texts)
+
+    delete_record_success: bool = users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key})
+    self.assertTrue(delete_record_success)
+
+
+def test_removers_packed_in_minimal_requests(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    num_removers = 400
+    texts_values: Dict[str, str] = {f"text{i:03d}": f"textValue_{uuid4()}" for i in range(num_removers)}
+    record_key: str = f"recordId_{uuid4()}"
+    put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: record_key, 'textsDict': texts_values})
+    self.assertTrue(put_record_success)
+
+    users_table.reset_round_trips_count()
+    delete_success: bool = users_table.grouped_delete_multiple_fields(key_value=record_key, removers=[
+        FieldRemover(field_path='textsDict.{{textKey}}', query_kwargs={'textKey': text_key})
+        for text_key in texts_values.keys()
+    ])
+    self.assertTrue(delete_success)
+    if is_caching is True:
+        self.assertTrue(users_table.commit_operations())
+        users_table.clear_cached_data()
+
+    expected_num_requests: int = _expected_num_requests(action_keyword="REMOVE", expressions_clauses=[
+        f"#k0.#k{i + 1}" for i in range(num_removers)
+    ])
+    self.assertGreater(expected_num_requests, 1)
+    self.assertEqual(expected_num_requests, users_table.round_trips_count)
+
+    retrieved_texts: Optional[Any] = users_table.get_field(key_value=record_key, field_path='textsDict')
+    self.assertEqual(({} if is_caching is not True else {'fromCache': False, 'value': {}}), retrieved_texts)
+
+    delete_record_success: bool = users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key})
+    self.assertTrue(delete_record_success)
+
+
+def test_removers_with_failed_request(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    num_removers = 400
+    texts_values: Dict[str, str] = {f"text{i:03d}": f"textValue_{uuid4()}" for i in range(num_removers)}
+    record_key: str = f"recordId_{uuid4()}"
+    put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: record_key, 'textsDict': texts_values})
+    self.assertTrue(put_record_success)
+
+    # Only the first of the packed requests fails, which fails the entire removal
+    table_resource_stand_in = install_throttling_table_resource_stand_in(table_client=users_table, errors_schedule=["AccessDeniedException"])
+    delete_success: bool = users_table.grouped_delete_multiple_fields(key_value=record_key, removers=[
+        FieldRemover(field_path='textsDict.{{textKey}}', query_kwargs={'textKey': text_key})
+        for text_key in texts_values.keys()
+    ])
+    if is_caching is True:
+        self.assertTrue(delete_success)
+        self.assertFalse(users_table.commit_operations())
+        # The removers of the failed commit are kept pending, and sent again by the next commit
+        self.assertTrue(users_table.has_pending_operations())
+        self.assertTrue(users_table.commit_operations())
+        users_table.clear_cached_data()
+    else:
+        self.assertFalse(delete_success)
+    self.assertGreater(table_resource_stand_in.num_requests, 1)
+    users_table.dynamodb_client._table_resource = table_resource_stand_in._table_resource
+
+    retrieved_texts: Optional[Any] = users_table.get_field(key_value=record_key, field_path='textsDict')
+    if is_caching is True:
+        self.assertEqual({'fromCache': False, 'value': {}}, retrieved_texts)
+    else:
+        # Only the removers of the requests that succeeded have been removed
+        self.assertGreater(len(retrieved_texts), 0)
+        self.assertLess(len(retrieved_texts), num_removers)
+
+    delete_record_success: bool = users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key})
+    self.assertTrue(delete_record_success)
+
+
+def test_overlapping_setters_applied_in_order(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    record_key: str = f"recordId_{uuid4()}"
+    put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: record_key})
+    self.assertTrue(put_record_success)
+
+    # Many small setters are packed with the child setters, where as the parent setter is the biggest clause
+    num_setters = 300
+    texts_values: Dict[str, str] = {f"text{i:03d}": f"textValue_{uuid4()}" for i in range(num_setters)}
+    parent_texts_values: Dict[str, str] = {'parentText': "x" * 5000}
+    update_success: bool = users_table.update_multiple_fields(key_value=record_key, setters=[
+        FieldSetter(field_path='textsDict', value_to_set=parent_texts_values),
+        *[
+            FieldSetter(field_path='textsDict.{{textKey}}', query_kwargs={'textKey': text_key}, value_to_set=text_value)
+            for text_key, text_value in texts_values.items()
+        ]
+    ])
+    self.assertTrue(update_success)
+    if is_caching is True:
+        self.assertTrue(users_table.commit_operations())
+        users_table.clear_cached_data()
+
+    # The child setters are applied after their parent setter, which does not override them
+    retrieved_texts: Optional[Any] = users_table.get_field(key_value=record_key, field_path='textsDict')
+    expected_texts: Dict[str, str] = {**parent_texts_values, **texts_values}
+    self.assertEqual((expected_texts if is_caching is not True else {'fromCache': False, 'value': expected_texts}), retrieved_texts)
+
+    delete_record_success: bool = users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key})
+    self.assertTrue(delete_record_success)
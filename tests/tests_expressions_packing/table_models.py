@@ -0,0 +1,8 @@
+from typing import Dict
+
+from StructNoSQL import TableDataModel, BaseField
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    textsDict = BaseField(field_type=Dict[str, str], key_name='textKey', required=False)
@@ -0,0 +1,30 @@
+import unittest
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_expressions_packing.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel)
+        self.users_table.debug = True
+
+        self.DYNAMODB_CASE_KWARGS = {'self': self, 'users_table': self.users_table, 'is_caching': True}
+        self.SHARED_CASE_KWARGS = {**self.DYNAMODB_CASE_KWARGS, 'primary_key_name': 'accountId'}
+
+    def test_setters_packed_in_minimal_requests(self):
+        from tests.tests_expressions_packing.cases_shared import test_setters_packed_in_minimal_requests
+        test_setters_packed_in_minimal_requests(**self.SHARED_CASE_KWARGS)
+
+    def test_removers_packed_in_minimal_requests(self):
+        from tests.tests_expressions_packing.cases_shared import test_removers_packed_in_minimal_requests
+        test_removers_packed_in_minimal_requests(**self.SHARED_CASE_KWARGS)
+
+    def test_removers_with_failed_request(self):
+        from tests.tests_expressions_packing.cases_shared import test_removers_with_failed_request
+        test_removers_with_failed_request(**self.SHARED_CASE_KWARGS)
+
+    def test_overlapping_setters_applied_in_order(self):
+        from tests.tests_expressions_packing.cases_shared import test_overlapping_setters_applied_in_order
+        test_overlapping_setters_applied_in_order(**self.SHARED_CASE_KWARGS)
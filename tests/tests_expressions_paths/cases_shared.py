@@ -0,0 +1,82 @@
+import unittest
+from typing import Union, Optional, Dict, Any, List
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBBasicTable, DynamoDBCachingTable, FieldGetter, FieldSetter, FieldRemover
+from StructNoSQL.models import DatabasePathElement, FieldPathSetter
+from StructNoSQL.tables_clients.backend.dynamodb_core import DynamoDbCoreAdapter
+from StructNoSQL.tables_clients.backend.expressions_paths import ExpressionPathsBuilder
+
+
+def _project_field_path_elements(project_id: str, field_key: str) -> List[DatabasePathElement]:
+    return [
+        DatabasePathElement(element_key='projects', default_type=dict),
+        DatabasePathElement(element_key=project_id, default_type=dict),
+        DatabasePathElement(element_key=field_key, default_type=str)
+    ]
+
+
+def test_expressions_share_element_keys_placeholders(self: unittest.TestCase):
+    projection_kwargs: dict = DynamoDbCoreAdapter._fields_paths_elements_to_expressions(fields_path_elements=[
+        _project_field_path_elements(project_id="projectA", field_key='name'),
+        _project_field_path_elements(project_id="projectA", field_key='description'),
+        _project_field_path_elements(project_id="projectB", field_key='name'),
+    ])
+    self.assertEqual("#k0.#k1.#k2, #k0.#k1.#k3, #k0.#k4.#k2", projection_kwargs['ProjectionExpression'])
+    self.assertEqual({
+        '#k0': 'projects', '#k1': "projectA", '#k2': 'name', '#k3': 'description', '#k4': "projectB"
+    }, projection_kwargs['ExpressionAttributeNames'])
+
+    # The setters and the removers of a same request share their placeholders, but each clause only has the attribute
+    # names that it uses, since the clauses can be split in multiple requests, and DynamoDB rejects unused names.
+    paths_builder = ExpressionPathsBuilder()
+    setters_clauses = DynamoDbCoreAdapter._make_setters_clauses(setters=[FieldPathSetter(
+        field_path_elements=_project_field_path_elements(project_id="projectA", field_key='name'), value_to_set="nameA"
+    )], paths_builder=paths_builder)
+    removers_clauses = DynamoDbCoreAdapter._make_removers_clauses(targets_path_elements=[
+        _project_field_path_elements(project_id="projectB", field_key='name')
+    ], paths_builder=paths_builder)
+    self.assertEqual("#k0.#k1.#k2 = :item0", setters_clauses[0].expression)
+    self.assertEqual({'#k0': 'projects', '#k1': "projectA", '#k2': 'name'}, setters_clauses[0].attribute_names)
+    self.assertEqual("#k0.#k3.#k2", removers_clauses[0].expression)
+    self.assertEqual({'#k0': 'projects', '#k3': "projectB", '#k2': 'name'}, removers_clauses[0].attribute_names)
+
+
+def test_fields_with_shared_element_keys(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    record_key: str = f"recordId_{uuid4()}"
+    put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: record_key, 'projects': {
+        'projectA': {'name': "nameA", 'description': "descriptionA"}, 'projectB': {'name': "nameB"}
+    }})
+    self.assertTrue(put_record_success)
+
+    update_success: bool = users_table.update_multiple_fields(key_value=record_key, setters=[
+        FieldSetter(field_path='projects.{{projectId}}.name', query_kwargs={'projectId': "projectA"}, value_to_set="newNameA"),
+        FieldSetter(field_path='projects.{{projectId}}.description', query_kwargs={'projectId': "projectB"}, value_to_set="descriptionB"),
+    ])
+    self.assertTrue(update_success)
+    removed_fields: Dict[str, Optional[Any]] = users_table.remove_multiple_fields(key_value=record_key, removers={
+        'descriptionA': FieldRemover(field_path='projects.{{projectId}}.description', query_kwargs={'projectId': "projectA"})
+    })
+    self.assertEqual(({'descriptionA': "descriptionA"} if is_caching is not True else {
+        'descriptionA': {'fromCache': True, 'value': "descriptionA"}
+    }), removed_fields)
+    if is_caching is True:
+        self.assertTrue(users_table.commit_operations())
+        users_table.clear_cached_data()
+
+    retrieved_fields: Optional[dict] = users_table.get_multiple_fields(key_value=record_key, getters={
+        'nameA': FieldGetter(field_path='projects.{{projectId}}.name', query_kwargs={'projectId': "projectA"}),
+        'descriptionA': FieldGetter(field_path='projects.{{projectId}}.description', query_kwargs={'projectId': "projectA"}),
+        'nameB': FieldGetter(field_path='projects.{{projectId}}.name', query_kwargs={'projectId': "projectB"}),
+        'descriptionB': FieldGetter(field_path='projects.{{projectId}}.description', query_kwargs={'projectId': "projectB"}),
+    })
+    expected_fields: Dict[str, Optional[str]] = {'nameA': "newNameA", 'descriptionA': None, 'nameB': "nameB", 'descriptionB': "descriptionB"}
+    self.assertEqual((expected_fields if is_caching is not True else {
+        field_key: {'fromCache': False, 'value': field_value} for field_key, field_value in expected_fields.items()
+    }), retrieved_fields)
+
+    delete_record_success: bool = users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key})
+    self.assertTrue(delete_record_success)
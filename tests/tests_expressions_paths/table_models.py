@@ -0,0 +1,11 @@
+from typing import Dict
+
+from StructNoSQL import TableDataModel, BaseField, MapModel
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    class ProjectModel(MapModel):
+        name = BaseField(field_type=str, required=False)
+        description = BaseField(field_type=str, required=False)
+    projects = BaseField(field_type=Dict[str, ProjectModel], key_name='projectId', required=False)
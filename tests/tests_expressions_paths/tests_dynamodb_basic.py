@@ -0,0 +1,21 @@
+import unittest
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBBasicTable
+from tests.tests_expressions_paths.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBBasicTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.users_table = PlaygroundDynamoDBBasicTable(data_model=DynamoDBTableModel)
+
+        self.DYNAMODB_CASE_KWARGS = {'self': self, 'users_table': self.users_table, 'is_caching': False}
+        self.SHARED_CASE_KWARGS = {**self.DYNAMODB_CASE_KWARGS, 'primary_key_name': 'accountId'}
+
+    def test_expressions_share_element_keys_placeholders(self):
+        from tests.tests_expressions_paths.cases_shared import test_expressions_share_element_keys_placeholders
+        test_expressions_share_element_keys_placeholders(self=self)
+
+    def test_fields_with_shared_element_keys(self):
+        from tests.tests_expressions_paths.cases_shared import test_fields_with_shared_element_keys
+        test_fields_with_shared_element_keys(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,88 @@
+import unittest
+from typing import Union, Optional, Dict, Any
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBBasicTable, DynamoDBCachingTable, FieldSetter, FieldGetter
+
+
+def test_deep_field_initialization_round_trips(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    record_key: str = f"recordId_{uuid4()}"
+    put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: record_key})
+    self.assertTrue(put_record_success)
+
+    text_field_random_value: str = f"textField_randomValue_{uuid4()}"
+    users_table.reset_round_trips_count()
+    update_success: bool = users_table.update_field(
+        key_value=record_key, value_to_set=text_field_random_value,
+        field_path='levelOne.levelTwo.levelThree.levelFour.textField'
+    )
+    self.assertTrue(update_success)
+    if is_caching is True:
+        self.assertTrue(users_table.commit_operations())
+        users_table.clear_cached_data()
+
+    # One failed update request, and one initialization request per depth level of the field path
+    self.assertEqual(1 + 5, users_table.round_trips_count)
+
+    retrieved_text_field: Optional[Any] = users_table.get_field(
+        key_value=record_key, field_path='levelOne.levelTwo.levelThree.levelFour.textField'
+    )
+    self.assertEqual((
+        text_field_random_value if is_caching is not True else
+        {'fromCache': False, 'value': text_field_random_value}
+    ), retrieved_text_field)
+
+    delete_record_success: bool = users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key})
+    self.assertTrue(delete_record_success)
+
+
+def test_multiple_fields_initialization_with_shared_parents(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    record_key: str = f"recordId_{uuid4()}"
+    put_record_success: bool = users_table.put_record(record_dict_data={
+        primary_key_name: record_key, 'levelOne': {'textField': "existingTextField"}
+    })
+    self.assertTrue(put_record_success)
+
+    level_one_text_field_random_value: str = f"levelOneTextField_randomValue_{uuid4()}"
+    level_three_text_field_random_value: str = f"levelThreeTextField_randomValue_{uuid4()}"
+    users_table.reset_round_trips_count()
+    update_success: bool = users_table.update_multiple_fields(key_value=record_key, setters=[
+        FieldSetter(field_path='levelOne.textField', value_to_set=level_one_text_field_random_value),
+        FieldSetter(field_path='levelOne.levelTwo.levelThree.textField', value_to_set=level_three_text_field_random_value),
+        FieldSetter(field_path='levelOne.levelTwo.levelThree.levelFour.textField', value_to_set="levelFourTextField"),
+        # A falsy value must be set, and not be replaced by the default value of its field
+        FieldSetter(field_path='levelOne.levelTwo.levelThree.levelFour.counterField', value_to_set=0),
+    ])
+    self.assertTrue(update_success)
+    if is_caching is True:
+        self.assertTrue(users_table.commit_operations())
+        users_table.clear_cached_data()
+
+    # The setters share their parents, so they only require one initialization request per depth level
+    self.assertEqual(1 + 5, users_table.round_trips_count)
+
+    retrieved_values: Optional[Dict[str, Any]] = users_table.get_multiple_fields(key_value=record_key, getters={
+        'levelOneTextField': FieldGetter(field_path='levelOne.textField'),
+        'levelThreeTextField': FieldGetter(field_path='levelOne.levelTwo.levelThree.textField'),
+        'levelFourTextField': FieldGetter(field_path='levelOne.levelTwo.levelThree.levelFour.textField'),
+        'levelFourCounterField': FieldGetter(field_path='levelOne.levelTwo.levelThree.levelFour.counterField'),
+    })
+    expected_values: Dict[str, Any] = {
+        'levelOneTextField': level_one_text_field_random_value,
+        'levelThreeTextField': level_three_text_field_random_value,
+        'levelFourTextField': "levelFourTextField",
+        'levelFourCounterField': 0
+    }
+    self.assertEqual((
+        expected_values if is_caching is not True else
+        {key: {'fromCache': False, 'value': value} for key, value in expected_values.items()}
+    ), retrieved_values)
+
+    delete_record_success: bool = users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key})
+    self.assertTrue(delete_record_success)
@@ -0,0 +1,17 @@
+from StructNoSQL import TableDataModel, BaseField, MapModel
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    class LevelOneModel(MapModel):
+        class LevelTwoModel(MapModel):
+            class LevelThreeModel(MapModel):
+                class LevelFourModel(MapModel):
+                    textField = BaseField(field_type=str, required=False)
+                    counterField = BaseField(field_type=int, required=False)
+                levelFour = BaseField(field_type=LevelFourModel, required=False)
+                textField = BaseField(field_type=str, required=False)
+            levelThree = BaseField(field_type=LevelThreeModel, required=False)
+        levelTwo = BaseField(field_type=LevelTwoModel, required=False)
+        textField = BaseField(field_type=str, required=False)
+    levelOne = BaseField(field_type=LevelOneModel, required=False)
@@ -0,0 +1,21 @@
+import unittest
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBBasicTable
+from tests.tests_fields_initialization.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBBasicTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.users_table = PlaygroundDynamoDBBasicTable(data_model=DynamoDBTableModel)
+
+        self.DYNAMODB_CASE_KWARGS = {'self': self, 'users_table': self.users_table, 'is_caching': False}
+        self.SHARED_CASE_KWARGS = {**self.DYNAMODB_CASE_KWARGS, 'primary_key_name': 'accountId'}
+
+    def test_deep_field_initialization_round_trips(self):
+        from tests.tests_fields_initialization.cases_shared import test_deep_field_initialization_round_trips
+        test_deep_field_initialization_round_trips(**self.SHARED_CASE_KWARGS)
+
+    def test_multiple_fields_initialization_with_shared_parents(self):
+        from tests.tests_fields_initialization.cases_shared import test_multiple_fields_initialization_with_shared_parents
+        test_multiple_fields_initialization_with_shared_parents(**self.SHARED_CASE_KWARGS)
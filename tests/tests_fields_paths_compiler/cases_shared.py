@@ -0,0 +1,54 @@
+import unittest
+from typing import List, Tuple
+
+from StructNoSQL import DynamoDBCachingTable
+from StructNoSQL.exceptions import MissingQueryKwarg
+from StructNoSQL.utils.process_render_fields_paths import process_and_make_single_rendered_database_path
+
+
+FIELDS_PATHS_WITH_QUERY_KWARGS: List[Tuple[str, dict]] = [
+    ('textField', {}),
+    ('(textField, numberField)', {}),
+    ('projects.{{projectId}}.name', {'projectId': "projectA"}),
+    ('projects.{{projectId}}.(name, tags)', {'projectId': "projectB", 'unusedKwarg': "value"}),
+    ('projects.{{projectId}}.tags.{{tagIndex}}', {'projectId': "projectC", 'tagIndex': 2}),
+]
+
+
+def test_compiled_fields_paths_match_parsed_fields_paths(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    # A plain dict does not have a FieldPathsCompiler, so its fields paths are parsed on each call
+    parsed_fields_switch: dict = dict(users_table.fields_switch)
+    for field_path, query_kwargs in FIELDS_PATHS_WITH_QUERY_KWARGS:
+        for _ in range(2):
+            self.assertEqual(
+                process_and_make_single_rendered_database_path(field_path=field_path, fields_switch=parsed_fields_switch, query_kwargs=query_kwargs),
+                process_and_make_single_rendered_database_path(field_path=field_path, fields_switch=users_table.fields_switch, query_kwargs=query_kwargs)
+            )
+
+
+def test_rendered_database_paths_cache(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    fields_switch = users_table.fields_switch
+    (_, first_rendered_path), _ = process_and_make_single_rendered_database_path(
+        field_path='projects.{{projectId}}.tags.{{tagIndex}}', fields_switch=fields_switch, query_kwargs={'projectId': "projectA", 'tagIndex': 1}
+    )
+    (_, second_rendered_path), _ = process_and_make_single_rendered_database_path(
+        field_path='projects.{{projectId}}.tags.{{tagIndex}}', fields_switch=fields_switch, query_kwargs={'projectId': "projectA", 'tagIndex': 1}
+    )
+    self.assertIs(first_rendered_path, second_rendered_path)
+
+    # The kwargs values that are equal but of different types (like 1 and True) are rendered apart
+    (_, boolean_index_rendered_path), _ = process_and_make_single_rendered_database_path(
+        field_path='projects.{{projectId}}.tags.{{tagIndex}}', fields_switch=fields_switch, query_kwargs={'projectId': "projectA", 'tagIndex': True}
+    )
+    self.assertIs(True, boolean_index_rendered_path[-1].element_key)
+
+    # The missing kwargs raise the same exceptions than without compilation, and are not cached
+    for _ in range(2):
+        with self.assertRaises(MissingQueryKwarg):
+            process_and_make_single_rendered_database_path(
+                field_path='projects.{{projectId}}.name', fields_switch=fields_switch, query_kwargs={'otherKwarg': "value"}
+            )
+    self.assertTrue(users_table.update_field(
+        key_value="recordId", field_path='projects.{{projectId}}.name', query_kwargs={'projectId': "projectA"}, value_to_set="name"
+    ))
+    users_table.clear_pending_operations()
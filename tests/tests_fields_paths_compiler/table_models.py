@@ -0,0 +1,13 @@
+from typing import Dict, List
+
+from StructNoSQL import TableDataModel, BaseField, MapModel
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    textField = BaseField(field_type=str, required=False)
+    numberField = BaseField(field_type=int, required=False)
+    class ProjectModel(MapModel):
+        name = BaseField(field_type=str, required=False)
+        tags = BaseField(field_type=List[str], key_name='tagIndex', required=False)
+    projects = BaseField(field_type=Dict[str, ProjectModel], key_name='projectId', required=False)
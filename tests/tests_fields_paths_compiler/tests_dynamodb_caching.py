@@ -0,0 +1,20 @@
+import unittest
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_fields_paths_compiler.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel)
+        self.users_table.debug = True
+        self.SHARED_CASE_KWARGS = {'self': self, 'users_table': self.users_table, 'primary_key_name': 'accountId'}
+
+    def test_compiled_fields_paths_match_parsed_fields_paths(self):
+        from tests.tests_fields_paths_compiler.cases_shared import test_compiled_fields_paths_match_parsed_fields_paths
+        test_compiled_fields_paths_match_parsed_fields_paths(**self.SHARED_CASE_KWARGS)
+
+    def test_rendered_database_paths_cache(self):
+        from tests.tests_fields_paths_compiler.cases_shared import test_rendered_database_paths_cache
+        test_rendered_database_paths_cache(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,70 @@
+import random
+import unittest
+from decimal import Decimal
+from typing import Optional, Union, Dict, Any
+
+from StructNoSQL import DynamoDBBasicTable, DynamoDBCachingTable, FieldSetter, FieldGetter
+from StructNoSQL.utils.decimals import float_to_decimal_serializer, float_to_exact_decimal
+from tests.components.playground_table_clients import TEST_ACCOUNT_ID
+
+
+def test_exact_float_conversion(
+        self: unittest.TestCase,
+        table_client: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        exact_table_client: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        is_caching: bool, primary_key_name: str
+):
+    # The shortest conversion keeps the shortest representation of the floats, whereas the exact conversion
+    # keeps their binary value up to the 38 digits supported by DynamoDB. Both give back the same floats.
+    self.assertEqual(Decimal('0.1'), table_client.record_dynamodb_serializers.encode({'simpleFloatField': 0.1})['simpleFloatField'])
+    self.assertEqual(
+        Decimal('0.10000000000000000555111512312578270212'),
+        exact_table_client.record_dynamodb_serializers.encode({'simpleFloatField': 0.1})['simpleFloatField']
+    )
+    self.assertEqual(Decimal(42), exact_table_client.record_dynamodb_serializers.encode({'simpleFloatField': 42.0})['simpleFloatField'])
+
+    # Integers of more than 15 digits cannot be represented by a float, and must be retrieved from their exact value
+    big_int_value: int = 2 ** 60 + 1
+    random_float_value: float = random.randint(1, 10000) / 1000 + 0.0001
+    for current_table_client in [table_client, exact_table_client]:
+        update_success: bool = current_table_client.update_multiple_fields(key_value=TEST_ACCOUNT_ID, setters=[
+            FieldSetter(field_path='simpleFloatField', value_to_set=random_float_value),
+            FieldSetter(field_path='simpleIntField', value_to_set=big_int_value)
+        ])
+        self.assertTrue(update_success)
+        if is_caching is True:
+            self.assertTrue(current_table_client.commit_operations())
+            current_table_client.clear_cached_data()
+
+        retrieved_values: Dict[str, Optional[Any]] = current_table_client.get_multiple_fields(
+            key_value=TEST_ACCOUNT_ID, getters={
+                'float': FieldGetter(field_path='simpleFloatField'),
+                'int': FieldGetter(field_path='simpleIntField')
+            }
+        )
+        if is_caching is True:
+            retrieved_values = {key: item['value'] for key, item in retrieved_values.items()}
+        self.assertEqual({'float': random_float_value, 'int': big_int_value}, retrieved_values)
+        self.assertIsInstance(retrieved_values['float'], float)
+        self.assertIsInstance(retrieved_values['int'], int)
+
+
+def test_float_to_decimal_serializer(
+        self: unittest.TestCase,
+        table_client: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        exact_table_client: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        is_caching: bool, primary_key_name: str
+):
+    serialized_item: dict = float_to_decimal_serializer(item={
+        'measurements': [0.5, 1.0, 2.25], 'mixedList': [1, 0.1, "text", {'nested': 3.5}],
+        'nested': {'float': 0.1, 'int': 1, 'text': "text"}
+    })
+    self.assertEqual({
+        'measurements': [Decimal('0.5'), Decimal('1'), Decimal('2.25')],
+        'mixedList': [1, Decimal('0.1'), "text", {'nested': Decimal('3.5')}],
+        'nested': {'float': Decimal('0.1'), 'int': 1, 'text': "text"}
+    }, serialized_item)
+    self.assertEqual(
+        [float_to_exact_decimal(0.1), Decimal('0.5')],
+        float_to_decimal_serializer(item=[0.1, 0.5], float_to_decimal_function=float_to_exact_decimal)
+    )
@@ -0,0 +1,7 @@
+from StructNoSQL import TableDataModel, BaseField
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    simpleFloatField = BaseField(field_type=float, required=False)
+    simpleIntField = BaseField(field_type=int, required=False)
@@ -0,0 +1,26 @@
+import unittest
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBBasicTable
+from tests.tests_float_conversion.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBBasicTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.table_client = PlaygroundDynamoDBBasicTable(data_model=DynamoDBTableModel)
+        self.exact_table_client = PlaygroundDynamoDBBasicTable(
+            data_model=DynamoDBTableModel, float_conversion=PlaygroundDynamoDBBasicTable.EXACT_FLOAT_CONVERSION
+        )
+
+        self.SHARED_CASE_KWARGS = {
+            'self': self, 'table_client': self.table_client, 'exact_table_client': self.exact_table_client,
+            'is_caching': False, 'primary_key_name': 'accountId'
+        }
+
+    def test_exact_float_conversion(self):
+        from tests.tests_float_conversion.cases_shared import test_exact_float_conversion
+        test_exact_float_conversion(**self.SHARED_CASE_KWARGS)
+
+    def test_float_to_decimal_serializer(self):
+        from tests.tests_float_conversion.cases_shared import test_float_to_decimal_serializer
+        test_float_to_decimal_serializer(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,103 @@
+import time
+import unittest
+from typing import Callable
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBCachingTable, CacheEvictionPolicy, FieldGetter
+
+
+def _put_record(users_table: DynamoDBCachingTable, primary_key_name: str) -> str:
+    record_key: str = f"recordId_{uuid4()}"
+    put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': "textValue"})
+    if put_record_success is not True:
+        raise Exception(f"Failed to put the record {record_key}")
+    users_table.clear_cached_data()
+    return record_key
+
+
+def test_missing_field_cached(
+        self: unittest.TestCase, table_factory: Callable[[CacheEvictionPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(CacheEvictionPolicy())
+    record_key: str = _put_record(users_table=users_table, primary_key_name=primary_key_name)
+    users_table.reset_round_trips_count()
+
+    self.assertIsNone(users_table.get_field(key_value=record_key, field_path='numberField'))
+    # The field has been found missing by the first read, so the second read is answered by the cache
+    self.assertEqual({'fromCache': True, 'value': None}, users_table.get_field(key_value=record_key, field_path='numberField'))
+    self.assertIsNone(users_table.get_field(key_value=record_key, field_path='mapField'))
+    # The children of a missing field are also missing
+    self.assertEqual(
+        {'fromCache': True, 'value': None},
+        users_table.get_field(key_value=record_key, field_path='mapField.{{mapKey}}', query_kwargs={'mapKey': 'first'})
+    )
+    self.assertEqual(2, users_table.round_trips_count)
+    self.assertEqual(2, users_table.cache_negative_hits_count)
+    self.assertEqual(0, users_table.cache_hits_count)
+
+    # Writing a field discards its negative entry, and the negative entries of its parents
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='mapField.{{mapKey}}', query_kwargs={'mapKey': 'first'}, value_to_set="a"))
+    self.assertEqual(
+        {'fromCache': True, 'value': "a"},
+        users_table.get_field(key_value=record_key, field_path='mapField.{{mapKey}}', query_kwargs={'mapKey': 'first'})
+    )
+    self.assertEqual({'fromCache': True, 'value': None}, users_table.get_field(key_value=record_key, field_path='numberField'))
+    self.assertTrue(users_table.commit_operations())
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_missing_fields_and_records_cached_by_multiple_getters(
+        self: unittest.TestCase, table_factory: Callable[[CacheEvictionPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(CacheEvictionPolicy())
+    record_key: str = _put_record(users_table=users_table, primary_key_name=primary_key_name)
+    missing_record_key: str = f"recordId_{uuid4()}"
+    users_table.reset_round_trips_count()
+
+    records_values = users_table.get_multiple_records_fields(keys_values=[record_key, missing_record_key], getters={
+        'text': FieldGetter(field_path='textField'), 'number': FieldGetter(field_path='numberField')
+    })
+    self.assertEqual({'fromCache': False, 'value': "textValue"}, records_values[record_key]['text'])
+    self.assertEqual({'fromCache': False, 'value': None}, records_values[record_key]['number'])
+    self.assertEqual({'text': None, 'number': None}, records_values[missing_record_key])
+    self.assertEqual(1, users_table.round_trips_count)
+
+    # Both the fields missing from an existing record and any field of a missing record are answered by the cache
+    self.assertEqual({'fromCache': True, 'value': None}, users_table.get_field(key_value=record_key, field_path='numberField'))
+    self.assertEqual({'fromCache': True, 'value': None}, users_table.get_field(key_value=missing_record_key, field_path='textField'))
+    self.assertEqual({'fromCache': True, 'value': None}, users_table.get_field(key_value=missing_record_key, field_path=primary_key_name))
+    self.assertEqual(
+        {'number': {'fromCache': True, 'value': None}, 'map': {'fromCache': True, 'value': None}},
+        users_table.get_multiple_fields(key_value=missing_record_key, getters={
+            'number': FieldGetter(field_path='numberField'), 'map': FieldGetter(field_path='mapField')
+        })
+    )
+    self.assertEqual(1, users_table.round_trips_count)
+    self.assertEqual(5, users_table.cache_negative_hits_count)
+
+    # Once the missing record is put, its fields are no longer considered missing
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: missing_record_key, 'textField': "otherValue"}))
+    self.assertEqual({'fromCache': True, 'value': "otherValue"}, users_table.get_field(key_value=missing_record_key, field_path='textField'))
+    users_table.delete_records(indexes_keys_selectors_list=[{primary_key_name: record_key}, {primary_key_name: missing_record_key}])
+
+
+def test_negative_entries_expiration(
+        self: unittest.TestCase, table_factory: Callable[[CacheEvictionPolicy], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(CacheEvictionPolicy(negative_entry_ttl_seconds=0.05))
+    record_key: str = _put_record(users_table=users_table, primary_key_name=primary_key_name)
+    self.assertIsNone(users_table.get_field(key_value=record_key, field_path='numberField'))
+    self.assertEqual({'fromCache': True, 'value': None}, users_table.get_field(key_value=record_key, field_path='numberField'))
+    time.sleep(0.1)
+    users_table.reset_round_trips_count()
+    self.assertIsNone(users_table.get_field(key_value=record_key, field_path='numberField'))
+    self.assertEqual(1, users_table.round_trips_count)
+
+    # Without negative_caching, the missing fields are always retrieved from the database
+    users_table = table_factory(CacheEvictionPolicy(negative_caching=False))
+    users_table.reset_round_trips_count()
+    for _ in range(2):
+        self.assertIsNone(users_table.get_field(key_value=record_key, field_path='numberField'))
+    self.assertEqual(2, users_table.round_trips_count)
+    self.assertEqual(0, users_table.cache_negative_hits_count)
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
@@ -0,0 +1,29 @@
+import unittest
+
+from StructNoSQL import CacheEvictionPolicy
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_negative_caching.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.SHARED_CASE_KWARGS = {'self': self, 'table_factory': self.table_factory, 'primary_key_name': 'accountId'}
+
+    @staticmethod
+    def table_factory(cache_eviction_policy: CacheEvictionPolicy) -> PlaygroundDynamoDBCachingTable:
+        users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel, cache_eviction_policy=cache_eviction_policy)
+        users_table.debug = True
+        return users_table
+
+    def test_missing_field_cached(self):
+        from tests.tests_negative_caching.cases_shared import test_missing_field_cached
+        test_missing_field_cached(**self.SHARED_CASE_KWARGS)
+
+    def test_missing_fields_and_records_cached_by_multiple_getters(self):
+        from tests.tests_negative_caching.cases_shared import test_missing_fields_and_records_cached_by_multiple_getters
+        test_missing_fields_and_records_cached_by_multiple_getters(**self.SHARED_CASE_KWARGS)
+
+    def test_negative_entries_expiration(self):
+        from tests.tests_negative_caching.cases_shared import test_negative_entries_expiration
+        test_negative_entries_expiration(**self.SHARED_CASE_KWARGS)
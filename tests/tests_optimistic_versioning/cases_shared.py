@@ -0,0 +1,165 @@
+import unittest
+from typing import Any, Callable, Type
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBCachingTable, TableDataModel, CommitOperationsReport, FieldGetter
+from tests.tests_optimistic_versioning.table_models import ReportConflictsTableModel, ReplayConflictsTableModel
+
+
+class InterleavedWriterTableResourceStandIn:
+    # Stand-in of the boto3 Table resource of a table client, that increments the version of the record right after the
+    # first update request, as if another writer had committed the record between the requests of a commit.
+    def __init__(self, table_resource: Any, version_field_name: str):
+        self._table_resource = table_resource
+        self.version_field_name = version_field_name
+        self.has_interleaved_write = False
+
+    def __getattr__(self, item: str):
+        real_function = getattr(self._table_resource, item)
+        if item != 'update_item':
+            return real_function
+
+        def update_item(**kwargs):
+            response = real_function(**kwargs)
+            if self.has_interleaved_write is not True:
+                self.has_interleaved_write = True
+                real_function(
+                    Key=kwargs['Key'], UpdateExpression="SET #recordVersion = #recordVersion + :oneRecordVersion",
+                    ExpressionAttributeNames={'#recordVersion': self.version_field_name},
+                    ExpressionAttributeValues={':oneRecordVersion': 1}
+                )
+            return response
+        return update_item
+
+
+def test_conflicting_commit_reported(
+        self: unittest.TestCase, table_factory: Callable[[Type[TableDataModel]], DynamoDBCachingTable], primary_key_name: str
+):
+    # Each table simulates a different process, that caches the same record
+    first_table = table_factory(ReportConflictsTableModel)
+    second_table = table_factory(ReportConflictsTableModel)
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(first_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': "initialValue"}))
+    first_table.clear_cached_data()
+
+    # The version of the record is retrieved along with the first fields read by each table
+    first_table.reset_round_trips_count()
+    self.assertEqual({'fromCache': False, 'value': "initialValue"}, first_table.get_field(key_value=record_key, field_path='textField'))
+    self.assertEqual({'fromCache': False, 'value': "initialValue"}, second_table.get_field(key_value=record_key, field_path='textField'))
+    self.assertEqual(1, first_table.round_trips_count)
+
+    self.assertTrue(first_table.update_field(key_value=record_key, field_path='textField', value_to_set="firstValue"))
+    self.assertTrue(first_table.commit_operations())
+    self.assertEqual({'fromCache': True, 'value': 1}, first_table.get_field(key_value=record_key, field_path='recordVersion'))
+
+    # The second table read the record before the commit of the first table, so its commit is rejected
+    self.assertTrue(second_table.update_field(key_value=record_key, field_path='textField', value_to_set="secondValue"))
+    commit_report: CommitOperationsReport = second_table.commit_operations_with_report()
+    self.assertFalse(commit_report.success)
+    self.assertEqual([record_key], commit_report.conflicted_records_keys)
+    self.assertFalse(second_table.has_pending_operations())
+    # The conflicted record has been removed from the cache, so it is read again from the database
+    self.assertEqual({'fromCache': False, 'value': "firstValue"}, second_table.get_field(key_value=record_key, field_path='textField'))
+
+    self.assertTrue(second_table.update_field(key_value=record_key, field_path='textField', value_to_set="secondValue"))
+    self.assertTrue(second_table.commit_operations())
+    first_table.clear_cached_data()
+    self.assertEqual(
+        {'text': {'fromCache': False, 'value': "secondValue"}, 'version': {'fromCache': False, 'value': 2}},
+        first_table.get_multiple_fields(key_value=record_key, getters={
+            'text': FieldGetter(field_path='textField'), 'version': FieldGetter(field_path='recordVersion')
+        })
+    )
+    self.assertTrue(first_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_conflicting_commit_replayed(
+        self: unittest.TestCase, table_factory: Callable[[Type[TableDataModel]], DynamoDBCachingTable], primary_key_name: str
+):
+    first_table = table_factory(ReplayConflictsTableModel)
+    second_table = table_factory(ReplayConflictsTableModel)
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(first_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': "initialValue", 'numberField': 1}))
+    first_table.clear_cached_data()
+
+    second_table.get_multiple_fields(key_value=record_key, getters={
+        'text': FieldGetter(field_path='textField'), 'number': FieldGetter(field_path='numberField')
+    })
+    self.assertTrue(first_table.update_field(key_value=record_key, field_path='numberField', value_to_set=2))
+    self.assertTrue(first_table.commit_operations())
+
+    # The commit of the second table is replayed with the new version of the record
+    self.assertTrue(second_table.update_field(key_value=record_key, field_path='textField', value_to_set="secondValue"))
+    second_table.reset_round_trips_count()
+    commit_report: CommitOperationsReport = second_table.commit_operations_with_report()
+    self.assertTrue(commit_report.success)
+    self.assertEqual([], commit_report.conflicted_records_keys)
+    # The rejected commit, the retrieval of the new version, and the replayed commit
+    self.assertEqual(3, second_table.round_trips_count)
+    self.assertEqual({'fromCache': True, 'value': "secondValue"}, second_table.get_field(key_value=record_key, field_path='textField'))
+    # The field changed by the first table is no longer cached with its previous value
+    self.assertEqual({'fromCache': False, 'value': 2}, second_table.get_field(key_value=record_key, field_path='numberField'))
+    self.assertEqual({'fromCache': True, 'value': 2}, second_table.get_field(key_value=record_key, field_path='recordVersion'))
+    self.assertTrue(first_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_written_records_versions(
+        self: unittest.TestCase, table_factory: Callable[[Type[TableDataModel]], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(ReportConflictsTableModel)
+    record_key: str = f"recordId_{uuid4()}"
+
+    # A record that has only been written has no captured version, so its version is incremented without condition
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='textField', value_to_set="firstValue"))
+    users_table.reset_round_trips_count()
+    self.assertTrue(users_table.commit_operations())
+    # The version is incremented by its own request, that also returns the new version
+    self.assertEqual(2, users_table.round_trips_count)
+    self.assertEqual({'fromCache': True, 'value': 1}, users_table.get_field(key_value=record_key, field_path='recordVersion'))
+
+    # Once the version is known, the operations and the version increment are sent in a single conditional request
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='numberField', value_to_set=1))
+    self.assertTrue(users_table.delete_field(key_value=record_key, field_path='textField'))
+    users_table.reset_round_trips_count()
+    self.assertTrue(users_table.commit_operations())
+    self.assertEqual(1, users_table.round_trips_count)
+
+    users_table.clear_cached_data()
+    self.assertEqual(
+        {'text': {'fromCache': False, 'value': None}, 'number': {'fromCache': False, 'value': 1}, 'version': {'fromCache': False, 'value': 2}},
+        users_table.get_multiple_fields(key_value=record_key, getters={
+            'text': FieldGetter(field_path='textField'), 'number': FieldGetter(field_path='numberField'),
+            'version': FieldGetter(field_path='recordVersion')
+        })
+    )
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_commit_requests_conditioned_on_claimed_version(
+        self: unittest.TestCase, table_factory: Callable[[Type[TableDataModel]], DynamoDBCachingTable], primary_key_name: str
+):
+    users_table = table_factory(ReportConflictsTableModel)
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key}))
+    users_table.clear_cached_data()
+
+    # A record that has only been written is committed by the claim of its next version, followed by the requests of its operations
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='textField', value_to_set="firstValue"))
+    dynamodb_client = users_table.dynamodb_client
+    table_resource_stand_in = InterleavedWriterTableResourceStandIn(
+        table_resource=dynamodb_client._table_resource, version_field_name='recordVersion'
+    )
+    dynamodb_client._table_resource = table_resource_stand_in
+    self.assertFalse(users_table.commit_operations())
+    self.assertTrue(table_resource_stand_in.has_interleaved_write)
+    dynamodb_client._table_resource = table_resource_stand_in._table_resource
+
+    # The other writer claimed the next version in between, so the requests of the operations have been rejected
+    users_table.clear_cached_data()
+    self.assertEqual(
+        {'text': {'fromCache': False, 'value': None}, 'version': {'fromCache': False, 'value': 2}},
+        users_table.get_multiple_fields(key_value=record_key, getters={
+            'text': FieldGetter(field_path='textField'), 'version': FieldGetter(field_path='recordVersion')
+        })
+    )
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
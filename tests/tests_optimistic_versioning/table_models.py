@@ -0,0 +1,15 @@
+from StructNoSQL import TableDataModel, BaseField, VersionField
+
+
+class ReportConflictsTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    recordVersion = VersionField(conflict_resolution=VersionField.REPORT_CONFLICTS)
+    textField = BaseField(field_type=str, required=False)
+    numberField = BaseField(field_type=int, required=False)
+
+
+class ReplayConflictsTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    recordVersion = VersionField(conflict_resolution=VersionField.REPLAY_PENDING_OPERATIONS)
+    textField = BaseField(field_type=str, required=False)
+    numberField = BaseField(field_type=int, required=False)
@@ -0,0 +1,33 @@
+import unittest
+from typing import Type
+
+from StructNoSQL import TableDataModel
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.SHARED_CASE_KWARGS = {'self': self, 'table_factory': self.table_factory, 'primary_key_name': 'accountId'}
+
+    @staticmethod
+    def table_factory(data_model: Type[TableDataModel]) -> PlaygroundDynamoDBCachingTable:
+        users_table = PlaygroundDynamoDBCachingTable(data_model=data_model)
+        users_table.debug = True
+        return users_table
+
+    def test_conflicting_commit_reported(self):
+        from tests.tests_optimistic_versioning.cases_shared import test_conflicting_commit_reported
+        test_conflicting_commit_reported(**self.SHARED_CASE_KWARGS)
+
+    def test_conflicting_commit_replayed(self):
+        from tests.tests_optimistic_versioning.cases_shared import test_conflicting_commit_replayed
+        test_conflicting_commit_replayed(**self.SHARED_CASE_KWARGS)
+
+    def test_written_records_versions(self):
+        from tests.tests_optimistic_versioning.cases_shared import test_written_records_versions
+        test_written_records_versions(**self.SHARED_CASE_KWARGS)
+
+    def test_commit_requests_conditioned_on_claimed_version(self):
+        from tests.tests_optimistic_versioning.cases_shared import test_commit_requests_conditioned_on_claimed_version
+        test_commit_requests_conditioned_on_claimed_version(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,70 @@
+import unittest
+from typing import List
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBCachingTable, FieldGetter
+
+
+def _put_records(users_table: DynamoDBCachingTable, primary_key_name: str, num_records: int) -> List[str]:
+    records_keys: List[str] = [f"recordId_{uuid4()}" for _ in range(num_records)]
+    for i_record, record_key in enumerate(records_keys):
+        put_record_success: bool = users_table.put_record(record_dict_data={
+            primary_key_name: record_key, 'textField': f"text{i_record}", 'numberField': i_record, 'mapField': {'first': "a"}
+        })
+        if put_record_success is not True:
+            raise Exception(f"Failed to put the record {record_key}")
+    users_table.clear_cached_data()
+    return records_keys
+
+
+def test_prefetch_entire_records(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    records_keys: List[str] = _put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=3)
+    missing_record_key: str = f"recordId_{uuid4()}"
+
+    users_table.reset_round_trips_count()
+    records_prefetched = users_table.prefetch_records(keys_values=[*records_keys, missing_record_key])
+    self.assertEqual({**{record_key: True for record_key in records_keys}, missing_record_key: False}, records_prefetched)
+    self.assertEqual(1, users_table.round_trips_count)
+
+    for i_record, record_key in enumerate(records_keys):
+        self.assertEqual({'fromCache': True, 'value': f"text{i_record}"}, users_table.get_field(key_value=record_key, field_path='textField'))
+        self.assertEqual({'fromCache': True, 'value': {'first': "a"}}, users_table.get_field(key_value=record_key, field_path='mapField'))
+        # The fields missing from an entirely loaded record do not exist, and are retrieved from the cache as None
+        self.assertEqual(
+            {'fromCache': True, 'value': None},
+            users_table.get_field(key_value=record_key, field_path='mapField.{{mapKey}}', query_kwargs={'mapKey': 'second'})
+        )
+    self.assertEqual(1, users_table.round_trips_count)
+    users_table.delete_records(indexes_keys_selectors_list=[{primary_key_name: record_key} for record_key in records_keys])
+
+
+def test_prefetch_records_projection(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    records_keys: List[str] = _put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=2)
+    users_table.reset_round_trips_count()
+    records_prefetched = users_table.prefetch_records(keys_values=records_keys, getters={
+        'text': FieldGetter(field_path='textField'), 'map': FieldGetter(field_path='mapField')
+    })
+    self.assertEqual({record_key: True for record_key in records_keys}, records_prefetched)
+
+    self.assertEqual({'fromCache': True, 'value': "text1"}, users_table.get_field(key_value=records_keys[1], field_path='textField'))
+    self.assertEqual(
+        {'fromCache': True, 'value': None},
+        users_table.get_field(key_value=records_keys[1], field_path='mapField.{{mapKey}}', query_kwargs={'mapKey': 'second'})
+    )
+    self.assertEqual(1, users_table.round_trips_count)
+    # The fields outside of the projection are still retrieved from the database
+    self.assertEqual({'fromCache': False, 'value': 1}, users_table.get_field(key_value=records_keys[1], field_path='numberField'))
+    self.assertEqual(2, users_table.round_trips_count)
+    users_table.delete_records(indexes_keys_selectors_list=[{primary_key_name: record_key} for record_key in records_keys])
+
+
+def test_prefetch_keeps_records_with_pending_operations(self: unittest.TestCase, users_table: DynamoDBCachingTable, primary_key_name: str):
+    records_keys: List[str] = _put_records(users_table=users_table, primary_key_name=primary_key_name, num_records=2)
+    self.assertTrue(users_table.update_field(key_value=records_keys[0], field_path='textField', value_to_set="pendingText"))
+
+    records_prefetched = users_table.prefetch_records(keys_values=records_keys)
+    # The records with pending operations are skipped, which is not reported as if they did not exist
+    self.assertEqual({records_keys[0]: None, records_keys[1]: True}, records_prefetched)
+    self.assertEqual({'fromCache': True, 'value': "pendingText"}, users_table.get_field(key_value=records_keys[0], field_path='textField'))
+    self.assertTrue(users_table.commit_operations())
+    users_table.delete_records(indexes_keys_selectors_list=[{primary_key_name: record_key} for record_key in records_keys])
@@ -0,0 +1,10 @@
+from typing import Dict
+
+from StructNoSQL import TableDataModel, BaseField
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    textField = BaseField(field_type=str, required=False)
+    numberField = BaseField(field_type=int, required=False)
+    mapField = BaseField(field_type=Dict[str, str], key_name='mapKey', required=False)
@@ -0,0 +1,24 @@
+import unittest
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_prefetch_records.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel)
+        self.users_table.debug = True
+        self.SHARED_CASE_KWARGS = {'self': self, 'users_table': self.users_table, 'primary_key_name': 'accountId'}
+
+    def test_prefetch_entire_records(self):
+        from tests.tests_prefetch_records.cases_shared import test_prefetch_entire_records
+        test_prefetch_entire_records(**self.SHARED_CASE_KWARGS)
+
+    def test_prefetch_records_projection(self):
+        from tests.tests_prefetch_records.cases_shared import test_prefetch_records_projection
+        test_prefetch_records_projection(**self.SHARED_CASE_KWARGS)
+
+    def test_prefetch_keeps_records_with_pending_operations(self):
+        from tests.tests_prefetch_records.cases_shared import test_prefetch_keeps_records_with_pending_operations
+        test_prefetch_keeps_records_with_pending_operations(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,75 @@
+import unittest
+from typing import Union, Optional, List
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBBasicTable, DynamoDBCachingTable
+from StructNoSQL.fields import BaseItem
+
+
+CHILD_PROPERTIES_FIELD_PATH = 'properties.{{propertyKey}}.childProperties'
+
+
+def _make_child_property_field_path(num_levels: int) -> str:
+    return CHILD_PROPERTIES_FIELD_PATH + ''.join(
+        f"{'.childProperties' if i_level > 0 else ''}.{{{{childPropertyKey{i_level}}}}}" for i_level in range(num_levels)
+    )
+
+
+def _get_database_path_keys(field_object: BaseItem) -> List[str]:
+    return [path_element.element_key for path_element in field_object.database_path]
+
+
+def test_recursive_fields_expanded_on_demand(self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable]):
+    # No level of the recursive field is created with the table
+    self.assertFalse(any(field_path.startswith(CHILD_PROPERTIES_FIELD_PATH + '.') for field_path in users_table.fields_switch.keys()))
+    self.assertEqual(['properties', '$key$:propertyKey', 'childProperties'], _get_database_path_keys(
+        users_table.fields_switch.get(CHILD_PROPERTIES_FIELD_PATH)
+    ))
+
+    second_level_name_field: Optional[BaseItem] = users_table.fields_switch.get(f"{_make_child_property_field_path(num_levels=2)}.name")
+    self.assertEqual([
+        'properties', '$key$:propertyKey', 'childProperties', '$key$:childPropertyKey0',
+        'childProperties', '$key$:childPropertyKey1', 'name'
+    ], _get_database_path_keys(second_level_name_field))
+    # The levels are created up to the targeted level, and each level has its own fields objects
+    first_level_name_field: BaseItem = users_table.fields_switch[f"{_make_child_property_field_path(num_levels=1)}.name"]
+    self.assertEqual(['properties', '$key$:propertyKey', 'childProperties', '$key$:childPropertyKey0', 'name'], _get_database_path_keys(first_level_name_field))
+    self.assertEqual(['properties', '$key$:propertyKey', 'name'], _get_database_path_keys(users_table.fields_switch['properties.{{propertyKey}}.name']))
+    self.assertNotIn(_make_child_property_field_path(num_levels=3), dict(users_table.fields_switch))
+    self.assertEqual('childPropertyKey1', users_table.fields_switch[_make_child_property_field_path(num_levels=2)].key_name)
+
+    # The levels are limited by the max_nested_depth of the field
+    self.assertIsNotNone(users_table.fields_switch.get(_make_child_property_field_path(num_levels=4)))
+    self.assertIsNone(users_table.fields_switch.get(_make_child_property_field_path(num_levels=5)))
+    self.assertIsNone(users_table.fields_switch.get(f"{_make_child_property_field_path(num_levels=1)}.missingField"))
+
+
+def test_recursive_fields_operations(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    record_key: str = f"recordId_{uuid4()}"
+    put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: record_key, 'properties': {
+        'propertyA': {'name': "nameA", 'childProperties': {'childA': {'name': "childNameA", 'childProperties': {}}}}
+    }})
+    self.assertTrue(put_record_success)
+
+    query_kwargs: dict = {'propertyKey': "propertyA", 'childPropertyKey0': "childA", 'childPropertyKey1': "grandChildA"}
+    update_success: bool = users_table.update_field(
+        key_value=record_key, field_path=f"{_make_child_property_field_path(num_levels=2)}.name",
+        query_kwargs=query_kwargs, value_to_set="grandChildNameA"
+    )
+    self.assertTrue(update_success)
+    if is_caching is True:
+        self.assertTrue(users_table.commit_operations())
+        users_table.clear_cached_data()
+
+    for field_path, expected_value in [
+        (f"{_make_child_property_field_path(num_levels=1)}.name", "childNameA"),
+        (f"{_make_child_property_field_path(num_levels=2)}.name", "grandChildNameA"),
+    ]:
+        retrieved_value = users_table.get_field(key_value=record_key, field_path=field_path, query_kwargs=query_kwargs)
+        self.assertEqual(expected_value if is_caching is not True else {'fromCache': False, 'value': expected_value}, retrieved_value)
+
+    delete_record_success: bool = users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key})
+    self.assertTrue(delete_record_success)
@@ -0,0 +1,11 @@
+from typing import Dict
+
+from StructNoSQL import TableDataModel, BaseField, MapModel, ActiveSelf
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    class PropertyModel(MapModel):
+        name = BaseField(field_type=str, required=False)
+        childProperties = BaseField(field_type=Dict[str, ActiveSelf], key_name='childPropertyKey{i}', max_nested_depth=4, required=False)
+    properties = BaseField(field_type=Dict[str, PropertyModel], key_name='propertyKey', required=False)
@@ -0,0 +1,25 @@
+import unittest
+
+from StructNoSQL.base_tables.base_table import BaseTable
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBBasicTable
+from tests.tests_recursive_fields.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBBasicTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        # The levels expanded by the other tests of the model would be shared by its compiled schema
+        BaseTable.clear_compiled_schemas()
+        self.users_table = PlaygroundDynamoDBBasicTable(data_model=DynamoDBTableModel)
+
+        self.DYNAMODB_CASE_KWARGS = {'self': self, 'users_table': self.users_table, 'is_caching': False}
+        self.SHARED_CASE_KWARGS = {**self.DYNAMODB_CASE_KWARGS, 'primary_key_name': 'accountId'}
+
+    def test_recursive_fields_expanded_on_demand(self):
+        from tests.tests_recursive_fields.cases_shared import test_recursive_fields_expanded_on_demand
+        test_recursive_fields_expanded_on_demand(self=self, users_table=self.users_table)
+
+    def test_recursive_fields_operations(self):
+        from tests.tests_recursive_fields.cases_shared import test_recursive_fields_operations
+        test_recursive_fields_operations(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,136 @@
+import unittest
+from typing import Union, Optional, Callable
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBBasicTable, DynamoDBCachingTable, RetryPolicy
+from tests.components.throttling_table_stand_in import install_throttling_table_resource_stand_in
+
+
+THROTTLED = 'ProvisionedThroughputExceededException'
+# Short delays, so that the tests do not wait for the real backoff delays
+FAST_RETRY_POLICY_KWARGS = {'base_delay': 0.001, 'max_delay': 0.005}
+
+
+def test_throttled_requests_retried(
+        self: unittest.TestCase, table_factory: Callable[[Optional[RetryPolicy]], Union[DynamoDBBasicTable, DynamoDBCachingTable]],
+        primary_key_name: str, is_caching: bool
+):
+    users_table = table_factory(RetryPolicy(**FAST_RETRY_POLICY_KWARGS))
+    record_key: str = f"recordId_{uuid4()}"
+    table_resource_stand_in = install_throttling_table_resource_stand_in(
+        table_client=users_table, errors_schedule=[THROTTLED, 'ThrottlingException', None, THROTTLED]
+    )
+    users_table.reset_round_trips_count()
+    put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': "textValue"})
+    self.assertTrue(put_record_success)
+    self.assertEqual(3, users_table.round_trips_count)
+
+    if is_caching is True:
+        users_table.clear_cached_data()
+    retrieved_value: Optional[str] = users_table.get_field(key_value=record_key, field_path='textField')
+    self.assertEqual("textValue", retrieved_value)
+    self.assertEqual(5, users_table.round_trips_count)
+    self.assertEqual(5, table_resource_stand_in.num_requests)
+    # Only the cost of the last retry of a successful request is given back to the retry budget
+    retry_policy: RetryPolicy = users_table.dynamodb_client.requests_retrier.retry_policy
+    self.assertEqual(retry_policy.retry_budget_capacity - retry_policy.retry_cost, users_table.dynamodb_client.requests_retrier.retry_budget)
+
+    delete_record_success: bool = users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key})
+    self.assertTrue(delete_record_success)
+
+
+def test_non_retryable_errors_not_retried(
+        self: unittest.TestCase, table_factory: Callable[[Optional[RetryPolicy]], Union[DynamoDBBasicTable, DynamoDBCachingTable]],
+        primary_key_name: str, is_caching: bool
+):
+    users_table = table_factory(RetryPolicy(**FAST_RETRY_POLICY_KWARGS))
+    install_throttling_table_resource_stand_in(table_client=users_table, errors_schedule=['ValidationException'])
+    users_table.reset_round_trips_count()
+    put_record_success: bool = users_table.put_record(record_dict_data={primary_key_name: f"recordId_{uuid4()}"})
+    self.assertFalse(put_record_success)
+    self.assertEqual(1, users_table.round_trips_count)
+
+
+
+def test_transaction_conflicts_retried(
+        self: unittest.TestCase, table_factory: Callable[[Optional[RetryPolicy]], Union[DynamoDBBasicTable, DynamoDBCachingTable]],
+        primary_key_name: str, is_caching: bool
+):
+    users_table = table_factory(RetryPolicy(**FAST_RETRY_POLICY_KWARGS))
+    install_throttling_table_resource_stand_in(table_client=users_table, errors_schedule=['TransactionConflictException'])
+    users_table.reset_round_trips_count()
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key}))
+    self.assertEqual(2, users_table.round_trips_count)
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_non_idempotent_requests_not_retried_after_server_errors(
+        self: unittest.TestCase, table_factory: Callable[[Optional[RetryPolicy]], Union[DynamoDBBasicTable, DynamoDBCachingTable]],
+        primary_key_name: str, is_caching: bool
+):
+    users_table = table_factory(RetryPolicy(**FAST_RETRY_POLICY_KWARGS))
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key}))
+
+    # A server error can happen after the request has been applied, so retrying the append could add the items twice
+    install_throttling_table_resource_stand_in(table_client=users_table, errors_schedule=['InternalServerError'])
+    users_table.reset_round_trips_count()
+    append_response = users_table.dynamodb_client.add_data_elements_to_list(
+        index_name=primary_key_name, key_value=record_key, object_path='listField', element_values=["itemA"]
+    )
+    self.assertIsNone(append_response)
+    self.assertEqual(1, users_table.round_trips_count)
+
+    # A throttled request has not been applied, and is retried
+    install_throttling_table_resource_stand_in(table_client=users_table, errors_schedule=[THROTTLED])
+    users_table.reset_round_trips_count()
+    append_response = users_table.dynamodb_client.add_data_elements_to_list(
+        index_name=primary_key_name, key_value=record_key, object_path='listField', element_values=["itemB"]
+    )
+    self.assertEqual({'listField': ["itemB"]}, append_response.attributes)
+    self.assertEqual(2, users_table.round_trips_count)
+
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_retry_budget_exhausted(
+        self: unittest.TestCase, table_factory: Callable[[Optional[RetryPolicy]], Union[DynamoDBBasicTable, DynamoDBCachingTable]],
+        primary_key_name: str, is_caching: bool
+):
+    # A budget of two retries, that is used by the first request, so that the next throttled request is not retried
+    users_table = table_factory(RetryPolicy(retry_budget_capacity=10, retry_cost=5, **FAST_RETRY_POLICY_KWARGS))
+    install_throttling_table_resource_stand_in(table_client=users_table, errors_schedule=[THROTTLED] * 4)
+    users_table.reset_round_trips_count()
+    self.assertFalse(users_table.put_record(record_dict_data={primary_key_name: f"recordId_{uuid4()}"}))
+    self.assertEqual(3, users_table.round_trips_count)
+    self.assertEqual(0, users_table.dynamodb_client.requests_retrier.retry_budget)
+
+    self.assertFalse(users_table.put_record(record_dict_data={primary_key_name: f"recordId_{uuid4()}"}))
+    self.assertEqual(4, users_table.round_trips_count)
+
+    # Each successful request gives back one unit to the retry budget
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key}))
+    self.assertEqual(1, users_table.dynamodb_client.requests_retrier.retry_budget)
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_rate_limiter_adapts_to_throttling(
+        self: unittest.TestCase, table_factory: Callable[[Optional[RetryPolicy]], Union[DynamoDBBasicTable, DynamoDBCachingTable]],
+        primary_key_name: str, is_caching: bool
+):
+    users_table = table_factory(RetryPolicy(rate_limit_requests_per_second=1000, rate_limit_burst_capacity=2, **FAST_RETRY_POLICY_KWARGS))
+    rate_limiter = users_table.dynamodb_client.requests_retrier.rate_limiter
+    self.assertEqual(0.0, rate_limiter.reserve())
+    self.assertEqual(0.0, rate_limiter.reserve())
+    # Without any token left, the next requests have to wait for the tokens to be refilled
+    self.assertGreater(rate_limiter.reserve(), 0.0)
+
+    install_throttling_table_resource_stand_in(table_client=users_table, errors_schedule=[THROTTLED, THROTTLED])
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key}))
+    # Decreased twice by the throttled requests, and then increased by 1% of the max rate by the successful request
+    self.assertAlmostEqual(1000 * 0.7 * 0.7 + 10, rate_limiter.requests_per_second)
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+    self.assertAlmostEqual(1000 * 0.7 * 0.7 + 20, rate_limiter.requests_per_second)
@@ -0,0 +1,42 @@
+import unittest
+from typing import Optional
+
+from StructNoSQL import RetryPolicy
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_retry_policy.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.SHARED_CASE_KWARGS = {
+            'self': self, 'table_factory': self.table_factory, 'primary_key_name': 'accountId', 'is_caching': True
+        }
+
+    @staticmethod
+    def table_factory(retry_policy: Optional[RetryPolicy]) -> PlaygroundDynamoDBCachingTable:
+        return PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel, retry_policy=retry_policy)
+
+    def test_throttled_requests_retried(self):
+        from tests.tests_retry_policy.cases_shared import test_throttled_requests_retried
+        test_throttled_requests_retried(**self.SHARED_CASE_KWARGS)
+
+    def test_non_retryable_errors_not_retried(self):
+        from tests.tests_retry_policy.cases_shared import test_non_retryable_errors_not_retried
+        test_non_retryable_errors_not_retried(**self.SHARED_CASE_KWARGS)
+
+    def test_transaction_conflicts_retried(self):
+        from tests.tests_retry_policy.cases_shared import test_transaction_conflicts_retried
+        test_transaction_conflicts_retried(**self.SHARED_CASE_KWARGS)
+
+    def test_non_idempotent_requests_not_retried_after_server_errors(self):
+        from tests.tests_retry_policy.cases_shared import test_non_idempotent_requests_not_retried_after_server_errors
+        test_non_idempotent_requests_not_retried_after_server_errors(**self.SHARED_CASE_KWARGS)
+
+    def test_retry_budget_exhausted(self):
+        from tests.tests_retry_policy.cases_shared import test_retry_budget_exhausted
+        test_retry_budget_exhausted(**self.SHARED_CASE_KWARGS)
+
+    def test_rate_limiter_adapts_to_throttling(self):
+        from tests.tests_retry_policy.cases_shared import test_rate_limiter_adapts_to_throttling
+        test_rate_limiter_adapts_to_throttling(**self.SHARED_CASE_KWARGS)
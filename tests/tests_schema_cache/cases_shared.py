@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from typing import Callable, Optional, List, Any
+from unittest.mock import patch
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBCachingTable
+from StructNoSQL.base_tables.base_table import Processor
+from StructNoSQL.base_tables.schema_cache import compute_model_source_hash, make_schema_cache_file_path, \
+    read_schema_file, load_processed_schema
+from tests.tests_schema_cache.table_models import DynamoDBTableModel
+
+
+def _describe_fields_switch(users_table: DynamoDBCachingTable) -> List[tuple]:
+    return [(
+        field_path, type(field_object).__name__, getattr(field_object, 'field_name', None), field_object.key_name,
+        [(path_element.element_key, path_element.default_type) for path_element in field_object.database_path],
+        [required_field.field_name for required_field in getattr(field_object.map_model, 'required_fields', None) or []]
+    ) for field_path, field_object in users_table.fields_switch.items()]
+
+
+def test_schema_loaded_from_cache_file(
+        self: unittest.TestCase, table_factory: Callable[[Optional[str]], DynamoDBCachingTable], primary_key_name: str
+):
+    processed_table: DynamoDBCachingTable = table_factory(None)
+    with tempfile.TemporaryDirectory() as schema_cache_directory_path:
+        writing_table: DynamoDBCachingTable = table_factory(schema_cache_directory_path)
+        self.assertEqual(1, len(os.listdir(schema_cache_directory_path)))
+        with patch.object(Processor, 'assign_internal_mapping_from_class') as assign_internal_mapping_mock:
+            loading_table: DynamoDBCachingTable = table_factory(schema_cache_directory_path)
+            assign_internal_mapping_mock.assert_not_called()
+
+    self.assertEqual(_describe_fields_switch(processed_table), _describe_fields_switch(writing_table))
+    self.assertEqual(_describe_fields_switch(processed_table), _describe_fields_switch(loading_table))
+    self.assertEqual(
+        [required_field.field_name for required_field in processed_table.model.required_fields],
+        [required_field.field_name for required_field in loading_table.model.required_fields]
+    )
+
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(loading_table.put_record(record_dict_data={primary_key_name: record_key, 'properties': {
+        'propertyA': {'name': "nameA", 'tags': {'tagA': {'count': 1}}, 'childProperties': {'childA': {'name': "childNameA"}}}
+    }}))
+    loading_table.clear_cached_data()
+    retrieved_child_name: Optional[Any] = loading_table.get_field(
+        key_value=record_key, field_path='properties.{{propertyKey}}.childProperties.{{childPropertyKey}}.name',
+        query_kwargs={'propertyKey': "propertyA", 'childPropertyKey': "childA"}
+    )
+    self.assertEqual({'fromCache': False, 'value': "childNameA"}, retrieved_child_name)
+    retrieved_tag_count: Optional[Any] = loading_table.get_field(
+        key_value=record_key, field_path='properties.{{propertyKey}}.tags.{{tagKey}}.{{tagKeyChild}}',
+        query_kwargs={'propertyKey': "propertyA", 'tagKey': "tagA", 'tagKeyChild': "count"}
+    )
+    self.assertEqual({'fromCache': False, 'value': 1}, retrieved_tag_count)
+    # The required name of the PropertyModel is still validated with the loaded schema
+    self.assertFalse(loading_table.update_field(
+        key_value=record_key, field_path='properties.{{propertyKey}}', query_kwargs={'propertyKey': "propertyB"},
+        value_to_set={'tags': {}}
+    ))
+    self.assertTrue(loading_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_schema_cache_falls_back_to_processing(
+        self: unittest.TestCase, table_factory: Callable[[Optional[str]], DynamoDBCachingTable], primary_key_name: str
+):
+    processed_table: DynamoDBCachingTable = table_factory(None)
+    source_hash: Optional[bytes] = compute_model_source_hash(data_model=DynamoDBTableModel)
+    self.assertIsNotNone(source_hash)
+    with tempfile.TemporaryDirectory() as schema_cache_directory_path:
+        schema_cache_file_path: str = make_schema_cache_file_path(
+            directory_path=schema_cache_directory_path, data_model=DynamoDBTableModel, source_hash=source_hash
+        )
+        with open(schema_cache_file_path, 'wb') as schema_file:
+            schema_file.write(b"not a schema")
+        # The invalid schema file is replaced by the schema of the processed model
+        fallback_table: DynamoDBCachingTable = table_factory(schema_cache_directory_path)
+        self.assertEqual(_describe_fields_switch(processed_table), _describe_fields_switch(fallback_table))
+
+        schema_bytes: Optional[bytes] = read_schema_file(file_path=schema_cache_file_path)
+        self.assertNotEqual(b"not a schema", schema_bytes)
+        with patch.object(Processor, 'assign_internal_mapping_from_class') as assign_internal_mapping_mock:
+            table_factory(schema_cache_directory_path)
+            assign_internal_mapping_mock.assert_not_called()
+
+        # A schema exported from other sources of the model is rejected
+        with self.assertRaises(Exception):
+            load_processed_schema(
+                model_class=DynamoDBTableModel.copy(), fields_switch=processed_table.fields_switch,
+                schema_bytes=schema_bytes, source_hash=bytes(32)
+            )
@@ -0,0 +1,14 @@
+from typing import Dict
+
+from StructNoSQL import TableDataModel, BaseField, MapModel
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    class PropertyModel(MapModel):
+        name = BaseField(field_type=str, required=True)
+        tags = BaseField(field_type=Dict[str, Dict[str, int]], key_name='tagKey', required=False)
+        class ChildPropertyModel(MapModel):
+            name = BaseField(field_type=str, required=False)
+        childProperties = BaseField(field_type=Dict[str, ChildPropertyModel], key_name='childPropertyKey', required=False)
+    properties = BaseField(field_type=Dict[str, PropertyModel], key_name='propertyKey', required=False)
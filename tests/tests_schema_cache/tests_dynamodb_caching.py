@@ -0,0 +1,29 @@
+import unittest
+from typing import Optional
+
+from StructNoSQL.base_tables.base_table import BaseTable
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_schema_cache.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.SHARED_CASE_KWARGS = {'self': self, 'table_factory': self.table_factory, 'primary_key_name': 'accountId'}
+
+    @staticmethod
+    def table_factory(schema_cache_directory_path: Optional[str]) -> PlaygroundDynamoDBCachingTable:
+        # Each table compiles its schema, instead of using the compiled schema of the previous tables of the model
+        BaseTable.clear_compiled_schemas()
+        users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel, schema_cache_directory_path=schema_cache_directory_path)
+        users_table.debug = True
+        return users_table
+
+    def test_schema_loaded_from_cache_file(self):
+        from tests.tests_schema_cache.cases_shared import test_schema_loaded_from_cache_file
+        test_schema_loaded_from_cache_file(**self.SHARED_CASE_KWARGS)
+
+    def test_schema_cache_falls_back_to_processing(self):
+        from tests.tests_schema_cache.cases_shared import test_schema_cache_falls_back_to_processing
+        test_schema_cache_falls_back_to_processing(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,109 @@
+import unittest
+from copy import deepcopy
+from decimal import Decimal
+from typing import Union, Dict, Any
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBBasicTable, DynamoDBCachingTable, FieldGetter, FieldSetter
+from StructNoSQL.tables_clients.backend.dynamodb_utils import DynamoDBUtils
+
+
+def _values_types(value: Any) -> Any:
+    # The values equality does not check the types of the numbers (since 1 == 1.0 == Decimal(1))
+    if isinstance(value, dict):
+        return {key: _values_types(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [_values_types(item) for item in value]
+    elif isinstance(value, (set, frozenset)):
+        return sorted(type(item).__name__ for item in value)
+    return type(value).__name__
+
+
+def _make_record_data(primary_key_name: str, record_key: str) -> dict:
+    return {
+        primary_key_name: record_key,
+        'floatField': 0.1, 'numberField': 42, 'textField': "text",
+        'floatsList': [1.5, 2.25, 3.0],
+        'flagsDict': {'flagOne': True, 'flagTwo': False},
+        'stringsSetField': {"one", "two"},
+        'untypedField': {'nestedFloat': 4.2, 'nestedList': [1, 0.5, "text"]},
+        'projects': {
+            'projectOne': {
+                'projectName': "ProjectOne", 'score': 9.75, 'tags': ["tagOne", "tagTwo"],
+                'settings': {'volume': 10, 'ratio': 0.33}
+            },
+            'projectTwo': {'projectName': "ProjectTwo", 'score': 1.0}
+        }
+    }
+
+
+def test_compiled_serializers_match_generic_serializers(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    record_data: dict = _make_record_data(primary_key_name=primary_key_name, record_key="recordId")
+    # Values with unexpected types (like when the data validation is disabled) must be handled like the generic serializers
+    mismatched_record_data: dict = {
+        primary_key_name: "recordId", 'floatField': "notAFloat", 'textField': 1.5,
+        'floatsList': {'notAList': 2.5}, 'projects': [{'projectName': 0.5}]
+    }
+    for current_record_data in [record_data, mismatched_record_data]:
+        compiled_encoded_record: dict = users_table.record_dynamodb_serializers.encode(deepcopy(current_record_data))
+        generic_encoded_record: dict = DynamoDBUtils.python_to_dynamodb(python_object=deepcopy(current_record_data))
+        self.assertEqual(generic_encoded_record, compiled_encoded_record)
+        self.assertEqual(_values_types(generic_encoded_record), _values_types(compiled_encoded_record))
+
+        compiled_decoded_record: dict = users_table.record_dynamodb_serializers.decode(deepcopy(generic_encoded_record))
+        generic_decoded_record: dict = DynamoDBUtils.dynamodb_to_python(dynamodb_object=deepcopy(generic_encoded_record))
+        self.assertEqual(generic_decoded_record, compiled_decoded_record)
+        self.assertEqual(_values_types(generic_decoded_record), _values_types(compiled_decoded_record))
+
+    self.assertIsInstance(users_table.record_dynamodb_serializers.encode(record_data)['floatsList'][0], Decimal)
+    self.assertEqual([1.5, 2.25, 3.0], record_data['floatsList'])
+    # The encoding never modifies the encoded values, since they can still be used after the request (like in the cache)
+
+
+def test_put_record_and_update_fields_with_compiled_serializers(
+        self: unittest.TestCase, users_table: Union[DynamoDBBasicTable, DynamoDBCachingTable],
+        primary_key_name: str, is_caching: bool
+):
+    record_key: str = f"recordId_{uuid4()}"
+    record_data: dict = _make_record_data(primary_key_name=primary_key_name, record_key=record_key)
+    self.assertTrue(users_table.put_record(record_dict_data=record_data))
+
+    update_success: bool = users_table.update_multiple_fields(key_value=record_key, setters=[
+        FieldSetter(field_path='floatsList', value_to_set=[0.1, 0.2]),
+        FieldSetter(field_path='projects.{{projectId}}.settings', query_kwargs={'projectId': "projectTwo"}, value_to_set={'volume': 3, 'ratio': 0.5}),
+        FieldSetter(field_path='numberField', value_to_set=7.5),
+    ])
+    self.assertTrue(update_success)
+    if is_caching is True:
+        self.assertTrue(users_table.commit_operations())
+        users_table.clear_cached_data()
+
+    retrieved_record: Dict[str, Any] = users_table.get_multiple_fields(key_value=record_key, getters={
+        field_key: FieldGetter(field_path=field_key)
+        for field_key in ['floatField', 'numberField', 'floatsList', 'flagsDict', 'untypedField', 'projects']
+    })
+    expected_record: Dict[str, Any] = {
+        'floatField': 0.1, 'numberField': 7.5, 'floatsList': [0.1, 0.2],
+        'flagsDict': {'flagOne': True, 'flagTwo': False},
+        'untypedField': {'nestedFloat': 4.2, 'nestedList': [1, 0.5, "text"]},
+        'projects': {
+            'projectOne': {
+                'projectName': "ProjectOne", 'score': 9.75, 'tags': ["tagOne", "tagTwo"],
+                'settings': {'volume': 10, 'ratio': 0.33}
+            },
+            'projectTwo': {'projectName': "ProjectTwo", 'score': 1, 'settings': {'volume': 3, 'ratio': 0.5}}
+        }
+    }
+    if is_caching is True:
+        expected_record = {key: {'fromCache': False, 'value': item} for key, item in expected_record.items()}
+    self.assertEqual(expected_record, retrieved_record)
+    self.assertEqual(_values_types(expected_record), _values_types(retrieved_record))
+
+    removed_record: dict = users_table.remove_record(indexes_keys_selectors={primary_key_name: record_key})
+    if is_caching is True:
+        removed_record = removed_record['value']
+    self.assertEqual(record_data['projects']['projectOne'], removed_record['projects']['projectOne'])
+    self.assertEqual(_values_types(record_data['untypedField']), _values_types(removed_record['untypedField']))
@@ -0,0 +1,23 @@
+from typing import Dict, List, Set, Any
+
+from StructNoSQL import TableDataModel, BaseField, MapModel
+
+
+class DynamoDBTableModel(TableDataModel):
+    accountId = BaseField(field_type=str, required=True)
+    floatField = BaseField(field_type=float, required=False)
+    numberField = BaseField(field_type=(int, float), required=False)
+    textField = BaseField(field_type=str, required=False)
+    floatsList = BaseField(field_type=List[float], required=False)
+    flagsDict = BaseField(field_type=Dict[str, bool], key_name='flagKey', required=False)
+    stringsSetField = BaseField(field_type=Set[str], required=False)
+    untypedField = BaseField(field_type=Any, required=False)
+    class ProjectModel(MapModel):
+        projectName = BaseField(field_type=str, required=True)
+        score = BaseField(field_type=float, required=False)
+        tags = BaseField(field_type=List[str], required=False)
+        class SettingsModel(MapModel):
+            volume = BaseField(field_type=int, required=False)
+            ratio = BaseField(field_type=float, required=False)
+        settings = BaseField(field_type=SettingsModel, required=False)
+    projects = BaseField(field_type=Dict[str, ProjectModel], key_name='projectId', required=False)
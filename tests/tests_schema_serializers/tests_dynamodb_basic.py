@@ -0,0 +1,21 @@
+import unittest
+
+from tests.components.playground_table_clients import PlaygroundDynamoDBBasicTable
+from tests.tests_schema_serializers.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBBasicTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.users_table = PlaygroundDynamoDBBasicTable(data_model=DynamoDBTableModel)
+
+        self.DYNAMODB_CASE_KWARGS = {'self': self, 'users_table': self.users_table, 'is_caching': False}
+        self.SHARED_CASE_KWARGS = {**self.DYNAMODB_CASE_KWARGS, 'primary_key_name': 'accountId'}
+
+    def test_compiled_serializers_match_generic_serializers(self):
+        from tests.tests_schema_serializers.cases_shared import test_compiled_serializers_match_generic_serializers
+        test_compiled_serializers_match_generic_serializers(**self.SHARED_CASE_KWARGS)
+
+    def test_put_record_and_update_fields_with_compiled_serializers(self):
+        from tests.tests_schema_serializers.cases_shared import test_put_record_and_update_fields_with_compiled_serializers
+        test_put_record_and_update_fields_with_compiled_serializers(**self.SHARED_CASE_KWARGS)
@@ -0,0 +1,104 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from typing import Callable, Optional
+from uuid import uuid4
+
+from StructNoSQL import DynamoDBCachingTable, MmapSharedCacheBackend
+
+
+def _make_shared_cache_backend(self: unittest.TestCase, **backend_kwargs) -> MmapSharedCacheBackend:
+    file_descriptor, file_path = tempfile.mkstemp(prefix='structnosql-shared-cache-')
+    os.close(file_descriptor)
+    os.remove(file_path)
+    shared_cache_backend = MmapSharedCacheBackend(file_path=file_path, **backend_kwargs)
+    self.addCleanup(os.remove, file_path)
+    self.addCleanup(shared_cache_backend.close)
+    return shared_cache_backend
+
+def _run_in_forked_process(target: Callable[[multiprocessing.Queue], None]) -> list:
+    # The forked process inherits the tables of the parent process, like a pre-forked server worker would
+    fork_context = multiprocessing.get_context('fork')
+    results_queue = fork_context.Queue()
+    process = fork_context.Process(target=target, args=(results_queue,))
+    process.start()
+    results: list = results_queue.get(timeout=30)
+    process.join(timeout=30)
+    return results
+
+
+def test_records_shared_between_processes(
+        self: unittest.TestCase, table_factory: Callable[[Optional[MmapSharedCacheBackend]], DynamoDBCachingTable], primary_key_name: str
+):
+    shared_cache_backend = _make_shared_cache_backend(self)
+    users_table = table_factory(shared_cache_backend)
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': "parentValue"}))
+    # Only the shared cached data of the record will be available to the child process
+    users_table._cached_data_per_primary_key.pop_record(primary_key_value=record_key)
+
+    def child_process(results_queue: multiprocessing.Queue):
+        child_users_table = table_factory(MmapSharedCacheBackend(file_path=shared_cache_backend.file_path))
+        child_users_table.reset_round_trips_count()
+        retrieved_value: dict = child_users_table.get_field(key_value=record_key, field_path='textField')
+        child_round_trips_count: int = child_users_table.round_trips_count
+        update_success: bool = child_users_table.update_field(key_value=record_key, field_path='textField', value_to_set="childValue")
+        commit_success: bool = child_users_table.commit_operations()
+        results_queue.put([retrieved_value, child_round_trips_count, update_success, commit_success])
+
+    retrieved_value, child_round_trips_count, update_success, commit_success = _run_in_forked_process(target=child_process)
+    self.assertEqual({'fromCache': True, 'value': "parentValue"}, retrieved_value)
+    self.assertEqual(0, child_round_trips_count)
+    self.assertTrue(update_success)
+    self.assertTrue(commit_success)
+
+    # The update committed by the child process changed the version of the shared record, and is seen by the parent
+    users_table.reset_round_trips_count()
+    self.assertEqual({'fromCache': True, 'value': "childValue"}, users_table.get_field(key_value=record_key, field_path='textField'))
+    self.assertEqual(0, users_table.round_trips_count)
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+
+
+def test_records_with_pending_operations_not_published(
+        self: unittest.TestCase, table_factory: Callable[[Optional[MmapSharedCacheBackend]], DynamoDBCachingTable], primary_key_name: str
+):
+    shared_cache_backend = _make_shared_cache_backend(self)
+    users_table = table_factory(shared_cache_backend)
+    record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: record_key, 'textField': "committedValue"}))
+    published_version: int = shared_cache_backend.get_record_version(primary_key_value=record_key)
+
+    self.assertTrue(users_table.update_field(key_value=record_key, field_path='textField', value_to_set="pendingValue"))
+    self.assertEqual(published_version, shared_cache_backend.get_record_version(primary_key_value=record_key))
+    self.assertEqual({primary_key_name: record_key, 'textField': "committedValue"}, shared_cache_backend.load_record(primary_key_value=record_key).record_data)
+
+    self.assertTrue(users_table.commit_operations())
+    self.assertEqual("pendingValue", shared_cache_backend.load_record(primary_key_value=record_key).record_data['textField'])
+    self.assertTrue(users_table.delete_record(indexes_keys_selectors={primary_key_name: record_key}))
+    self.assertIsNone(shared_cache_backend.load_record(primary_key_value=record_key))
+
+
+def test_slots_collisions_and_large_records(
+        self: unittest.TestCase, table_factory: Callable[[Optional[MmapSharedCacheBackend]], DynamoDBCachingTable], primary_key_name: str
+):
+    # With a single slot, each published record replaces the previously published one
+    shared_cache_backend = _make_shared_cache_backend(self, num_slots=1, max_record_bytes_size=1024)
+    users_table = table_factory(shared_cache_backend)
+    first_record_key: str = f"recordId_{uuid4()}"
+    second_record_key: str = f"recordId_{uuid4()}"
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: first_record_key, 'textField': "firstValue"}))
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: second_record_key, 'textField': "secondValue"}))
+    self.assertIsNone(shared_cache_backend.load_record(primary_key_value=first_record_key))
+    self.assertEqual("secondValue", shared_cache_backend.load_record(primary_key_value=second_record_key).record_data['textField'])
+
+    # The version of the slot changed, so the first record is not trusted anymore, and is retrieved from the database
+    users_table.reset_round_trips_count()
+    self.assertEqual({'fromCache': False, 'value': "firstValue"}, users_table.get_field(key_value=first_record_key, field_path='textField'))
+    self.assertEqual(1, users_table.round_trips_count)
+
+    # The records larger than the max_record_bytes_size are not shared, and invalidate their previous shared version
+    self.assertTrue(users_table.put_record(record_dict_data={primary_key_name: second_record_key, 'textField': "x" * 2048}))
+    self.assertIsNone(shared_cache_backend.load_record(primary_key_value=second_record_key))
+    self.assertEqual({'fromCache': True, 'value': "x" * 2048}, users_table.get_field(key_value=second_record_key, field_path='textField'))
+    users_table.delete_records(indexes_keys_selectors_list=[{primary_key_name: first_record_key}, {primary_key_name: second_record_key}])
@@ -0,0 +1,30 @@
+import unittest
+from typing import Optional
+
+from StructNoSQL import MmapSharedCacheBackend
+from tests.components.playground_table_clients import PlaygroundDynamoDBCachingTable
+from tests.tests_shared_cache_backend.table_models import DynamoDBTableModel
+
+
+class TestsDynamoDBCachingTable(unittest.TestCase):
+    def __init__(self, method_name: str):
+        super().__init__(methodName=method_name)
+        self.SHARED_CASE_KWARGS = {'self': self, 'table_factory': self.table_factory, 'primary_key_name': 'accountId'}
+
+    @staticmethod
+    def table_factory(shared_cache_backend: Optional[MmapSharedCacheBackend]) -> PlaygroundDynamoDBCachingTable:
+        users_table = PlaygroundDynamoDBCachingTable(data_model=DynamoDBTableModel, shared_cache_backend=shared_cache_backend)
+        users_table.debug = True
+        return users_table
+
+    def test_records_shared_between_processes(self):
+        from tests.tests_shared_cache_backend.cases_shared import test_records_shared_between_processes
+        test_records_shared_between_processes(**self.SHARED_CASE_KWARGS)
+
+    def test_records_with_pending_operations_not_published(self):
+        from tests.tests_shared_cache_backend.cases_shared import test_records_with_pending_operations_not_published
+        test_records_with_pending_operations_not_published(**self.SHARED_CASE_KWARGS)
+
+    def test_slots_collisions_and_large_records(self):
+        from tests.tests_shared_cache_backend.cases_shared import test_slots_collisions_and_large_records
+        test_slots_collisions_and_large_records(**self.SHARED_CASE_KWARGS)